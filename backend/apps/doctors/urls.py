@@ -1,7 +1,10 @@
 # Doctors app URLs
-# Will be populated when updating doctor views imports
 from django.urls import path
+from core.lazy_views import lazy_view
 
 urlpatterns = [
-    # Doctor endpoints will be added here
+    # Doctor/Physiotherapist Endpoints
+    path('doctor/patients/', lazy_view('apps.doctors.views.doctor_patient_list'), name='doctor-patient-list'),
+    path('doctor/patient/<int:patient_id>/', lazy_view('apps.doctors.views.doctor_patient_detail'), name='doctor-patient-detail'),
+    path('doctor/create/', lazy_view('apps.doctors.views.create_doctor_user'), name='create-doctor-user'),
 ]
@@ -8,14 +8,17 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from django.contrib.auth.models import User
-from django.db.models import Avg, Count, Max
+from django.db.models import Avg, Count, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 
 from exercise.models import UserProfile, ExerciseSession, HealthVitals, ActivityData, PregnancyProfile
 from apps.health.serializers import HealthVitalsSerializer
+from core.db_router import read_replica
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_replica
 def doctor_patient_list(request):
     """
     List all patients with summary statistics (doctor/physio only)
@@ -35,57 +38,67 @@ def doctor_patient_list(request):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Get all patients
-        patients = User.objects.filter(profile__role='patient')
+        # Get all patients, with per-patient statistics as correlated
+        # subqueries so the list costs the same number of queries at any size
+        def per_patient(queryset, aggregate):
+            return Subquery(
+                queryset.filter(user=OuterRef('pk')).order_by().values('user')
+                .annotate(value=aggregate).values('value')
+            )
+        
+        patients = User.objects.filter(profile__role='patient').select_related(
+            'pregnancyprofile'
+        ).annotate(
+            total_sessions=Coalesce(per_patient(ExerciseSession.objects, Count('id')), 0),
+            total_reps=Coalesce(per_patient(ExerciseSession.objects, Sum('rep_count')), 0),
+            avg_posture=per_patient(ExerciseSession.objects, Avg('avg_posture_score')),
+            activity_count=Coalesce(per_patient(ActivityData.objects, Count('id')), 0),
+            last_session_end=per_patient(ExerciseSession.objects, Max('end_time')),
+            latest_vitals_id=Subquery(
+                HealthVitals.objects.filter(user=OuterRef('pk')).order_by('-timestamp').values('id')[:1]
+            ),
+        )
+        patients = list(patients)
+        
+        # Latest health vitals for every patient in one query
+        latest = HealthVitals.objects.in_bulk(
+            [p.latest_vitals_id for p in patients if p.latest_vitals_id]
+        )
         
         patient_data = []
         for patient in patients:
-            # Get exercise statistics
-            sessions = ExerciseSession.objects.filter(user=patient)
-            total_sessions = sessions.count()
-            avg_posture = sessions.aggregate(Avg('avg_posture_score'))['avg_posture_score__avg'] or 0
-            total_reps = sum(s.rep_count for s in sessions)
-            
-            # Get latest health vitals
-            latest_vitals = HealthVitals.objects.filter(user=patient).first()
+            latest_vitals = latest.get(patient.latest_vitals_id)
             
             # Get pregnancy info
             pregnancy_week = None
             trimester = None
             try:
-                pregnancy_profile = PregnancyProfile.objects.get(user=patient)
+                pregnancy_profile = patient.pregnancyprofile
                 pregnancy_week = pregnancy_profile.current_week
                 trimester = pregnancy_profile.trimester
             except PregnancyProfile.DoesNotExist:
                 pass
             
-            # Get activity data count
-            activity_count = ActivityData.objects.filter(user=patient).count()
-            
-            # Get last activity date
-            last_session = sessions.order_by('-end_time').first()
-            last_active = last_session.end_time if last_session else patient.last_login
-            
             patient_data.append({
                 'id': patient.id,
                 'username': patient.username,
                 'email': patient.email,
                 'date_joined': patient.date_joined,
-                'last_active': last_active,
+                'last_active': patient.last_session_end or patient.last_login,
                 'pregnancy_week': pregnancy_week,
                 'trimester': trimester,
                 'statistics': {
-                    'total_sessions': total_sessions,
-                    'total_reps': total_reps,
-                    'avg_posture_score': round(avg_posture, 1),
-                    'activity_uploads': activity_count
+                    'total_sessions': patient.total_sessions,
+                    'total_reps': patient.total_reps,
+                    'avg_posture_score': round(patient.avg_posture or 0, 1),
+                    'activity_uploads': patient.activity_count
                 },
                 'latest_vitals': {
-                    'heart_rate': latest_vitals.heart_rate if latest_vitals else None,
-                    'spo2': latest_vitals.spo2 if latest_vitals else None,
-                    'stress_level': latest_vitals.stress_level if latest_vitals else None,
-                    'energy_level': latest_vitals.energy_level if latest_vitals else None,
-                    'timestamp': latest_vitals.timestamp if latest_vitals else None
+                    'heart_rate': latest_vitals.heart_rate,
+                    'spo2': latest_vitals.spo2,
+                    'stress_level': latest_vitals.stress_level,
+                    'energy_level': latest_vitals.energy_level,
+                    'timestamp': latest_vitals.timestamp
                 } if latest_vitals else None
             })
         
@@ -103,6 +116,7 @@ def doctor_patient_list(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_replica
 def doctor_patient_detail(request, patient_id):
     """
     Get detailed information about a specific patient (doctor/physio only)
@@ -155,7 +169,7 @@ def doctor_patient_detail(request, patient_id):
             pass
         
         # Recent exercise sessions (last 10)
-        sessions = ExerciseSession.objects.filter(user=patient).order_by('-end_time')[:10]
+        sessions = ExerciseSession.objects.filter(user=patient).select_related('exercise').order_by('-end_time')[:10]
         session_data = [{
             'id': s.id,
             'exercise_name': s.exercise.name,
@@ -183,8 +197,11 @@ def doctor_patient_detail(request, patient_id):
         
         # Calculate trends
         all_sessions = ExerciseSession.objects.filter(user=patient)
+        totals = all_sessions.aggregate(
+            count=Count('id'), reps=Sum('rep_count'), avg_posture=Avg('avg_posture_score')
+        )
         posture_trend = []
-        if all_sessions.exists():
+        if totals['count']:
             # Group by date and calculate average
             from django.db.models.functions import TruncDate
             daily_posture = all_sessions.annotate(
@@ -208,9 +225,9 @@ def doctor_patient_detail(request, patient_id):
                 'posture_over_time': posture_trend
             },
             'summary': {
-                'total_sessions': all_sessions.count(),
-                'total_reps': sum(s.rep_count for s in all_sessions),
-                'avg_posture_score': round(all_sessions.aggregate(Avg('avg_posture_score'))['avg_posture_score__avg'] or 0, 1),
+                'total_sessions': totals['count'],
+                'total_reps': totals['reps'] or 0,
+                'avg_posture_score': round(totals['avg_posture'] or 0, 1),
                 'total_activity_days': ActivityData.objects.filter(user=patient).count()
             }
         })
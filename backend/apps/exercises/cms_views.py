@@ -8,6 +8,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from exercise.models import Exercise, UserProfile
 from apps.exercises.serializers import ExerciseSerializer
+from apps.exercises.session_sync import invalidate_exercise_ids
 from core.audit import log_action
 
 
@@ -35,6 +36,7 @@ def manage_exercises(request):
         serializer = ExerciseSerializer(data=request.data)
         if serializer.is_valid():
             exercise = serializer.save()
+            invalidate_exercise_ids()
             
             # Log the creation
             log_action(
@@ -113,6 +115,7 @@ def manage_exercise_detail(request, exercise_id):
         )
         
         exercise.delete()
+        invalidate_exercise_ids()
         return Response({
             'message': f'Exercise "{exercise_name}" deleted successfully'
         }, status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.1 on 2026-10-18 23:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('exercise', '0012_userprofile_timezone_customreminder_next_fire_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionTelemetry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('frame_count', models.IntegerField(default=0)),
+                ('batch_count', models.IntegerField(default=0, help_text='Batches appended; the next batch must send this as seq')),
+                ('angle_count', models.PositiveSmallIntegerField(default=0)),
+                ('data', models.BinaryField(default=b'', help_text='Delta-encoded, compressed chunks')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('session', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='telemetry', to='exercise.exercisesession')),
+            ],
+            options={
+                'verbose_name_plural': 'Session telemetry',
+            },
+        ),
+    ]
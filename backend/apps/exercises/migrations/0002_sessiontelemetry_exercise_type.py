@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-18 23:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exercises', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sessiontelemetry',
+            name='exercise_type',
+            field=models.CharField(blank=True, help_text='Frontend exercise id (pose_analysis.EXERCISES), for re-scoring', max_length=50),
+        ),
+    ]
@@ -1 +1,38 @@
 # Models will be imported from exercise app for now
+from django.db import models
+
+from exercise.models import ExerciseSession
+
+
+class SessionTelemetry(models.Model):
+    """
+    Per-frame telemetry of an exercise session (joint angles, posture score,
+    velocity, issue codes) as one compressed blob, see apps/exercises/telemetry.py
+    """
+    session = models.OneToOneField(ExerciseSession, on_delete=models.CASCADE, related_name='telemetry')
+    frame_count = models.IntegerField(default=0)
+    batch_count = models.IntegerField(default=0, help_text='Batches appended; the next batch must send this as seq')
+    angle_count = models.PositiveSmallIntegerField(default=0)
+    exercise_type = models.CharField(max_length=50, blank=True, help_text='Frontend exercise id (pose_analysis.EXERCISES), for re-scoring')
+    data = models.BinaryField(default=b'', help_text='Delta-encoded, compressed chunks')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = 'Session telemetry'
+
+    def __str__(self):
+        return f"{self.session} ({self.frame_count} frames)"
+
+    def append(self, matrix):
+        """Append a quantized batch (telemetry.quantize_batch) as a new chunk"""
+        from apps.exercises.telemetry import encode_chunk
+
+        self.data = bytes(self.data) + encode_chunk(matrix)
+        self.frame_count += len(matrix)
+        self.batch_count += 1
+
+    def arrays(self):
+        """Decoded NumPy arrays, see telemetry.decode()"""
+        from apps.exercises.telemetry import decode
+
+        return decode(self.data)
@@ -0,0 +1,261 @@
+"""
+Pose Analysis
+NumPy port of frontend/src/utils/poseAnalysis.ts, run over whole recordings
+instead of frame by frame, so that sessions can be re-scored on the server
+when the scoring rules change. Keep the two in step: the golden file
+tests/fixtures/pose_golden.json is produced by the TS code
+(frontend/src/test/poseGolden.ts) and checked against this module.
+
+Landmark arrays are (frames, 33, 4): x, y, z (NaN when the pose has no
+depth) and visibility, as MediaPipe returns them.
+"""
+import numpy as np
+
+from apps.exercises.telemetry import ISSUE_CODES, decode
+
+
+VISIBILITY_THRESHOLD = 0.5
+SMOOTHING_WINDOW = 5
+REP_HYSTERESIS = 5  # degrees
+MIN_TRANSITION_FRAMES = 1
+TOO_FAST_VELOCITY = 150  # degrees/s
+
+# EXERCISES in frontend/src/types.ts: landmark indices of the tracked angle and rep thresholds
+EXERCISES = {
+    'squat': {'joints': (23, 25, 27), 'down': 130, 'up': 150},
+    'modified_lunge': {'joints': (23, 25, 27), 'down': 110, 'up': 160},
+    'wall_pushup': {'joints': (11, 13, 15), 'down': 100, 'up': 160},
+    'side_leg_raise': {'joints': (23, 25, 27), 'down': 5, 'up': 40},
+    'arm_raise': {'joints': (11, 13, 15), 'down': 90, 'up': 140},
+    'pelvic_tilt': {'joints': (23, 25, 27), 'down': 100, 'up': 160},
+    'shoulder_roll': {'joints': (11, 13, 23), 'down': 30, 'up': 150},
+    'calf_raise': {'joints': (25, 27, 31), 'down': 95, 'up': 115},
+    'cat_cow': {'joints': (11, 23, 25), 'down': 155, 'up': 145},
+    'seated_march': {'joints': (23, 25, 27), 'down': 100, 'up': 50},
+}
+
+# analyzePosture() issue messages by code
+ISSUE_MESSAGES = {
+    'large_deviation': 'Large angle deviation',
+    'moderate_deviation': 'Moderate angle deviation',
+    'minor_deviation': 'Minor angle deviation',
+    'knees_forward': 'Knees too far forward',
+    'leaning_forward': 'Leaning too far forward',
+    'arms_asymmetric': 'Arms not symmetrical',
+}
+
+# Score penalties of the checks that need landmarks, not just the tracked angle
+LANDMARK_PENALTIES = {'knees_forward': 15, 'leaning_forward': 10, 'arms_asymmetric': 15}
+
+
+def _bit(code):
+    return 1 << ISSUE_CODES.index(code)
+
+
+def exercise_type_for(name):
+    """Exercise type of an Exercise row: the frontend saves sessions against the first name containing its id"""
+    name = (name or '').lower()
+    for exercise_type in EXERCISES:
+        if exercise_type in name or exercise_type.replace('_', ' ') in name:
+            return exercise_type
+    return None
+
+
+def calculate_angle(a, b, c):
+    """
+    calculateAngle(): angle at b in degrees, per frame. Points are (..., 2)
+    or (..., 3) arrays; frames where any z is NaN use the 2D formula.
+    """
+    a, b, c = (np.asarray(point, dtype=np.float64) for point in (a, b, c))
+    radians = np.arctan2(c[..., 1] - b[..., 1], c[..., 0] - b[..., 0]) - np.arctan2(a[..., 1] - b[..., 1], a[..., 0] - b[..., 0])
+    angle_2d = np.abs(radians * 180 / np.pi)
+    angle_2d = np.where(angle_2d > 180, 360 - angle_2d, angle_2d)
+    if a.shape[-1] < 3:
+        return angle_2d
+
+    use_z = ~(np.isnan(a[..., 2]) | np.isnan(b[..., 2]) | np.isnan(c[..., 2]))
+    ba = a[..., :3] - b[..., :3]
+    bc = c[..., :3] - b[..., :3]
+    dot = ba[..., 0] * bc[..., 0] + ba[..., 1] * bc[..., 1] + ba[..., 2] * bc[..., 2]
+    magnitudes = np.sqrt(ba[..., 0] ** 2 + ba[..., 1] ** 2 + ba[..., 2] ** 2) * np.sqrt(bc[..., 0] ** 2 + bc[..., 1] ** 2 + bc[..., 2] ** 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        angle_3d = np.arccos(dot / magnitudes) * 180 / np.pi
+    return np.where(use_z, angle_3d, angle_2d)
+
+
+def smooth_angles(angles):
+    """AngleSmoothing: weighted moving average of the last 5 angles, newest weighted 5, oldest 1"""
+    angles = np.asarray(angles, dtype=np.float64)
+    smoothed = np.empty_like(angles)
+    for i in range(min(SMOOTHING_WINDOW - 1, len(angles))):
+        weights = np.arange(1, i + 2)
+        smoothed[i] = (angles[:i + 1] * weights).sum() / weights.sum()
+    if len(angles) >= SMOOTHING_WINDOW:
+        windows = np.lib.stride_tricks.sliding_window_view(angles, SMOOTHING_WINDOW)
+        weights = np.arange(1, SMOOTHING_WINDOW + 1)
+        # Summed left to right like the TS loop, for bit-identical results
+        total = np.zeros(len(windows))
+        for k in range(SMOOTHING_WINDOW):
+            total = total + windows[:, k] * weights[k]
+        smoothed[SMOOTHING_WINDOW - 1:] = total / weights.sum()
+    return smoothed
+
+
+def angular_velocity(angles, t_ms):
+    """VelocityTracker: |delta angle| / delta t in degrees/s; NaN for the first frame"""
+    angles = np.asarray(angles, dtype=np.float64)
+    velocity = np.full(len(angles), np.nan)
+    if len(angles) > 1:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            velocity[1:] = np.abs(np.diff(angles) / (np.diff(np.asarray(t_ms, dtype=np.float64)) / 1000))
+    return velocity
+
+
+def count_reps(angles, down, up):
+    """
+    RepCounter with its hysteresis. The state machine is inherently
+    sequential, so it is a plain loop over the angles.
+    Returns (counted flags, phase per frame).
+    """
+    down_limit = down + REP_HYSTERESIS
+    up_limit = up - REP_HYSTERESIS
+    counted = np.zeros(len(angles), dtype=bool)
+    phases = []
+    phase, transition_frames = 'up', 0
+    for i, angle in enumerate(np.asarray(angles, dtype=np.float64).tolist()):
+        if phase == 'up' and angle < down_limit:
+            phase, transition_frames = 'transition', 1
+        elif phase == 'transition' and angle < down_limit:
+            transition_frames += 1
+            if transition_frames >= MIN_TRANSITION_FRAMES:
+                phase, transition_frames = 'down', 0
+        elif phase == 'down' and angle > up_limit:
+            phase, transition_frames = 'transition', 1
+        elif phase == 'transition' and angle > up_limit:
+            transition_frames += 1
+            if transition_frames >= MIN_TRANSITION_FRAMES:
+                phase, transition_frames = 'up', 0
+                counted[i] = True
+        elif phase == 'transition' and down_limit <= angle <= up_limit:
+            transition_frames = 0
+        phases.append(phase)
+    return counted, phases
+
+
+def deviation_penalty(angles, target):
+    """Angle deviation part of analyzePosture(): (penalty, issue bits) per frame"""
+    deviation = np.abs(np.asarray(angles, dtype=np.float64) - target)
+    penalty = np.select([deviation > 30, deviation > 20, deviation > 10], [30, 20, 10], 0)
+    issues = np.select(
+        [deviation > 30, deviation > 20, deviation > 10],
+        [_bit('large_deviation'), _bit('moderate_deviation'), _bit('minor_deviation')], 0,
+    )
+    return penalty, issues
+
+
+def landmark_penalty(landmarks, exercise_type):
+    """Exercise-specific checks of analyzePosture() that read landmarks: (penalty, issue bits) per frame"""
+    landmarks = np.asarray(landmarks, dtype=np.float64)
+    penalty = np.zeros(len(landmarks), dtype=np.int64)
+    issues = np.zeros(len(landmarks), dtype=np.int64)
+    if exercise_type == 'squat':
+        hip, knee, ankle, shoulder = landmarks[:, 23], landmarks[:, 25], landmarks[:, 27], landmarks[:, 11]
+        knees_forward = knee[:, 0] > ankle[:, 0] + 0.1
+        vertical = np.stack([shoulder[:, 0], np.zeros(len(shoulder))], axis=-1)
+        back_angle = calculate_angle(hip[:, :2], shoulder[:, :2], vertical)
+        leaning = back_angle > 45
+        penalty += np.where(knees_forward, LANDMARK_PENALTIES['knees_forward'], 0)
+        penalty += np.where(leaning, LANDMARK_PENALTIES['leaning_forward'], 0)
+        issues |= np.where(knees_forward, _bit('knees_forward'), 0) | np.where(leaning, _bit('leaning_forward'), 0)
+    elif exercise_type == 'arm_raise':
+        left = calculate_angle(landmarks[:, 11, :3], landmarks[:, 13, :3], landmarks[:, 15, :3])
+        right = calculate_angle(landmarks[:, 12, :3], landmarks[:, 14, :3], landmarks[:, 16, :3])
+        asymmetric = np.abs(left - right) > 20
+        penalty += np.where(asymmetric, LANDMARK_PENALTIES['arms_asymmetric'], 0)
+        issues |= np.where(asymmetric, _bit('arms_asymmetric'), 0)
+    return penalty, issues
+
+
+def issue_messages(mask):
+    """analyzePosture() issue messages for a bitmask, in the order it reports them"""
+    return [ISSUE_MESSAGES[code] for code in ISSUE_CODES if code in ISSUE_MESSAGES and int(mask) & _bit(code)]
+
+
+def running_average(scores):
+    """The session's avg_posture_score: avg = avg * 0.9 + score * 0.1 per frame, from 0"""
+    scores = np.asarray(scores, dtype=np.float64)
+    average = 0.0
+    # Blocks of 256 keep the decay weights well inside float range
+    for start in range(0, len(scores), 256):
+        block = scores[start:start + 256]
+        weights = 0.9 ** np.arange(len(block) - 1, -1, -1)
+        average = average * 0.9 ** len(block) + 0.1 * (block * weights).sum()
+    return average
+
+
+def _score(angles, raw_angles, t_ms, exercise_type, penalty, issues):
+    config = EXERCISES[exercise_type]
+    velocity = angular_velocity(angles, t_ms)
+    counted, phases = count_reps(angles, config['down'], config['up'])
+    deviation, deviation_issues = deviation_penalty(angles, (config['down'] + config['up']) / 2)
+    score = np.maximum(0, 100 - deviation - penalty)
+    with np.errstate(invalid='ignore'):
+        too_fast = np.where(velocity > TOO_FAST_VELOCITY, _bit('too_fast'), 0)
+    return {
+        'raw_angle': raw_angles,
+        'angle': angles,
+        'velocity': velocity,
+        'counted': counted,
+        'phase': phases,
+        'score': score,
+        'issues': deviation_issues | issues | too_fast,
+        'reps': int(counted.sum()),
+        'avg_posture_score': running_average(score),
+    }
+
+
+def score_landmarks(landmarks, t_ms, exercise_type):
+    """
+    processExercise() over a recording: frames where the tracked joints are
+    not visible are skipped, as in the app. Per-frame arrays cover the
+    visible frames; 'visible' is the mask over all frames.
+    """
+    landmarks = np.asarray(landmarks, dtype=np.float64)
+    joints = EXERCISES[exercise_type]['joints']
+    visible = np.all(landmarks[:, joints, 3] > VISIBILITY_THRESHOLD, axis=1)
+    landmarks = landmarks[visible]
+    raw = calculate_angle(landmarks[:, joints[0], :3], landmarks[:, joints[1], :3], landmarks[:, joints[2], :3])
+    penalty, issues = landmark_penalty(landmarks, exercise_type)
+    result = _score(smooth_angles(raw), raw, np.asarray(t_ms)[visible], exercise_type, penalty, issues)
+    result['visible'] = visible
+    return result
+
+
+def score_telemetry(arrays, exercise_type):
+    """
+    Re-score stored session telemetry (telemetry.decode()) with the current
+    rules. Smoothing, rep counting, velocity and the deviation checks are
+    recomputed from the raw angle; the landmark checks cannot be (landmarks
+    are not stored), so their recorded issue bits are kept and penalised.
+    """
+    angles = arrays['angles']
+    raw = angles[:, 1] if angles.shape[1] > 1 else angles[:, 0]
+    raw = raw.astype(np.float64)
+    recorded = arrays['issues'].astype(np.int64)
+    landmark_bits = sum(_bit(code) for code in LANDMARK_PENALTIES)
+    penalty = sum(np.where(recorded & _bit(code), points, 0) for code, points in LANDMARK_PENALTIES.items())
+    return _score(smooth_angles(raw), raw, arrays['t_ms'], exercise_type, penalty, recorded & landmark_bits)
+
+
+def score_blobs(rows):
+    """
+    Re-score (session_id, exercise_type, telemetry blob) rows
+    Returns (session_id, rep_count, avg_posture_score) per row. This is the
+    process pool worker of apps/exercises/rescoring.py; it needs neither
+    Django nor the database.
+    """
+    results = []
+    for session_id, exercise_type, blob in rows:
+        scored = score_telemetry(decode(blob), exercise_type)
+        results.append((session_id, scored['reps'], round(float(scored['avg_posture_score']), 1)))
+    return results
@@ -0,0 +1,100 @@
+"""
+Session Re-scoring
+Recompute rep_count and avg_posture_score of stored sessions from their
+telemetry with the current rules in pose_analysis.py.
+
+Scoring is CPU-bound, so chunks of sessions are scored in a process pool.
+The workers only get the telemetry blobs and return numbers: they never
+touch the database, and all writes are bulk updates from the parent.
+Workers are spawned rather than forked so that they do not inherit (and
+on exit close) the parent's database connections.
+"""
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.exercises.models import SessionTelemetry
+from apps.exercises.pose_analysis import EXERCISES, exercise_type_for, score_blobs
+from apps.reports.weekly_snapshots import invalidate_snapshots
+from exercise.models import ExerciseSession
+
+logger = logging.getLogger(__name__)
+
+
+def _iter_chunks(queryset, chunk_size):
+    chunk = []
+    for session_id, exercise_type, exercise_name, data in queryset.values_list(
+        'session_id', 'exercise_type', 'session__exercise__name', 'data'
+    ).iterator(chunk_size=chunk_size):
+        exercise_type = exercise_type or exercise_type_for(exercise_name)
+        if exercise_type not in EXERCISES:
+            logger.warning(f"Re-score: session {session_id} has no known exercise type, skipped")
+            continue
+        chunk.append((session_id, exercise_type, bytes(data)))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _apply(results, dry_run):
+    """Write one chunk of results; returns how many sessions changed"""
+    scores = {session_id: (reps, avg) for session_id, reps, avg in results}
+    changed = []
+    for session in ExerciseSession.objects.filter(id__in=scores).only('id', 'user_id', 'start_time', 'rep_count', 'avg_posture_score'):
+        reps, avg = scores[session.id]
+        if (session.rep_count, session.avg_posture_score) != (reps, avg):
+            session.rep_count, session.avg_posture_score = reps, avg
+            changed.append(session)
+    if changed and not dry_run:
+        with transaction.atomic():
+            ExerciseSession.objects.bulk_update(changed, ['rep_count', 'avg_posture_score'])
+        # bulk_update sends no post_save, so drop the affected weekly report snapshots here
+        days = {}
+        for session in changed:
+            days.setdefault(session.user_id, set()).add(timezone.localdate(session.start_time))
+        for user_id, user_days in days.items():
+            invalidate_snapshots(user_id, user_days)
+    return len(changed)
+
+
+def rescore_sessions(session_ids=None, workers=None, chunk_size=200, dry_run=False):
+    """
+    Re-score every session with telemetry (or only `session_ids`)
+    workers=0 scores in this process; None uses one worker per CPU.
+    Returns {'scored': sessions scored, 'changed': sessions whose scores changed}
+    """
+    queryset = SessionTelemetry.objects.filter(frame_count__gt=0).order_by('session_id')
+    if session_ids is not None:
+        queryset = queryset.filter(session_id__in=session_ids)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    totals = {'scored': 0, 'changed': 0}
+
+    def collect(results):
+        totals['scored'] += len(results)
+        totals['changed'] += _apply(results, dry_run)
+        logger.info(f"Re-score: {totals['scored']} sessions scored, {totals['changed']} changed")
+
+    if workers == 0:
+        for chunk in _iter_chunks(queryset, chunk_size):
+            collect(score_blobs(chunk))
+        return totals
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        pending = set()
+        for chunk in _iter_chunks(queryset, chunk_size):
+            pending.add(executor.submit(score_blobs, chunk))
+            # Bound the blobs held in memory to a couple of chunks per worker
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future.result())
+        for future in pending:
+            collect(future.result())
+    return totals
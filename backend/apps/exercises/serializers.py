@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from exercise.models import Exercise, ExerciseSession, ActivityUpload, ActivityData
+from apps.exercises.session_sync import is_exercise_id
 import csv
 from io import StringIO
 
@@ -25,10 +26,11 @@ class ExerciseSessionSerializer(serializers.ModelSerializer):
                  'posture_warnings', 'start_time', 'end_time', 'user']
         read_only_fields = ['id', 'start_time', 'user']
 
-    def create(self, validated_data):
-        exercise_id = validated_data.pop('exercise_id')
-        validated_data['exercise'] = Exercise.objects.get(id=exercise_id)
-        return super().create(validated_data)
+    def validate_exercise_id(self, value):
+        # Checked against the cached id set instead of a query per session
+        if not is_exercise_id(value):
+            raise serializers.ValidationError('Exercise not found')
+        return value
 
 # =========================
 # Activity Data
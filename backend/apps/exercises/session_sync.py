@@ -0,0 +1,146 @@
+"""
+Session Sync
+Offline-first clients queue finished sessions and flush them in one
+request. Each session carries a client-generated idempotency key
+(client_id), so a flush that is retried after a lost response never
+creates duplicates; new sessions are inserted with a single bulk_create.
+Sessions keep the start_time the client recorded, however late they are
+flushed; bulk_create sends no post_save, so the weekly snapshots of the
+days they land on are invalidated here.
+"""
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.reports.weekly_snapshots import invalidate_snapshots
+from exercise.models import Exercise, ExerciseSession
+
+
+EXERCISE_IDS_KEY = 'exercises:ids'
+EXERCISE_IDS_TIMEOUT = 300
+
+MAX_SYNC_ITEMS = 100
+
+# Client clocks may run a little ahead of the server's
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+
+
+# =========================
+# Cached exercise ids
+# =========================
+
+def exercise_ids(refresh=False):
+    """Set of existing Exercise ids, cached so that validating a session costs no query"""
+    ids = None if refresh else cache.get(EXERCISE_IDS_KEY)
+    if ids is None:
+        ids = frozenset(Exercise.objects.values_list('id', flat=True))
+        cache.set(EXERCISE_IDS_KEY, ids, EXERCISE_IDS_TIMEOUT)
+    return ids
+
+
+def is_exercise_id(exercise_id):
+    """True if the exercise exists; an unknown id re-reads the set once, in case it was just created"""
+    return exercise_id in exercise_ids() or exercise_id in exercise_ids(refresh=True)
+
+
+def invalidate_exercise_ids():
+    """Drop the cached set after exercises are created or deleted"""
+    cache.delete(EXERCISE_IDS_KEY)
+
+
+# =========================
+# Bulk sync
+# =========================
+
+class SessionSyncItemSerializer(serializers.Serializer):
+    client_id = serializers.CharField(max_length=64)
+    exercise_id = serializers.IntegerField()
+    rep_count = serializers.IntegerField(min_value=0)
+    avg_posture_score = serializers.FloatField(min_value=0, max_value=100)
+    posture_warnings = serializers.CharField(required=False, allow_blank=True, default='')
+    start_time = serializers.DateTimeField(required=False, allow_null=True, default=None)
+    end_time = serializers.DateTimeField(required=False, allow_null=True, default=None)
+
+    def validate_exercise_id(self, value):
+        if not is_exercise_id(value):
+            raise serializers.ValidationError('Exercise not found')
+        return value
+
+    def validate_start_time(self, value):
+        if value and value > timezone.now() + MAX_CLOCK_SKEW:
+            raise serializers.ValidationError('Start time is in the future')
+        return value
+
+    def validate(self, data):
+        if data['start_time'] and data['end_time'] and data['end_time'] < data['start_time']:
+            raise serializers.ValidationError({'end_time': 'End time is before start time'})
+        return data
+
+
+def sync_sessions(user, items):
+    """
+    Store a batch of queued sessions for `user`
+    Returns one result per item, in order:
+        {"client_id": ..., "status": "created" | "duplicate", "id": session id}
+        {"client_id": ..., "status": "invalid", "errors": {...}}
+    """
+    results = []
+    valid = {}
+    for item in items:
+        serializer = SessionSyncItemSerializer(data=item)
+        if not serializer.is_valid():
+            client_id = item.get('client_id') if isinstance(item, dict) else None
+            results.append({'client_id': client_id, 'status': 'invalid', 'errors': serializer.errors})
+            continue
+        data = serializer.validated_data
+        results.append({'client_id': data['client_id']})
+        # A key repeated within the batch is stored once
+        valid.setdefault(data['client_id'], data)
+
+    try:
+        stored = _store(user, valid)
+    except IntegrityError:
+        # A concurrent flush of the same queue inserted some keys first
+        stored = _store(user, valid)
+
+    for result in results:
+        if 'status' not in result:
+            session_id, created = stored[result['client_id']]
+            result['status'] = 'created' if created else 'duplicate'
+            result['id'] = session_id
+            # Later repeats of a key are duplicates of the first
+            stored[result['client_id']] = (session_id, False)
+    return results
+
+
+def _store(user, valid):
+    """Insert the sessions whose client_id is new; returns {client_id: (session id, created)}"""
+    now = timezone.now()
+    with transaction.atomic():
+        stored = {
+            client_id: (session_id, False)
+            for client_id, session_id in ExerciseSession.objects.filter(
+                user=user, client_id__in=list(valid)
+            ).values_list('client_id', 'id')
+        }
+        new = [
+            ExerciseSession(
+                user=user,
+                client_id=client_id,
+                exercise_id=data['exercise_id'],
+                rep_count=data['rep_count'],
+                avg_posture_score=data['avg_posture_score'],
+                posture_warnings=data['posture_warnings'],
+                # Queues from clients that predate start_time: the end time is the closest known
+                start_time=data['start_time'] or data['end_time'] or now,
+                end_time=data['end_time'],
+            )
+            for client_id, data in valid.items() if client_id not in stored
+        ]
+        for session in ExerciseSession.objects.bulk_create(new):
+            stored[session.client_id] = (session.id, True)
+        invalidate_snapshots(user.id, {timezone.localdate(session.start_time) for session in new})
+    return stored
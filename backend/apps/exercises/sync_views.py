@@ -0,0 +1,35 @@
+"""
+Session Sync API
+Flush a client's queue of finished sessions in one round trip
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.exercises.session_sync import MAX_SYNC_ITEMS, sync_sessions
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def sync_session_batch(request):
+    """
+    Store queued sessions for the authenticated user
+    POST {"sessions": [{"client_id": "<uuid>", "exercise_id": 1, "rep_count": 10,
+                        "avg_posture_score": 87.5, "posture_warnings": "", "end_time": null}, ...]}
+    Every item gets a result in the same order: "created" or "duplicate"
+    (with the session id) or "invalid" (with errors), so the client can drop
+    all but the invalid items from its queue.
+    """
+    items = request.data.get('sessions') if isinstance(request.data, dict) else None
+    if not isinstance(items, list):
+        return Response({'error': "'sessions' must be a list"}, status=status.HTTP_400_BAD_REQUEST)
+    if len(items) > MAX_SYNC_ITEMS:
+        return Response({'error': f'At most {MAX_SYNC_ITEMS} sessions per request'},
+                        status=status.HTTP_400_BAD_REQUEST)
+
+    results = sync_sessions(request.user, items)
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    return Response({'results': results, **{key: counts.get(key, 0) for key in ('created', 'duplicate', 'invalid')}})
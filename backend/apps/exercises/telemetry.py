@@ -0,0 +1,203 @@
+"""
+Session Telemetry Codec
+Per-frame samples from ExerciseExecution.tsx stored as one compact blob per
+session instead of one row per frame.
+
+A batch arrives as columns of equal length:
+
+    t          milliseconds since the session started
+    rep        reps counted so far
+    score      posture score, 0-100
+    velocity   angular velocity in degrees/s, null before the second frame
+    issues     bitmask over ISSUE_CODES
+    angles     one column per tracked joint angle, in degrees
+
+Each batch is quantized to int32 (0.1 units for scores, velocities and
+angles), delta-encoded along time, byte-shuffled and zlib-compressed into a
+chunk. A session's blob is its chunks back to back, so appending a batch
+never re-encodes earlier ones. decode() returns NumPy arrays.
+"""
+import struct
+import zlib
+
+import numpy as np
+
+
+# Bit i of the issues mask; keep in sync with ISSUE_CODES in frontend/src/utils/telemetry.ts
+ISSUE_CODES = (
+    'large_deviation',
+    'moderate_deviation',
+    'minor_deviation',
+    'knees_forward',
+    'leaning_forward',
+    'arms_asymmetric',
+    'too_fast',
+)
+
+MAX_BATCH = 5000
+MAX_ANGLES = 8
+MAX_FRAMES = 200_000  # ~1h50 at 30 fps
+
+SCALE = 10  # 0.1 units
+FIXED_COLUMNS = ('t', 'rep', 'score', 'velocity', 'issues')
+
+CHUNK_HEADER = struct.Struct('<2sBBII')  # magic, version, angle count, frames, payload bytes
+MAGIC = b'ST'
+VERSION = 1
+
+
+class TelemetryError(ValueError):
+    """Invalid telemetry batch or blob"""
+
+
+def _column(data, name, length=None, nullable=False):
+    values = data.get(name)
+    if not isinstance(values, list):
+        raise TelemetryError(f"'{name}' must be a list")
+    if length is not None and len(values) != length:
+        raise TelemetryError(f"'{name}' has {len(values)} values, expected {length}")
+    if nullable:
+        values = [np.nan if value is None else value for value in values]
+    try:
+        column = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise TelemetryError(f"'{name}' must contain numbers")
+    if column.ndim != 1 or not np.all(np.isfinite(column) | (nullable & np.isnan(column))):
+        raise TelemetryError(f"'{name}' must contain numbers")
+    return column
+
+
+def quantize_batch(data):
+    """
+    Validate a batch of columns and return it as an int32 matrix
+    (frames x (5 + angles)), columns in FIXED_COLUMNS order then the angles
+    """
+    t = _column(data, 't')
+    frames = len(t)
+    if not 1 <= frames <= MAX_BATCH:
+        raise TelemetryError(f'A batch holds 1 to {MAX_BATCH} frames')
+    rep = _column(data, 'rep', frames)
+    score = _column(data, 'score', frames)
+    velocity = _column(data, 'velocity', frames, nullable=True)
+    issues = _column(data, 'issues', frames)
+
+    angles = data.get('angles')
+    if not isinstance(angles, list) or not 1 <= len(angles) <= MAX_ANGLES:
+        raise TelemetryError(f"'angles' must be a list of 1 to {MAX_ANGLES} columns")
+    angles = [_column({'angles': column}, 'angles', frames) for column in angles]
+
+    if np.any(t < 0) or np.any(np.diff(t) < 0):
+        raise TelemetryError("'t' must be non-negative and in order")
+    if np.any(rep < 0):
+        raise TelemetryError("'rep' must be non-negative")
+    if np.any((score < 0) | (score > 100)):
+        raise TelemetryError("'score' must be between 0 and 100")
+    if np.any(velocity < 0):
+        raise TelemetryError("'velocity' must be non-negative")
+    if np.any((issues < 0) | (issues >= 1 << len(ISSUE_CODES)) | (issues != np.floor(issues))):
+        raise TelemetryError("'issues' must be bitmasks over the issue codes")
+    if any(np.any((column < 0) | (column > 360)) for column in angles):
+        raise TelemetryError("'angles' must be between 0 and 360 degrees")
+
+    matrix = np.empty((frames, len(FIXED_COLUMNS) + len(angles)), dtype=np.int32)
+    matrix[:, 0] = t
+    matrix[:, 1] = rep
+    matrix[:, 2] = np.rint(score * SCALE)
+    # -1 marks a missing velocity
+    matrix[:, 3] = np.where(np.isnan(velocity), -1, np.rint(np.nan_to_num(velocity) * SCALE))
+    matrix[:, 4] = issues
+    for i, column in enumerate(angles):
+        matrix[:, len(FIXED_COLUMNS) + i] = np.rint(column * SCALE)
+    return matrix
+
+
+def encode_chunk(matrix):
+    """Delta-encode, byte-shuffle and compress a quantized batch"""
+    frames, columns = matrix.shape
+    deltas = np.diff(matrix, axis=0, prepend=np.zeros((1, columns), dtype=np.int32))
+    # Column-major so each column's deltas are contiguous, then group bytes by significance
+    shuffled = np.ascontiguousarray(deltas.T, dtype='<i4').view(np.uint8).reshape(-1, 4).T
+    payload = zlib.compress(shuffled.tobytes(), 6)
+    return CHUNK_HEADER.pack(MAGIC, VERSION, columns - len(FIXED_COLUMNS), frames, len(payload)) + payload
+
+
+def _decode_chunks(blob):
+    offset = 0
+    blob = bytes(blob)
+    while offset < len(blob):
+        try:
+            magic, version, angle_count, frames, size = CHUNK_HEADER.unpack_from(blob, offset)
+        except struct.error:
+            raise TelemetryError('Truncated telemetry chunk')
+        if magic != MAGIC or version != VERSION:
+            raise TelemetryError('Unknown telemetry format')
+        offset += CHUNK_HEADER.size
+        columns = len(FIXED_COLUMNS) + angle_count
+        raw = np.frombuffer(zlib.decompress(blob[offset:offset + size]), dtype=np.uint8)
+        offset += size
+        deltas = raw.reshape(4, -1).T.copy().view('<i4').reshape(columns, frames).T
+        yield np.cumsum(deltas, axis=0, dtype=np.int64)
+
+
+def angle_count(blob):
+    """Angle columns in a blob, or None if it is empty"""
+    if not blob:
+        return None
+    return CHUNK_HEADER.unpack_from(bytes(blob), 0)[2]
+
+
+def decode(blob):
+    """
+    Decode a session blob into NumPy arrays:
+    t_ms (int64), rep (int32), score and velocity (float32, velocity NaN
+    where missing), issues (uint16 bitmask) and angles (float32, frames x angles)
+    """
+    chunks = list(_decode_chunks(blob)) if blob else []
+    if not chunks:
+        matrix = np.zeros((0, len(FIXED_COLUMNS) + 1), dtype=np.int64)
+    else:
+        matrix = np.concatenate(chunks)
+    velocity = matrix[:, 3].astype(np.float32) / SCALE
+    velocity[matrix[:, 3] < 0] = np.nan
+    return {
+        't_ms': matrix[:, 0],
+        'rep': matrix[:, 1].astype(np.int32),
+        'score': matrix[:, 2].astype(np.float32) / SCALE,
+        'velocity': velocity,
+        'issues': matrix[:, 4].astype(np.uint16),
+        'angles': matrix[:, len(FIXED_COLUMNS):].astype(np.float32) / SCALE,
+    }
+
+
+def issue_names(mask):
+    """Issue codes set in a bitmask"""
+    return [code for bit, code in enumerate(ISSUE_CODES) if int(mask) & (1 << bit)]
+
+
+def rep_summary(arrays):
+    """Per rep: frames, mean/min posture score, angle range, peak velocity and issue frame counts"""
+    rep = arrays['rep']
+    if not len(rep):
+        return []
+    boundaries = np.flatnonzero(np.diff(rep)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(rep)]))
+    bits = (arrays['issues'][:, None] >> np.arange(len(ISSUE_CODES))) & 1
+    summary = []
+    for number, start, end in zip(rep[starts], starts, ends):
+        score = arrays['score'][start:end]
+        angles = arrays['angles'][start:end, 0]
+        velocity = arrays['velocity'][start:end]
+        issue_frames = bits[start:end].sum(axis=0)
+        summary.append({
+            'rep': int(number),
+            'frames': int(end - start),
+            'duration_ms': int(arrays['t_ms'][end - 1] - arrays['t_ms'][start]),
+            'mean_score': round(float(score.mean()), 1),
+            'min_score': round(float(score.min()), 1),
+            'angle_min': round(float(angles.min()), 1),
+            'angle_max': round(float(angles.max()), 1),
+            'peak_velocity': None if np.all(np.isnan(velocity)) else round(float(np.nanmax(velocity)), 1),
+            'issues': {code: int(count) for code, count in zip(ISSUE_CODES, issue_frames) if count},
+        })
+    return summary
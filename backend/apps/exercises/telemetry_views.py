@@ -0,0 +1,124 @@
+"""
+Session Telemetry API
+POST batches of per-frame samples for a session; GET them back decoded
+for charts, with a per-rep summary
+"""
+import math
+
+import numpy as np
+from django.db import transaction
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.exercises.models import SessionTelemetry
+from apps.exercises.pose_analysis import EXERCISES
+from apps.exercises.telemetry import (
+    FIXED_COLUMNS, ISSUE_CODES, MAX_FRAMES, TelemetryError, quantize_batch, rep_summary,
+)
+from exercise.models import ExerciseSession, UserProfile
+
+
+def _can_view(user, session):
+    if session.user_id == user.id:
+        return True
+    return UserProfile.objects.filter(user=user, role__in=('doctor', 'admin')).exists()
+
+
+def _series(values):
+    """Array as a JSON list: floats to 0.1, NaN as null"""
+    if values.dtype.kind == 'f':
+        values = np.round(values.astype(np.float64), 1)
+    return [None if isinstance(value, float) and math.isnan(value) else value for value in values.tolist()]
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def session_telemetry(request, session_id):
+    """
+    POST: Append a batch of samples to the authenticated user's session
+        {"seq": 0, "exercise_type": "squat", "t": [...], "rep": [...], "score": [...],
+         "velocity": [...], "issues": [...], "angles": [[...], ...]}
+        seq is optional; a batch with an already stored seq is ignored so
+        that retries are safe, a gap returns 409. exercise_type (optional)
+        is the frontend exercise id, used to re-score the session later
+    GET: Decoded series (downsampled to ?max_points=, default 2000) and the
+        per-rep summary, for the session's owner, doctors and admins
+    """
+    session = ExerciseSession.objects.filter(id=session_id).first()
+    if session is None:
+        return Response({'error': 'Session not found'}, status=404)
+
+    if request.method == 'GET':
+        if not _can_view(request.user, session):
+            return Response({'error': 'Session not found'}, status=404)
+        return _telemetry_detail(request, session)
+
+    if session.user_id != request.user.id:
+        return Response({'error': 'Session not found'}, status=404)
+    try:
+        matrix = quantize_batch(request.data)
+        seq = request.data.get('seq')
+        if seq is not None and (isinstance(seq, bool) or not isinstance(seq, int) or seq < 0):
+            raise TelemetryError("'seq' must be a non-negative integer")
+        exercise_type = request.data.get('exercise_type') or ''
+        if exercise_type and exercise_type not in EXERCISES:
+            raise TelemetryError(f"Unknown exercise_type '{exercise_type}'")
+    except TelemetryError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    angle_count = matrix.shape[1] - len(FIXED_COLUMNS)
+    with transaction.atomic():
+        telemetry, _ = SessionTelemetry.objects.select_for_update().get_or_create(session=session)
+        result = {'session': session.id}
+        if seq is not None and seq < telemetry.batch_count:
+            return Response({**result, 'duplicate': True, 'frames': telemetry.frame_count,
+                             'batches': telemetry.batch_count})
+        if seq is not None and seq > telemetry.batch_count:
+            return Response({'error': f'Expected batch {telemetry.batch_count}, got {seq}'},
+                            status=status.HTTP_409_CONFLICT)
+        if telemetry.frame_count and angle_count != telemetry.angle_count:
+            return Response({'error': f'Session telemetry has {telemetry.angle_count} angle columns'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if telemetry.frame_count + len(matrix) > MAX_FRAMES:
+            return Response({'error': f'Session telemetry is limited to {MAX_FRAMES} frames'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        telemetry.angle_count = angle_count
+        telemetry.exercise_type = exercise_type or telemetry.exercise_type
+        telemetry.append(matrix)
+        telemetry.save()
+
+    return Response({**result, 'frames': telemetry.frame_count, 'batches': telemetry.batch_count,
+                     'stored_bytes': len(telemetry.data)}, status=status.HTTP_201_CREATED)
+
+
+def _telemetry_detail(request, session):
+    try:
+        max_points = max(1, int(request.query_params.get('max_points', 2000)))
+    except ValueError:
+        return Response({'error': 'max_points must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+    telemetry = SessionTelemetry.objects.filter(session=session).first()
+    if telemetry is None:
+        return Response({'error': 'No telemetry for this session'}, status=404)
+
+    arrays = telemetry.arrays()
+    step = max(1, math.ceil(telemetry.frame_count / max_points))
+    sampled = {name: values[::step] for name, values in arrays.items()}
+    return Response({
+        'session': session.id,
+        'frames': telemetry.frame_count,
+        'step': step,
+        'stored_bytes': len(telemetry.data),
+        'issue_codes': list(ISSUE_CODES),
+        'series': {
+            't_ms': _series(sampled['t_ms']),
+            'rep': _series(sampled['rep']),
+            'score': _series(sampled['score']),
+            'velocity': _series(sampled['velocity']),
+            'issues': _series(sampled['issues']),
+            'angles': [_series(column) for column in sampled['angles'].T],
+        },
+        'reps': rep_summary(arrays),
+    })
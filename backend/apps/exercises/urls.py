@@ -1,5 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from core.lazy_views import lazy_view
 from apps.exercises import views
 
 router = DefaultRouter()
@@ -7,8 +8,16 @@ router.register(r'exercises', views.ExerciseViewSet, basename='exercise')
 router.register(r'sessions', views.ExerciseSessionViewSet, basename='session')
 router.register(r'activity-uploads', views.ActivityUploadViewSet, basename='activity-upload')
 router.register(r'activity-data', views.ActivityDataViewSet, basename='activity-data')
+router.register(r'pregnancy-content', views.PregnancyContentViewSet, basename='pregnancy-content')
 
 urlpatterns = [
+    # Before the router, whose sessions/<pk>/ route would match it
+    path('sessions/sync/', lazy_view('apps.exercises.sync_views.sync_session_batch'), name='session-sync'),
     path('', include(router.urls)),
     path('pregnancy-profile/', views.PregnancyProfileView.as_view()),
+    path('sessions/<int:session_id>/telemetry/', lazy_view('apps.exercises.telemetry_views.session_telemetry'), name='session-telemetry'),
+
+    # CMS Endpoints (Admin only)
+    path('admin/cms/exercises/', lazy_view('apps.exercises.cms_views.manage_exercises'), name='cms-exercises'),
+    path('admin/cms/exercises/<int:exercise_id>/', lazy_view('apps.exercises.cms_views.manage_exercise_detail'), name='cms-exercise-detail'),
 ]
@@ -1,7 +1,16 @@
 # Guidance app URLs
-# Will be populated when updating guidance views imports
 from django.urls import path
+from core.lazy_views import lazy_view
 
 urlpatterns = [
-    # Guidance and FAQ endpoints will be added here
+    # Doctor directory, Guidance and FAQ
+    path('doctors/', lazy_view('apps.guidance.views.list_doctors'), name='list-doctors'),
+    path('guidance/', lazy_view('apps.guidance.views.get_guidance'), name='get-guidance'),
+    path('faqs/', lazy_view('apps.guidance.views.get_faqs'), name='get-faqs'),
+
+    # CMS Endpoints (Admin only)
+    path('admin/cms/guidance/articles/', lazy_view('apps.guidance.cms_views.create_guidance_article'), name='cms-create-article'),
+    path('admin/cms/guidance/articles/<int:article_id>/', lazy_view('apps.guidance.cms_views.manage_guidance_article'), name='cms-manage-article'),
+    path('admin/cms/faqs/', lazy_view('apps.guidance.cms_views.create_faq'), name='cms-create-faq'),
+    path('admin/cms/faqs/<int:faq_id>/', lazy_view('apps.guidance.cms_views.manage_faq'), name='cms-manage-faq'),
 ]
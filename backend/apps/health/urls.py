@@ -1,7 +1,11 @@
 # Health app URLs
-# Will be populated when updating health views imports
 from django.urls import path
+from core.lazy_views import lazy_view
 
 urlpatterns = [
-    # Health monitoring endpoints will be added here
+    # Health Monitoring Endpoints
+    path('current-health-vitals/', lazy_view('apps.health.views.current_health_vitals'), name='current-health-vitals'),
+    path('health-vitals-history/', lazy_view('apps.health.views.health_vitals_history'), name='health-vitals-history'),
+    path('check-exercise-safety/', lazy_view('apps.health.views.check_exercise_safety'), name='check-exercise-safety'),
+    path('health-dashboard-summary/', lazy_view('apps.health.views.health_dashboard_summary'), name='health-dashboard-summary'),
 ]
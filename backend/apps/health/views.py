@@ -12,6 +12,7 @@ from django.contrib.auth.models import User
 from exercise.models import HealthVitals, PregnancyProfile
 from apps.health.serializers import HealthVitalsSerializer
 from apps.health.simulator import HealthDataSimulator
+from core.db_router import read_replica
 
 
 @api_view(['GET'])
@@ -58,6 +59,7 @@ def current_health_vitals(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_replica
 def health_vitals_history(request):
     """
     Get health vitals history for the authenticated user
@@ -0,0 +1,342 @@
+"""
+Engagement Trigger Engine
+Evaluates EngagementNotification templates for every user with a handful
+of set-based queries (one per trigger) and writes the results through the
+bulk notification writer.
+
+Evaluated triggers: inactive_user, streak_milestone, pregnancy_week,
+weekly_summary and achievement. new_content and health_tip are
+broadcasts tied to content publishing; welcome_back is left to the
+login flow.
+"""
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import Count, Max, Q, Sum
+from django.utils import timezone
+
+from exercise.models import (
+    EngagementNotification, ExerciseSession, Notification, NotificationPreferences, UserProfile
+)
+from apps.notifications.utils import bulk_create_notifications
+from core.email import send_email
+from apps.notifications.models_engagement import EngagementDelivery
+from apps.notifications.schedule import get_user_timezone
+
+logger = logging.getLogger(__name__)
+
+STREAK_MILESTONES = (3, 7, 14, 30)
+ACHIEVEMENT_REPS = 100
+
+# A milestone reached this many days ago still counts, so a missed run
+# does not lose it; the delivery ledger stops it firing twice
+GRACE_DAYS = 2
+
+NOTIFICATION_TYPES = {
+    'inactive_user': 'exercise_reminder',
+    'streak_milestone': 'achievement',
+    'pregnancy_week': 'milestone',
+    'weekly_summary': 'system',
+    'achievement': 'achievement',
+}
+
+# Per-trigger opt-out on NotificationPreferences, on top of enable_engagement
+PREFERENCE_FLAGS = {
+    'inactive_user': 'enable_exercise_reminders',
+    'pregnancy_week': 'enable_pregnancy_tips',
+}
+
+
+class _TemplateContext(dict):
+    """format_map() mapping that leaves unknown placeholders untouched"""
+
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+
+def audience(trigger_type):
+    """Users eligible for a trigger: active patients who have not opted out"""
+    users = (
+        User.objects.filter(is_active=True)
+        .exclude(profile__role__in=['admin', 'doctor'])
+        .exclude(notification_preferences__enable_engagement=False)
+    )
+    flag = PREFERENCE_FLAGS.get(trigger_type)
+    if flag:
+        users = users.exclude(**{f'notification_preferences__{flag}': False})
+    return users
+
+
+# =========================
+# Trigger Evaluators
+# Each yields (user_id, period_key, context) for every user the trigger
+# currently applies to.
+# =========================
+
+def inactive_users(now):
+    """Users with no session for ENGAGEMENT_INACTIVE_DAYS; once per inactive stretch"""
+    days = settings.ENGAGEMENT_INACTIVE_DAYS
+    cutoff = now - timedelta(days=days)
+    rows = (
+        audience('inactive_user')
+        .annotate(last_session=Max('exercisesession__start_time'))
+        .filter(
+            Q(last_session__lt=cutoff)
+            | Q(last_session__isnull=True, date_joined__lt=cutoff)
+        )
+        .values_list('id', 'last_session', 'date_joined')
+    )
+    for user_id, last_session, date_joined in rows:
+        since = last_session or date_joined
+        yield user_id, f'since-{since:%Y-%m-%d}', {'days': (now - since).days}
+
+
+def _day_number_sql(column):
+    """SQL for a UTC calendar day as a consecutive integer"""
+    if connection.vendor == 'postgresql':
+        return f"(({column} AT TIME ZONE 'UTC')::date - DATE '1970-01-01')"
+    # SQLite stores UTC text; julianday() of a date is always N.5
+    return f"CAST(julianday(date({column})) AS INTEGER)"
+
+
+def _day_number(day):
+    if connection.vendor == 'postgresql':
+        return (day - date(1970, 1, 1)).days
+    return day.toordinal() + 1721424
+
+
+def streak_milestones(now):
+    """
+    Consecutive-day exercise streaks. Days are numbered, and day number
+    minus ROW_NUMBER() is constant within a run, which groups each run in
+    one pass. A milestone fires on the day it is reached.
+    """
+    today = now.date()
+    lookback = today - timedelta(days=2 * max(STREAK_MILESTONES))
+    day = _day_number_sql('start_time')
+    sql = f"""
+        WITH days AS (
+            SELECT DISTINCT user_id, {day} AS day_number
+            FROM {ExerciseSession._meta.db_table}
+            WHERE start_time >= %s
+        ),
+        runs AS (
+            SELECT user_id, day_number,
+                   day_number - ROW_NUMBER() OVER (
+                       PARTITION BY user_id ORDER BY day_number
+                   ) AS run_id
+            FROM days
+        )
+        SELECT user_id, MIN(day_number), COUNT(*)
+        FROM runs
+        GROUP BY user_id, run_id
+        HAVING MAX(day_number) >= %s
+    """
+    eligible = set(audience('streak_milestone').values_list('id', flat=True))
+    offset = _day_number(today) - today.toordinal()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [
+            connection.ops.adapt_datetimefield_value(
+                datetime.combine(lookback, time.min, tzinfo=dt_timezone.utc)
+            ),
+            _day_number(today) - GRACE_DAYS,
+        ])
+        runs = cursor.fetchall()
+
+    for user_id, first_day, length in runs:
+        if user_id not in eligible:
+            continue
+        first = date.fromordinal(first_day - offset)
+        reached = [
+            m for m in STREAK_MILESTONES
+            if m <= length and first + timedelta(days=m - 1) >= today - timedelta(days=GRACE_DAYS)
+        ]
+        if reached:
+            milestone = max(reached)
+            reached_on = first + timedelta(days=milestone - 1)
+            yield user_id, f'{reached_on:%Y-%m-%d}-{milestone}', {'days': milestone}
+
+
+def pregnancy_weeks(now):
+    """Users who have entered a new pregnancy week since their last notice"""
+    today = now.date()
+    rows = (
+        UserProfile.objects
+        .filter(
+            user__in=audience('pregnancy_week'),
+            lmp_date__lte=today - timedelta(days=7),
+            lmp_date__gt=today - timedelta(days=42 * 7),
+        )
+        .values_list('user_id', 'lmp_date')
+    )
+    for user_id, lmp_date in rows:
+        days_pregnant = (today - lmp_date).days
+        # Only the first GRACE_DAYS of a week count as crossing into it
+        if days_pregnant % 7 <= GRACE_DAYS:
+            week = days_pregnant // 7
+            yield user_id, f'week-{week}', {'week': week}
+
+
+def weekly_summaries(now):
+    """Users who exercised last ISO week; once per week"""
+    today = now.date()
+    week_start = today - timedelta(days=today.weekday() + 7)
+    start = datetime.combine(week_start, time.min, tzinfo=dt_timezone.utc)
+    end = start + timedelta(days=7)
+    year, week, _ = week_start.isocalendar()
+    in_week = Q(exercisesession__start_time__gte=start, exercisesession__start_time__lt=end)
+    rows = (
+        audience('weekly_summary')
+        .annotate(
+            sessions=Count('exercisesession', filter=in_week),
+            reps=Sum('exercisesession__rep_count', filter=in_week),
+        )
+        .filter(sessions__gt=0)
+        .values_list('id', 'sessions', 'reps')
+    )
+    for user_id, sessions, reps in rows:
+        yield user_id, f'{year}-W{week:02d}', {'sessions': sessions, 'reps': reps or 0}
+
+
+def rep_achievements(now):
+    """Users whose lifetime rep count has passed ACHIEVEMENT_REPS"""
+    rows = (
+        audience('achievement')
+        .annotate(reps=Sum('exercisesession__rep_count'))
+        .filter(reps__gte=ACHIEVEMENT_REPS)
+        .values_list('id', 'reps')
+    )
+    for user_id, reps in rows:
+        yield user_id, f'reps-{ACHIEVEMENT_REPS}', {'reps': reps}
+
+
+TRIGGERS = {
+    'inactive_user': inactive_users,
+    'streak_milestone': streak_milestones,
+    'pregnancy_week': pregnancy_weeks,
+    'weekly_summary': weekly_summaries,
+    'achievement': rep_achievements,
+}
+
+
+# =========================
+# Engine
+# =========================
+
+class EngagementEngine:
+    """
+    Runs every active trigger, skips users currently in quiet hours, then
+    drops deliveries already in the ledger and writes notifications and
+    ledger rows in bulk. Users in quiet hours are picked up by a later run.
+    The ledger is checked and written while holding a lock on the active
+    templates, so runs that overlap never send the same delivery twice.
+    """
+
+    def __init__(self, now=None, batch_size=None):
+        self.now = now or timezone.now()
+        self.batch_size = batch_size or settings.NOTIFICATION_BATCH_SIZE
+
+    def run(self):
+        """Evaluate all triggers; returns {trigger_type: notifications sent}"""
+        templates = {
+            t.trigger_type: t
+            for t in EngagementNotification.objects.filter(
+                is_active=True, trigger_type__in=TRIGGERS.keys()
+            )
+        }
+
+        pending = defaultdict(dict)
+        for trigger_type, template in templates.items():
+            for user_id, period_key, context in TRIGGERS[trigger_type](self.now):
+                pending[trigger_type][(user_id, period_key)] = context
+
+        quiet = self._users_in_quiet_hours({
+            user_id for candidates in pending.values() for user_id, _ in candidates
+        })
+
+        sends = defaultdict(dict)
+        for trigger_type, candidates in pending.items():
+            template = templates[trigger_type]
+            for (user_id, period_key), context in candidates.items():
+                if user_id in quiet:
+                    continue
+                context = _TemplateContext(context)
+                title = template.title.format_map(context)
+                message = template.message.format_map(context)
+                delivery = EngagementDelivery(user_id=user_id, trigger_type=trigger_type, period_key=period_key)
+                notification = Notification(
+                    user_id=user_id,
+                    notification_type=NOTIFICATION_TYPES[trigger_type],
+                    priority=template.priority,
+                    title=title,
+                    message=message,
+                    action_url=template.action_url or None
+                )
+                email = (user_id, title, message) if template.send_email else None
+                sends[trigger_type][(user_id, period_key)] = (delivery, notification, email)
+
+        with transaction.atomic():
+            # Overlapping runs queue on the template rows, then see each other's ledger rows
+            list(EngagementNotification.objects.select_for_update().filter(
+                pk__in=[t.pk for t in templates.values()]
+            ).values_list('pk', flat=True))
+            for trigger_type, candidates in sends.items():
+                self._drop_delivered(trigger_type, candidates)
+            sent = [send for candidates in sends.values() for send in candidates.values()]
+            EngagementDelivery.objects.bulk_create(
+                [delivery for delivery, _, _ in sent], batch_size=self.batch_size, ignore_conflicts=True
+            )
+            bulk_create_notifications([notification for _, notification, _ in sent], batch_size=self.batch_size)
+
+        self._send_emails([email for _, _, email in sent if email])
+
+        counts = defaultdict(int)
+        for delivery, _, _ in sent:
+            counts[delivery.trigger_type] += 1
+        logger.info(f"Engagement triggers sent: {dict(counts)}")
+        return dict(counts)
+
+    def _drop_delivered(self, trigger_type, candidates):
+        """Remove candidates whose (user, period) is already in the ledger"""
+        if not candidates:
+            return
+        keys = {period_key for _, period_key in candidates}
+        delivered = EngagementDelivery.objects.filter(
+            trigger_type=trigger_type, period_key__in=keys
+        ).values_list('user_id', 'period_key')
+        for pair in delivered.iterator(chunk_size=self.batch_size):
+            candidates.pop(pair, None)
+
+    def _users_in_quiet_hours(self, user_ids):
+        prefs = NotificationPreferences.objects.filter(
+            user_id__in=user_ids, quiet_hours_enabled=True
+        ).select_related('user__profile')
+        return {
+            p.user_id for p in prefs
+            if p.is_quiet_hours(at=self.now, tz=get_user_timezone(p.user))
+        }
+
+    def _send_emails(self, emails):
+        if not emails:
+            return
+        user_ids = {user_id for user_id, _, _ in emails}
+        opted_out = set(
+            NotificationPreferences.objects.filter(user_id__in=user_ids, enable_email=False)
+            .values_list('user_id', flat=True)
+        )
+        addresses = dict(
+            User.objects.filter(id__in=user_ids - opted_out).exclude(email='')
+            .values_list('id', 'email')
+        )
+        for user_id, title, message in emails:
+            if user_id in addresses:
+                send_email(addresses[user_id], title, message)
+
+
+def run_engagement_triggers(now=None, batch_size=None):
+    """Convenience wrapper used by the management command"""
+    return EngagementEngine(now=now, batch_size=batch_size).run()
@@ -0,0 +1,137 @@
+"""
+Notification Feed Helpers
+Cached unread counters and keyset (cursor) pagination for the notification feed
+"""
+import base64
+import binascii
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from exercise.models import Notification
+
+
+UNREAD_COUNT_KEY = 'notifications:unread:{user_id}'
+
+# Counters are kept exact by incr/decr on every mutation. The timeout only
+# bounds drift when the cache is per-process (LocMemCache) and several
+# workers mutate the same user's notifications.
+UNREAD_COUNT_TIMEOUT = 300
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """Raised when a feed cursor cannot be decoded"""
+
+
+# =========================
+# Unread counter
+# =========================
+
+def _unread_key(user_id):
+    return UNREAD_COUNT_KEY.format(user_id=user_id)
+
+
+def get_unread_count(user_id):
+    """Return the cached unread count, computing it once on a cache miss"""
+    key = _unread_key(user_id)
+    count = cache.get(key)
+    if count is None:
+        count = Notification.objects.filter(user_id=user_id, is_read=False).count()
+        # add() never overwrites a value written by a concurrent incr/decr
+        if not cache.add(key, count, UNREAD_COUNT_TIMEOUT):
+            count = cache.get(key, count)
+    return count
+
+
+def adjust_unread_count(user_id, delta):
+    """
+    Atomically add delta to a user's cached unread count once the current
+    transaction commits (at once outside a transaction), so a rollback
+    leaves the counter alone.
+    A missing counter is left missing; the next read recomputes it.
+    """
+    if delta:
+        transaction.on_commit(lambda: _incr_unread_count(user_id, delta))
+
+
+def _incr_unread_count(user_id, delta):
+    key = _unread_key(user_id)
+    try:
+        value = cache.incr(key, delta)
+    except ValueError:
+        return
+    if value < 0:
+        cache.delete(key)
+
+
+def reset_unread_count(user_id):
+    """Drop the cached counter so the next read recomputes it"""
+    cache.delete(_unread_key(user_id))
+
+
+# =========================
+# Keyset pagination
+# =========================
+
+def encode_cursor(notification):
+    """Encode a notification's (created_at, id) position as an opaque cursor"""
+    raw = f"{notification.created_at.isoformat()}|{notification.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Decode a cursor back into a (created_at, id) tuple"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, notification_id = raw.rsplit('|', 1)
+        created_at = parse_datetime(created_at)
+        notification_id = int(notification_id)
+    except (ValueError, UnicodeDecodeError, binascii.Error):
+        raise InvalidCursor(cursor)
+    if created_at is None:
+        raise InvalidCursor(cursor)
+    return created_at, notification_id
+
+
+def get_feed_page(user, cursor=None, since=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Fetch one page of a user's notifications, newest first.
+
+    Args:
+        user: User object
+        cursor: Return items strictly older than this cursor
+        since: Return only items strictly newer than this cursor; the page
+            holds the oldest of them, so a poll that repeats while has_more
+            is true sees every new item
+        page_size: Maximum number of items to return
+
+    Returns:
+        (notifications, has_more) tuple
+    """
+    notifications = Notification.objects.filter(user=user)
+
+    if cursor:
+        created_at, notification_id = decode_cursor(cursor)
+        notifications = notifications.filter(
+            Q(created_at__lt=created_at) |
+            Q(created_at=created_at, id__lt=notification_id)
+        )
+    if since:
+        created_at, notification_id = decode_cursor(since)
+        notifications = notifications.filter(
+            Q(created_at__gt=created_at) |
+            Q(created_at=created_at, id__gt=notification_id)
+        )
+
+    # Served by the (user, -created_at) index; fetch one extra row to
+    # learn whether another page exists without a COUNT
+    if since:
+        page = list(notifications.order_by('created_at', 'id')[:page_size + 1])
+        return page[:page_size][::-1], len(page) > page_size
+    page = list(notifications.order_by('-created_at', '-id')[:page_size + 1])
+    return page[:page_size], len(page) > page_size
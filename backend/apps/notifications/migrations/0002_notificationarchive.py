@@ -0,0 +1,31 @@
+# Generated by Django 5.1.1 on 2026-10-18 22:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.DateField(help_text='First day of the archived month')),
+                ('item_count', models.IntegerField(default=0)),
+                ('payload', models.BinaryField(help_text='zlib-compressed JSON list of notifications')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_archives', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-period'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'period'), name='unique_notification_archive_period')],
+            },
+        ),
+    ]
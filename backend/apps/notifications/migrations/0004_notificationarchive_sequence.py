@@ -0,0 +1,32 @@
+# Generated by Django 5.1.1 on 2026-10-19 01:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_engagementdelivery'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='notificationarchive',
+            options={'ordering': ['-period', 'sequence']},
+        ),
+        migrations.RemoveConstraint(
+            model_name='notificationarchive',
+            name='unique_notification_archive_period',
+        ),
+        migrations.AddField(
+            model_name='notificationarchive',
+            name='sequence',
+            field=models.PositiveIntegerField(default=0, help_text='Order of the batch within the month'),
+        ),
+        migrations.AddConstraint(
+            model_name='notificationarchive',
+            constraint=models.UniqueConstraint(fields=('user', 'period', 'sequence'), name='unique_notification_archive_batch'),
+        ),
+    ]
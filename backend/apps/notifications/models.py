@@ -1,4 +1,6 @@
 # Import email campaign models for migrations
 from .models_email import EmailCampaign, EmailLog
+from .models_archive import NotificationArchive
+from .models_engagement import EngagementDelivery
 
-__all__ = ['EmailCampaign', 'EmailLog']
+__all__ = ['EmailCampaign', 'EmailLog', 'NotificationArchive', 'EngagementDelivery']
@@ -0,0 +1,40 @@
+import json
+import zlib
+
+from django.db import models
+from django.contrib.auth.models import User
+
+
+class NotificationArchive(models.Model):
+    """
+    Compressed per-user, per-month store for notifications
+    moved out of the live Notification table by the retention job.
+    Each retention batch adds its own rows (sequence 0, 1, ...), so
+    archiving never rewrites what is already archived.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notification_archives')
+    period = models.DateField(help_text='First day of the archived month')
+    sequence = models.PositiveIntegerField(default=0, help_text='Order of the batch within the month')
+    item_count = models.IntegerField(default=0)
+    payload = models.BinaryField(help_text='zlib-compressed JSON list of notifications')
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['-period', 'sequence']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'period', 'sequence'], name='unique_notification_archive_batch'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.period:%Y-%m} #{self.sequence} ({self.item_count})"
+    
+    def get_items(self):
+        """Decode the archived notifications"""
+        if not self.payload:
+            return []
+        return json.loads(zlib.decompress(bytes(self.payload)))
+    
+    def set_items(self, items):
+        """Encode and store archived notifications"""
+        self.payload = zlib.compress(json.dumps(items, separators=(',', ':')).encode())
+        self.item_count = len(items)
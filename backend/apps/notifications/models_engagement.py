@@ -0,0 +1,26 @@
+from django.db import models
+from django.contrib.auth.models import User
+
+
+class EngagementDelivery(models.Model):
+    """
+    Ledger of engagement notifications already sent, one row per user,
+    trigger and period (e.g. pregnancy week 23, ISO week 2025-W10), so
+    each trigger fires once per period however often the engine runs
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='engagement_deliveries')
+    trigger_type = models.CharField(max_length=50)
+    period_key = models.CharField(max_length=50, help_text='What this delivery covers, e.g. week-23')
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['trigger_type', 'period_key', 'user'],
+                name='unique_engagement_delivery'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.trigger_type} ({self.period_key})"
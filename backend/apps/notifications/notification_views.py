@@ -7,39 +7,80 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from django.conf import settings
+from core.db_optimization import batched_update, batched_delete
 from exercise.models import Notification
 from apps.notifications.serializers import NotificationSerializer
+from apps.notifications.feed import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor,
+    get_unread_count, adjust_unread_count, reset_unread_count,
+    get_feed_page, encode_cursor
+)
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_notifications(request):
     """
-    Get user notifications with pagination
+    Get user notifications, newest first, with keyset pagination
     Query params:
-    - page: page number (default: 1)
-    - page_size: items per page (default: 10)
+    - cursor: next_cursor from a previous page (fetch older items)
+    - since: latest_cursor from a previous response (fetch only newer items;
+      repeat with the new latest_cursor while has_more is true)
+    - page_size: items per page (default: 10, max: 100)
+    - page: legacy offset pagination (page number, includes total)
     """
-    notifications = Notification.objects.filter(user=request.user)
-    unread_count = notifications.filter(is_read=False).count()
+    try:
+        page_size = int(request.GET.get('page_size', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        page_size = DEFAULT_PAGE_SIZE
+    page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
     
-    # Pagination
-    page = int(request.GET.get('page', 1))
-    page_size = int(request.GET.get('page_size', 10))
-    start = (page - 1) * page_size
-    end = start + page_size
+    unread_count = get_unread_count(request.user.id)
     
-    notifications_data = NotificationSerializer(
-        notifications[start:end], 
-        many=True
-    ).data
+    # Legacy OFFSET pagination, kept for older clients
+    if 'page' in request.GET:
+        notifications = Notification.objects.filter(user=request.user)
+        page = int(request.GET.get('page', 1))
+        start = (page - 1) * page_size
+        end = start + page_size
+        
+        notifications_data = NotificationSerializer(
+            notifications[start:end], 
+            many=True
+        ).data
+        
+        return Response({
+            'notifications': notifications_data,
+            'unread_count': unread_count,
+            'total': notifications.count(),
+            'page': page,
+            'page_size': page_size
+        })
+    
+    since = request.GET.get('since')
+    try:
+        notifications, has_more = get_feed_page(
+            request.user,
+            cursor=request.GET.get('cursor'),
+            since=since,
+            page_size=page_size
+        )
+    except InvalidCursor:
+        return Response(
+            {'error': 'Invalid cursor'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
     
     return Response({
-        'notifications': notifications_data,
+        'notifications': NotificationSerializer(notifications, many=True).data,
         'unread_count': unread_count,
-        'total': notifications.count(),
-        'page': page,
-        'page_size': page_size
+        'page_size': page_size,
+        'has_more': has_more,
+        # Older items; a since poll that has more continues through latest_cursor instead
+        'next_cursor': encode_cursor(notifications[-1]) if has_more and not since else None,
+        # Newest item seen; pass back as `since` to poll for new items only
+        'latest_cursor': encode_cursor(notifications[0]) if notifications else since
     })
 
 
@@ -47,29 +88,33 @@ def get_notifications(request):
 @permission_classes([IsAuthenticated])
 def mark_notification_read(request, notification_id):
     """Mark a specific notification as read"""
-    try:
-        notification = Notification.objects.get(
-            id=notification_id, 
-            user=request.user
-        )
-        notification.is_read = True
-        notification.save()
-        return Response({'message': 'Marked as read'})
-    except Notification.DoesNotExist:
+    # Conditional UPDATE so concurrent requests decrement the counter once
+    updated = Notification.objects.filter(
+        id=notification_id,
+        user=request.user,
+        is_read=False
+    ).update(is_read=True)
+    
+    if updated:
+        adjust_unread_count(request.user.id, -updated)
+    elif not Notification.objects.filter(id=notification_id, user=request.user).exists():
         return Response(
             {'error': 'Notification not found'}, 
             status=status.HTTP_404_NOT_FOUND
         )
+    return Response({'message': 'Marked as read'})
 
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def mark_all_notifications_read(request):
     """Mark all user notifications as read"""
-    count = Notification.objects.filter(
-        user=request.user, 
-        is_read=False
-    ).update(is_read=True)
+    count = batched_update(
+        Notification.objects.filter(user=request.user, is_read=False),
+        batch_size=settings.NOTIFICATION_BATCH_SIZE,
+        is_read=True
+    )
+    adjust_unread_count(request.user.id, -count)
     
     return Response({
         'message': f'{count} notifications marked as read',
@@ -86,7 +131,10 @@ def delete_notification(request, notification_id):
             id=notification_id, 
             user=request.user
         )
+        was_unread = not notification.is_read
         notification.delete()
+        if was_unread:
+            adjust_unread_count(request.user.id, -1)
         return Response({'message': 'Notification deleted'})
     except Notification.DoesNotExist:
         return Response(
@@ -99,7 +147,11 @@ def delete_notification(request, notification_id):
 @permission_classes([IsAuthenticated])
 def clear_all_notifications(request):
     """Delete all user notifications"""
-    count, _ = Notification.objects.filter(user=request.user).delete()
+    count = batched_delete(
+        Notification.objects.filter(user=request.user),
+        batch_size=settings.NOTIFICATION_BATCH_SIZE
+    )
+    reset_unread_count(request.user.id)
     return Response({
         'message': f'{count} notifications deleted',
         'count': count
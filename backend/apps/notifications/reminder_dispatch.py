@@ -0,0 +1,141 @@
+"""
+Custom Reminder Dispatcher
+Fires reminders whose precomputed next_fire_at has passed and moves each
+one on to its next slot in the owner's timezone
+"""
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+
+from exercise.models import CustomReminder, NotificationPreferences, Notification
+from apps.notifications.utils import bulk_create_notifications
+from core.email import send_email
+from apps.notifications.schedule import (
+    get_user_timezone, quiet_hours_end_after, reminder_next_fire_at
+)
+
+logger = logging.getLogger(__name__)
+
+TICK_SECONDS = 60
+
+
+def recompute_next_fire_times(user_ids=None, now=None, batch_size=1000):
+    """
+    Recompute next_fire_at for active reminders, e.g. after a user changes
+    timezone or the tz database changes a zone's DST rules.
+    Returns the number of reminders updated.
+    """
+    now = now or timezone.now()
+    reminders = CustomReminder.objects.filter(is_active=True).select_related('user__profile')
+    if user_ids is not None:
+        reminders = reminders.filter(user_id__in=user_ids)
+
+    updated = 0
+    batch = []
+    for reminder in reminders.iterator(chunk_size=batch_size):
+        reminder.next_fire_at = reminder_next_fire_at(reminder, now, get_user_timezone(reminder.user))
+        batch.append(reminder)
+        if len(batch) >= batch_size:
+            updated += CustomReminder.objects.bulk_update(batch, ['next_fire_at'])
+            batch = []
+    if batch:
+        updated += CustomReminder.objects.bulk_update(batch, ['next_fire_at'])
+    return updated
+
+
+class ReminderDispatcher:
+    """
+    Database-driven reminder scheduler.
+
+    next_fire_at is stored in UTC, so a tick is one indexed range query
+    (`is_active, next_fire_at <= now`) with no per-user timezone work.
+    Timezone and DST rules are applied only when a reminder's next slot is
+    computed: on save, after each send, and by recompute_next_fire_times().
+    Rows are locked with SKIP LOCKED where the database supports it, so
+    several dispatchers can run side by side.
+    """
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        self.stats = {'sent': 0, 'deferred': 0, 'skipped': 0}
+
+    def tick(self, now=None):
+        """Fire everything due up to now; returns the number of reminders sent"""
+        now = now or timezone.now()
+        sent = 0
+        while True:
+            with transaction.atomic():
+                due = list(
+                    CustomReminder.objects
+                    .filter(is_active=True, next_fire_at__lte=now)
+                    .select_related('user__profile')
+                    .select_for_update(skip_locked=True, of=('self',))
+                    .order_by('next_fire_at', 'id')[:self.batch_size]
+                )
+                if not due:
+                    break
+                batch_sent, emails = self._dispatch(due, now)
+            sent += batch_sent
+            self._send_emails(emails)
+            if len(due) < self.batch_size:
+                break
+        return sent
+
+    def _dispatch(self, reminders, now):
+        """
+        Write notifications and move every reminder past `now`.
+        Runs inside the caller's transaction; returns (sent, emails).
+        """
+        preferences = {
+            p.user_id: p for p in
+            NotificationPreferences.objects.filter(user_id__in={r.user_id for r in reminders})
+        }
+
+        to_send = []
+        for reminder in reminders:
+            tz = get_user_timezone(reminder.user)
+            prefs = preferences.get(reminder.user_id)
+
+            if prefs and not prefs.enable_reminders:
+                self.stats['skipped'] += 1
+                reminder.next_fire_at = reminder_next_fire_at(reminder, now, tz)
+            elif prefs and prefs.is_quiet_hours(at=now, tz=tz):
+                # Same slot, moved to just after the user's quiet hours end
+                self.stats['deferred'] += 1
+                reminder.next_fire_at = quiet_hours_end_after(prefs.quiet_hours_end, now, tz)
+            else:
+                reminder.last_sent = now
+                reminder.next_fire_at = reminder_next_fire_at(reminder, now, tz)
+                to_send.append((reminder, prefs))
+
+        # In-app notifications, last_sent and next_fire_at commit together,
+        # so a crash cannot record a send without its notification
+        bulk_create_notifications([
+            Notification(
+                user_id=reminder.user_id,
+                notification_type='exercise_reminder' if reminder.reminder_type == 'exercise' else 'system',
+                priority='medium',
+                title=reminder.title,
+                message=reminder.message,
+                action_url='/reminders'
+            )
+            for reminder, _ in to_send if reminder.send_notification
+        ], batch_size=self.batch_size)
+        CustomReminder.objects.bulk_update(
+            reminders, ['last_sent', 'next_fire_at'], batch_size=self.batch_size
+        )
+
+        emails = [
+            reminder for reminder, prefs in to_send
+            if reminder.send_email and reminder.user.email and (prefs is None or prefs.enable_email)
+        ]
+        self.stats['sent'] += len(to_send)
+        return len(to_send), emails
+
+    def _send_emails(self, reminders):
+        for reminder in reminders:
+            try:
+                send_email(reminder.user.email, reminder.title, reminder.message)
+            except Exception as e:
+                logger.warning(f"Reminder {reminder.id} email failed: {e}")
@@ -0,0 +1,102 @@
+"""
+Notification Retention
+Expire read notifications and archive old unread ones in bounded batches
+"""
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from core.db_optimization import batched_delete, iter_pk_batches
+from exercise.models import Notification
+from apps.notifications.models_archive import NotificationArchive
+from apps.notifications.feed import adjust_unread_count
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FIELDS = [
+    'id', 'user_id', 'notification_type', 'priority', 'title', 'message',
+    'is_read', 'created_at', 'action_url'
+]
+
+
+def expire_read_notifications(days=None, batch_size=None, now=None):
+    """
+    Delete read notifications older than `days`
+    Returns the number of rows deleted
+    """
+    days = days if days is not None else settings.NOTIFICATION_READ_RETENTION_DAYS
+    batch_size = batch_size or settings.NOTIFICATION_BATCH_SIZE
+    cutoff = (now or timezone.now()) - timedelta(days=days)
+
+    expired = Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+    return batched_delete(expired, batch_size=batch_size, label='Expire read notifications')
+
+
+def archive_notifications(days=None, batch_size=None, now=None):
+    """
+    Move notifications older than `days` into the per-user monthly archive
+    Returns the number of rows archived
+    """
+    days = days if days is not None else settings.NOTIFICATION_ARCHIVE_AFTER_DAYS
+    batch_size = batch_size or settings.NOTIFICATION_BATCH_SIZE
+    cutoff = (now or timezone.now()) - timedelta(days=days)
+
+    stale = Notification.objects.filter(created_at__lt=cutoff)
+    total = 0
+    for pks in iter_pk_batches(stale, batch_size):
+        total += _archive_batch(pks)
+        logger.info(f"Archive notifications: archived {total} rows")
+    return total
+
+
+def _archive_batch(pks):
+    """Archive one batch of notifications (one row per user and month) and remove them"""
+    rows = Notification.objects.filter(pk__in=pks).values(*ARCHIVE_FIELDS)
+
+    grouped = defaultdict(list)
+    unread = defaultdict(int)
+    for row in rows:
+        created_at = row['created_at']
+        grouped[(row['user_id'], created_at.date().replace(day=1))].append([
+            row['id'], row['notification_type'], row['priority'], row['title'],
+            row['message'], row['is_read'], created_at.isoformat(), row['action_url']
+        ])
+        if not row['is_read']:
+            unread[row['user_id']] += 1
+
+    with transaction.atomic():
+        # Each batch gets new archive rows, numbered after the month's last one
+        last = {
+            (row['user_id'], row['period']): row['last']
+            for row in NotificationArchive.objects.filter(
+                user_id__in={user_id for user_id, _ in grouped},
+                period__in={period for _, period in grouped},
+            ).values('user_id', 'period').annotate(last=Max('sequence')).order_by()
+        }
+        archives = []
+        for (user_id, period), items in grouped.items():
+            archive = NotificationArchive(
+                user_id=user_id, period=period, sequence=last.get((user_id, period), -1) + 1
+            )
+            archive.set_items(items)
+            archives.append(archive)
+        NotificationArchive.objects.bulk_create(archives)
+        Notification.objects.filter(pk__in=pks).delete()
+
+    for user_id, count in unread.items():
+        adjust_unread_count(user_id, -count)
+    return sum(len(items) for items in grouped.values())
+
+
+def run_retention(read_days=None, archive_days=None, batch_size=None):
+    """Expire read notifications, then archive what remains past the archive window"""
+    now = timezone.now()
+    expired = expire_read_notifications(read_days, batch_size, now=now)
+    archived = archive_notifications(archive_days, batch_size, now=now)
+    logger.info(f"Notification retention finished: {expired} expired, {archived} archived")
+    return {'expired': expired, 'archived': archived}
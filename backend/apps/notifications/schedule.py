@@ -0,0 +1,97 @@
+"""
+Reminder Schedule Rules
+Timezone-aware slot calculation for custom reminders and quiet hours.
+Kept free of model imports so models and migrations can use it.
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+
+UTC = dt_timezone.utc
+
+DEFAULT_TIMEZONE = 'UTC'
+
+# Longest gap between two slots of any frequency (monthly on the 31st)
+MAX_SCAN_DAYS = 400
+
+
+def get_zone(name):
+    """ZoneInfo for an IANA name, falling back to UTC for unknown names"""
+    try:
+        return ZoneInfo(name or DEFAULT_TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(DEFAULT_TIMEZONE)
+
+
+def validate_timezone_name(value):
+    """Model field validator for IANA timezone names"""
+    try:
+        ZoneInfo(value)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValidationError(f'Unknown timezone: {value}')
+
+
+def get_user_timezone(user):
+    """The user's profile timezone; users without a profile are treated as UTC"""
+    try:
+        return get_zone(user.profile.timezone)
+    except ObjectDoesNotExist:
+        return get_zone(DEFAULT_TIMEZONE)
+
+
+def local_slot(day, at, tz):
+    """
+    Aware datetime for wall-clock `at` on local `day`, normalised through UTC.
+    A time skipped by a DST jump resolves to the same offset past the jump
+    (02:30 on spring-forward day fires at 03:30); a repeated time fires on
+    its first occurrence.
+    """
+    return datetime.combine(day, at, tzinfo=tz).astimezone(UTC)
+
+
+def next_fire_time(frequency, scheduled_time, days_of_week, created_at, last_sent, after, tz=UTC):
+    """
+    Return the first slot strictly after `after` allowed by the reminder's
+    frequency rules, as a UTC datetime, or None if it will never fire again.
+    Slots are the reminder's scheduled_time on qualifying days of the
+    user's local calendar.
+    """
+    if frequency == 'once' and last_sent:
+        return None
+    if frequency == 'weekly' and not days_of_week:
+        return None
+
+    day = after.astimezone(tz).date()
+    anchor_day = created_at.astimezone(tz).day if created_at else None
+    # Start a day early: a slot on the previous local date can still be
+    # in the future when the offset crosses midnight
+    for offset in range(-1, MAX_SCAN_DAYS):
+        current = day + timedelta(days=offset)
+        candidate = local_slot(current, scheduled_time, tz)
+        if candidate <= after:
+            continue
+        if frequency in ('once', 'daily'):
+            return candidate
+        if frequency == 'weekly' and current.weekday() in days_of_week:
+            return candidate
+        if frequency == 'monthly' and current.day == anchor_day:
+            return candidate
+    return None
+
+
+def quiet_hours_end_after(end, after, tz=UTC):
+    """First UTC moment after `after` once local quiet hours ending at `end` are over"""
+    resume_at = next_fire_time('daily', end, [], None, None, after, tz)
+    # is_quiet_hours() treats the end minute as quiet
+    return resume_at + timedelta(minutes=1)
+
+
+def reminder_next_fire_at(reminder, after, tz):
+    """Next UTC slot for a CustomReminder (or any object with its fields)"""
+    if reminder.last_sent:
+        after = max(after, reminder.last_sent)
+    return next_fire_time(
+        reminder.frequency, reminder.scheduled_time, reminder.days_of_week,
+        reminder.created_at, reminder.last_sent, after, tz
+    )
@@ -26,9 +26,9 @@ class CustomReminderSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'reminder_type', 'title', 'message', 'scheduled_time',
             'frequency', 'days_of_week', 'is_active', 'send_email',
-            'send_notification', 'last_sent', 'created_at', 'updated_at'
+            'send_notification', 'last_sent', 'next_fire_at', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'last_sent', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'last_sent', 'next_fire_at', 'created_at', 'updated_at']
 
 
 class EngagementNotificationSerializer(serializers.ModelSerializer):
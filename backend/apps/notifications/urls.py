@@ -1,7 +1,28 @@
 # Notifications app URLs
-# Will be populated when updating notification views imports
 from django.urls import path
+from core.lazy_views import lazy_view
 
 urlpatterns = [
-    # Notification and reminder endpoints will be added here
+    # Notification Endpoints
+    path('notifications/', lazy_view('apps.notifications.notification_views.get_notifications'), name='get-notifications'),
+    path('notifications/<int:notification_id>/read/', lazy_view('apps.notifications.notification_views.mark_notification_read'), name='mark-notification-read'),
+    path('notifications/mark-all-read/', lazy_view('apps.notifications.notification_views.mark_all_notifications_read'), name='mark-all-notifications-read'),
+    path('notifications/<int:notification_id>/delete/', lazy_view('apps.notifications.notification_views.delete_notification'), name='delete-notification'),
+    path('notifications/clear-all/', lazy_view('apps.notifications.notification_views.clear_all_notifications'), name='clear-all-notifications'),
+
+    # Custom Reminder Endpoints
+    path('reminders/', lazy_view('apps.notifications.reminder_views.reminder_list_create'), name='reminder-list-create'),
+    path('reminders/<int:reminder_id>/', lazy_view('apps.notifications.reminder_views.reminder_detail'), name='reminder-detail'),
+    path('reminders/<int:reminder_id>/toggle/', lazy_view('apps.notifications.reminder_views.reminder_toggle'), name='reminder-toggle'),
+
+    # Notification Preferences
+    path('notification-preferences/', lazy_view('apps.notifications.reminder_views.notification_preferences'), name='notification-preferences'),
+
+    # Engagement Notifications
+    path('engagement-notifications/', lazy_view('apps.notifications.reminder_views.engagement_notification_list'), name='engagement-notification-list'),
+
+    # Email Campaign Endpoints (Admin only)
+    path('admin/campaigns/', lazy_view('apps.notifications.campaign_views.manage_campaigns'), name='manage-campaigns'),
+    path('admin/campaigns/<int:campaign_id>/', lazy_view('apps.notifications.campaign_views.manage_campaign_detail'), name='manage-campaign-detail'),
+    path('admin/campaigns/<int:campaign_id>/send/', lazy_view('apps.notifications.campaign_views.send_campaign'), name='send-campaign'),
 ]
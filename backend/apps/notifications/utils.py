@@ -3,7 +3,9 @@ Notification Utility Functions
 Helper functions to create and send notifications
 """
 
-from .models import Notification
+from collections import Counter
+from exercise.models import Notification
+from apps.notifications.feed import adjust_unread_count
 from .email_utils import (
     send_welcome_email,
     send_exercise_completion_email,
@@ -36,10 +38,32 @@ def create_notification(user, notification_type, title, message, priority='mediu
         priority=priority,
         action_url=action_url
     )
+    adjust_unread_count(user.id, 1)
     
     return notification
 
 
+def bulk_create_notifications(notifications, batch_size=1000):
+    """
+    Insert many in-app notifications at once
+    
+    Args:
+        notifications: Unsaved Notification objects
+        batch_size: Rows per INSERT statement
+    
+    Returns:
+        List of created Notification objects
+    """
+    created = Notification.objects.bulk_create(notifications, batch_size=batch_size)
+    
+    # One counter update per recipient rather than per row
+    unread = Counter(n.user_id for n in created if not n.is_read)
+    for user_id, count in unread.items():
+        adjust_unread_count(user_id, count)
+    
+    return created
+
+
 def notify_welcome(user):
     """Send welcome notification and email"""
     create_notification(
@@ -14,6 +14,9 @@ class NutritionCategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'icon', 'description', 'order', 'food_count']
     
     def get_food_count(self, obj):
+        # Annotated by list views to avoid one COUNT per category
+        if hasattr(obj, 'recommended_food_count'):
+            return obj.recommended_food_count
         return obj.foods.filter(is_recommended=True).count()
 
 
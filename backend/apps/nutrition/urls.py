@@ -1,7 +1,17 @@
 # Nutrition app URLs
-# Will be populated when updating nutrition views imports
 from django.urls import path
+from core.lazy_views import lazy_view
 
 urlpatterns = [
-    # Nutrition endpoints will be added here
+    # Nutrition Guide
+    path('nutrition/categories/', lazy_view('apps.nutrition.views.nutrition_categories'), name='nutrition-categories'),
+    path('nutrition/foods/', lazy_view('apps.nutrition.views.nutrition_foods'), name='nutrition-foods'),
+    path('nutrition/foods/<int:food_id>/', lazy_view('apps.nutrition.views.nutrition_food_detail'), name='nutrition-food-detail'),
+    path('nutrition/tips/', lazy_view('apps.nutrition.views.nutrition_tips'), name='nutrition-tips'),
+    path('nutrition/recommended/', lazy_view('apps.nutrition.views.nutrition_recommended'), name='nutrition-recommended'),
+    path('nutrition/avoid/', lazy_view('apps.nutrition.views.nutrition_avoid'), name='nutrition-avoid'),
+
+    # CMS Endpoints (Admin only)
+    path('admin/cms/nutrition/foods/', lazy_view('apps.nutrition.cms_views.create_nutrition_food'), name='cms-create-food'),
+    path('admin/cms/nutrition/foods/<int:food_id>/', lazy_view('apps.nutrition.cms_views.manage_nutrition_food'), name='cms-manage-food'),
 ]
@@ -6,6 +6,7 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from django.db.models import Count, Q
 from exercise.models import NutritionCategory, NutritionFood, NutritionTip
 from apps.nutrition.serializers import NutritionCategorySerializer, NutritionFoodSerializer, NutritionTipSerializer
 
@@ -14,7 +15,9 @@ from apps.nutrition.serializers import NutritionCategorySerializer, NutritionFoo
 @permission_classes([IsAuthenticated])
 def nutrition_categories(request):
     """Get all nutrition categories"""
-    categories = NutritionCategory.objects.all()
+    categories = NutritionCategory.objects.annotate(
+        recommended_food_count=Count('foods', filter=Q(foods__is_recommended=True))
+    )
     serializer = NutritionCategorySerializer(categories, many=True)
     return Response(serializer.data)
 
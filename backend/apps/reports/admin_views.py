@@ -8,10 +8,13 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.contrib.auth.models import User
 from exercise.models import ExerciseSession, ActivityData, UserProfile
+from apps.users.directory import annotated_users, get_directory_page, InvalidQuery, USER_FIELDS
+from core.db_router import read_replica
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_replica
 def admin_analytics(request):
     """System-wide analytics for administrators only"""
     # Check if user is admin
@@ -63,6 +66,7 @@ def admin_analytics(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_replica
 def user_list(request):
     """List all users with their activity stats (admin only)"""
     # Check if user is admin
@@ -73,35 +77,64 @@ def user_list(request):
     except UserProfile.DoesNotExist:
         return Response({'error': 'User profile not found'}, status=404)
     
-    users = User.objects.all().values(
-        'id', 'username', 'email', 'date_joined', 'last_login'
-    )
+    # Role and activity counts are annotated, so this is a single query
+    users = annotated_users().order_by('id').values(*USER_FIELDS)
     
-    # Add activity stats for each user
-    user_data = []
-    for user in users:
-        sessions_count = ExerciseSession.objects.filter(user_id=user['id']).count()
-        activities_count = ActivityData.objects.filter(user_id=user['id']).count()
-        
-        # Get user role
-        try:
-            user_profile = UserProfile.objects.get(user_id=user['id'])
-            role = user_profile.role
-        except UserProfile.DoesNotExist:
-            role = 'patient'  # Default role
-        
-        user_data.append({
-            **user,
-            'role': role,
-            'exercise_sessions': sessions_count,
-            'activity_records': activities_count
-        })
+    user_data = [
+        {
+            'id': user['id'],
+            'username': user['username'],
+            'email': user['email'],
+            'date_joined': user['date_joined'],
+            'last_login': user['last_login'],
+            'role': user['role'],
+            'exercise_sessions': user['exercise_sessions'],
+            'activity_records': user['activity_records']
+        }
+        for user in users
+    ]
     
     return Response(user_data)
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_replica
+def user_directory(request):
+    """
+    Paginated, filterable user directory (admin only)
+    
+    Query params:
+        q, role, active_within, inactive_for, trimester: filters
+        sort: id, username, date_joined, last_login, last_session,
+              exercise_sessions, activity_records or total_reps; '-' for descending
+        cursor: next_cursor from the previous page
+        page_size: default 25, max 100
+    """
+    # Check if user is admin
+    try:
+        profile = UserProfile.objects.get(user=request.user)
+        if profile.role != 'admin':
+            return Response({'error': 'Admin access required'}, status=403)
+    except UserProfile.DoesNotExist:
+        return Response({'error': 'User profile not found'}, status=404)
+    
+    try:
+        users, next_cursor = get_directory_page(request.query_params)
+    except InvalidQuery as e:
+        return Response({'error': str(e)}, status=400)
+    
+    return Response({
+        'users': users,
+        'page_size': len(users),
+        'has_more': next_cursor is not None,
+        'next_cursor': next_cursor
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@read_replica
 def user_growth_data(request):
     """Get user registration growth over time (admin only)"""
     # Check if user is admin
@@ -130,6 +163,7 @@ def user_growth_data(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_replica
 def activity_trends(request):
     """Get activity trends over time (admin only)"""
     # Check if user is admin
@@ -181,7 +215,7 @@ def delete_user(request, user_id):
     # Store username for response
     username = user_to_delete.username
     
-    # Log the deletion
+    # Log the request; the job logs the deletion again with row counts when it finishes
     from core.audit import log_action
     log_action(
         user=request.user,
@@ -189,15 +223,18 @@ def delete_user(request, user_id):
         model_name='User',
         object_id=user_id,
         object_repr=username,
-        request=request
+        request=request,
+        sync=True
     )
     
-    # Delete user (cascade will delete related data)
-    user_to_delete.delete()
+    # Deactivate now; related data is deleted in bounded batches by a background job
+    from apps.reports.user_deletion import request_deletion
+    job = request_deletion(user_to_delete, request.user)
     
     return Response({
-        'message': f'User "{username}" and all related data deleted successfully',
-        'deleted_user_id': user_id
+        'message': f'User "{username}" deactivated; their data is being deleted',
+        'deleted_user_id': user_id,
+        'job_id': job.id
     })
 
 
@@ -248,7 +285,8 @@ def change_user_role(request, user_id):
         object_id=user_profile.id,
         object_repr=f"{user.username}",
         changes={'old': {'role': old_role}, 'new': {'role': new_role}},
-        request=request
+        request=request,
+        sync=True
     )
     
     return Response({
@@ -7,14 +7,16 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.contrib.auth.models import User
 from django.utils import timezone
-from django.db.models import Count, Avg, Q
+from django.db.models import Count, Avg, F, Q
 from datetime import timedelta
 
 from exercise.models import UserProfile, ExerciseSession, ActivityData, HealthVitals, Notification
+from core.db_router import read_replica
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_replica
 def retention_metrics(request):
     """
     Calculate user retention metrics
@@ -40,8 +42,8 @@ def retention_metrics(request):
     
     # Day 1 Retention: Users who logged in within 24 hours of registration
     day_1_retained = recent_users.filter(
-        last_login__gte=models.F('date_joined'),
-        last_login__lte=models.F('date_joined') + timedelta(days=1)
+        last_login__gte=F('date_joined'),
+        last_login__lte=F('date_joined') + timedelta(days=1)
     ).count()
     
     # Day 7 Retention: Users who logged in within 7 days
@@ -52,7 +54,7 @@ def retention_metrics(request):
         profile__role='patient'
     )
     day_7_retained = users_7_days_old.filter(
-        last_login__gte=models.F('date_joined') + timedelta(days=7)
+        last_login__gte=F('date_joined') + timedelta(days=7)
     ).count()
     
     # Day 30 Retention
@@ -96,6 +98,7 @@ def retention_metrics(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_replica
 def feature_adoption(request):
     """
     Track adoption rates of different features
@@ -125,12 +128,12 @@ def feature_adoption(request):
     
     # Health monitoring adoption
     users_with_vitals = User.objects.filter(
-        healthvitals__isnull=False
+        health_vitals__isnull=False
     ).distinct().count()
     
     # Notification engagement
     users_with_notifications = User.objects.filter(
-        notification__isnull=False
+        notifications__isnull=False
     ).distinct().count()
     
     # Average sessions per user
@@ -172,6 +175,7 @@ def feature_adoption(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_replica
 def engagement_metrics(request):
     """
     Detailed engagement metrics
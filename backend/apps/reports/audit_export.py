@@ -0,0 +1,227 @@
+"""
+Audit Log Export
+Filtered, keyset-paged access to AuditLog over (timestamp, id): cursor
+pages for the audit API, and chunked iteration with streaming CSV /
+NDJSON encoders (optional gzip) for StreamingHttpResponse
+"""
+import base64
+import binascii
+import csv
+import json
+import zlib
+from datetime import datetime, time, timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from apps.reports.models import AuditLog
+
+
+EXPORT_CHUNK_SIZE = 2000
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+EXPORT_FIELDS = [
+    'id', 'timestamp', 'user_id', 'user__username', 'action', 'model_name',
+    'object_id', 'object_repr', 'changes', 'ip_address', 'user_agent',
+]
+
+CSV_HEADER = [
+    'id', 'timestamp', 'user_id', 'username', 'action', 'model_name',
+    'object_id', 'object_repr', 'changes', 'ip_address', 'user_agent',
+]
+
+
+class InvalidFilter(ValueError):
+    """Raised for a malformed export filter"""
+
+
+def _parse_bound(value, end=False):
+    """A date (whole day, inclusive) or an ISO datetime"""
+    try:
+        day = parse_date(value)
+    except ValueError:
+        day = None
+    if day is not None:
+        if end:
+            day += timedelta(days=1)
+        return timezone.make_aware(datetime.combine(day, time.min))
+    moment = parse_datetime(value)
+    if moment is None:
+        raise InvalidFilter(f'Invalid date: {value}')
+    return moment if timezone.is_aware(moment) else timezone.make_aware(moment)
+
+
+def _is_date(value):
+    try:
+        return parse_date(value) is not None
+    except ValueError:
+        return False
+
+
+def filter_audit_logs(params):
+    """
+    Apply audit log filters:
+        start, end  date (YYYY-MM-DD, inclusive) or ISO datetime
+        user        user ID
+        action      action type
+        model       model name
+    """
+    logs = AuditLog.objects.all()
+    try:
+        start = _parse_bound(params['start']) if params.get('start') else None
+        end = _parse_bound(params['end'], end=True) if params.get('end') else None
+    except ValueError as e:
+        raise InvalidFilter(str(e))
+    # A date end already points at the next midnight; a datetime end is inclusive
+    logs = logs.between(start, end, end_inclusive=end is not None and not _is_date(params['end']))
+    if params.get('user'):
+        try:
+            logs = logs.filter(user_id=int(params['user']))
+        except ValueError:
+            raise InvalidFilter('user must be an integer')
+    if params.get('action'):
+        logs = logs.filter(action=params['action'])
+    if params.get('model'):
+        logs = logs.filter(model_name=params['model'])
+    return logs
+
+
+def iter_audit_chunks(queryset, chunk_size=None):
+    """
+    Yield lists of row dicts in (timestamp, id) order.
+    Each chunk is a separate LIMIT query resuming after the last row seen,
+    so memory use is bounded by chunk_size however large the export.
+    """
+    chunk_size = chunk_size or EXPORT_CHUNK_SIZE
+    queryset = queryset.order_by('timestamp', 'id').values(*EXPORT_FIELDS)
+    last = None
+    while True:
+        page = queryset
+        if last is not None:
+            page = page.between(start=last[0]).filter(
+                Q(timestamp__gt=last[0]) | Q(timestamp=last[0], id__gt=last[1])
+            )
+        rows = list(page[:chunk_size])
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_size:
+            return
+        last = (rows[-1]['timestamp'], rows[-1]['id'])
+
+
+def encode_cursor(timestamp, log_id):
+    raw = json.dumps([timestamp.isoformat(), log_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        timestamp, log_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        timestamp = parse_datetime(timestamp)
+        log_id = int(log_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidFilter('Invalid cursor')
+    if timestamp is None:
+        raise InvalidFilter('Invalid cursor')
+    return timestamp, log_id
+
+
+def get_audit_page(params):
+    """
+    One page of filtered logs, newest first: (logs, next_cursor).
+    The cursor is the last (timestamp, id) seen; it also bounds the months
+    scanned, so a deep page reads only the partitions at or before it.
+    """
+    try:
+        limit = min(int(params.get('limit', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+    except (TypeError, ValueError):
+        raise InvalidFilter('limit must be an integer')
+    if limit < 1:
+        raise InvalidFilter('limit must be positive')
+
+    logs = filter_audit_logs(params).select_related('user')
+    cursor = params.get('cursor')
+    if cursor:
+        timestamp, log_id = decode_cursor(cursor)
+        logs = logs.between(end=timestamp, end_inclusive=True).filter(
+            Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=log_id)
+        )
+
+    page = list(logs.order_by('-timestamp', '-id')[:limit + 1])
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = encode_cursor(page[-1].timestamp, page[-1].id)
+    return page, next_cursor
+
+
+class _LineBuffer:
+    """File-like object for csv.writer that keeps what was written"""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, value):
+        self.parts.append(value)
+
+    def take(self):
+        data, self.parts = ''.join(self.parts), []
+        return data
+
+
+def encode_csv(chunks):
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    yield buffer.take()
+    for rows in chunks:
+        for row in rows:
+            writer.writerow([
+                row['id'], row['timestamp'].isoformat(), row['user_id'] or '',
+                row['user__username'] or '', row['action'], row['model_name'],
+                row['object_id'] if row['object_id'] is not None else '',
+                row['object_repr'], json.dumps(row['changes'], cls=DjangoJSONEncoder),
+                row['ip_address'] or '', row['user_agent'],
+            ])
+        yield buffer.take()
+
+
+def encode_ndjson(chunks):
+    for rows in chunks:
+        yield ''.join(
+            json.dumps({
+                'id': row['id'],
+                'timestamp': row['timestamp'],
+                'user_id': row['user_id'],
+                'username': row['user__username'],
+                'action': row['action'],
+                'model_name': row['model_name'],
+                'object_id': row['object_id'],
+                'object_repr': row['object_repr'],
+                'changes': row['changes'],
+                'ip_address': row['ip_address'],
+                'user_agent': row['user_agent'],
+            }, cls=DjangoJSONEncoder) + '\n'
+            for row in rows
+        )
+
+
+def gzip_stream(parts):
+    """Incrementally gzip an iterator of strings"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # 31: gzip container
+    for part in parts:
+        data = compressor.compress(part.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+EXPORT_FORMATS = {
+    # format: (encoder, content type, file extension)
+    'csv': (encode_csv, 'text/csv', 'csv'),
+    'ndjson': (encode_ndjson, 'application/x-ndjson', 'ndjson'),
+}
@@ -2,24 +2,34 @@
 Audit Logs API View
 View audit trail of admin actions
 """
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from exercise.models import UserProfile
-from apps.reports.models import AuditLog
 from apps.reports.serializers import AuditLogSerializer
+from apps.reports.audit_export import (
+    EXPORT_FORMATS, InvalidFilter, filter_audit_logs, get_audit_page, gzip_stream,
+    iter_audit_chunks
+)
+from core.audit import log_action
+from core.db_router import read_replica
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_replica
 def audit_logs(request):
     """
-    Get audit logs (admin only)
+    Get audit logs (admin only), newest first, cursor-paginated
     Query params:
     - action: filter by action type
     - user: filter by user ID
     - model: filter by model name
-    - limit: number of records (default: 100, max: 500)
+    - start, end: date (YYYY-MM-DD, inclusive) or ISO datetime
+    - limit: page size (default: 100, max: 500)
+    - cursor: next_cursor from the previous page
     """
     # Check if user is admin
     try:
@@ -29,28 +39,67 @@ def audit_logs(request):
     except UserProfile.DoesNotExist:
         return Response({'error': 'User profile not found'}, status=404)
     
-    # Get logs
-    logs = AuditLog.objects.select_related('user').all()
-    
-    # Apply filters
-    action = request.query_params.get('action')
-    user_id = request.query_params.get('user')
-    model_name = request.query_params.get('model')
-    
-    if action:
-        logs = logs.filter(action=action)
-    if user_id:
-        logs = logs.filter(user_id=user_id)
-    if model_name:
-        logs = logs.filter(model_name=model_name)
-    
-    # Limit results
-    limit = min(int(request.query_params.get('limit', 100)), 500)
-    logs = logs[:limit]
+    try:
+        logs, next_cursor = get_audit_page(request.query_params)
+    except InvalidFilter as e:
+        return Response({'error': str(e)}, status=400)
     
     serializer = AuditLogSerializer(logs, many=True)
     
     return Response({
         'count': len(serializer.data),
-        'logs': serializer.data
+        'logs': serializer.data,
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None
     })
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_audit_logs(request):
+    """
+    Stream audit logs as a file download (admin only)
+    Query params:
+    - export_format: csv (default) or ndjson
+    - gzip: 1 to gzip the stream
+    - start, end: date (YYYY-MM-DD, inclusive) or ISO datetime
+    - action, user, model: same filters as the audit log list
+    """
+    # Check if user is admin
+    try:
+        profile = UserProfile.objects.get(user=request.user)
+        if profile.role != 'admin':
+            return Response({'error': 'Admin access required'}, status=403)
+    except UserProfile.DoesNotExist:
+        return Response({'error': 'User profile not found'}, status=404)
+    
+    export_format = request.query_params.get('export_format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return Response({'error': 'export_format must be csv or ndjson'}, status=400)
+    
+    try:
+        logs = filter_audit_logs(request.query_params)
+    except InvalidFilter as e:
+        return Response({'error': str(e)}, status=400)
+    
+    # Exports of the audit trail are themselves audited, before streaming starts
+    log_action(
+        user=request.user,
+        action='export',
+        model_name='AuditLog',
+        object_repr=request.query_params.urlencode()[:200],
+        request=request,
+        sync=True
+    )
+    
+    encode, content_type, extension = EXPORT_FORMATS[export_format]
+    stream = encode(iter_audit_chunks(logs))
+    filename = f"audit-logs-{timezone.now():%Y%m%d-%H%M%S}.{extension}"
+    if request.query_params.get('gzip') in ('1', 'true'):
+        stream = gzip_stream(stream)
+        content_type = 'application/gzip'
+        filename += '.gz'
+    
+    response = StreamingHttpResponse(stream, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
@@ -0,0 +1,190 @@
+"""
+User Data Export
+Everything stored about one user, for data access requests: a ZIP with
+one NDJSON file per table and a manifest of row counts. Written by a
+background job (core/jobs.py, kind 'user_export') to DATA_EXPORT_DIR and
+downloaded through the export's token until it expires.
+
+Rows are read with QuerySet.iterator(), which uses a server-side cursor on
+PostgreSQL, and written into the archive entry a chunk at a time, so
+memory use does not grow with the size of the user's history.
+"""
+import json
+import logging
+import os
+import secrets
+import zipfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.exercises.models import SessionTelemetry
+from apps.notifications.models import EmailLog, EngagementDelivery, NotificationArchive
+from apps.reports.models import AuditLog, DataExport
+from core.jobs import enqueue
+from exercise.models import (
+    ActivityData, ActivityUpload, CustomReminder, ExerciseSession, HealthVitals, Notification,
+    NotificationPreferences, PregnancyProfile, UserProfile,
+)
+
+logger = logging.getLogger(__name__)
+
+EXPORT_TABLES = [
+    # (file name, model, user lookup)
+    ('account.ndjson', User, 'id'),
+    ('profile.ndjson', UserProfile, 'user'),
+    ('pregnancy_profile.ndjson', PregnancyProfile, 'user'),
+    ('exercise_sessions.ndjson', ExerciseSession, 'user'),
+    ('activity_uploads.ndjson', ActivityUpload, 'user'),
+    ('activity_data.ndjson', ActivityData, 'user'),
+    ('health_vitals.ndjson', HealthVitals, 'user'),
+    ('notifications.ndjson', Notification, 'user'),
+    ('notification_archive.ndjson', NotificationArchive, 'user'),
+    ('notification_preferences.ndjson', NotificationPreferences, 'user'),
+    ('reminders.ndjson', CustomReminder, 'user'),
+    ('engagement_deliveries.ndjson', EngagementDelivery, 'user'),
+    ('emails.ndjson', EmailLog, 'recipient'),
+]
+
+# Never exported
+EXCLUDED_FIELDS = {'password'}
+
+
+def _table_rows(model, lookup, user, chunk_size):
+    fields = [field.attname for field in model._meta.concrete_fields if field.attname not in EXCLUDED_FIELDS]
+    queryset = model.objects.filter(**{lookup: user.id}).order_by('pk').values(*fields)
+    return queryset.iterator(chunk_size=chunk_size)
+
+
+def _audit_rows(user, chunk_size):
+    """Audit entries the user made, and those about their account"""
+    fields = [field.attname for field in AuditLog._meta.concrete_fields]
+    queryset = (
+        AuditLog.objects
+        .filter(Q(user_id=user.id) | Q(model_name__in=('User', 'UserProfile'), object_id=user.id))
+        .order_by('timestamp', 'id')
+        .values(*fields)
+    )
+    return queryset.iterator(chunk_size=chunk_size)
+
+
+def _telemetry_rows(user):
+    """One row per recorded frame; sessions are decoded one at a time"""
+    from apps.exercises.telemetry import decode, issue_names
+
+    telemetry = SessionTelemetry.objects.filter(session__user_id=user.id).order_by('session_id')
+    for session_id, blob in telemetry.values_list('session_id', 'data').iterator(chunk_size=10):
+        arrays = decode(blob)
+        for frame in range(len(arrays['t_ms'])):
+            velocity = float(arrays['velocity'][frame])
+            yield {
+                'session_id': session_id,
+                't_ms': int(arrays['t_ms'][frame]),
+                'rep': int(arrays['rep'][frame]),
+                'score': round(float(arrays['score'][frame]), 1),
+                'velocity': None if velocity != velocity else round(velocity, 1),
+                'issues': issue_names(arrays['issues'][frame]),
+                'angles': [round(float(angle), 1) for angle in arrays['angles'][frame]],
+            }
+
+
+def export_tables(user, chunk_size=None):
+    """(file name, row iterator) for every table holding the user's data"""
+    chunk_size = chunk_size or settings.DATA_EXPORT_CHUNK_SIZE
+    for name, model, lookup in EXPORT_TABLES:
+        yield name, _table_rows(model, lookup, user, chunk_size)
+    yield 'session_telemetry.ndjson', _telemetry_rows(user)
+    yield 'audit_log.ndjson', _audit_rows(user, chunk_size)
+
+
+def write_export(user, path, chunk_size=None):
+    """Write the user's export ZIP to path; returns {file name: row count}"""
+    chunk_size = chunk_size or settings.DATA_EXPORT_CHUNK_SIZE
+    counts = {}
+    partial = f'{path}.part'
+    with zipfile.ZipFile(partial, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, rows in export_tables(user, chunk_size):
+            count = 0
+            lines = []
+            with archive.open(name, 'w', force_zip64=True) as entry:
+                for row in rows:
+                    lines.append(json.dumps(row, cls=DjangoJSONEncoder))
+                    count += 1
+                    if len(lines) >= chunk_size:
+                        entry.write(('\n'.join(lines) + '\n').encode())
+                        lines = []
+                if lines:
+                    entry.write(('\n'.join(lines) + '\n').encode())
+            counts[name] = count
+        archive.writestr('manifest.json', json.dumps({
+            'user_id': user.id,
+            'username': user.username,
+            'generated_at': timezone.now().isoformat(),
+            'files': counts,
+        }, indent=2))
+    # Only a complete archive is ever visible under the final name
+    os.replace(partial, path)
+    return counts
+
+
+# =========================
+# Requests and the job
+# =========================
+
+def request_export(user, requested_by):
+    """The user's export in progress, or a new one queued for the job worker"""
+    in_progress = DataExport.objects.filter(
+        user=user, completed_at__isnull=True, job__status__in=('pending', 'running')
+    ).first()
+    if in_progress:
+        return in_progress
+    export = DataExport.objects.create(user=user, requested_by=requested_by, token=secrets.token_urlsafe(32))
+    export.job = enqueue('user_export', {'export_id': export.id}, created_by=requested_by)
+    export.save(update_fields=['job'])
+    return export
+
+
+def run_export(job):
+    """Job handler: write the archive and open its download window"""
+    export = DataExport.objects.select_related('user').filter(id=job.payload['export_id']).first()
+    if export is None:
+        # The user (and with them the export) was deleted before the job ran
+        return {'skipped': 'export no longer exists'}
+
+    os.makedirs(settings.DATA_EXPORT_DIR, exist_ok=True)
+    path = os.path.join(settings.DATA_EXPORT_DIR, f'user-{export.user_id}-export-{export.id}.zip')
+    counts = write_export(export.user, path)
+
+    now = timezone.now()
+    export.file_path = path
+    export.size = os.path.getsize(path)
+    export.row_counts = counts
+    export.completed_at = now
+    export.expires_at = now + timedelta(hours=settings.DATA_EXPORT_TTL_HOURS)
+    export.save(update_fields=['file_path', 'size', 'row_counts', 'completed_at', 'expires_at'])
+
+    purge_expired_exports(now)
+    return {'export_id': export.id, 'rows': sum(counts.values()), 'size': export.size}
+
+
+def purge_expired_exports(now=None):
+    """Delete the files of expired exports (the rows stay as a record); returns how many"""
+    now = now or timezone.now()
+    expired = DataExport.objects.filter(expires_at__lt=now).exclude(file_path='')
+    purged = 0
+    for export in expired:
+        try:
+            os.remove(export.file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Could not delete expired export {export.file_path}: {e}")
+            continue
+        export.file_path = ''
+        export.save(update_fields=['file_path'])
+        purged += 1
+    return purged
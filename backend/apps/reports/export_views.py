@@ -0,0 +1,121 @@
+"""
+User Data Export Views
+Request a user's full data export, poll it, and download it through its
+expiring token link (see apps/reports/data_export.py)
+"""
+import os
+
+from django.contrib.auth.models import User
+from django.http import FileResponse
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+
+from apps.reports.data_export import request_export
+from apps.reports.models import DataExport
+from core.audit import log_action
+from exercise.models import UserProfile
+
+
+def _is_admin(user):
+    return UserProfile.objects.filter(user=user, role='admin').exists()
+
+
+def _export_data(export, request):
+    status = export.job.status if export.job else 'failed'
+    if export.completed_at:
+        status = 'expired' if not export.file_path or export.expires_at <= timezone.now() else 'ready'
+    data = {
+        'id': export.id,
+        'user_id': export.user_id,
+        'status': status,
+        'created_at': export.created_at,
+        'completed_at': export.completed_at,
+        'expires_at': export.expires_at,
+        'size': export.size,
+        'row_counts': export.row_counts,
+        'download_url': None,
+    }
+    if status == 'ready':
+        data['download_url'] = request.build_absolute_uri(
+            reverse('data-export-download', args=[export.token])
+        )
+    return data
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def create_data_export(request):
+    """
+    Queue an export of everything stored about a user
+    Body: user_id (optional; admins only, default: yourself)
+    Returns 202 with the export's status; poll /exports/<id>/ for the link
+    """
+    user_id = request.data.get('user_id')
+    subject = request.user
+    if user_id not in (None, ''):
+        try:
+            user_id = int(user_id)
+        except (TypeError, ValueError):
+            return Response({'error': 'user_id must be an integer'}, status=400)
+        if user_id != request.user.id:
+            if not _is_admin(request.user):
+                return Response({'error': 'Admin access required'}, status=403)
+            subject = User.objects.filter(id=user_id).first()
+            if subject is None:
+                return Response({'error': 'User not found'}, status=404)
+
+    export = request_export(subject, request.user)
+    log_action(
+        user=request.user,
+        action='export',
+        model_name='UserDataExport',
+        object_id=subject.id,
+        object_repr=subject.username,
+        request=request,
+        sync=True
+    )
+    return Response(_export_data(export, request), status=202)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def data_export_status(request, export_id):
+    """Status of an export, with its download link once ready"""
+    export = DataExport.objects.select_related('job').filter(id=export_id).first()
+    if export is None:
+        return Response({'error': 'Export not found'}, status=404)
+    if request.user.id not in (export.user_id, export.requested_by_id) and not _is_admin(request.user):
+        return Response({'error': 'Export not found'}, status=404)
+    return Response(_export_data(export, request))
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def download_data_export(request, token):
+    """
+    Download an export archive. The unguessable token is the credential,
+    so the link works from a plain browser download until it expires.
+    """
+    export = DataExport.objects.select_related('user').filter(token=token, completed_at__isnull=False).first()
+    if export is None:
+        return Response({'error': 'Export not found'}, status=404)
+    if export.expires_at <= timezone.now() or not export.file_path or not os.path.exists(export.file_path):
+        return Response({'error': 'This download link has expired'}, status=410)
+
+    log_action(
+        user=request.user if request.user.is_authenticated else None,
+        action='export',
+        model_name='UserDataExport',
+        object_id=export.user_id,
+        object_repr=f'{export.user.username} (download)',
+        request=request,
+    )
+    return FileResponse(
+        open(export.file_path, 'rb'),
+        as_attachment=True,
+        filename=f'{export.user.username}-data-export.zip',
+        content_type='application/zip',
+    )
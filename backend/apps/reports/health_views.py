@@ -11,6 +11,8 @@ from django.contrib.auth.models import User
 import time
 
 from exercise.models import UserProfile, ExerciseSession, ActivityData, HealthVitals
+from core.db_connections import connection_stats
+from core.metrics import registry
 
 
 @api_view(['GET'])
@@ -66,6 +68,7 @@ def _check_database_health():
         return {
             'status': 'connected',
             'connection_time_ms': round(connection_time, 2),
+            'connections': connection_stats()['default'],
             'tables': {
                 'users': user_count,
                 'sessions': session_count,
@@ -96,7 +99,9 @@ def _measure_api_performance():
         return {
             'simple_query_ms': round(simple_query_time, 2),
             'complex_query_ms': round(complex_query_time, 2),
-            'status': 'fast' if complex_query_time < 100 else 'slow'
+            'status': 'fast' if complex_query_time < 100 else 'slow',
+            # Real traffic seen by this worker, slowest p95 first
+            'slowest_routes': registry.summary(limit=10)
         }
     except Exception as e:
         return {
@@ -0,0 +1,77 @@
+# Generated by Django 5.1.1 on 2026-10-18 23:06
+
+import datetime
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+def create_or_adopt_table(apps, schema_editor):
+    """
+    Create reports_auditlog, or, on databases that created it with
+    --run-syncdb before the app had migrations, add what the table lacks
+    (partition_key and its index) and fill partition_key from timestamp
+    """
+    AuditLog = apps.get_model('reports', 'AuditLog')
+    table = AuditLog._meta.db_table
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        if table not in connection.introspection.table_names(cursor):
+            schema_editor.create_model(AuditLog)
+            return
+        columns = {column.name for column in connection.introspection.get_table_description(cursor, table)}
+
+    for field in AuditLog._meta.local_fields:
+        if field.column not in columns:
+            schema_editor.add_field(AuditLog, field)
+    # Read after adding fields: SQLite adds a column by rebuilding the table with every index
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    for index in AuditLog._meta.indexes:
+        if index.name not in constraints:
+            schema_editor.add_index(AuditLog, index)
+    utc = datetime.timezone.utc
+    AuditLog.objects.using(connection.alias).filter(partition_key=0).update(
+        partition_key=ExtractYear('timestamp', tzinfo=utc) * 100 + ExtractMonth('timestamp', tzinfo=utc)
+    )
+
+
+def drop_table(apps, schema_editor):
+    schema_editor.delete_model(apps.get_model('reports', 'AuditLog'))
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # The table is created (or adopted) by create_or_adopt_table below
+        migrations.SeparateDatabaseAndState(state_operations=[migrations.CreateModel(
+            name='AuditLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(choices=[('create', 'Create'), ('update', 'Update'), ('delete', 'Delete'), ('view', 'View'), ('export', 'Export'), ('login', 'Login'), ('logout', 'Logout')], max_length=20)),
+                ('model_name', models.CharField(max_length=100)),
+                ('object_id', models.IntegerField(blank=True, null=True)),
+                ('object_repr', models.CharField(blank=True, max_length=200)),
+                ('changes', models.JSONField(blank=True, default=dict)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True)),
+                ('timestamp', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('partition_key', models.PositiveIntegerField(default=0, editable=False)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-timestamp'],
+                'indexes': [models.Index(fields=['-timestamp'], name='reports_aud_timesta_5ddcef_idx'), models.Index(fields=['user', '-timestamp'], name='reports_aud_user_id_109722_idx'), models.Index(fields=['action', '-timestamp'], name='reports_aud_action_fb2039_idx'), models.Index(fields=['partition_key', 'timestamp'], name='reports_aud_partiti_bf2baf_idx')],
+            },
+        )]),
+        migrations.RunPython(create_or_adopt_table, drop_table),
+    ]
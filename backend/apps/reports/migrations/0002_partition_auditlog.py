@@ -0,0 +1,79 @@
+"""
+Convert reports_auditlog into a table range-partitioned by month on
+PostgreSQL. Other databases keep the plain table and rely on the
+partition_key column added in 0001.
+"""
+import re
+
+from django.conf import settings
+from django.db import migrations
+from django.utils import timezone
+
+from apps.reports.partitions import (
+    DEFAULT_PARTITION, TABLE, add_months, create_partitions, month_key
+)
+
+LEGACY = f'{TABLE}_unpartitioned'
+
+
+def partition_by_month(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE {TABLE} RENAME TO {LEGACY}')
+
+        # Index and constraint names survive the rename; free them for the new table
+        cursor.execute(
+            "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype IN ('p', 'f')",
+            [LEGACY]
+        )
+        constraints = cursor.fetchall()
+        for name, _, _ in constraints:
+            cursor.execute(f'ALTER TABLE {LEGACY} DROP CONSTRAINT {name}')
+        cursor.execute("SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s", [LEGACY])
+        indexes = cursor.fetchall()
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX {name}')
+
+        cursor.execute(
+            f'CREATE TABLE {TABLE} (LIKE {LEGACY} INCLUDING DEFAULTS INCLUDING IDENTITY '
+            f'INCLUDING CONSTRAINTS) PARTITION BY RANGE ("timestamp")'
+        )
+        # A partitioned table's primary key must contain the partition column
+        cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, "timestamp")')
+        for name, kind, definition in constraints:
+            if kind == 'f':
+                cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}')
+        for _, definition in indexes:
+            cursor.execute(re.sub(rf'\b{LEGACY}\b', TABLE, definition))
+
+        cursor.execute(f'CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT')
+        cursor.execute(f'SELECT MIN("timestamp") FROM {LEGACY}')
+        oldest = cursor.fetchone()[0]
+
+    current = month_key(timezone.now())
+    first = month_key(oldest) if oldest else current
+    create_partitions(first, add_months(current, settings.AUDIT_PARTITION_MONTHS_AHEAD), connection)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'INSERT INTO {TABLE} SELECT * FROM {LEGACY}')
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence('{TABLE}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {TABLE}), 0) + 1, false)"
+        )
+        cursor.execute(f'DROP TABLE {LEGACY}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0001_initial'),
+    ]
+
+    operations = [
+        # Not reversible in place: going back means restoring from a dump
+        migrations.RunPython(partition_by_month, migrations.RunPython.noop),
+    ]
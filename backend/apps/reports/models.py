@@ -1,5 +1,32 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
+
+from apps.reports.partitions import month_key
+
+
+class AuditLogQuerySet(models.QuerySet):
+
+    def bulk_create(self, objs, *args, **kwargs):
+        # bulk_create skips save(), so fill the partition key here
+        objs = list(objs)
+        for obj in objs:
+            obj.partition_key = month_key(obj.timestamp)
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def between(self, start=None, end=None, end_inclusive=False):
+        """
+        Filter to a time range and the months it spans. PostgreSQL prunes
+        partitions from the timestamp bounds; the partition_key bounds give
+        other databases the same pruning through the partition index.
+        """
+        logs = self
+        if start is not None:
+            logs = logs.filter(timestamp__gte=start, partition_key__gte=month_key(start))
+        if end is not None:
+            op = 'timestamp__lte' if end_inclusive else 'timestamp__lt'
+            logs = logs.filter(**{op: end}, partition_key__lte=month_key(end))
+        return logs
 
 
 class AuditLog(models.Model):
@@ -25,7 +52,12 @@ class AuditLog(models.Model):
     changes = models.JSONField(default=dict, blank=True)  # Store old/new values
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(blank=True)
-    timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Set when the event happens, not when the buffered writer flushes it
+    timestamp = models.DateTimeField(default=timezone.now, db_index=True)
+    # UTC month of timestamp (YYYYMM); the partition on databases without native partitioning
+    partition_key = models.PositiveIntegerField(editable=False, default=0)
+    
+    objects = AuditLogQuerySet.as_manager()
     
     class Meta:
         ordering = ['-timestamp']
@@ -33,9 +65,96 @@ class AuditLog(models.Model):
             models.Index(fields=['-timestamp']),
             models.Index(fields=['user', '-timestamp']),
             models.Index(fields=['action', '-timestamp']),
+            models.Index(fields=['partition_key', 'timestamp']),
         ]
     
+    def save(self, *args, **kwargs):
+        self.partition_key = month_key(self.timestamp)
+        super().save(*args, **kwargs)
+    
     def __str__(self):
         user_str = self.user.username if self.user else 'System'
         return f"{user_str} - {self.action} - {self.model_name} - {self.timestamp}"
 
+
+
+class WeeklySnapshot(models.Model):
+    """
+    A user's activity and exercise totals for one completed ISO week, as
+    per-day buckets (see apps/reports/weekly_snapshots.py). Past weeks do
+    not change, so reports read these instead of re-aggregating; a snapshot
+    is deleted when data for its week is backfilled.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='weekly_snapshots')
+    week = models.CharField(max_length=8, help_text='ISO week, e.g. 2024-W40')
+    week_start = models.DateField(help_text='Monday of the week')
+    days = models.JSONField(default=dict)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'week'], name='unique_weekly_snapshot'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.week}"
+
+
+class BackgroundJob(models.Model):
+    """
+    A unit of work for the database-backed job queue (core/jobs.py).
+    Workers claim pending rows with SKIP LOCKED; a running job whose lease
+    has expired (its worker died) is claimed again and resumes from
+    `progress`.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+
+    kind = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    progress = models.JSONField(default=dict, blank=True)  # Checkpoint for resumable jobs
+    result = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_after']),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.id} - {self.status}"
+
+
+class DataExport(models.Model):
+    """
+    A user's full data export: a ZIP of NDJSON files, one per table (see
+    apps/reports/data_export.py), written by a background job and
+    downloaded through an unguessable token until expires_at.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='data_exports')
+    requested_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='+')
+    job = models.ForeignKey(BackgroundJob, on_delete=models.SET_NULL, null=True, related_name='+')
+    token = models.CharField(max_length=64, unique=True)
+    file_path = models.CharField(max_length=500, blank=True)
+    size = models.BigIntegerField(default=0)
+    row_counts = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.user.username} - {self.created_at:%Y-%m-%d %H:%M}"
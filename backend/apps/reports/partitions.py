@@ -0,0 +1,170 @@
+"""
+Audit Log Partitions
+AuditLog is stored by month: native range partitions on PostgreSQL, and
+an indexed partition_key (YYYYMM) on other databases so time-bounded
+queries and retention only touch the months involved.
+Retention drops whole partitions instead of deleting rows.
+"""
+import logging
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import connection as default_connection, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+TABLE = 'reports_auditlog'
+DEFAULT_PARTITION = f'{TABLE}_default'
+
+
+def month_key(moment):
+    """UTC month of a datetime as an integer, e.g. 202403"""
+    if timezone.is_aware(moment):
+        moment = moment.astimezone(dt_timezone.utc)
+    return moment.year * 100 + moment.month
+
+
+def add_months(key, months):
+    year, month = divmod(key // 100 * 12 + key % 100 - 1 + months, 12)
+    return year * 100 + month + 1
+
+
+def month_start(key):
+    return datetime(key // 100, key % 100, 1, tzinfo=dt_timezone.utc)
+
+
+def partition_name(key):
+    return f'{TABLE}_p{key}'
+
+
+def is_partitioned(connection=None):
+    """True when the audit table is a native PostgreSQL partitioned table"""
+    connection = connection or default_connection
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = %s",
+            [TABLE]
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions(connection=None):
+    """Month keys that currently hold (or can hold) audit rows, oldest first"""
+    connection = connection or default_connection
+    if is_partitioned(connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = %s",
+                [TABLE]
+            )
+            names = [row[0] for row in cursor.fetchall()]
+        prefix = f'{TABLE}_p'
+        return sorted(int(name[len(prefix):]) for name in names if name.startswith(prefix))
+
+    from apps.reports.models import AuditLog
+    return list(
+        AuditLog.objects.order_by('partition_key')
+        .values_list('partition_key', flat=True).distinct()
+    )
+
+
+def create_partitions(first_key, last_key, connection=None):
+    """
+    Create the monthly partitions first_key..last_key that do not exist yet.
+    Each one is built detached, takes over any of its rows that landed in
+    the default partition, then is attached, so this is safe on a live table.
+    Returns the keys created. No-op unless the table is partitioned.
+    """
+    connection = connection or default_connection
+    if not is_partitioned(connection):
+        return []
+
+    existing = set(list_partitions(connection))
+    created = []
+    key = first_key
+    while key <= last_key:
+        if key not in existing:
+            _create_partition(connection, key)
+            created.append(key)
+        key = add_months(key, 1)
+    return created
+
+
+def _create_partition(connection, key):
+    name = partition_name(key)
+    # Bounds are generated here, never user input; DDL cannot take parameters
+    start = month_start(key).isoformat()
+    end = month_start(add_months(key, 1)).isoformat()
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        )
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM {DEFAULT_PARTITION} '
+            f'WHERE "timestamp" >= %s AND "timestamp" < %s RETURNING *) '
+            f'INSERT INTO {name} SELECT * FROM moved',
+            [start, end]
+        )
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+    logger.info(f"Audit partitions: created {name}")
+
+
+def ensure_partitions(months_ahead=None, now=None, connection=None):
+    """Make sure the current month and the next months_ahead have partitions"""
+    months_ahead = settings.AUDIT_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    current = month_key(now or timezone.now())
+    return create_partitions(current, add_months(current, months_ahead), connection)
+
+
+def drop_partitions_before(cutoff_key, connection=None, batch_size=None):
+    """
+    Remove every month older than cutoff_key.
+    PostgreSQL: DETACH + DROP each partition table (no row-by-row delete).
+    Elsewhere: a batched delete by partition_key, which is indexed.
+    Returns the month keys removed.
+    """
+    connection = connection or default_connection
+    dropped = [key for key in list_partitions(connection) if key < cutoff_key]
+
+    if is_partitioned(connection):
+        with connection.cursor() as cursor:
+            for key in dropped:
+                name = partition_name(key)
+                cursor.execute(f'ALTER TABLE {TABLE} DETACH PARTITION {name}')
+                cursor.execute(f'DROP TABLE {name}')
+                logger.info(f"Audit partitions: dropped {name}")
+            # Stragglers that were written before their month's partition existed
+            cursor.execute(
+                f'DELETE FROM {DEFAULT_PARTITION} WHERE "timestamp" < %s',
+                [month_start(cutoff_key)]
+            )
+        return dropped
+
+    from apps.reports.models import AuditLog
+    from core.db_optimization import batched_delete
+    if dropped:
+        batched_delete(
+            AuditLog.objects.filter(partition_key__lt=cutoff_key),
+            batch_size=batch_size or settings.AUDIT_PARTITION_BATCH_SIZE,
+            label='Drop audit partitions'
+        )
+    return dropped
+
+
+def prune_audit_partitions(retention_months=None, now=None, connection=None):
+    """Keep the current month plus retention_months full months before it"""
+    retention_months = (
+        settings.AUDIT_RETENTION_MONTHS if retention_months is None else retention_months
+    )
+    cutoff = add_months(month_key(now or timezone.now()), -retention_months)
+    return drop_partitions_before(cutoff, connection)
@@ -0,0 +1,172 @@
+"""
+Patient Reports
+Builds report data for one patient or a whole roster, renders it to PDF or
+CSV (apps/reports/report_rendering.py) and streams rosters as a ZIP.
+
+Rendered files are cached under a hash of the report content, so an
+unchanged patient is never rendered twice; cache misses are rendered in a
+process pool (REPORT_WORKERS) a chunk at a time while the ZIP streams.
+"""
+import logging
+import multiprocessing
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.reports.report_rendering import RENDERERS, content_hash, render_batch
+from apps.reports.weekly_snapshots import recommendations, report_days, summarize
+from exercise.models import Exercise
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_KEY = 'reports:artifact:{}'
+
+
+def build_report(patient, start, end, exercise_names):
+    """Report dict for report_rendering from the patient's day buckets (weekly snapshots)"""
+    days = report_days(patient, start, end)
+    activity_summary, exercise_summary, _ = summarize(days)
+    exercise_summary['exercises'] = [
+        {'name': exercise_names.get(item['exercise_id'], f"Exercise {item['exercise_id']}"), 'count': item['count']}
+        for item in exercise_summary['exercises']
+    ]
+
+    daily = []
+    day = start
+    while day <= end:
+        bucket = days.get(day.isoformat())
+        activities = bucket['activities'] if bucket else []
+        heart_rates = [row[2] for row in activities if row[2] is not None]
+        sessions = bucket['sessions'] if bucket else 0
+        daily.append({
+            'date': day.isoformat(),
+            'steps': sum(row[0] for row in activities),
+            'calories': round(sum(row[1] for row in activities), 1),
+            'heart_rate': round(sum(heart_rates) / len(heart_rates), 1) if heart_rates else None,
+            'sleep_hours': round(sum((row[3] or 0) for row in activities) / 60, 1),
+            'sessions': sessions,
+            'reps': bucket['reps'] if bucket else 0,
+            'avg_posture_score': round(bucket['posture_sum'] / sessions, 1) if sessions else None,
+        })
+        day += timedelta(days=1)
+
+    return {
+        'patient': {
+            'id': patient.id,
+            'username': patient.username,
+            'name': patient.get_full_name() or patient.username,
+        },
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'activity_summary': activity_summary,
+        'exercise_summary': exercise_summary,
+        'daily': daily,
+        'recommendations': recommendations(activity_summary, exercise_summary),
+    }
+
+
+def exercise_name_map():
+    return dict(Exercise.objects.values_list('id', 'name'))
+
+
+def report_filename(report, report_format):
+    return f"{report['patient']['username']}-{report['start']}-{report['end']}.{RENDERERS[report_format][2]}"
+
+
+# =========================
+# Rendering
+# =========================
+
+_executor = None
+
+
+def _pool():
+    """The process pool, started on first use and kept for the life of the server process"""
+    global _executor
+    if _executor is None:
+        # Spawned, not forked: workers must not inherit database connections
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.REPORT_WORKERS, mp_context=multiprocessing.get_context('spawn')
+        )
+    return _executor
+
+
+def render_reports(reports, report_format, chunk_size=None):
+    """
+    Yield (report, rendered bytes) in order. Cached files are reused; the
+    misses of each chunk are split across the pool's workers.
+    """
+    workers = settings.REPORT_WORKERS
+    chunk_size = chunk_size or max(1, workers) * 4
+    chunk = []
+    for report in reports:
+        chunk.append(report)
+        if len(chunk) >= chunk_size:
+            yield from _render_chunk(chunk, report_format, workers)
+            chunk = []
+    if chunk:
+        yield from _render_chunk(chunk, report_format, workers)
+
+
+def _render_chunk(reports, report_format, workers):
+    keys = [ARTIFACT_KEY.format(content_hash(report_format, report)) for report in reports]
+    cached = cache.get_many(keys)
+    misses = [i for i, key in enumerate(keys) if key not in cached]
+    if misses:
+        jobs = [(report_format, reports[i]) for i in misses]
+        if workers and len(jobs) > 1:
+            batches = [jobs[n::workers] for n in range(min(workers, len(jobs)))]
+            rendered = [None] * len(jobs)
+            for n, results in enumerate(_pool().map(render_batch, batches)):
+                rendered[n::workers] = results
+        else:
+            rendered = render_batch(jobs)
+        fresh = {keys[i]: data for i, data in zip(misses, rendered)}
+        cache.set_many(fresh, settings.REPORT_CACHE_TIMEOUT)
+        cached.update(fresh)
+        logger.info(f"Reports: rendered {len(misses)}, reused {len(reports) - len(misses)} {report_format} files")
+    for report, key in zip(reports, keys):
+        yield report, cached[key]
+
+
+# =========================
+# ZIP streaming
+# =========================
+
+class _ZipBuffer:
+    """Write-only file for ZipFile: collects output to be yielded as it is produced"""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data, self.parts = b''.join(self.parts), []
+        return data
+
+
+def stream_zip(files):
+    """
+    Yield a ZIP archive of (filename, bytes) pairs as it is written.
+    The output is not seekable, so ZipFile writes data descriptors and the
+    archive never has to be held in memory.
+    """
+    buffer = _ZipBuffer()
+    modified = time.localtime()[:6]
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, data in files:
+            # PDF content is already deflated
+            compression = zipfile.ZIP_STORED if name.endswith('.pdf') else zipfile.ZIP_DEFLATED
+            archive.writestr(zipfile.ZipInfo(name, date_time=modified), data, compress_type=compression)
+            yield buffer.take()
+    yield buffer.take()
@@ -0,0 +1,117 @@
+"""
+Minimal PDF Writer
+Just enough of PDF 1.4 for the server-side reports: A4 pages of text in the
+standard Helvetica fonts (no embedding) and filled rectangles. Output is
+deterministic (no timestamps or ids), so identical content renders to
+identical bytes. Free of Django so that report workers can import it alone.
+"""
+import zlib
+
+PAGE_WIDTH = 595  # A4 in points
+PAGE_HEIGHT = 842
+
+FONTS = {'regular': 'Helvetica', 'bold': 'Helvetica-Bold'}
+
+# Average glyph width of Helvetica as a fraction of the font size, for wrapping
+AVERAGE_WIDTH = {'regular': 0.52, 'bold': 0.56}
+
+
+def _escape(text):
+    text = str(text).encode('cp1252', 'replace').decode('cp1252')
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _color(rgb):
+    return ' '.join(f'{channel / 255:.3f}' for channel in rgb)
+
+
+def text_width(text, size, weight='regular'):
+    return len(str(text)) * size * AVERAGE_WIDTH[weight]
+
+
+def wrap(text, width, size, weight='regular'):
+    """Split text into lines no wider than width points"""
+    limit = max(1, int(width / (size * AVERAGE_WIDTH[weight])))
+    lines, line = [], ''
+    for word in str(text).split():
+        candidate = f'{line} {word}' if line else word
+        if len(candidate) <= limit:
+            line = candidate
+        else:
+            if line:
+                lines.append(line)
+            while len(word) > limit:
+                lines.append(word[:limit])
+                word = word[limit:]
+            line = word
+    if line:
+        lines.append(line)
+    return lines or ['']
+
+
+class PDFDocument:
+    """
+    Pages are drawn top-down: y is the distance from the top edge of the page
+
+        doc = PDFDocument()
+        doc.add_page()
+        doc.text(40, 60, 'Hello', size=14, weight='bold')
+        data = doc.render()
+    """
+
+    def __init__(self):
+        self.pages = []
+
+    def add_page(self):
+        self.pages.append([])
+
+    def text(self, x, y, text, size=10, weight='regular', color=(0, 0, 0), align='left'):
+        if align == 'center':
+            x -= text_width(text, size, weight) / 2
+        elif align == 'right':
+            x -= text_width(text, size, weight)
+        font = 'F2' if weight == 'bold' else 'F1'
+        self.pages[-1].append(
+            f'BT {_color(color)} rg /{font} {size} Tf {x:.2f} {PAGE_HEIGHT - y:.2f} Td ({_escape(text)}) Tj ET'
+        )
+
+    def rect(self, x, y, width, height, color):
+        """Filled rectangle whose top-left corner is (x, y)"""
+        self.pages[-1].append(
+            f'{_color(color)} rg {x:.2f} {PAGE_HEIGHT - y - height:.2f} {width:.2f} {height:.2f} re f'
+        )
+
+    def render(self):
+        if not self.pages:
+            self.add_page()
+        # Object numbers: 1 catalog, 2 page tree, 3-4 fonts, then page + content pairs
+        objects = [
+            b'<< /Type /Catalog /Pages 2 0 R >>',
+            None,
+            b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+            b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>',
+        ]
+        kids = []
+        for operations in self.pages:
+            page_number = len(objects) + 1
+            kids.append(f'{page_number} 0 R')
+            objects.append(
+                f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] '
+                f'/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {page_number + 1} 0 R >>'.encode()
+            )
+            stream = zlib.compress('\n'.join(operations).encode('cp1252'), 6)
+            objects.append(
+                f'<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n'.encode() + stream + b'\nendstream'
+            )
+        objects[1] = f'<< /Type /Pages /Kids [{" ".join(kids)}] /Count {len(kids)} >>'.encode()
+
+        output = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(output))
+            output += f'{number} 0 obj\n'.encode() + body + b'\nendobj\n'
+        xref = len(output)
+        output += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+        output += b''.join(f'{offset:010d} 00000 n \n'.encode() for offset in offsets)
+        output += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+        return bytes(output)
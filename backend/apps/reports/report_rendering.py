@@ -0,0 +1,181 @@
+"""
+Report Rendering
+Renders a patient report (built by apps/reports/patient_reports.py) to PDF
+or CSV bytes. Pure functions of the report dict, free of Django, so that
+they run in the report process pool and their output can be cached under
+a hash of the report content.
+
+A report:
+    {"patient": {"id": 7, "username": "...", "name": "..."},
+     "start": "2024-10-01", "end": "2024-10-07",
+     "activity_summary": {...}, "exercise_summary": {..., "exercises": [{"name", "count"}]},
+     "daily": [{"date", "steps", "calories", "heart_rate", "sleep_hours",
+                "sessions", "reps", "avg_posture_score"}, ...],
+     "recommendations": [...]}
+"""
+import csv
+import hashlib
+import io
+import json
+
+from apps.reports.pdf import PAGE_HEIGHT, PAGE_WIDTH, PDFDocument, wrap
+
+# Part of the content hash: bump when the rendered output changes
+RENDERER_VERSION = 1
+
+PURPLE = (139, 92, 246)
+GREEN = (16, 185, 129)
+BLUE = (59, 130, 246)
+LIGHT = (243, 244, 246)
+WHITE = (255, 255, 255)
+
+MARGIN = 40
+ROW_HEIGHT = 16
+
+DAILY_COLUMNS = ['date', 'steps', 'calories', 'heart_rate', 'sleep_hours', 'sessions', 'reps', 'avg_posture_score']
+
+
+def content_hash(report_format, report):
+    """Cache key of a rendered report: changes whenever its data or the renderer does"""
+    payload = json.dumps([RENDERER_VERSION, report_format, report], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _number(value, digits=1):
+    if value is None or value == '':
+        return ''
+    return f'{value:,.{digits}f}' if isinstance(value, float) else f'{value:,}'
+
+
+# =========================
+# CSV
+# =========================
+
+def render_csv(report):
+    """One row per day of the period, then a totals row"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['patient', *DAILY_COLUMNS])
+    username = report['patient']['username']
+    for day in report['daily']:
+        writer.writerow([username, *('' if day[column] is None else day[column] for column in DAILY_COLUMNS)])
+    activity, exercise = report['activity_summary'], report['exercise_summary']
+    writer.writerow([
+        username, 'total', activity['total_steps'], round(activity['total_calories'], 1),
+        round(activity['avg_heart_rate'], 1), round(activity['total_sleep_hours'], 1),
+        exercise['total_sessions'], exercise['total_reps'], round(exercise['avg_posture_score'], 1),
+    ])
+    return buffer.getvalue().encode()
+
+
+# =========================
+# PDF
+# =========================
+
+class _Layout:
+    """Top-down flow over pages with page breaks"""
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.y = PAGE_HEIGHT
+
+    def need(self, height):
+        if self.y + height > PAGE_HEIGHT - MARGIN:
+            self.doc.add_page()
+            self.y = MARGIN
+
+    def section(self, title, color):
+        self.need(30 + ROW_HEIGHT * 2)
+        self.doc.rect(MARGIN, self.y, PAGE_WIDTH - 2 * MARGIN, 20, color)
+        self.doc.text(MARGIN + 8, self.y + 14, title, size=12, weight='bold', color=WHITE)
+        self.y += 30
+
+    def table(self, header, rows, widths):
+        def row(cells, weight, shade):
+            self.need(ROW_HEIGHT)
+            if shade:
+                self.doc.rect(MARGIN, self.y, sum(widths), ROW_HEIGHT, LIGHT)
+            x = MARGIN
+            for cell, width in zip(cells, widths):
+                self.doc.text(x + 4, self.y + 11, cell, size=9, weight=weight)
+                x += width
+            self.y += ROW_HEIGHT
+
+        row(header, 'bold', True)
+        for index, cells in enumerate(rows):
+            row(cells, 'regular', index % 2 == 1)
+        self.y += 12
+
+    def paragraph(self, text, size=10, indent=0):
+        for line in wrap(text, PAGE_WIDTH - 2 * MARGIN - indent, size):
+            self.need(size + 4)
+            self.doc.text(MARGIN + indent, self.y + size, line, size=size)
+            self.y += size + 4
+
+
+def render_pdf(report):
+    doc = PDFDocument()
+    doc.add_page()
+    doc.rect(0, 0, PAGE_WIDTH, 80, PURPLE)
+    doc.text(PAGE_WIDTH / 2, 38, 'Weekly Health Report', size=22, weight='bold', color=WHITE, align='center')
+    doc.text(PAGE_WIDTH / 2, 60, report['patient']['name'], size=13, color=WHITE, align='center')
+
+    layout = _Layout(doc)
+    layout.y = 110
+    doc.text(MARGIN, layout.y, 'Report Period:', size=11, weight='bold')
+    doc.text(MARGIN + 90, layout.y, f"{report['start']} - {report['end']}", size=11)
+    layout.y += 25
+
+    activity, exercise = report['activity_summary'], report['exercise_summary']
+    layout.section('Activity Summary', PURPLE)
+    layout.table(['Metric', 'Value'], [
+        ['Total Steps', _number(activity['total_steps'])],
+        ['Total Calories', f"{_number(float(activity['total_calories']), 0)} kcal"],
+        ['Avg Heart Rate', f"{round(activity['avg_heart_rate'])} bpm"],
+        ['Total Sleep', f"{activity['total_sleep_hours']:.1f} hrs"],
+    ], [200, 315])
+
+    layout.section('Exercise Performance', GREEN)
+    layout.table(['Metric', 'Value'], [
+        ['Total Sessions', str(exercise['total_sessions'])],
+        ['Total Reps', _number(exercise['total_reps'])],
+        ['Avg Posture Score', f"{round(exercise['avg_posture_score'])}%"],
+    ], [200, 315])
+
+    if exercise['exercises']:
+        total = sum(item['count'] for item in exercise['exercises'])
+        layout.section('Exercise Distribution', BLUE)
+        layout.table(['Exercise', 'Sessions', 'Share'], [
+            [item['name'], str(item['count']), f"{item['count'] / total * 100:.1f}%"]
+            for item in exercise['exercises']
+        ], [255, 130, 130])
+
+    layout.section('Daily Activity', PURPLE)
+    layout.table(['Date', 'Steps', 'Calories', 'Heart Rate', 'Sleep (h)', 'Sessions', 'Reps', 'Posture'], [
+        [day['date'], _number(day['steps']), _number(day['calories'], 0), _number(day['heart_rate'], 0),
+         _number(day['sleep_hours']), str(day['sessions']), str(day['reps']), _number(day['avg_posture_score'], 0)]
+        for day in report['daily']
+    ], [75, 65, 65, 65, 60, 55, 55, 75])
+
+    layout.section('Recommendations', GREEN)
+    for recommendation in report['recommendations']:
+        layout.paragraph(f'- {recommendation}')
+        layout.y += 4
+
+    return doc.render()
+
+
+RENDERERS = {
+    # format: (renderer, content type, file extension)
+    'pdf': (render_pdf, 'application/pdf', 'pdf'),
+    'csv': (render_csv, 'text/csv', 'csv'),
+}
+
+
+def render_report(report_format, report):
+    return RENDERERS[report_format][0](report)
+
+
+def render_batch(jobs):
+    """Process pool entry point: render (format, report) jobs in order"""
+    return [render_report(report_format, report) for report_format, report in jobs]
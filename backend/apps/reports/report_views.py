@@ -0,0 +1,118 @@
+"""
+Report Export Views
+Server-rendered PDF/CSV reports: a single patient's file, or the whole
+patient roster as a streamed ZIP (doctors and admins)
+"""
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.reports.patient_reports import (
+    build_report, exercise_name_map, render_reports, report_filename, stream_zip,
+)
+from apps.reports.report_rendering import RENDERERS
+from core.audit import log_action
+from exercise.models import UserProfile
+
+
+class _BadRequest(ValueError):
+    pass
+
+
+def _report_params(params):
+    """(format, start, end) from ?export_format=pdf|csv&start_date=&end_date= (default: the last 7 days)"""
+    report_format = params.get('export_format', 'pdf')
+    if report_format not in RENDERERS:
+        raise _BadRequest('export_format must be pdf or csv')
+    try:
+        end = date.fromisoformat(params['end_date']) if params.get('end_date') else timezone.localdate()
+        start = date.fromisoformat(params['start_date']) if params.get('start_date') else end - timedelta(days=6)
+    except ValueError:
+        raise _BadRequest('start_date and end_date must be YYYY-MM-DD')
+    if start > end:
+        raise _BadRequest('start_date must not be after end_date')
+    if (end - start).days >= settings.REPORT_MAX_DAYS:
+        raise _BadRequest(f'Reports cover at most {settings.REPORT_MAX_DAYS} days')
+    return report_format, start, end
+
+
+def _is_staff(user):
+    return UserProfile.objects.filter(user=user, role__in=('doctor', 'admin')).exists()
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def patient_report(request, patient_id=None):
+    """
+    Download one patient's report as PDF or CSV
+    /reports/weekly/ is the authenticated user's own report;
+    /reports/patients/<id>/ is for doctors and admins
+    Query params: export_format (pdf, csv), start_date, end_date (YYYY-MM-DD)
+    """
+    try:
+        report_format, start, end = _report_params(request.query_params)
+    except _BadRequest as e:
+        return Response({'error': str(e)}, status=400)
+
+    if patient_id is None or patient_id == request.user.id:
+        patient = request.user
+    else:
+        if not _is_staff(request.user):
+            return Response({'error': 'Doctor or admin access required'}, status=403)
+        patient = User.objects.filter(id=patient_id, profile__role='patient').first()
+        if patient is None:
+            return Response({'error': 'Patient not found'}, status=404)
+
+    report = build_report(patient, start, end, exercise_name_map())
+    (_, data), = render_reports([report], report_format)
+    response = HttpResponse(data, content_type=RENDERERS[report_format][1])
+    response['Content-Disposition'] = f'attachment; filename="{report_filename(report, report_format)}"'
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def roster_report(request):
+    """
+    Stream a ZIP with one report per patient (doctors and admins)
+    Query params: export_format (pdf, csv), start_date, end_date (YYYY-MM-DD),
+    patients (optional comma-separated ids; default: every patient)
+    """
+    if not _is_staff(request.user):
+        return Response({'error': 'Doctor or admin access required'}, status=403)
+    try:
+        report_format, start, end = _report_params(request.query_params)
+        patients = User.objects.filter(profile__role='patient').order_by('username')
+        if request.query_params.get('patients'):
+            patients = patients.filter(id__in=[int(i) for i in request.query_params['patients'].split(',')])
+    except _BadRequest as e:
+        return Response({'error': str(e)}, status=400)
+    except ValueError:
+        return Response({'error': 'patients must be comma-separated ids'}, status=400)
+
+    # Exports of patient data are audited before streaming starts
+    log_action(
+        user=request.user,
+        action='export',
+        model_name='PatientReport',
+        object_repr=request.query_params.urlencode()[:200],
+        request=request,
+        sync=True
+    )
+
+    exercise_names = exercise_name_map()
+    reports = (build_report(patient, start, end, exercise_names) for patient in patients)
+    files = (
+        (report_filename(report, report_format), data)
+        for report, data in render_reports(reports, report_format)
+    )
+    response = StreamingHttpResponse(stream_zip(files), content_type='application/zip')
+    filename = f'patient-reports-{start}-{end}-{report_format}.zip'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
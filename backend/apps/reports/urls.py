@@ -1,7 +1,32 @@
 # Reports app URLs
-# Will be populated when updating admin/report views imports
 from django.urls import path
+from core.lazy_views import lazy_view
 
 urlpatterns = [
-    # Admin analytics and report endpoints will be added here
+    path('weekly-report/', lazy_view('apps.reports.weekly_report.weekly_report'), name='weekly-report'),
+    path('reports/weekly/', lazy_view('apps.reports.report_views.patient_report'), name='report-weekly'),
+    path('reports/patients/<int:patient_id>/', lazy_view('apps.reports.report_views.patient_report'), name='report-patient'),
+    path('reports/roster/', lazy_view('apps.reports.report_views.roster_report'), name='report-roster'),
+    path('exports/', lazy_view('apps.reports.export_views.create_data_export'), name='data-export-create'),
+    path('exports/<int:export_id>/', lazy_view('apps.reports.export_views.data_export_status'), name='data-export-status'),
+    path('exports/download/<str:token>/', lazy_view('apps.reports.export_views.download_data_export'), name='data-export-download'),
+
+    # Admin dashboard and user management (Admin only)
+    path('admin-analytics/', lazy_view('apps.reports.admin_views.admin_analytics'), name='admin-analytics'),
+    path('user-list/', lazy_view('apps.reports.admin_views.user_list'), name='user-list'),
+    path('admin/users/', lazy_view('apps.reports.admin_views.user_directory'), name='user-directory'),
+    path('user-growth/', lazy_view('apps.reports.admin_views.user_growth_data'), name='user-growth'),
+    path('activity-trends/', lazy_view('apps.reports.admin_views.activity_trends'), name='activity-trends'),
+    path('admin/users/<int:user_id>/delete/', lazy_view('apps.reports.admin_views.delete_user'), name='delete-user'),
+    path('admin/users/<int:user_id>/change-role/', lazy_view('apps.reports.admin_views.change_user_role'), name='change-user-role'),
+    path('admin/audit-logs/', lazy_view('apps.reports.audit_views.audit_logs'), name='audit-logs'),
+    path('admin/audit-logs/export/', lazy_view('apps.reports.audit_views.export_audit_logs'), name='export-audit-logs'),
+
+    # Advanced Analytics Endpoints (Admin only)
+    path('admin/analytics/retention/', lazy_view('apps.reports.analytics_views.retention_metrics'), name='retention-metrics'),
+    path('admin/analytics/feature-adoption/', lazy_view('apps.reports.analytics_views.feature_adoption'), name='feature-adoption'),
+    path('admin/analytics/engagement/', lazy_view('apps.reports.analytics_views.engagement_metrics'), name='engagement-metrics'),
+
+    # System Health Monitoring (Admin only)
+    path('admin/system-health/', lazy_view('apps.reports.health_views.system_health'), name='system-health'),
 ]
@@ -0,0 +1,150 @@
+"""
+User Deletion
+Deleting a User through the ORM makes Django's collector load every
+related row (vitals, sessions, notifications...) into memory first, which
+for a long-time user takes minutes and can run out of memory.
+
+Instead, an account is deactivated at once and a background job (core/jobs.py,
+kind 'user_deletion') deletes its data table by table, children before
+parents, in raw DELETE statements of at most USER_DELETION_BATCH_SIZE rows.
+Rows that only reference the user (audit entries, campaigns, jobs) keep
+their history with the reference cleared, as their SET_NULL foreign keys
+would. Progress is checkpointed after every batch, so a job that dies
+resumes at its table. The User row itself goes last, when nothing large
+is left for the collector, and the run is recorded in the audit log.
+"""
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.exercises.models import SessionTelemetry
+from apps.notifications.models import EmailCampaign, EmailLog, EngagementDelivery, NotificationArchive
+from apps.reports.models import AuditLog, BackgroundJob, DataExport, WeeklySnapshot
+from core.audit import log_action
+from core.jobs import checkpoint, enqueue
+from exercise.models import (
+    ActivityData, ActivityUpload, CustomReminder, ExerciseSession, HealthVitals, Notification,
+    NotificationPreferences, PregnancyProfile, UserProfile,
+)
+
+logger = logging.getLogger(__name__)
+
+DELETE = 'delete'
+NULLIFY = 'nullify'
+
+# (model, user lookup, action) in execution order: children before their parents
+DELETION_PLAN = [
+    (SessionTelemetry, 'session__user', DELETE),
+    (ExerciseSession, 'user', DELETE),
+    (ActivityData, 'user', DELETE),
+    (ActivityUpload, 'user', DELETE),
+    (HealthVitals, 'user', DELETE),
+    (Notification, 'user', DELETE),
+    (NotificationArchive, 'user', DELETE),
+    (EngagementDelivery, 'user', DELETE),
+    (EmailLog, 'recipient', DELETE),
+    (CustomReminder, 'user', DELETE),
+    (NotificationPreferences, 'user', DELETE),
+    (WeeklySnapshot, 'user', DELETE),
+    (DataExport, 'user', DELETE),
+    (PregnancyProfile, 'user', DELETE),
+    (UserProfile, 'user', DELETE),
+    (AuditLog, 'user', NULLIFY),
+    (EmailCampaign, 'created_by', NULLIFY),
+    (BackgroundJob, 'created_by', NULLIFY),
+    (DataExport, 'requested_by', NULLIFY),
+]
+
+
+def request_deletion(user, requested_by):
+    """Deactivate the account and queue its deletion (or return the job already queued)"""
+    User.objects.filter(id=user.id).update(is_active=False)
+    queued = BackgroundJob.objects.filter(
+        kind='user_deletion', payload__user_id=user.id, status__in=('pending', 'running')
+    ).first()
+    if queued:
+        return queued
+    return enqueue('user_deletion', {'user_id': user.id, 'username': user.username}, created_by=requested_by)
+
+
+def _step_name(model, lookup, action):
+    return f'{model._meta.db_table}.{lookup}' if action == NULLIFY else model._meta.db_table
+
+
+def _run_batch(model, lookup, action, user_id, batch_size):
+    """Delete (or clear the user reference of) up to batch_size rows; returns how many"""
+    ids = list(
+        model.objects.filter(**{lookup: user_id}).order_by().values_list('pk', flat=True)[:batch_size]
+    )
+    if not ids:
+        return 0
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    placeholders = ', '.join(['%s'] * len(ids))
+    where = f'{quote(model._meta.pk.column)} IN ({placeholders})'
+    if action == DELETE:
+        sql = f'DELETE FROM {table} WHERE {where}'
+    else:
+        sql = f'UPDATE {table} SET {quote(model._meta.get_field(lookup).column)} = NULL WHERE {where}'
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(sql, ids)
+    return len(ids)
+
+
+def _remove_export_files(user_id):
+    for path in DataExport.objects.filter(user_id=user_id).exclude(file_path='').values_list('file_path', flat=True):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def delete_user_data(job, batch_size=None):
+    """
+    Work through DELETION_PLAN from the job's checkpoint, then delete the
+    User row; returns {step name: rows}
+    """
+    batch_size = batch_size or settings.USER_DELETION_BATCH_SIZE
+    user_id = job.payload['user_id']
+    deleted = dict(job.progress.get('deleted', {}))
+
+    if job.progress.get('step', 0) == 0:
+        _remove_export_files(user_id)
+    for index in range(job.progress.get('step', 0), len(DELETION_PLAN)):
+        model, lookup, action = DELETION_PLAN[index]
+        name = _step_name(model, lookup, action)
+        while True:
+            count = _run_batch(model, lookup, action, user_id, batch_size)
+            if not count:
+                break
+            deleted[name] = deleted.get(name, 0) + count
+            checkpoint(job, step=index, deleted=deleted)
+        checkpoint(job, step=index + 1, deleted=deleted)
+
+    # Only small relations remain (permissions, groups, admin log)
+    User.objects.filter(id=user_id).delete()
+    return deleted
+
+
+def run_deletion(job):
+    """Job handler: delete the user's data and record the deletion"""
+    started = time.monotonic()
+    deleted = delete_user_data(job)
+    seconds = round(time.monotonic() - started, 1)
+
+    log_action(
+        user=job.created_by,
+        action='delete',
+        model_name='User',
+        object_id=job.payload['user_id'],
+        object_repr=f"{job.payload['username']} (data deleted)",
+        changes={'rows': deleted, 'seconds': seconds, 'completed_at': timezone.now().isoformat()},
+        sync=True
+    )
+    logger.info(f"Deleted user {job.payload['user_id']}: {sum(deleted.values())} rows in {seconds}s")
+    return {'rows': deleted, 'seconds': seconds}
@@ -0,0 +1,195 @@
+"""
+Weekly Report Snapshots
+The weekly report covers any date range, but its data only changes for
+the current week. Each completed ISO week is computed once per user and
+stored as per-day buckets (WeeklySnapshot); a report merges the buckets of
+the days it covers. The current week is always computed live.
+
+A day bucket:
+    {"activities": [[steps, calories, avg_heart_rate, sleep_minutes], ...],
+     "sessions": 3, "reps": 42, "posture_sum": 251.5, "exercises": {"1": 2, "4": 1}}
+
+Saving or deleting an ActivityData or ExerciseSession row dated in a
+completed week (a backfill) deletes that week's snapshot; the next report
+recomputes it. Snapshots are computed from the primary, even in reports
+served from the read replica, so a lagging replica is never stored.
+"""
+from datetime import date, timedelta
+
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from apps.reports.models import WeeklySnapshot
+from exercise.models import ActivityData, ExerciseSession
+
+
+def week_start(day):
+    """Monday of day's ISO week"""
+    return day - timedelta(days=day.weekday())
+
+
+def iso_week(day):
+    """ISO week key, e.g. 2024-W40"""
+    year, week, _ = day.isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+def _empty_bucket():
+    return {'activities': [], 'sessions': 0, 'reps': 0, 'posture_sum': 0.0, 'exercises': {}}
+
+
+def compute_days(user, start, end, using=None):
+    """
+    Day buckets for start..end (inclusive) from two queries: the activity
+    rows, and one aggregate over sessions grouped by day and exercise.
+    using forces a database; by default the router picks one.
+    """
+    days = {}
+    activities = ActivityData.objects.using(using).filter(user=user, date__range=[start, end]).order_by('date', 'id')
+    for day, steps, calories, heart_rate, sleep in activities.values_list(
+        'date', 'steps', 'calories', 'avg_heart_rate', 'sleep_minutes'
+    ):
+        days.setdefault(day.isoformat(), _empty_bucket())['activities'].append([steps, calories, heart_rate, sleep])
+
+    sessions = (
+        ExerciseSession.objects.using(using).filter(user=user, start_time__date__range=[start, end])
+        .annotate(day=TruncDate('start_time'))
+        .values('day', 'exercise_id')
+        .annotate(count=Count('id'), reps=Sum('rep_count'), posture=Sum('avg_posture_score'))
+        .order_by()
+    )
+    for row in sessions:
+        bucket = days.setdefault(row['day'].isoformat(), _empty_bucket())
+        bucket['sessions'] += row['count']
+        bucket['reps'] += row['reps'] or 0
+        bucket['posture_sum'] += row['posture'] or 0
+        bucket['exercises'][str(row['exercise_id'])] = row['count']
+    return days
+
+
+def report_days(user, start, end, today=None):
+    """
+    Day buckets for start..end: completed weeks from their snapshots
+    (computing and storing any that are missing), the current week live
+    """
+    today = today or timezone.localdate()
+    current = week_start(today)
+    weeks = []
+    monday = week_start(start)
+    while monday <= end:
+        weeks.append(monday)
+        monday += timedelta(days=7)
+
+    completed = {iso_week(monday): monday for monday in weeks if monday < current}
+    days = {}
+    for snapshot in WeeklySnapshot.objects.filter(user=user, week__in=list(completed)):
+        days.update(snapshot.days)
+        del completed[snapshot.week]
+
+    if completed:
+        # One pass over the span of the missing weeks, split into snapshots; these
+        # are stored, so they are read from the primary rather than a lagging replica
+        computed = compute_days(
+            user, min(completed.values()), max(completed.values()) + timedelta(days=6), using=DEFAULT_DB_ALIAS
+        )
+        snapshots = []
+        for week, monday in completed.items():
+            week_days = {
+                day: bucket for day, bucket in computed.items()
+                if monday.isoformat() <= day <= (monday + timedelta(days=6)).isoformat()
+            }
+            snapshots.append(WeeklySnapshot(user=user, week=week, week_start=monday, days=week_days))
+            days.update(week_days)
+        WeeklySnapshot.objects.bulk_create(snapshots, ignore_conflicts=True)
+
+    if weeks and weeks[-1] >= current:
+        days.update(compute_days(user, max(start, current), end))
+
+    return {day: bucket for day, bucket in days.items() if start.isoformat() <= day <= end.isoformat()}
+
+
+def summarize(days):
+    """activity_summary, exercise_summary and daily_data of the weekly report"""
+    rows = [(day, row) for day in sorted(days) for row in days[day]['activities']]
+    heart_rates = [row[2] for _, row in rows if row[2] is not None]
+    sessions = sum(bucket['sessions'] for bucket in days.values())
+    exercises = {}
+    for bucket in days.values():
+        for exercise_id, count in bucket['exercises'].items():
+            exercises[int(exercise_id)] = exercises.get(int(exercise_id), 0) + count
+
+    activity_summary = {
+        'total_steps': sum(row[0] for _, row in rows),
+        'total_calories': sum(row[1] for _, row in rows),
+        'avg_heart_rate': sum(heart_rates) / len(heart_rates) if heart_rates else 0,
+        'total_sleep_hours': sum((row[3] or 0) / 60 for _, row in rows),
+    }
+    exercise_summary = {
+        'total_sessions': sessions,
+        'total_reps': sum(bucket['reps'] for bucket in days.values()),
+        'avg_posture_score': sum(bucket['posture_sum'] for bucket in days.values()) / sessions if sessions else 0,
+        'exercises': [{'exercise_id': exercise_id, 'count': count} for exercise_id, count in sorted(exercises.items())],
+    }
+    daily_data = [{
+        'date': day,
+        'steps': row[0],
+        'calories': int(row[1]),
+        'heart_rate': row[2],
+        'sleep_hours': (row[3] or 0) / 60,
+    } for day, row in rows]
+    return activity_summary, exercise_summary, daily_data
+
+
+def recommendations(activity_summary, exercise_summary):
+    """The weekly report's advice for a period's totals"""
+    advice = []
+    if activity_summary['total_steps'] < 50000:
+        advice.append('Try to increase your daily steps. Aim for 7,000-10,000 steps per day for optimal health.')
+    if exercise_summary['total_sessions'] < 3:
+        advice.append('Consider adding more exercise sessions. 3-4 sessions per week is ideal during pregnancy.')
+    if activity_summary['avg_heart_rate'] > 100:
+        advice.append('Your average heart rate is elevated. Ensure adequate rest and consult your doctor if concerned.')
+    if activity_summary['total_sleep_hours'] < 49:
+        advice.append('Prioritize sleep. Aim for 7-9 hours per night for optimal health during pregnancy.')
+    if exercise_summary['avg_posture_score'] > 0 and exercise_summary['avg_posture_score'] < 70:
+        advice.append('Focus on maintaining proper form during exercises. Review the reference videos for guidance.')
+    if not advice:
+        advice.append('Great job! You\'re maintaining a healthy activity level. Keep up the good work!')
+    return advice
+
+
+# =========================
+# Invalidation
+# =========================
+
+def invalidate_snapshots(user_id, days):
+    """Delete the snapshots of completed weeks containing any of days (dates or ISO strings)"""
+    current = week_start(timezone.localdate())
+    weeks = set()
+    for day in days:
+        if isinstance(day, str):
+            day = date.fromisoformat(day)
+        if week_start(day) < current:
+            weeks.add(iso_week(day))
+    if weeks:
+        WeeklySnapshot.objects.filter(user_id=user_id, week__in=weeks).delete()
+
+
+def _activity_changed(sender, instance, **kwargs):
+    invalidate_snapshots(instance.user_id, [instance.date])
+
+
+def _session_changed(sender, instance, **kwargs):
+    if instance.start_time:
+        invalidate_snapshots(instance.user_id, [timezone.localdate(instance.start_time)])
+
+
+def connect_signals():
+    """Called from ReportsConfig.ready()"""
+    post_save.connect(_activity_changed, sender=ActivityData, dispatch_uid='weekly_snapshots_activity')
+    post_save.connect(_session_changed, sender=ExerciseSession, dispatch_uid='weekly_snapshots_session')
+    post_delete.connect(_activity_changed, sender=ActivityData, dispatch_uid='weekly_snapshots_activity_delete')
+    post_delete.connect(_session_changed, sender=ExerciseSession, dispatch_uid='weekly_snapshots_session_delete')
@@ -0,0 +1,222 @@
+"""
+Admin User Directory
+Annotated user listing (per-user activity counts in the same query),
+filters, search and keyset pagination over any sort column
+"""
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.models import User
+from django.db.models import (
+    Count, DateTimeField, Exists, F, OuterRef, Q, Subquery, Sum, Value
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from exercise.models import ActivityData, ExerciseSession
+
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+
+# Sorting on NULL-able columns goes through a sentinel so the keyset
+# comparison stays a plain < / >
+NULL_DATETIME = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+USER_FIELDS = [
+    'id', 'username', 'email', 'date_joined', 'last_login', 'role',
+    'exercise_sessions', 'activity_records', 'total_reps', 'last_session',
+]
+
+SORT_FIELDS = {
+    # name: (expression, is_datetime)
+    'id': (F('id'), False),
+    'username': (F('username'), False),
+    'date_joined': (F('date_joined'), True),
+    'last_login': (Coalesce('last_login', Value(NULL_DATETIME, output_field=DateTimeField())), True),
+    'last_session': (Coalesce('last_session', Value(NULL_DATETIME, output_field=DateTimeField())), True),
+    'exercise_sessions': (F('exercise_sessions'), False),
+    'activity_records': (F('activity_records'), False),
+    'total_reps': (F('total_reps'), False),
+}
+
+TRIMESTER_WEEKS = {1: (0, 14), 2: (14, 28), 3: (28, 43)}
+
+
+def trimester_for(week):
+    """Trimester whose TRIMESTER_WEEKS range holds week (as ?trimester filters), else None"""
+    if week is None:
+        return None
+    return next((trimester for trimester, (first, end) in TRIMESTER_WEEKS.items() if first <= week < end), None)
+
+
+class InvalidQuery(ValueError):
+    """Raised for a malformed cursor, sort key or filter value"""
+
+
+def _per_user(queryset, aggregate):
+    """Correlated subquery computing one aggregate for the outer user row"""
+    return Subquery(
+        queryset.filter(user=OuterRef('pk')).order_by().values('user')
+        .annotate(value=aggregate).values('value')
+    )
+
+
+def annotated_users():
+    """
+    Users with role and activity aggregates, one row per user.
+    Correlated subqueries (rather than JOIN + GROUP BY) keep each count
+    independent and let the database evaluate them only for returned rows
+    when the sort does not depend on them.
+    """
+    return User.objects.annotate(
+        role=Coalesce(F('profile__role'), Value('patient')),
+        lmp_date=F('profile__lmp_date'),
+        exercise_sessions=Coalesce(_per_user(ExerciseSession.objects, Count('id')), 0),
+        activity_records=Coalesce(_per_user(ActivityData.objects, Count('id')), 0),
+        total_reps=Coalesce(_per_user(ExerciseSession.objects, Sum('rep_count')), 0),
+        last_session=Subquery(
+            ExerciseSession.objects.filter(user=OuterRef('pk'))
+            .order_by('-start_time').values('start_time')[:1]
+        ),
+    )
+
+
+def _positive_int(params, name):
+    value = params.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise InvalidQuery(f'{name} must be an integer')
+    if value < 0:
+        raise InvalidQuery(f'{name} must not be negative')
+    return value
+
+
+def apply_filters(users, params, now=None):
+    """
+    Filter by query parameters:
+        q             username or email contains
+        role          patient / doctor / admin
+        active_within has a session in the last N days
+        inactive_for  no session in the last N days
+        trimester     1, 2 or 3 (from profile LMP date)
+    """
+    now = now or timezone.now()
+
+    search = (params.get('q') or '').strip()
+    if search:
+        users = users.filter(Q(username__icontains=search) | Q(email__icontains=search))
+
+    role = params.get('role')
+    if role:
+        if role not in ('patient', 'doctor', 'admin'):
+            raise InvalidQuery('Invalid role')
+        users = users.filter(role=role)
+
+    active_within = _positive_int(params, 'active_within')
+    if active_within is not None:
+        recent = ExerciseSession.objects.filter(
+            user=OuterRef('pk'), start_time__gte=now - timedelta(days=active_within)
+        )
+        users = users.filter(Exists(recent))
+
+    inactive_for = _positive_int(params, 'inactive_for')
+    if inactive_for is not None:
+        recent = ExerciseSession.objects.filter(
+            user=OuterRef('pk'), start_time__gte=now - timedelta(days=inactive_for)
+        )
+        users = users.filter(~Exists(recent))
+
+    trimester = params.get('trimester')
+    if trimester:
+        try:
+            first_week, end_week = TRIMESTER_WEEKS[int(trimester)]
+        except (ValueError, KeyError):
+            raise InvalidQuery('trimester must be 1, 2 or 3')
+        today = now.date()
+        users = users.filter(
+            profile__lmp_date__lte=today - timedelta(weeks=first_week),
+            profile__lmp_date__gt=today - timedelta(weeks=end_week),
+        )
+
+    return users
+
+
+def parse_sort(sort):
+    """Return (field, descending) for a sort parameter such as '-total_reps'"""
+    sort = sort or '-id'
+    descending = sort.startswith('-')
+    field = sort.lstrip('-')
+    if field not in SORT_FIELDS:
+        raise InvalidQuery(f"Cannot sort by '{field}'")
+    return field, descending
+
+
+def encode_cursor(sort_value, user_id):
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, user_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor, is_datetime):
+    try:
+        sort_value, user_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        user_id = int(user_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidQuery('Invalid cursor')
+    if is_datetime:
+        sort_value = parse_datetime(sort_value) if isinstance(sort_value, str) else None
+        if sort_value is None:
+            raise InvalidQuery('Invalid cursor')
+    return sort_value, user_id
+
+
+def get_directory_page(params, now=None):
+    """
+    One page of the directory: (rows, next_cursor).
+    Keyset pagination on (sort value, id), so any page costs the same as
+    the first when sorting by an indexed column.
+    """
+    try:
+        page_size = min(int(params.get('page_size', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+    except (TypeError, ValueError):
+        raise InvalidQuery('page_size must be an integer')
+    if page_size < 1:
+        raise InvalidQuery('page_size must be positive')
+
+    field, descending = parse_sort(params.get('sort'))
+    expression, is_datetime = SORT_FIELDS[field]
+
+    users = apply_filters(annotated_users(), params, now=now).annotate(sort_key=expression)
+
+    cursor = params.get('cursor')
+    if cursor:
+        value, last_id = decode_cursor(cursor, is_datetime)
+        op = 'lt' if descending else 'gt'
+        users = users.filter(
+            Q(**{f'sort_key__{op}': value}) | Q(sort_key=value, **{f'id__{op}': last_id})
+        )
+
+    order = ['-sort_key', '-id'] if descending else ['sort_key', 'id']
+    rows = list(users.order_by(*order).values(*USER_FIELDS, 'lmp_date', 'sort_key')[:page_size + 1])
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(rows[-1]['sort_key'], rows[-1]['id'])
+
+    today = (now or timezone.now()).date()
+    for row in rows:
+        del row['sort_key']
+        lmp_date = row.pop('lmp_date')
+        week = (today - lmp_date).days // 7 if lmp_date else None
+        row['pregnancy_week'] = week
+        row['trimester'] = trimester_for(week)
+    return rows, next_cursor
@@ -0,0 +1,79 @@
+"""
+User Registration View
+"""
+import logging
+
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework import status
+from django.contrib.auth.models import User
+from exercise.models import UserProfile
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def register_user(request):
+    """
+    Register a new user with patient role
+    """
+    try:
+        username = request.data.get('username')
+        email = request.data.get('email')
+        password = request.data.get('password')
+        
+        # Validate required fields
+        if not username or not password:
+            return Response(
+                {'error': 'Username and password are required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # Use username as email if email not provided or empty
+        if not email or (isinstance(email, str) and email.strip() == ''):
+            email = f"{username}@example.com"
+        else:
+            email = email.strip()  # Remove any whitespace
+        
+        # Check if username already exists
+        if User.objects.filter(username=username).exists():
+            return Response(
+                {'error': 'Username already exists'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # Create user
+        user = User.objects.create_user(
+            username=username,
+            email=email,
+            password=password
+        )
+        logger.debug(f"Registered user {user.id}")
+        
+        # Create patient profile
+        UserProfile.objects.create(
+            user=user,
+            role='patient'
+        )
+        
+        # Send welcome notification and email
+        from apps.notifications.utils import notify_welcome
+        notify_welcome(user)
+        
+        return Response({
+            'message': 'User registered successfully',
+            'user': {
+                'id': user.id,
+                'username': user.username,
+                'email': user.email,
+                'role': 'patient'
+            }
+        }, status=status.HTTP_201_CREATED)
+        
+    except Exception as e:
+        return Response(
+            {'error': f'Registration failed: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from exercise.models import UserProfile
+from apps.notifications.reminder_dispatch import recompute_next_fire_times
 
 
 # =========================
@@ -33,6 +34,8 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'medical_conditions', 'allergies', 'medications', 'previous_pregnancies',
             # Emergency Contact
             'emergency_contact_name', 'emergency_contact_relationship', 'emergency_contact_phone',
+            # Preferences
+            'timezone',
             # Auto-calculated
             'age', 'bmi', 'due_date', 'pregnancy_week', 'trimester', 'days_until_due',
             # Timestamps
@@ -43,3 +46,11 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'age', 'bmi', 'due_date', 'pregnancy_week', 'trimester', 'days_until_due',
             'created_at', 'updated_at'
         ]
+    
+    def update(self, instance, validated_data):
+        previous_timezone = instance.timezone
+        profile = super().update(instance, validated_data)
+        if profile.timezone != previous_timezone:
+            # Reminder send times are stored in UTC; move them to the new zone
+            recompute_next_fire_times(user_ids=[profile.user_id])
+        return profile
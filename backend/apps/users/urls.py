@@ -1,7 +1,10 @@
 # Users app URLs
-# Will be populated when updating user views imports
 from django.urls import path
+from core.lazy_views import lazy_view
 
 urlpatterns = [
-    # User profile endpoints will be added here
+    # User Profile
+    path('profile/', lazy_view('apps.users.views.user_profile'), name='user-profile'),
+    path('profile/picture/', lazy_view('apps.users.views.upload_profile_picture'), name='upload-profile-picture'),
+    path('profile/picture/delete/', lazy_view('apps.users.views.delete_profile_picture'), name='delete-profile-picture'),
 ]
@@ -0,0 +1 @@
+# Standalone performance benchmarks (not collected by pytest)
@@ -0,0 +1,235 @@
+"""
+API Latency Benchmark
+p50/p95/p99 of every GET /api/ endpoint against generated datasets
+
+Run with:
+    python benchmarks/api_latency.py --scale tiny small --json api.json
+    python benchmarks/api_latency.py --scale large --iterations 20 --json api-large.json
+    python benchmarks/api_latency.py --compare before.json after.json
+
+For each scale a throwaway database is filled by the
+generate_load_dataset command, then every /api/ route that answers GET is
+discovered from the URLconf and timed in-process (full middleware, auth,
+view and serialization; no network) as the first of patient, doctor or
+admin that is allowed to call it. Results carry the git commit so two
+runs can be diffed with --compare.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import setup_django, benchmark_database, git_commit, time_call, write_results
+
+ROLES = ('patient', 'doctor', 'admin')
+# Schema generation and rendered documentation pages, not API calls
+SKIP_ROUTES = {'api/schema/', 'api/docs/', 'api/redoc/'}
+REGRESSION_THRESHOLD = 0.2  # 20% slower p95 is flagged by --compare
+
+_ROUTE_PARAM = re.compile(r'<(?:\w+:)?(\w+)>')
+_REGEX_PARAM = re.compile(r'\(\?P<(\w+)>[^)]*\)')
+
+
+def _allows_get(callback):
+    actions = getattr(callback, 'actions', None)
+    if actions is not None:  # DRF ViewSet
+        return 'get' in actions
+    view_class = getattr(callback, 'cls', None) or getattr(callback, 'view_class', None)
+    if view_class is not None:
+        return hasattr(view_class, 'get') and 'get' in view_class.http_method_names
+    return True
+
+
+def discover_endpoints(patterns=None, prefix=''):
+    """[(route template, [param names])] for every GET-able /api/ route"""
+    from django.urls import URLPattern, get_resolver
+
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    endpoints = []
+    for pattern in patterns:
+        text = str(pattern.pattern)
+        if '(?P<format>' in text or '<drf_format_suffix:' in text:  # DRF format-suffix duplicates
+            continue
+        route = prefix + text.lstrip('^').rstrip('$')
+        if isinstance(pattern, URLPattern):
+            if route.startswith('api/') and route not in SKIP_ROUTES and _allows_get(pattern.callback):
+                params = _ROUTE_PARAM.findall(route) + _REGEX_PARAM.findall(route)
+                endpoints.append((route, params))
+        else:
+            endpoints.extend(discover_endpoints(pattern.url_patterns, route))
+    return endpoints
+
+
+def sample_objects(patient):
+    """Ids to fill URL parameters, keyed by parameter name or router prefix for pk"""
+    from exercise.models import (
+        ActivityData, Exercise, ExerciseSession, Notification, NutritionFood, PregnancyContent
+    )
+
+    def first(queryset):
+        return queryset.order_by('id').values_list('id', flat=True).first()
+
+    exercise_id = first(Exercise.objects.all())
+    return {
+        'patient_id': patient.id,
+        'user_id': patient.id,
+        'exercise_id': exercise_id,
+        'food_id': first(NutritionFood.objects.all()),
+        'notification_id': first(Notification.objects.filter(user=patient)),
+        'pk': {
+            'api/exercises/': exercise_id,
+            'api/sessions/': first(ExerciseSession.objects.filter(user=patient)),
+            'api/activity-data/': first(ActivityData.objects.filter(user=patient)),
+            'api/pregnancy-content/': first(PregnancyContent.objects.all()),
+        },
+    }
+
+
+def query_strings():
+    """Required query parameters, by route"""
+    from django.utils import timezone
+
+    today = timezone.now().date()
+    return {
+        'api/weekly-report/': f'?start_date={today - timedelta(days=6)}&end_date={today}',
+    }
+
+
+def build_path(route, params, samples):
+    """Concrete URL for a route template, or None if a parameter has no sample"""
+    path = route
+    for name in params:
+        value = samples.get(name)
+        if name == 'pk':
+            value = next((v for p, v in value.items() if route.startswith(p)), None)
+        if value is None:
+            return None
+        path = re.sub(rf'<(?:\w+:)?{name}>|\(\?P<{name}>[^)]*\)', str(value), path, count=1)
+    return '/' + path + query_strings().get(route, '')
+
+
+def make_clients():
+    from django.contrib.auth.models import User
+    from django.test import Client
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    users = {
+        'patient': User.objects.filter(username__startswith='load_patient_').order_by('id').first(),
+        'doctor': User.objects.get(username='load_doctor_0'),
+        'admin': User.objects.get(username='load_admin'),
+    }
+    clients = {}
+    for role, user in users.items():
+        token = RefreshToken.for_user(user).access_token
+        # secure=True on requests: SECURE_SSL_REDIRECT is on when DEBUG is off
+        clients[role] = Client(HTTP_AUTHORIZATION=f'Bearer {token}')
+    return users, clients
+
+
+def measure_scale(scale, overrides, iterations):
+    from django.core.management import call_command
+
+    started = time.monotonic()
+    call_command('generate_load_dataset', scale=scale, verbosity=0, **overrides)
+    generated_in = time.monotonic() - started
+
+    from django.contrib.auth.models import User
+    from exercise.models import ActivityData, ExerciseSession, HealthVitals
+
+    users, clients = make_clients()
+    samples = sample_objects(users['patient'])
+    dataset = {
+        'users': User.objects.count(),
+        'sessions': ExerciseSession.objects.count(),
+        'vitals': HealthVitals.objects.count(),
+        'activity': ActivityData.objects.count(),
+        'generated_seconds': round(generated_in, 1),
+    }
+
+    endpoints = {}
+    for route, params in discover_endpoints():
+        path = build_path(route, params, samples)
+        if path is None:
+            endpoints[route] = {'skipped': 'no sample object for URL parameters'}
+            continue
+        status = None
+        for role in ROLES:
+            status = clients[role].get(path, secure=True).status_code
+            if status < 300:
+                break
+        if status >= 300:
+            endpoints[route] = {'skipped': f'HTTP {status} for every role'}
+            continue
+        client = clients[role]
+        endpoints[route] = {
+            'path': path, 'role': role, 'status': status,
+            **time_call(lambda: client.get(path, secure=True), iterations),
+        }
+        print(f"  {route:<55} {role:<8} p50 {endpoints[route]['p50_ms']:8.2f}"
+              f"  p95 {endpoints[route]['p95_ms']:8.2f}  p99 {endpoints[route]['p99_ms']:8.2f} ms")
+    return {'scale': scale, 'dataset': dataset, 'endpoints': endpoints}
+
+
+def compare(before_path, after_path, threshold=REGRESSION_THRESHOLD):
+    """Print p95 changes between two result files; exit 1 on regressions"""
+    with open(before_path) as fh:
+        before = json.load(fh)
+    with open(after_path) as fh:
+        after = json.load(fh)
+    old = {(s['scale'], r): row for s in before['results'] for r, row in s['endpoints'].items()}
+    regressions = 0
+    print(f"{before.get('commit')} -> {after.get('commit')}")
+    for scale in after['results']:
+        for route, row in scale['endpoints'].items():
+            previous = old.get((scale['scale'], route))
+            if 'p95_ms' not in row or not previous or 'p95_ms' not in previous:
+                continue
+            change = (row['p95_ms'] - previous['p95_ms']) / max(previous['p95_ms'], 0.001)
+            flag = 'REGRESSION' if change > threshold else ''
+            regressions += bool(flag)
+            print(f"  [{scale['scale']}] {route:<55} p95 {previous['p95_ms']:8.2f} -> "
+                  f"{row['p95_ms']:8.2f} ms ({change:+.0%}) {flag}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', nargs='+', default=['tiny'], help='generate_load_dataset presets')
+    parser.add_argument('--patients', type=int)
+    parser.add_argument('--sessions', type=int)
+    parser.add_argument('--vitals', type=int)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--json', help='Write results to this JSON file')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'), help='Diff two result files')
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(compare(*args.compare))
+
+    # Thousands of requests per user would otherwise hit the daily throttle
+    os.environ.setdefault('THROTTLE_USER', '1000000000/day')
+    setup_django()
+    from django.test.utils import setup_test_environment
+    setup_test_environment()  # allows the 'testserver' host
+
+    overrides = {k: v for k, v in (
+        ('patients', args.patients), ('sessions', args.sessions), ('vitals', args.vitals)
+    ) if v is not None}
+    results = []
+    for scale in args.scale:
+        print(f"Scale {scale}:")
+        with benchmark_database():
+            results.append(measure_scale(scale, overrides, args.iterations))
+
+    if args.json:
+        write_results(args.json, {'benchmark': 'api_latency', 'commit': git_commit(), 'results': results})
+
+
+if __name__ == '__main__':
+    main()
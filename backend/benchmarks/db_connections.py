@@ -0,0 +1,165 @@
+"""
+Database Connection Benchmark
+Per-request connection overhead in each DB_CONN_MODE
+
+Run with:
+    python benchmarks/db_connections.py
+    DB_ENGINE=django.db.backends.postgresql DB_HOST=... python benchmarks/db_connections.py --threads 4 --json conn.json
+
+Each simulated request sends Django's request_started / request_finished
+signals, which is where connections are closed, kept or returned to the
+pool, around the queries of a typical authenticated API call (user and
+profile lookups). Requests run on --threads threads like gunicorn
+threads. For each mode the report gives request latency, throughput and
+connections opened, plus the cost of a bare connect for reference.
+'pool' is measured only on PostgreSQL with psycopg 3 and psycopg_pool.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import setup_django, benchmark_database, git_commit, summarize, time_call, write_results
+
+
+def simulate_request(user_id):
+    from django.contrib.auth.models import User
+    from django.core.signals import request_finished, request_started
+    from exercise.models import UserProfile
+
+    request_started.send(sender=None)
+    try:
+        User.objects.get(id=user_id)
+        UserProfile.objects.filter(user_id=user_id).first()
+    finally:
+        request_finished.send(sender=None)
+
+
+def close_thread_connections(executor, threads):
+    """Close the connection each worker thread holds (one call per thread)"""
+    from django.db import connections
+
+    barrier = threading.Barrier(threads)
+
+    def close():
+        barrier.wait()
+        connections.close_all()
+
+    for future in [executor.submit(close) for _ in range(threads)]:
+        future.result()
+
+
+def apply_mode(mode, threads):
+    """Reconfigure the default alias in place; new thread connections pick it up"""
+    from django.db import connections
+    from core.db_connections import configure_database, connection_mode
+
+    database = connections.settings['default']
+    configured = configure_database(database, mode, threads=threads)
+    database.clear()
+    database.update(configured)
+    return connection_mode(database)
+
+
+def measure_mode(mode, user_ids, threads, requests):
+    from django.db import connections
+    from core.db_connections import connection_stats
+
+    effective = apply_mode(mode, threads)
+    if effective != mode:
+        return {'skipped': f'{mode} unavailable here (falls back to {effective})'}
+
+    opened_before = connection_stats()['default']['opened']
+    samples = []
+    lock = threading.Lock()
+
+    def timed(i):
+        start = time.perf_counter()
+        simulate_request(user_ids[i % len(user_ids)])
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            samples.append(elapsed)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for future in [executor.submit(timed, i) for i in range(min(threads * 5, requests))]:
+            future.result()  # warm up: first connections, pool fill
+        samples.clear()
+        opened_warm = connection_stats()['default']['opened']
+        started = time.perf_counter()
+        for future in [executor.submit(timed, i) for i in range(requests)]:
+            future.result()
+        wall = time.perf_counter() - started
+        close_thread_connections(executor, threads)
+
+    if effective == 'pool':
+        connections['default'].close_pool()
+    return {
+        'threads': threads,
+        'throughput_rps': round(requests / wall, 1),
+        'connections_opened_warmup': opened_warm - opened_before,
+        'connections_opened': connection_stats()['default']['opened'] - opened_warm,
+        **summarize(samples),
+    }
+
+
+def measure_connect(iterations):
+    """Cost of opening and closing one connection"""
+    from django.db import connections
+
+    connection = connections['default']
+
+    def connect():
+        connection.connect()
+        connection.close()
+
+    return time_call(connect, iterations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modes', nargs='+', default=['per_request', 'persistent', 'pool'])
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from exercise.models import UserProfile
+
+    results = {}
+    with benchmark_database():
+        users = User.objects.bulk_create([User(username=f'conn_bench_{i}', password='!') for i in range(args.users)])
+        UserProfile.objects.bulk_create([UserProfile(user=user, role='patient') for user in users])
+        user_ids = list(User.objects.values_list('id', flat=True))
+        original = dict(connection.settings_dict)
+        connect = measure_connect(min(args.requests, 200))
+        print(f"{connection.vendor}: bare connect p50 {connect['p50_ms']:.3f} ms, p95 {connect['p95_ms']:.3f} ms")
+        connection.close()
+        for mode in args.modes:
+            row = measure_mode(mode, user_ids, args.threads, args.requests)
+            results[mode] = row
+            if 'skipped' in row:
+                print(f"  {mode:<12} skipped: {row['skipped']}")
+                continue
+            print(f"  {mode:<12} p50 {row['p50_ms']:7.3f} ms  p95 {row['p95_ms']:7.3f} ms  "
+                  f"p99 {row['p99_ms']:7.3f} ms  {row['throughput_rps']:8.1f} req/s  "
+                  f"{row['connections_opened']} connections opened for {args.requests} requests")
+        connection.settings_dict.clear()
+        connection.settings_dict.update(original)
+
+    if args.json:
+        write_results(args.json, {
+            'benchmark': 'db_connections', 'commit': git_commit(), 'vendor': connection.vendor,
+            'connect': connect, 'modes': results,
+        })
+
+
+if __name__ == '__main__':
+    main()
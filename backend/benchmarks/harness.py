@@ -0,0 +1,97 @@
+"""
+Benchmark Harness
+Shared setup, throwaway database and timing helpers for benchmark scripts
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    """Configure Django so a benchmark can run as a plain script"""
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pregnancy.settings')
+    os.environ.setdefault('SECRET_KEY', 'benchmark-only-secret-key')
+
+    import django
+    django.setup()
+
+
+@contextmanager
+def benchmark_database(keepdb=False):
+    """
+    Create a throwaway test database for the duration of the block.
+    SQLite databases go to a temp file rather than memory so that
+    multi-million-row datasets do not exhaust RAM.
+    """
+    from django.db import connection
+
+    test_settings = connection.settings_dict.setdefault('TEST', {})
+    if connection.vendor == 'sqlite' and not test_settings.get('NAME'):
+        test_settings['NAME'] = os.path.join(tempfile.gettempdir(), 'pregnancy_benchmark.sqlite3')
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+
+
+def time_call(func, iterations=50, warmup=3):
+    """Run func repeatedly and return latency percentiles in milliseconds"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, min(len(sorted_samples) - 1, round(pct / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[rank]
+
+
+def summarize(samples):
+    """Latency summary (ms) for a list of samples"""
+    ordered = sorted(samples)
+    return {
+        'count': len(ordered),
+        'mean_ms': round(statistics.fmean(ordered), 3) if ordered else 0.0,
+        'p50_ms': round(percentile(ordered, 50), 3),
+        'p95_ms': round(percentile(ordered, 95), 3),
+        'p99_ms': round(percentile(ordered, 99), 3),
+        'max_ms': round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+def git_commit():
+    """Short hash of the checked-out commit, recorded with results"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path, results):
+    """Write benchmark results as JSON for cross-commit comparison"""
+    with open(path, 'w') as fh:
+        json.dump(results, fh, indent=2, default=str)
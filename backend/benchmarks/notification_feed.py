@@ -0,0 +1,130 @@
+"""
+Notification Feed Benchmark
+Shows feed latency staying flat as the Notification table grows
+
+Run with:
+    python benchmarks/notification_feed.py --max-rows 10000000
+    python benchmarks/notification_feed.py --max-rows 100000 --json feed.json
+
+The table is grown in steps (10k, 100k, 1M, 10M by default) across
+--users users, and at each step the probe user's feed is timed through
+the keyset path (first page, deep page, `since` poll, cached unread count)
+next to the legacy OFFSET + COUNT path for comparison.
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import setup_django, benchmark_database, time_call, write_results
+
+DEFAULT_STEPS = [10_000, 100_000, 1_000_000, 10_000_000]
+INSERT_BATCH = 50_000
+
+
+def create_users(count):
+    from django.contrib.auth.models import User
+    User.objects.bulk_create(
+        [User(username=f'bench_user_{i}', password='!') for i in range(count)],
+        batch_size=5000
+    )
+    return list(User.objects.order_by('id').values_list('id', flat=True))
+
+
+def insert_notifications(connection, user_ids, start, stop, epoch):
+    """Raw executemany insert of rows [start, stop), round-robin over users"""
+    from django.db import transaction
+    from exercise.models import Notification
+
+    table = connection.ops.quote_name(Notification._meta.db_table)
+    sql = (
+        f"INSERT INTO {table} (user_id, notification_type, priority, title, message, "
+        f"is_read, created_at, action_url) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"
+    )
+    for batch_start in range(start, stop, INSERT_BATCH):
+        batch_stop = min(batch_start + INSERT_BATCH, stop)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(sql, [
+                (
+                    user_ids[i % len(user_ids)], 'system', 'low',
+                    f'Notification {i}', 'Benchmark message',
+                    i % 3 != 0, epoch + timedelta(seconds=i), None
+                )
+                for i in range(batch_start, batch_stop)
+            ])
+
+
+def measure(user, iterations):
+    from django.core.cache import cache
+    from exercise.models import Notification
+    from apps.notifications.feed import get_feed_page, get_unread_count, encode_cursor
+
+    first_page, _ = get_feed_page(user, page_size=10)
+    history = Notification.objects.filter(user=user).order_by('-created_at', '-id')
+    own_rows = history.count()
+    deep_offset = own_rows // 2
+    deep_item = history[deep_offset] if own_rows else None
+    deep_cursor = encode_cursor(deep_item) if deep_item else None
+    latest = encode_cursor(first_page[0]) if first_page else None
+
+    def cold_unread():
+        cache.clear()
+        get_unread_count(user.id)
+
+    def legacy_offset_page():
+        qs = Notification.objects.filter(user=user)
+        qs.filter(is_read=False).count()
+        qs.count()
+        list(qs[deep_offset:deep_offset + 10])
+
+    return {
+        'user_rows': own_rows,
+        'keyset_first_page': time_call(lambda: get_feed_page(user, page_size=10), iterations),
+        'keyset_deep_page': time_call(lambda: get_feed_page(user, cursor=deep_cursor, page_size=10), iterations),
+        'since_poll': time_call(lambda: get_feed_page(user, since=latest, page_size=10), iterations),
+        'unread_count_warm': time_call(lambda: get_unread_count(user.id), iterations),
+        'unread_count_cold': time_call(cold_unread, iterations),
+        'legacy_offset_deep_page': time_call(legacy_offset_page, iterations),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--max-rows', type=int, default=DEFAULT_STEPS[-1])
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth.models import User
+
+    steps = [s for s in DEFAULT_STEPS if s < args.max_rows] + [args.max_rows]
+    epoch = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+    results = []
+
+    with benchmark_database() as connection:
+        user_ids = create_users(args.users)
+        probe = User.objects.get(id=user_ids[0])
+        inserted = 0
+        for total in steps:
+            insert_notifications(connection, user_ids, inserted, total, epoch)
+            inserted = total
+            row = {'total_rows': total, **measure(probe, args.iterations)}
+            results.append(row)
+            print(
+                f"{total:>11,} rows | first page p50 {row['keyset_first_page']['p50_ms']:7.3f} ms"
+                f" | deep page p50 {row['keyset_deep_page']['p50_ms']:7.3f} ms"
+                f" | since p50 {row['since_poll']['p50_ms']:7.3f} ms"
+                f" | unread warm p50 {row['unread_count_warm']['p50_ms']:7.3f} ms"
+                f" | legacy offset p50 {row['legacy_offset_deep_page']['p50_ms']:8.3f} ms"
+            )
+
+    if args.json:
+        write_results(args.json, {'benchmark': 'notification_feed', 'results': results})
+
+
+if __name__ == '__main__':
+    main()
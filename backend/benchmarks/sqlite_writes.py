@@ -0,0 +1,166 @@
+"""
+SQLite Write Concurrency Benchmark
+Write throughput and "database is locked" errors with N writer threads,
+default SQLite settings against the tuning in core/sqlite_tuning.py
+
+Run with:
+    python benchmarks/sqlite_writes.py
+    python benchmarks/sqlite_writes.py --threads 1 4 16 --writes 4000 --json sqlite.json
+
+Each write is what a vitals save does: one transaction that reads the
+user's latest vitals, then inserts a vitals row and a notification.
+'default' is SQLite out of the box (rollback journal, synchronous=FULL,
+deferred transactions, 5 s busy timeout); 'tuned' is configure_sqlite()
+with the settings' busy timeout and retries. Failed writes are counted,
+not retried by the benchmark. Runs on a throwaway file database, so
+DB_ENGINE must be SQLite.
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import setup_django, benchmark_database, git_commit, summarize, write_results
+from benchmarks.db_connections import close_thread_connections
+
+
+def default_database(database):
+    """The entry without tuning"""
+    options = {
+        key: value for key, value in database.get('OPTIONS', {}).items()
+        if key not in ('init_command', 'transaction_mode', 'timeout')
+    }
+    return {**database, 'OPTIONS': options}
+
+
+def apply_config(name, original):
+    """Reconfigure the default alias in place; new thread connections pick it up"""
+    from django.conf import settings
+    from django.db import connections
+    from core import sqlite_tuning
+    from core.sqlite_tuning import configure_sqlite
+
+    if name == 'tuned':
+        configured = configure_sqlite(
+            default_database(original), busy_timeout=settings.DB_SQLITE_BUSY_TIMEOUT,
+            mmap_size=settings.DB_SQLITE_MMAP_SIZE, cache_size=settings.DB_SQLITE_CACHE_SIZE,
+        )
+    else:
+        configured = default_database(original)
+    database = connections.settings['default']
+    connection = connections['default']
+    connection.close()
+    database.clear()
+    database.update(configured)
+    connection.settings_dict = database
+    if name == 'default':
+        # WAL persists in the database file; the tuned run switches it on again
+        connection.ensure_connection()
+        connection.connection.execute('PRAGMA journal_mode=DELETE')
+        connection.close()
+        sqlite_tuning._wal_enabled.discard(database['NAME'])
+
+
+def write_vitals(user_id):
+    from django.db import transaction
+    from exercise.models import HealthVitals, Notification
+
+    with transaction.atomic():
+        latest = HealthVitals.objects.filter(user_id=user_id).order_by('-timestamp').first()
+        heart_rate = random.randint(70, 120)
+        HealthVitals.objects.create(
+            user_id=user_id, heart_rate=heart_rate, spo2=random.randint(94, 100),
+            fatigue_level=random.randint(0, 100), daily_active_minutes=latest.daily_active_minutes + 1 if latest else 0,
+        )
+        Notification.objects.create(
+            user_id=user_id, notification_type='health_alert', priority='low',
+            title='Vitals recorded', message=f'Heart rate {heart_rate} BPM',
+        )
+
+
+def measure(threads, writes, user_ids):
+    from django.db import OperationalError
+    from core.sqlite_tuning import is_busy_error, sqlite_stats
+
+    retries_before = sqlite_stats().get('default', {}).get('busy_retries', 0)
+    samples, errors = [], []
+    lock = threading.Lock()
+
+    def timed(i):
+        start = time.perf_counter()
+        try:
+            write_vitals(user_ids[i % len(user_ids)])
+        except OperationalError as exc:
+            with lock:
+                errors.append('locked' if is_busy_error(exc) else str(exc))
+            return
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            samples.append(elapsed)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        started = time.perf_counter()
+        for future in [executor.submit(timed, i) for i in range(writes)]:
+            future.result()
+        wall = time.perf_counter() - started
+        close_thread_connections(executor, threads)
+
+    return {
+        'threads': threads,
+        'writes_per_s': round(len(samples) / wall, 1),
+        'errors': len(errors),
+        'error_rate': round(len(errors) / writes, 4),
+        'locked_errors': errors.count('locked'),
+        'busy_retries': sqlite_stats().get('default', {}).get('busy_retries', 0) - retries_before,
+        **summarize(samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--configs', nargs='+', default=['default', 'tuned'], choices=['default', 'tuned'])
+    parser.add_argument('--threads', nargs='+', type=int, default=[1, 2, 4, 8, 16])
+    parser.add_argument('--writes', type=int, default=2000, help='Writes per run')
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth.models import User
+    from django.db import connection
+
+    if connection.vendor != 'sqlite':
+        parser.error('this benchmark needs DB_ENGINE=django.db.backends.sqlite3')
+
+    results = {}
+    with benchmark_database():
+        User.objects.bulk_create([User(username=f'sqlite_bench_{i}', password='!') for i in range(args.users)])
+        user_ids = list(User.objects.values_list('id', flat=True))
+        original = dict(connection.settings_dict)
+        for name in args.configs:
+            apply_config(name, original)
+            results[name] = []
+            print(f'{name}:')
+            for threads in args.threads:
+                row = measure(threads, args.writes, user_ids)
+                results[name].append(row)
+                print(f"  {threads:>3} threads  {row['writes_per_s']:8.1f} writes/s  "
+                      f"p50 {row['p50_ms']:7.3f} ms  p95 {row['p95_ms']:7.3f} ms  p99 {row['p99_ms']:8.3f} ms  "
+                      f"{row['errors']:>5} errors ({row['locked_errors']} locked), {row['busy_retries']} busy retries")
+        connection.close()
+        connection.settings_dict.clear()
+        connection.settings_dict.update(original)
+
+    if args.json:
+        write_results(args.json, {
+            'benchmark': 'sqlite_writes', 'commit': git_commit(), 'writes': args.writes, 'configs': results,
+        })
+
+
+if __name__ == '__main__':
+    main()
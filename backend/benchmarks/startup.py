@@ -0,0 +1,107 @@
+"""
+Worker Startup Benchmark
+Cold-start import time, peak RSS and the most expensive packages of a
+fresh worker, from `python -X importtime` (core/import_profile.py)
+
+Run with:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10 --json startup.json
+    python benchmarks/startup.py --warm --json startup-warm.json
+    python benchmarks/startup.py --why numpy --why rest_framework_simplejwt.settings
+    python benchmarks/startup.py --compare before.json after.json
+
+Each run boots Django in a new interpreter the way a gunicorn worker does
+before its first request (WSGI application, then the URLconf); --warm
+also imports every route's view, as in a worker that has served them
+all. Timings are the median over --runs; per-package numbers are the
+packages' own import time, so they add up to the total. --why prints the chain of
+imports that pulled a module in. Settings come from the environment
+(.env); DEBUG=False is used unless DEBUG is set, as in production.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import git_commit, write_results
+from core.import_profile import PROJECT_PACKAGES, by_package, import_chain, profile_startup
+
+REGRESSION_THRESHOLD = 0.1  # 10% slower imports or 10% more memory is flagged by --compare
+
+
+def measure(runs, top, warm=False):
+    env = {'DEBUG': os.environ.get('DEBUG', 'False')}
+    reports = [profile_startup(warm=warm, env=env) for _ in range(runs)]
+    median = reports[len(reports) // 2]
+    packages = by_package(median['modules'])
+    loaded = median['loaded']
+    return {
+        'runs': runs,
+        'warm': warm,
+        'wall_ms': round(statistics.median(r['wall_ms'] for r in reports), 1),
+        'import_ms': round(statistics.median(r['import_ms'] for r in reports), 1),
+        'max_rss_kb': statistics.median(r['max_rss_kb'] for r in reports),
+        'modules_loaded': len(loaded),
+        'project_modules': [name for name in loaded if name.split('.')[0] in PROJECT_PACKAGES],
+        'packages_ms': dict(list(packages.items())[:top]),
+    }, median
+
+
+def compare(before_path, after_path, threshold=REGRESSION_THRESHOLD):
+    """Print startup changes between two result files; exit 1 on regressions"""
+    with open(before_path) as fh:
+        before = json.load(fh)
+    with open(after_path) as fh:
+        after = json.load(fh)
+    regressions = 0
+    print(f"{before.get('commit')} -> {after.get('commit')}")
+    for key in ('wall_ms', 'import_ms', 'max_rss_kb', 'modules_loaded'):
+        old, new = before['results'][key], after['results'][key]
+        change = (new - old) / max(old, 0.001)
+        flag = 'REGRESSION' if key != 'wall_ms' and change > threshold else ''
+        regressions += bool(flag)
+        print(f"  {key:<16} {old:>10} -> {new:>10} ({change:+.0%}) {flag}")
+    dropped = sorted(set(before['results']['project_modules']) - set(after['results']['project_modules']))
+    added = sorted(set(after['results']['project_modules']) - set(before['results']['project_modules']))
+    if dropped:
+        print(f"  no longer imported at startup: {', '.join(dropped)}")
+    if added:
+        print(f"  newly imported at startup: {', '.join(added)}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15, help='Packages to list')
+    parser.add_argument('--warm', action='store_true', help="Also import every route's view")
+    parser.add_argument('--why', action='append', default=[], metavar='MODULE',
+                        help='Show what imports MODULE at startup')
+    parser.add_argument('--json', help='Write results to this JSON file')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'), help='Diff two result files')
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(compare(*args.compare))
+
+    results, median = measure(args.runs, args.top, args.warm)
+    print(f"{'Warm worker' if args.warm else 'Startup'} over {args.runs} runs: {results['wall_ms']} ms wall, "
+          f"{results['import_ms']} ms importing, {results['max_rss_kb'] / 1024:.1f} MB peak RSS, "
+          f"{results['modules_loaded']} modules")
+    for package, ms in results['packages_ms'].items():
+        print(f"  {package:<32} {ms:8.1f} ms")
+    for module in args.why:
+        if module in median['loaded']:
+            print(f"{module}: {' -> '.join(import_chain(median['modules'], module))}")
+        else:
+            print(f"{module}: not imported at startup")
+
+    if args.json:
+        write_results(args.json, {'benchmark': 'startup', 'commit': git_commit(), 'results': results})
+
+
+if __name__ == '__main__':
+    main()
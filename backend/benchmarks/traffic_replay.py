@@ -0,0 +1,501 @@
+"""
+Traffic Replay Load Generator
+Replays the frontend's polling and fan-out patterns with asyncio virtual users
+
+Run with:
+    python benchmarks/traffic_replay.py --users 200 --duration 300
+    python benchmarks/traffic_replay.py --users 50 --duration 60 --time-scale 10 --json replay.json
+    python benchmarks/traffic_replay.py --url http://localhost:8000 --users 1000 --duration 900
+
+Virtual users follow the client code:
+    patient  dashboard fan-out on load (App, PregnancyProgressWidget,
+             NotificationBell, HealthMonitoringPanel), bell poll with
+             `since` every 30 s, vitals poll every 30 s, and exercise
+             sessions with a safety check every 10 s, saved at the end
+    doctor   patient list, then one patient chart after another; bell poll
+    admin    AdminDashboard's four parallel calls, then the SystemHealth
+             page refreshing every 30 s for a while; bell poll
+
+Without --url the WSGI application is driven in-process against a
+throwaway database filled by generate_load_dataset, with --threads
+playing the server's worker threads. With --url the server must already
+hold a load dataset with at least --users patients (load_* accounts,
+password loadtest) and throttling raised (THROTTLE_USER / THROTTLE_ANON);
+each virtual user then logs in first, and those logins are reported.
+In-process users start with a token already issued.
+
+--time-scale shrinks every client interval (10 = polls every 3 s) to
+reach a given request rate with fewer users. Latency is measured from
+the client side, so it includes queueing for a free worker.
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import setup_django, benchmark_database, git_commit, summarize, write_results
+
+PASSWORD = 'loadtest'
+DATASET_DOCTORS = 10  # generate_load_dataset default
+
+# Client intervals in seconds, from the frontend
+BELL_POLL_INTERVAL = 30       # NotificationBell
+VITALS_POLL_INTERVAL = 30     # HealthMonitoringPanel
+SAFETY_CHECK_INTERVAL = 10    # ExerciseExecution during a session
+SYSTEM_HEALTH_INTERVAL = 30   # admin SystemHealth page
+
+ADMIN_DASHBOARD = ('/api/admin-analytics/', '/api/user-list/', '/api/user-growth/', '/api/activity-trends/')
+PATIENT_DASHBOARD = ('/api/pregnancy-profile/', '/api/profile/')
+
+
+# Transports: blocking, one channel per virtual user, run on the executor
+
+def _decode(raw):
+    try:
+        return json.loads(raw) if raw else None
+    except ValueError:
+        return None
+
+
+class HttpChannel:
+    """Keep-alive HTTP/1.1 connection to a running server, like one browser tab"""
+
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        self.connection_class = (
+            http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        )
+        self.netloc = parts.netloc
+        self.prefix = parts.path.rstrip('/')
+        self.connection = None
+        self.token = None
+
+    def request(self, method, path, body=None):
+        headers = {'Accept': 'application/json'}
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = self.connection_class(self.netloc, timeout=30)
+            try:
+                self.connection.request(method, self.prefix + path, payload, headers)
+                response = self.connection.getresponse()
+                return response.status, _decode(response.read())
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server closed an idle keep-alive connection; reconnect once
+                self.connection.close()
+                self.connection = None
+                if attempt:
+                    raise
+        return None
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+
+
+class InProcessChannel:
+    """Requests through Django's WSGI handler without a socket"""
+
+    def __init__(self):
+        from django.test import Client
+        self.client = Client()
+        self.token = None
+
+    def request(self, method, path, body=None):
+        extra = {'HTTP_AUTHORIZATION': f'Bearer {self.token}'} if self.token else {}
+        # secure=True: SECURE_SSL_REDIRECT is on when DEBUG is off
+        if method == 'GET':
+            response = self.client.get(path, secure=True, **extra)
+        else:
+            response = self.client.generic(
+                method, path, json.dumps(body or {}), content_type='application/json', secure=True, **extra
+            )
+        return response.status_code, _decode(response.content)
+
+    def close(self):
+        pass
+
+
+# Statistics
+
+class ReplayStats:
+    """Latency samples and outcomes per endpoint label"""
+
+    def __init__(self):
+        self.samples = {}
+        self.errors = Counter()
+        self.statuses = {}
+
+    def record(self, label, status, seconds):
+        self.samples.setdefault(label, []).append(seconds * 1000)
+        self.statuses.setdefault(label, Counter())[status] += 1
+        if not 200 <= status < 400:
+            self.errors[label] += 1
+
+    def report(self, elapsed):
+        endpoints = {}
+        for label in sorted(self.samples):
+            samples = self.samples[label]
+            endpoints[label] = {
+                'requests': len(samples),
+                'throughput_rps': round(len(samples) / elapsed, 3),
+                'errors': self.errors[label],
+                'error_rate': round(self.errors[label] / len(samples), 4),
+                'statuses': {str(status): count for status, count in self.statuses[label].items()},
+                **summarize(samples),
+            }
+        requests = sum(len(samples) for samples in self.samples.values())
+        errors = sum(self.errors.values())
+        totals = {
+            'requests': requests,
+            'throughput_rps': round(requests / elapsed, 3),
+            'errors': errors,
+            'error_rate': round(errors / requests, 4) if requests else 0.0,
+            **summarize([sample for samples in self.samples.values() for sample in samples]),
+        }
+        return totals, endpoints
+
+
+class Replay:
+    """Shared state of one run"""
+
+    def __init__(self, channel_factory, executor, duration, time_scale, session_interval, seed):
+        self.channel_factory = channel_factory
+        self.executor = executor
+        self.duration = duration
+        self.time_scale = time_scale
+        self.session_interval = session_interval
+        self.seed = seed
+        self.stats = ReplayStats()
+        self.deadline = None
+
+
+# Virtual users
+
+class VirtualUser:
+    role = None
+
+    def __init__(self, replay, index, username):
+        self.replay = replay
+        self.username = username
+        self.rng = random.Random(replay.seed * 100_003 + index)
+        self.channel = replay.channel_factory()
+        self.cursor = None
+
+    async def call(self, label, method, path, body=None):
+        """Issue one request; the decoded body on success, else None"""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            status, data = await loop.run_in_executor(
+                self.replay.executor, self.channel.request, method, path, body
+            )
+        except (OSError, http.client.HTTPException):
+            status, data = 0, None  # refused, reset or timed out
+        self.replay.stats.record(label, status, time.perf_counter() - start)
+        return data if 200 <= status < 400 else None
+
+    async def get(self, path, label=None):
+        return await self.call(label or f'GET {path}', 'GET', path)
+
+    async def sleep(self, seconds):
+        """Wait in client time; False once the run is over"""
+        remaining = self.replay.deadline - time.monotonic()
+        await asyncio.sleep(max(0.0, min(seconds / self.replay.time_scale, remaining)))
+        return time.monotonic() < self.replay.deadline
+
+    async def poll(self, interval, func):
+        """setInterval: browsers are not in lockstep, so start at a random phase"""
+        if not await self.sleep(self.rng.uniform(0, interval)):
+            return
+        while True:
+            await func()
+            if not await self.sleep(interval):
+                return
+
+    async def login(self):
+        data = await self.call('POST /api/auth/token/', 'POST', '/api/auth/token/', {
+            'username': self.username, 'password': PASSWORD,
+        })
+        if data:
+            self.channel.token = data['access']
+        return bool(data)
+
+    async def fetch_notifications(self):
+        data = await self.get('/api/notifications/')
+        if data:
+            self.cursor = data.get('latest_cursor')
+
+    async def poll_notifications(self):
+        if not self.cursor:
+            return await self.fetch_notifications()
+        data = await self.get(f'/api/notifications/?since={quote(self.cursor)}', 'GET /api/notifications/?since')
+        if data:
+            self.cursor = data.get('latest_cursor') or self.cursor
+
+    async def run(self):
+        try:
+            if self.channel.token or await self.login():
+                await self.browse()
+        finally:
+            self.channel.close()
+
+    async def browse(self):
+        raise NotImplementedError
+
+
+class Patient(VirtualUser):
+    role = 'patient'
+
+    async def browse(self):
+        await asyncio.gather(
+            *(self.get(path) for path in PATIENT_DASHBOARD),
+            self.fetch_notifications(),
+            self.get('/api/current-health-vitals/'),
+        )
+        await asyncio.gather(
+            self.poll(BELL_POLL_INTERVAL, self.poll_notifications),
+            self.poll(VITALS_POLL_INTERVAL, lambda: self.get('/api/current-health-vitals/')),
+            self.exercise(),
+        )
+
+    async def exercise(self):
+        rng = self.rng
+        while await self.sleep(rng.expovariate(1 / self.replay.session_interval)):
+            exercises = await self.get('/api/exercises/')
+            if isinstance(exercises, dict):  # paginated
+                exercises = exercises.get('results')
+            if not exercises:
+                continue
+            reps = 0
+            for _ in range(int(rng.uniform(120, 480) // SAFETY_CHECK_INTERVAL)):
+                if not await self.sleep(SAFETY_CHECK_INTERVAL):
+                    return
+                reps += rng.randint(2, 5)
+                await self.call('POST /api/check-exercise-safety/', 'POST', '/api/check-exercise-safety/', {
+                    'posture_score': round(rng.uniform(60, 98), 1), 'current_reps': reps,
+                })
+            await self.call('POST /api/sessions/', 'POST', '/api/sessions/', {
+                'exercise_id': rng.choice(exercises)['id'],
+                'rep_count': reps,
+                'avg_posture_score': round(rng.uniform(60, 98), 1),
+                'posture_warnings': '',
+            })
+
+
+class Doctor(VirtualUser):
+    role = 'doctor'
+
+    async def browse(self):
+        self.patients = []
+        await asyncio.gather(self.load_patients(), self.fetch_notifications())
+        await asyncio.gather(
+            self.poll(BELL_POLL_INTERVAL, self.poll_notifications),
+            self.review_patients(),
+        )
+
+    async def load_patients(self):
+        data = await self.get('/api/doctor/patients/')
+        if data:
+            self.patients = [patient['id'] for patient in data.get('patients', [])]
+
+    async def review_patients(self):
+        while await self.sleep(self.rng.uniform(10, 60)):  # reading one chart
+            if not self.patients or self.rng.random() < 0.2:
+                await self.load_patients()
+            if self.patients:
+                patient_id = self.rng.choice(self.patients)
+                await self.get(f'/api/doctor/patient/{patient_id}/', 'GET /api/doctor/patient/{id}/')
+
+
+class Admin(VirtualUser):
+    role = 'admin'
+
+    async def browse(self):
+        await self.fetch_notifications()
+        await asyncio.gather(
+            self.poll(BELL_POLL_INTERVAL, self.poll_notifications),
+            self.navigate(),
+        )
+
+    async def navigate(self):
+        while True:
+            await asyncio.gather(*(self.get(path) for path in ADMIN_DASHBOARD))
+            if not await self.sleep(self.rng.uniform(20, 90)):
+                return
+            # SystemHealth page: loads, then refreshes until the admin moves on
+            for _ in range(self.rng.randint(2, 10)):
+                await self.get('/api/admin/system-health/')
+                if not await self.sleep(SYSTEM_HEALTH_INTERVAL):
+                    return
+
+
+ROLE_CLASSES = {cls.role: cls for cls in (Patient, Doctor, Admin)}
+
+
+def parse_mix(text):
+    """'patient=90,doctor=8,admin=2' -> {role: weight}"""
+    mix = {}
+    for part in text.split(','):
+        role, _, weight = part.partition('=')
+        if role.strip() not in ROLE_CLASSES:
+            raise argparse.ArgumentTypeError(f"Unknown role '{role}'")
+        mix[role.strip()] = float(weight)
+    return mix
+
+
+def build_users(replay, count, mix):
+    total = sum(mix.values())
+    counts = {role: int(count * weight / total) for role, weight in mix.items()}
+    for role, weight in mix.items():
+        if weight and not counts[role] and count >= len(mix):
+            counts[role] = 1  # small runs still exercise every role
+    counts['patient'] = counts.get('patient', 0) + count - sum(counts.values())
+    users = []
+    for role, role_count in counts.items():
+        for i in range(role_count):
+            if role == 'patient':
+                username = f'load_patient_{i}'
+            elif role == 'doctor':
+                username = f'load_doctor_{i % DATASET_DOCTORS}'
+            else:
+                username = 'load_admin'
+            users.append(ROLE_CLASSES[role](replay, len(users), username))
+    random.Random(replay.seed).shuffle(users)  # interleave roles during ramp-up
+    return users, counts
+
+
+async def replay_traffic(replay, users, ramp_up):
+    async def start(user, delay):
+        await asyncio.sleep(delay)
+        await user.run()
+
+    replay.deadline = time.monotonic() + replay.duration
+    await asyncio.gather(*(
+        start(user, ramp_up * i / len(users)) for i, user in enumerate(users)
+    ))
+
+
+def issue_tokens(users):
+    """In-process users start with a token, like the one App.tsx keeps in localStorage"""
+    from django.contrib.auth.models import User
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    tokens = {}
+    for user in users:
+        if user.username not in tokens:
+            account = User.objects.get(username=user.username)
+            tokens[user.username] = str(RefreshToken.for_user(account).access_token)
+        user.channel.token = tokens[user.username]
+
+
+def close_thread_connections(executor, threads):
+    """Close the Django connection each worker thread opened"""
+    from django.db import connections
+
+    barrier = threading.Barrier(threads)
+
+    def close():
+        barrier.wait()  # one call per thread
+        connections.close_all()
+
+    for future in [executor.submit(close) for _ in range(threads)]:
+        future.result()
+
+
+def print_report(totals, endpoints):
+    print(f"{'endpoint':<45} {'requests':>9} {'req/s':>8} {'errors':>7} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for label, row in list(endpoints.items()) + [('TOTAL', totals)]:
+        print(f"{label:<45} {row['requests']:>9} {row['throughput_rps']:>8.2f} "
+              f"{row['error_rate']:>7.2%} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', help='Base URL of a running server (default: in-process WSGI)')
+    parser.add_argument('--users', type=int, default=100, help='Concurrent virtual users')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('patient=90,doctor=8,admin=2'))
+    parser.add_argument('--duration', type=float, default=120, help='Seconds of traffic')
+    parser.add_argument('--ramp-up', type=float, default=10, help='Seconds over which users arrive')
+    parser.add_argument('--time-scale', type=float, default=1.0, help='Speed up client clocks')
+    parser.add_argument('--session-interval', type=float, default=600,
+                        help='Mean seconds between a patient\'s exercise sessions')
+    parser.add_argument('--threads', type=int,
+                        help='Worker threads (default: 8 in-process, one per user with --url)')
+    parser.add_argument('--scale', default='tiny', help='generate_load_dataset preset for in-process runs')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    threads = args.threads or (min(args.users, 512) if args.url else 8)
+    executor = ThreadPoolExecutor(max_workers=threads)
+
+    def run(channel_factory, prepare=None):
+        replay = Replay(channel_factory, executor, args.duration, args.time_scale, args.session_interval, args.seed)
+        users, counts = build_users(replay, args.users, args.mix)
+        if prepare is not None:
+            prepare(users)
+        print(f"Replaying {args.duration:.0f}s of traffic from {counts} over {threads} threads...")
+        started = time.monotonic()
+        asyncio.run(replay_traffic(replay, users, args.ramp_up))
+        return counts, replay.stats.report(time.monotonic() - started)
+
+    if args.url:
+        counts, (totals, endpoints) = run(lambda: HttpChannel(args.url))
+    else:
+        # Logins and polls from one test client would otherwise hit the throttles
+        os.environ.setdefault('THROTTLE_ANON', '1000000000/day')
+        os.environ.setdefault('THROTTLE_USER', '1000000000/day')
+        setup_django()
+        # The report covers every request; per-request slow logs would drown it
+        logging.getLogger('performance').setLevel(logging.ERROR)
+        from django.core.management import call_command
+        from django.test.utils import setup_test_environment
+        setup_test_environment()
+
+        from exercise.management.commands.generate_load_dataset import SCALES
+
+        with benchmark_database():
+            # Every virtual patient needs an account of its own
+            patients = max(args.users, SCALES[args.scale][0])
+            call_command('generate_load_dataset', scale=args.scale, patients=patients, verbosity=0)
+            try:
+                counts, (totals, endpoints) = run(InProcessChannel, issue_tokens)
+            finally:
+                close_thread_connections(executor, threads)
+    executor.shutdown()
+
+    print_report(totals, endpoints)
+    if args.json:
+        write_results(args.json, {
+            'benchmark': 'traffic_replay',
+            'commit': git_commit(),
+            'target': args.url or 'in-process',
+            'config': {
+                'users': counts, 'duration_s': args.duration, 'ramp_up_s': args.ramp_up,
+                'time_scale': args.time_scale, 'threads': threads,
+            },
+            'totals': totals,
+            'endpoints': endpoints,
+        })
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,38 @@
 import pytest
 from django.contrib.auth.models import User
+from exercise.models import UserProfile
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
+pytest_plugins = ['core.pytest_query_budget']
+
+
+def pytest_configure(config):
+    """
+    A second SQLite database stands in for the read replica. Routing to it
+    is off (READ_REPLICA_ALIAS unset) unless a test turns it on.
+    """
+    from django.conf import settings
+    from django.db import connections
+
+    settings.DATABASES.setdefault('replica', {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': str(settings.BASE_DIR / 'replica.sqlite3'),
+    })
+    connections.configure_settings(settings.DATABASES)  # fill in defaults (TEST, OPTIONS...)
+
+
+@pytest.fixture(autouse=True)
+def synchronous_audit(settings):
+    """Write audit rows inside the test's own transaction"""
+    settings.AUDIT_ASYNC = False
+
+
+@pytest.fixture(autouse=True)
+def no_job_thread(settings):
+    """Tests run queued jobs explicitly with core.jobs.JobRunner"""
+    settings.JOBS_RUN_IN_PROCESS = False
+
 
 @pytest.fixture
 def api_client():
@@ -42,6 +72,12 @@ def admin_user(db):
     )
 
 
+@pytest.fixture
+def admin_profile(admin_user):
+    """The admin role UserProfile that admin endpoints authorize on"""
+    return UserProfile.objects.create(user=admin_user, role='admin')
+
+
 @pytest.fixture
 def admin_client(api_client, admin_user):
     """Fixture for authenticated admin client"""
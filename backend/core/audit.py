@@ -2,7 +2,10 @@
 Audit Logging Utility
 Helper functions for logging admin actions
 """
+from django.conf import settings
+
 from apps.reports.models import AuditLog
+from core.audit_writer import get_writer
 
 
 def get_client_ip(request):
@@ -15,10 +18,27 @@ def get_client_ip(request):
     return ip
 
 
-def log_action(user, action, model_name, object_id=None, object_repr='', changes=None, request=None):
+def changed_fields(changes):
+    """Reduce {'old': {...}, 'new': {...}} snapshots to the keys that differ"""
+    old = changes.get('old') if isinstance(changes, dict) else None
+    new = changes.get('new') if isinstance(changes, dict) else None
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return changes
+    keys = [key for key in new if old.get(key) != new[key]]
+    return {
+        'old': {key: old.get(key) for key in keys},
+        'new': {key: new[key] for key in keys},
+    }
+
+
+def log_action(user, action, model_name, object_id=None, object_repr='', changes=None, request=None, sync=False):
     """
     Log an admin action
     
+    The row is queued for the background audit writer unless sync=True
+    (compliance-critical actions), AUDIT_ASYNC is off, or the queue is full;
+    in those cases it is written before returning.
+    
     Args:
         user: User performing the action
         action: Action type ('create', 'update', 'delete', 'view', 'export')
@@ -27,6 +47,7 @@ def log_action(user, action, model_name, object_id=None, object_repr='', changes
         object_repr: String representation of the object
         changes: Dict of changes (for updates) with 'old' and 'new' keys
         request: HTTP request object (for IP and user agent)
+        sync: Write immediately instead of queueing
     """
     ip_address = None
     user_agent = ''
@@ -35,16 +56,19 @@ def log_action(user, action, model_name, object_id=None, object_repr='', changes
         ip_address = get_client_ip(request)
         user_agent = request.META.get('HTTP_USER_AGENT', '')[:500]  # Limit length
     
-    AuditLog.objects.create(
+    entry = AuditLog(
         user=user,
         action=action,
         model_name=model_name,
         object_id=object_id,
-        object_repr=object_repr,
-        changes=changes or {},
+        object_repr=object_repr[:200],
+        changes=changed_fields(changes) if changes else {},
         ip_address=ip_address,
         user_agent=user_agent
     )
+    
+    if sync or not settings.AUDIT_ASYNC or not get_writer().enqueue(entry):
+        entry.save()
 
 
 def log_user_action(user, action, request=None):
@@ -0,0 +1,136 @@
+"""
+Buffered Audit Writer
+In-process bounded queue of AuditLog rows, drained by a background thread
+with bulk_create on a size or time threshold
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+logger = logging.getLogger(__name__)
+
+
+class AuditWriter:
+    """
+    Usage:
+        writer = AuditWriter()
+        if not writer.enqueue(AuditLog(...)):
+            ...  # queue full: write synchronously instead
+
+    Rows are written when flush_size rows are waiting or flush_interval
+    seconds have passed since the oldest unwritten row, and on shutdown
+    via stop() (registered with atexit by get_writer()).
+    """
+
+    def __init__(self, max_queue=10000, flush_size=200, flush_interval=1.0):
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.failed = 0
+        self._stopping = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, entry):
+        """Queue an unsaved AuditLog; returns False if the queue is full"""
+        self._ensure_thread()
+        try:
+            self.queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            return False
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name='audit-writer', daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while not (self._stopping.is_set() and not batch and self.queue.empty()):
+            wait = self.flush_interval if deadline is None else deadline - time.monotonic()
+            try:
+                # Wake at least twice a second to notice stop()
+                batch.append(self.queue.get(timeout=min(max(wait, 0), 0.5)))
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            except queue.Empty:
+                pass
+
+            if batch and (
+                len(batch) >= self.flush_size
+                or time.monotonic() >= deadline
+                or (self._stopping.is_set() and self.queue.empty())
+            ):
+                close_old_connections()
+                self._write(batch)
+                batch = []
+                deadline = None
+        connection.close()
+
+    def _write(self, batch):
+        from apps.reports.models import AuditLog
+
+        try:
+            AuditLog.objects.bulk_create(batch, batch_size=self.flush_size)
+            self.written += len(batch)
+        except Exception:
+            # Never lose an audit event silently: it still reaches the log pipeline
+            self.failed += len(batch)
+            logger.exception(f"Audit flush of {len(batch)} rows failed")
+            for entry in batch:
+                logger.error(
+                    f"Unwritten audit event: user={entry.user_id} action={entry.action} "
+                    f"model={entry.model_name} object={entry.object_id} at={entry.timestamp}"
+                )
+
+    def flush(self):
+        """Write everything currently queued from the calling thread"""
+        batch = []
+        while True:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._write(batch)
+        return len(batch)
+
+    def stop(self, timeout=5.0):
+        """Stop the background thread after it has written its buffer"""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.flush()
+
+
+_writer = None
+_writer_pid = None
+
+
+def get_writer():
+    """Process-wide writer; recreated after fork so each worker has its own thread"""
+    global _writer, _writer_pid
+    if _writer is None or _writer_pid != os.getpid():
+        _writer = AuditWriter(
+            max_queue=settings.AUDIT_QUEUE_SIZE,
+            flush_size=settings.AUDIT_FLUSH_SIZE,
+            flush_interval=settings.AUDIT_FLUSH_INTERVAL,
+        )
+        _writer_pid = os.getpid()
+        atexit.register(_writer.stop)
+    return _writer
@@ -0,0 +1,113 @@
+"""
+Database Connection Management
+Connection modes for settings.DATABASES and connection statistics for
+/metrics and the system health page.
+
+    per_request  Django's default: connect at the first query of a request,
+                 disconnect when it finishes
+    persistent   keep each thread's connection for CONN_MAX_AGE seconds,
+                 checked with a ping before reuse after an error
+    pool         psycopg 3 connection pool shared by a process's threads
+                 (PostgreSQL; requires `pip install "psycopg[binary,pool]"`)
+"""
+import importlib.util
+import threading
+from collections import Counter
+
+from django.db.backends.signals import connection_created
+
+
+CONNECTION_MODES = ('per_request', 'persistent', 'pool')
+
+# Threads that hold a connection outside requests (core.audit_writer)
+BACKGROUND_THREADS = 1
+
+
+def pool_bounds(threads):
+    """(min_size, max_size) of one process's pool: a connection per request thread plus background threads"""
+    threads = max(threads, 1)
+    return threads, threads + BACKGROUND_THREADS
+
+
+def pool_available(database):
+    engine = database.get('ENGINE', '')
+    return (
+        engine.endswith('postgresql')
+        and importlib.util.find_spec('psycopg') is not None
+        and importlib.util.find_spec('psycopg_pool') is not None
+    )
+
+
+def configure_database(database, mode, max_age=60, threads=1, pool_timeout=10):
+    """
+    Copy of a DATABASES entry set up for a connection mode.
+    'pool' falls back to 'persistent' when the database is not PostgreSQL
+    or psycopg 3 with psycopg_pool is not installed; connection_stats()
+    reports the mode in effect.
+    """
+    if mode not in CONNECTION_MODES:
+        raise ValueError(f"DB_CONN_MODE must be one of {', '.join(CONNECTION_MODES)}, not '{mode}'")
+    database = {**database, 'OPTIONS': dict(database.get('OPTIONS', {}))}
+    database['OPTIONS'].pop('pool', None)
+
+    if mode == 'pool' and not pool_available(database):
+        mode = 'persistent'
+
+    if mode == 'per_request':
+        database.update(CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False)
+    elif mode == 'persistent':
+        database.update(CONN_MAX_AGE=max_age, CONN_HEALTH_CHECKS=True)
+    else:
+        min_size, max_size = pool_bounds(threads)
+        # Pooled connections are returned at the end of each request instead of closed
+        database.update(CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=True)
+        database['OPTIONS']['pool'] = {'min_size': min_size, 'max_size': max_size, 'timeout': pool_timeout}
+    return database
+
+
+def connection_mode(database):
+    if database.get('OPTIONS', {}).get('pool'):
+        return 'pool'
+    return 'persistent' if database.get('CONN_MAX_AGE') else 'per_request'
+
+
+# Connections opened per alias, in this process
+
+_opened = Counter()
+_opened_lock = threading.Lock()
+
+
+def _count_connection(sender, connection, **kwargs):
+    with _opened_lock:
+        _opened[connection.alias] += 1
+
+
+connection_created.connect(_count_connection, dispatch_uid='core.db_connections.count')
+
+
+def connection_stats():
+    """
+    Per alias: mode in effect, connections opened by this process, and
+    the pool's own statistics (psycopg_pool get_stats()) in pool mode
+    """
+    from django.conf import settings
+    from django.db import connections
+
+    stats = {}
+    for alias in connections:
+        database = connections[alias].settings_dict
+        entry = {
+            'mode': connection_mode(database),
+            'requested_mode': getattr(settings, 'DB_CONN_MODE', None) if alias == 'default' else None,
+            'conn_max_age': database.get('CONN_MAX_AGE'),
+            'health_checks': database.get('CONN_HEALTH_CHECKS', False),
+            'opened': _opened[alias],
+        }
+        if entry['mode'] == 'pool':
+            pool = connections[alias].pool
+            entry['pool'] = pool.get_stats() if pool is not None else {}
+            entry['fleet_max_connections'] = (
+                settings.WEB_CONCURRENCY * database['OPTIONS']['pool']['max_size']
+            )
+        stats[alias] = entry
+    return stats
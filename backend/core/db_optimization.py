@@ -117,32 +117,38 @@ INDEX_SUGGESTIONS = {
 }
 
 
-def analyze_query_performance():
+def analyze_query_performance(queries=None, threshold=5):
     """
     Analyze and report on query performance
     Returns suggestions for optimization
+
+    queries defaults to connection.queries (DEBUG only); pass a
+    core.query_analysis.QueryTracker's queries to analyze any block.
     """
     from django.db import connection
+    from core.query_analysis import fingerprint
     
     suggestions = []
     
-    # Check for N+1 queries
-    queries = connection.queries
+    # Check for N+1 queries: same statement shape with different literals
+    if queries is None:
+        queries = [(fingerprint(q['sql']), q['sql'], float(q['time']), None) for q in connection.queries]
     query_patterns = {}
     
-    for query in queries:
-        sql = query['sql']
-        # Simple pattern matching for similar queries
-        pattern = sql.split('WHERE')[0] if 'WHERE' in sql else sql
-        query_patterns[pattern] = query_patterns.get(pattern, 0) + 1
+    for fp, _, _, site in queries:
+        pattern = query_patterns.setdefault(fp, {'count': 0, 'sites': set()})
+        pattern['count'] += 1
+        if site:
+            pattern['sites'].add(site)
     
     # Report repeated queries
-    for pattern, count in query_patterns.items():
-        if count > 5:
+    for fp, pattern in query_patterns.items():
+        if pattern['count'] > threshold:
             suggestions.append({
                 'type': 'N+1 Query',
-                'pattern': pattern[:100],
-                'count': count,
+                'pattern': fp[:200],
+                'count': pattern['count'],
+                'call_sites': sorted(pattern['sites']),
                 'suggestion': 'Consider using select_related() or prefetch_related()'
             })
     
@@ -178,3 +184,50 @@ def clear_model_cache(model_name):
     """
     cache.delete_pattern(f"*{model_name}*")
     logger.info(f"Cache cleared for {model_name}")
+
+
+# Bounded batch mutations
+
+def iter_pk_batches(queryset, batch_size=1000):
+    """
+    Yield lists of primary keys matching queryset, in ascending pk order.
+    Each batch is fetched with a keyset (pk > last) query, so rows removed
+    or changed by the caller between batches never shift the window.
+    """
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = list(page.values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return
+        yield pks
+        last_pk = pks[-1]
+
+
+def batched_update(queryset, batch_size=1000, label=None, **values):
+    """
+    UPDATE queryset in bounded batches instead of one statement
+    Returns the number of rows updated
+    """
+    label = label or queryset.model.__name__
+    total = 0
+    for pks in iter_pk_batches(queryset, batch_size):
+        total += queryset.filter(pk__in=pks).update(**values)
+        logger.info(f"{label}: updated {total} rows")
+    return total
+
+
+def batched_delete(queryset, batch_size=1000, label=None):
+    """
+    DELETE queryset in bounded batches instead of one statement
+    Returns the number of rows deleted from queryset's table
+    """
+    label = label or queryset.model.__name__
+    model_label = queryset.model._meta.label
+    total = 0
+    for pks in iter_pk_batches(queryset, batch_size):
+        _, per_model = queryset.filter(pk__in=pks).delete()
+        total += per_model.get(model_label, 0)
+        logger.info(f"{label}: deleted {total} rows")
+    return total
@@ -0,0 +1,88 @@
+"""
+Read Replica Routing
+Read-only endpoints decorated with @read_replica send their reads to the
+READ_REPLICA_ALIAS database; everything else, and every write, uses the
+primary. Read-your-writes:
+- within a request, the first write pins its remaining reads to the primary
+- across requests, a user who wrote is served from the primary for
+  READ_REPLICA_STICKY_SECONDS. This is stored in the cache, so it spans
+  workers only with a shared cache such as Redis.
+
+Without READ_REPLICA_ALIAS the router routes everything to the primary.
+"""
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+
+_use_replica = ContextVar('use_replica', default=False)
+_wrote = ContextVar('wrote_to_primary', default=False)
+
+STICKY_KEY = 'db_router:primary:{}'
+
+
+def replica_alias():
+    return getattr(settings, 'READ_REPLICA_ALIAS', None)
+
+
+class ReadReplicaRouter:
+    def db_for_read(self, model, **hints):
+        alias = replica_alias()
+        if not alias:
+            return None
+        if _use_replica.get() and not _wrote.get():
+            return alias
+        # Explicit, so related lookups on replica-loaded objects still follow the rules
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        _wrote.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same data as the primary
+        return True
+
+
+def _sticky(user):
+    return bool(user and user.is_authenticated and cache.get(STICKY_KEY.format(user.pk)))
+
+
+def read_replica(view):
+    """
+    Route a read-only view's queries to the replica.
+    Apply directly to the view function, below @api_view, so that
+    authentication still reads the primary.
+    """
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        if not replica_alias() or _sticky(getattr(request, 'user', None)):
+            return view(request, *args, **kwargs)
+        token = _use_replica.set(True)
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            _use_replica.reset(token)
+    return wrapped
+
+
+class ReadReplicaMiddleware:
+    """Tracks whether a request wrote, and makes its user sticky to the primary if so"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _wrote.set(False)
+        try:
+            response = self.get_response(request)
+            if _wrote.get() and replica_alias():
+                user = getattr(request, 'user', None)  # set by DRF authentication too
+                if user is not None and user.is_authenticated:
+                    cache.set(STICKY_KEY.format(user.pk), True, settings.READ_REPLICA_STICKY_SECONDS)
+            return response
+        finally:
+            _wrote.reset(token)
@@ -0,0 +1,151 @@
+"""
+Import Profiling
+Measures what a cold worker start imports and what each module costs,
+from the interpreter's own `-X importtime` report.
+
+    report = profile_startup()
+    report['import_ms'], report['max_rss_kb'], by_package(report['modules'])
+
+profile_startup() boots Django in a fresh interpreter the way a gunicorn
+worker does before its first request (WSGI application, then the
+URLconf), or warm, with every route's view imported, and parses the
+timings it prints to stderr. Used by benchmarks/startup.py and the
+cold-start budget in tests/test_startup.py.
+
+-X importtime only times `import` statements: modules Django loads with
+importlib.import_module (app models, admin modules, URLconfs) are not
+listed themselves, though everything they import is. 'loaded' is the
+complete set of modules in sys.modules once the worker is ready.
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# `import time: self [us] | cumulative | imported package`, nesting shown by indentation
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+
+# Project packages; any other top-level package is a dependency
+PROJECT_PACKAGES = ('apps', 'core', 'exercise', 'pregnancy')
+
+BOOT_CODE = '''
+WARM = %s
+import json, os, resource, sys
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pregnancy.settings')
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+from django.urls import get_resolver
+get_resolver().url_patterns
+if WARM:
+    from core.lazy_views import LazyView
+    def load(patterns):
+        for pattern in patterns:
+            if hasattr(pattern, 'url_patterns'):
+                load(pattern.url_patterns)
+            elif isinstance(pattern.callback, LazyView):
+                pattern.callback.resolve()
+    load(get_resolver().url_patterns)
+# ru_maxrss survives exec on Linux (it would report the parent's peak); VmHWM does not
+try:
+    with open('/proc/self/status') as status:
+        max_rss_kb = next(int(line.split()[1]) for line in status if line.startswith('VmHWM:'))
+except OSError:
+    max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    'max_rss_kb': max_rss_kb,
+    'loaded': sorted(sys.modules),
+}))
+'''
+
+
+def parse_importtime(output):
+    """
+    Entries in import order: {'module', 'self_us', 'cumulative_us', 'depth',
+    'parent'}, where parent is the module whose import triggered this one
+    (None for a top-level import)
+    """
+    entries = []
+    waiting = {}  # depth -> entries whose importer is not printed yet
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        # The importer's line follows its imports', one level shallower
+        depth = len(indent) // 2
+        entry = {
+            'module': module,
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+            'depth': depth,
+            'parent': None,
+        }
+        for child in waiting.pop(depth + 1, []):
+            child['parent'] = module
+        waiting.setdefault(depth, []).append(entry)
+        entries.append(entry)
+    return entries
+
+
+def package_of(module):
+    """apps.<feature> for feature apps, else the top-level package"""
+    parts = module.split('.')
+    return '.'.join(parts[:2]) if parts[0] == 'apps' and len(parts) > 1 else parts[0]
+
+
+def by_package(entries):
+    """{package: own import time in ms}, most expensive first"""
+    totals = {}
+    for entry in entries:
+        package = package_of(entry['module'])
+        totals[package] = totals.get(package, 0) + entry['self_us']
+    return {
+        package: round(us / 1000, 1)
+        for package, us in sorted(totals.items(), key=lambda item: -item[1])
+    }
+
+
+def import_chain(entries, module):
+    """The chain of importers that loaded module, outermost first"""
+    parents = {entry['module']: entry['parent'] for entry in entries}
+    chain = [module]
+    while parents.get(chain[-1]):
+        chain.append(parents[chain[-1]])
+    return list(reversed(chain))
+
+
+def profile_startup(warm=False, env=None, python=None):
+    """
+    Boot a worker in a fresh interpreter with -X importtime; returns
+    {'wall_ms', 'import_ms', 'max_rss_kb', 'modules', 'loaded'}. warm also
+    imports the view of every route, as a worker has once it has served
+    them all.
+    """
+    code = BOOT_CODE % bool(warm)
+    environment = {**os.environ, 'DJANGO_SETTINGS_MODULE': 'pregnancy.settings', **(env or {})}
+    environment.setdefault('SECRET_KEY', 'import-profile-only-secret-key')
+    environment.pop('PYTHONPROFILEIMPORTTIME', None)
+
+    started = time.perf_counter()
+    result = subprocess.run(
+        [python or sys.executable, '-X', 'importtime', '-c', code],
+        cwd=BACKEND_DIR, env=environment, capture_output=True, text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f'Startup failed:\n{result.stderr[-2000:]}')
+
+    modules = parse_importtime(result.stderr)
+    stats = json.loads(result.stdout.strip().splitlines()[-1]) if result.stdout.strip() else {}
+    return {
+        'wall_ms': round(wall_ms, 1),
+        'import_ms': round(sum(entry['self_us'] for entry in modules) / 1000, 1),
+        'max_rss_kb': stats.get('max_rss_kb'),
+        'modules': modules,
+        'loaded': stats.get('loaded', []),
+    }
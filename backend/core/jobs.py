@@ -0,0 +1,152 @@
+"""
+Background Jobs
+Database-backed job queue: enqueue() stores a BackgroundJob row and a
+worker runs the handler registered for its kind (JOB_HANDLERS).
+
+Workers claim due jobs with SKIP LOCKED where the database supports it, so
+several can run side by side: `manage.py run_jobs` as a separate process,
+or, with JOBS_RUN_IN_PROCESS, a thread in the web process started when a
+job is queued. A claimed job holds a lease (JOB_LEASE_SECONDS); if its
+worker dies the job is claimed again once the lease expires, and handlers
+that checkpoint() their progress resume where they stopped. Failed jobs
+are retried with backoff up to JOB_MAX_ATTEMPTS.
+"""
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from apps.reports.models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+# kind: handler(job) -> result dict, imported on first use
+JOB_HANDLERS = {
+    'user_export': 'apps.reports.data_export.run_export',
+    'user_deletion': 'apps.reports.user_deletion.run_deletion',
+}
+
+RETRY_BACKOFF_SECONDS = 30
+
+
+def enqueue(kind, payload=None, created_by=None):
+    """Queue a job; it runs after the current transaction commits"""
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind '{kind}'")
+    job = BackgroundJob.objects.create(kind=kind, payload=payload or {}, created_by=created_by)
+    if settings.JOBS_RUN_IN_PROCESS:
+        transaction.on_commit(start_worker_thread)
+    return job
+
+
+def checkpoint(job, **progress):
+    """Save a resumable job's progress and renew its lease"""
+    job.progress.update(progress)
+    job.locked_until = timezone.now() + timedelta(seconds=settings.JOB_LEASE_SECONDS)
+    BackgroundJob.objects.filter(id=job.id).update(progress=job.progress, locked_until=job.locked_until)
+
+
+class JobRunner:
+    """Claims and runs due jobs, one at a time"""
+
+    def __init__(self, lease_seconds=None, max_attempts=None):
+        self.lease = timedelta(seconds=lease_seconds or settings.JOB_LEASE_SECONDS)
+        self.max_attempts = max_attempts or settings.JOB_MAX_ATTEMPTS
+        self.stats = {'completed': 0, 'retried': 0, 'failed': 0}
+
+    def claim(self, now=None):
+        """Lock the next due job (pending, or running with an expired lease) and mark it running"""
+        now = now or timezone.now()
+        with transaction.atomic():
+            job = (
+                BackgroundJob.objects
+                .filter(Q(status='pending', run_after__lte=now) | Q(status='running', locked_until__lt=now))
+                .select_for_update(skip_locked=True)
+                .order_by('run_after', 'id')
+                .first()
+            )
+            if job is None:
+                return None
+            job.status = 'running'
+            job.attempts += 1
+            job.locked_until = now + self.lease
+            job.save(update_fields=['status', 'attempts', 'locked_until'])
+        return job
+
+    def run(self, job):
+        """Run a claimed job and record its outcome; returns True if it completed"""
+        try:
+            handler = import_string(JOB_HANDLERS[job.kind])
+            result = handler(job)
+        except Exception as e:
+            logger.exception(f"Job {job.kind} #{job.id} failed (attempt {job.attempts})")
+            job.error = f'{type(e).__name__}: {e}'[:2000]
+            job.locked_until = None
+            if job.kind in JOB_HANDLERS and job.attempts < self.max_attempts:
+                job.status = 'pending'
+                job.run_after = timezone.now() + timedelta(seconds=RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1))
+                self.stats['retried'] += 1
+            else:
+                job.status = 'failed'
+                job.finished_at = timezone.now()
+                self.stats['failed'] += 1
+            job.save(update_fields=['status', 'error', 'locked_until', 'run_after', 'finished_at'])
+            return False
+
+        job.status = 'completed'
+        job.result = result or {}
+        job.locked_until = None
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'result', 'locked_until', 'finished_at'])
+        self.stats['completed'] += 1
+        return True
+
+    def run_pending(self, limit=None):
+        """Run due jobs until none are left (or limit); returns the number run"""
+        count = 0
+        while limit is None or count < limit:
+            job = self.claim()
+            if job is None:
+                break
+            self.run(job)
+            count += 1
+        return count
+
+
+# =========================
+# In-process worker
+# =========================
+
+_lock = threading.Lock()
+_thread = None
+_wanted = False
+
+
+def start_worker_thread():
+    """Run queued jobs on a daemon thread; a running thread picks up the new job instead"""
+    global _thread, _wanted
+    with _lock:
+        _wanted = True
+        if _thread is None:
+            _thread = threading.Thread(target=_work, name='background-jobs', daemon=True)
+            _thread.start()
+
+
+def _work():
+    global _thread, _wanted
+    while True:
+        with _lock:
+            if not _wanted:
+                _thread = None
+                break
+            _wanted = False
+        try:
+            JobRunner().run_pending()
+        except Exception:
+            logger.exception('Background job worker error')
+    connections.close_all()
@@ -0,0 +1,55 @@
+"""
+Lazy Views
+URLconfs that import every view module make each worker pay for all of
+them (and for what they import: numpy, PDF rendering, export writers)
+before serving its first request, though most workers only ever serve a
+handful of routes.
+
+    path('reports/roster/', lazy_view('apps.reports.report_views.roster_report'))
+    path('api/schema/', lazy_view('drf_spectacular.views.SpectacularAPIView'))
+
+lazy_view() stands in for the view and imports it on the first request
+that resolves to it (class-based views get .as_view(**initkwargs)). Its
+name and module come from the dotted path, so reverse(), URL checks and
+ResolverMatch work without importing anything. Router ViewSets are
+registered eagerly: the router inspects the class to build its routes.
+"""
+from django.utils.module_loading import import_string
+
+
+class LazyView:
+    def __init__(self, dotted_path, initkwargs):
+        self._view = None
+        self.dotted_path = dotted_path
+        self.initkwargs = initkwargs
+        self.__module__, self.__name__ = dotted_path.rsplit('.', 1)
+        self.__qualname__ = self.__name__
+
+    def resolve(self):
+        """Import the view (once) and return the callable Django should call"""
+        if self._view is None:
+            target = import_string(self.dotted_path)
+            self._view = target.as_view(**self.initkwargs) if isinstance(target, type) else target
+        return self._view
+
+    def __call__(self, request, *args, **kwargs):
+        return self.resolve()(request, *args, **kwargs)
+
+    def __getattr__(self, name):
+        # Only reached for attributes not set above. Django reads view
+        # attributes (csrf_exempt, cls, _non_atomic_requests...) while
+        # handling a request, so forwarding them imports the view then.
+        # The URL resolver probes view_class for every pattern on the first
+        # reverse(); until the view is loaded the dotted path already
+        # names it, so that probe must not import it.
+        if name.startswith('__') or (name == 'view_class' and self._view is None):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self):
+        return f'<LazyView {self.dotted_path}>'
+
+
+def lazy_view(dotted_path, **initkwargs):
+    """A view imported on its first request; initkwargs go to as_view() for class-based views"""
+    return LazyView(dotted_path, initkwargs)
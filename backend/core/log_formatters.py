@@ -0,0 +1,24 @@
+"""
+Log Formatters
+LOGGING builds every formatter it declares when settings load, so naming
+pythonjsonlogger's formatter there imports it in every process, including
+those whose handlers never format a record as JSON (management commands,
+DEBUG runs). JsonFormatter defers that import to the first JSON record.
+"""
+import logging
+
+
+class JsonFormatter(logging.Formatter):
+    """pythonjsonlogger.jsonlogger.JsonFormatter, created on first use"""
+
+    def __init__(self, format=None, datefmt=None, style='%', **kwargs):
+        # dictConfig passes a formatter factory its 'format' key by that name
+        super().__init__(format, datefmt, style)
+        self._kwargs = {'fmt': format, 'datefmt': datefmt, 'style': style, **kwargs}
+        self._formatter = None
+
+    def format(self, record):
+        if self._formatter is None:
+            from pythonjsonlogger.jsonlogger import JsonFormatter
+            self._formatter = JsonFormatter(**self._kwargs)
+        return self._formatter.format(record)
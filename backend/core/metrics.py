@@ -0,0 +1,226 @@
+"""
+Request Metrics
+Per-route HDR-style histograms (log-linear buckets, ~1.6% relative error,
+constant memory per route) filled by RequestMetricsMiddleware, and a
+/metrics endpoint rendering them, with database connection and pool
+statistics, in Prometheus text format.
+
+Metrics are per process: with several gunicorn workers each scrape sees
+the worker that served it, so scrape often or aggregate on the
+Prometheus side.
+"""
+import hmac
+import threading
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+
+
+# 2**7 sub-buckets per power of two: values are kept to within 1/64
+SUB_BUCKET_BITS = 7
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_BUCKETS = SUB_BUCKETS >> 1
+
+QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+# metric: (Prometheus family, help, divisor from the recorded unit)
+# Times are recorded in microseconds and exported in seconds
+REQUEST_METRICS = {
+    'duration': ('http_request_duration_seconds', 'Wall time of the request', 1_000_000),
+    'db_time': ('http_request_db_time_seconds', 'Time spent in database queries', 1_000_000),
+    'db_queries': ('http_request_db_queries', 'Database queries executed', 1),
+    'render_time': ('http_response_render_seconds', 'Time spent rendering (serializing) the response body', 1_000_000),
+    'response_size': ('http_response_size_bytes', 'Response body size', 1),
+}
+
+
+def bucket_index(value):
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return SUB_BUCKETS + (shift - 1) * HALF_BUCKETS + (value >> shift) - HALF_BUCKETS
+
+
+def bucket_upper(index):
+    """Highest value that lands in bucket `index`"""
+    if index < SUB_BUCKETS:
+        return index
+    shift, offset = divmod(index - SUB_BUCKETS, HALF_BUCKETS)
+    return ((offset + HALF_BUCKETS + 1) << (shift + 1)) - 1
+
+
+class Histogram:
+    """
+    Sparse log-linear histogram of non-negative integers.
+    Exact below 128, then 64 buckets per doubling, so any quantile is
+    reported within ~1.6% whatever the range of values.
+    Not locked: RouteStats records all its histograms under one lock.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value):
+        value = max(int(value), 0)
+        index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q):
+        if not self.count:
+            return 0
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(bucket_upper(index), self.max)
+        return self.max
+
+
+class RouteStats:
+    """All request histograms for one (method, route)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = {name: Histogram() for name in REQUEST_METRICS}
+
+    def record(self, **values):
+        with self.lock:
+            for name, value in values.items():
+                if value is not None:
+                    self.histograms[name].record(value)
+
+    def snapshot(self):
+        """{metric: (count, sum, {quantile: value})} in raw units"""
+        with self.lock:
+            return {
+                name: (h.count, h.total, {q: h.quantile(q) for q in QUANTILES})
+                for name, h in self.histograms.items()
+            }
+
+
+class MetricsRegistry:
+    """Route stats keyed by (method, route pattern); routes are bounded by the URLconf"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes = {}
+
+    def route(self, method, route):
+        key = (method, route)
+        stats = self.routes.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self.routes.setdefault(key, RouteStats())
+        return stats
+
+    def reset(self):
+        with self._lock:
+            self.routes = {}
+
+    def summary(self, metric='duration', quantile=0.95, limit=10):
+        """Slowest routes by one quantile, for dashboards"""
+        divisor = REQUEST_METRICS[metric][2]
+        rows = []
+        for (method, route), stats in list(self.routes.items()):
+            count, _, quantiles = stats.snapshot()[metric]
+            rows.append({
+                'method': method,
+                'route': route,
+                'requests': count,
+                f'p{int(quantile * 100)}': quantiles[quantile] / divisor,
+            })
+        rows.sort(key=lambda row: row[f'p{int(quantile * 100)}'], reverse=True)
+        return rows[:limit]
+
+
+registry = MetricsRegistry()
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_prometheus(metrics_registry=None):
+    """Prometheus text exposition (one summary family per request metric)"""
+    metrics_registry = metrics_registry or registry
+    snapshots = sorted(
+        (key, stats.snapshot()) for key, stats in list(metrics_registry.routes.items())
+    )
+    lines = []
+    for name, (family, help_text, divisor) in REQUEST_METRICS.items():
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} summary")
+        for (method, route), snapshot in snapshots:
+            count, total, quantiles = snapshot[name]
+            labels = f'method="{_escape(method)}",route="{_escape(route)}"'
+            for q, value in quantiles.items():
+                lines.append(f'{family}{{{labels},quantile="{q}"}} {value / divisor}')
+            lines.append(f'{family}_sum{{{labels}}} {total / divisor}')
+            lines.append(f'{family}_count{{{labels}}} {count}')
+    return '\n'.join(lines) + '\n'
+
+
+# psycopg_pool get_stats() keys that are current values; the rest are running totals
+POOL_GAUGES = ('pool_min', 'pool_max', 'pool_size', 'pool_available', 'requests_waiting')
+
+
+def render_database_metrics(stats=None, sqlite=None):
+    """
+    Connections opened per alias, the pool's statistics in pool mode and
+    SQLite busy retries for tuned SQLite aliases
+    """
+    from core.db_connections import connection_stats
+    from core.sqlite_tuning import sqlite_stats
+
+    stats = stats if stats is not None else connection_stats()
+    sqlite = sqlite if sqlite is not None else sqlite_stats()
+    lines = [
+        '# HELP db_connections_opened_total Database connections opened by this process',
+        '# TYPE db_connections_opened_total counter',
+    ]
+    for alias, entry in sorted(stats.items()):
+        lines.append(
+            f'db_connections_opened_total{{alias="{_escape(alias)}",mode="{entry["mode"]}"}} {entry["opened"]}'
+        )
+    pools = sorted((alias, entry['pool']) for alias, entry in stats.items() if entry.get('pool'))
+    for key in sorted({key for _, pool in pools for key in pool}):
+        family = f'db_pool_{key}' if key in POOL_GAUGES else f'db_pool_{key}_total'
+        lines.append(f"# TYPE {family} {'gauge' if key in POOL_GAUGES else 'counter'}")
+        for alias, pool in pools:
+            if key in pool:
+                lines.append(f'{family}{{alias="{_escape(alias)}"}} {pool[key]}')
+    for key, help_text in (('busy_retries', 'SQLite statements retried after SQLITE_BUSY'),
+                           ('busy_errors', 'SQLite statements still busy after all retries')):
+        if sqlite:
+            lines.append(f'# HELP db_sqlite_{key}_total {help_text}')
+            lines.append(f'# TYPE db_sqlite_{key}_total counter')
+        for alias, entry in sorted(sqlite.items()):
+            lines.append(f'db_sqlite_{key}_total{{alias="{_escape(alias)}"}} {entry[key]}')
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_view(request):
+    """
+    GET /metrics for Prometheus
+    The scraper must send METRICS_TOKEN as a Bearer token; without a token
+    the endpoint is only served when DEBUG is on
+    """
+    token = settings.METRICS_TOKEN
+    if token:
+        supplied = request.META.get('HTTP_AUTHORIZATION', '').removeprefix('Bearer ')
+        if not hmac.compare_digest(supplied, token):
+            return HttpResponseForbidden('Forbidden')
+    elif not settings.DEBUG:
+        raise Http404
+    return HttpResponse(
+        render_prometheus() + render_database_metrics(),
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
@@ -0,0 +1,124 @@
+"""
+Request Metrics Middleware
+Records wall time, DB query count and time, render time and response
+size per route into core.metrics, logs slow requests with their most
+expensive queries, and (QUERY_REPEAT_WARNING) repeated query shapes.
+Works with DEBUG off: queries are observed through
+connection.execute_wrapper rather than connection.queries.
+"""
+import heapq
+import logging
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from core.metrics import registry
+from core.query_analysis import QueryTracker
+
+logger = logging.getLogger('performance')
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+
+class QueryRecorder:
+    """execute_wrapper hook: query count, total time and the `keep` slowest statements"""
+
+    def __init__(self, keep=0):
+        self.keep = keep
+        self.count = 0
+        self.elapsed = 0.0
+        self._slowest = []  # min-heap of (seconds, sequence, sql)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.count += 1
+            self.elapsed += duration
+            if self.keep:
+                entry = (duration, self.count, sql)
+                if len(self._slowest) < self.keep:
+                    heapq.heappush(self._slowest, entry)
+                elif duration > self._slowest[0][0]:
+                    heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self):
+        """[(seconds, sql)] slowest first"""
+        return [(duration, sql) for duration, _, sql in sorted(self._slowest, reverse=True)]
+
+
+class RequestMetricsMiddleware:
+    """
+    Place first in MIDDLEWARE so the wall time covers the whole stack.
+    Streaming responses are measured up to the start of the stream.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_ms = settings.SLOW_REQUEST_MS
+        self.top_queries = settings.SLOW_REQUEST_TOP_QUERIES
+        self.repeat_threshold = settings.QUERY_REPEAT_WARNING
+
+    def __call__(self, request):
+        recorder = QueryRecorder(keep=self.top_queries)
+        # Fingerprinting and call-site lookup cost more; only when enabled
+        tracker = QueryTracker() if self.repeat_threshold else None
+        request._render_seconds = None
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(recorder))
+            if tracker is not None:
+                stack.enter_context(tracker.capture())
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        match = request.resolver_match
+        route = match.route if match is not None else UNMATCHED_ROUTE
+        size = None if response.streaming else len(response.content)
+        render = request._render_seconds
+
+        registry.route(request.method, route).record(
+            duration=elapsed * 1_000_000,
+            db_time=recorder.elapsed * 1_000_000,
+            db_queries=recorder.count,
+            render_time=None if render is None else render * 1_000_000,
+            response_size=size,
+        )
+
+        if elapsed * 1000 >= self.slow_ms:
+            self._log_slow(request, route, response, elapsed, recorder, render, size)
+        if tracker is not None and tracker.repeated(self.repeat_threshold):
+            logger.warning(
+                f"Repeated queries (possible N+1) in {request.method} {route}: "
+                f"{tracker.report(self.repeat_threshold)}"
+            )
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF Responses render after the view returns; time that step
+        started = time.perf_counter()
+
+        def rendered(response):
+            request._render_seconds = time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
+
+    def _log_slow(self, request, route, response, elapsed, recorder, render, size):
+        lines = [
+            f"Slow request: {request.method} {request.path} ({route}) -> {response.status_code} "
+            f"in {elapsed * 1000:.1f} ms; {recorder.count} queries in "
+            f"{recorder.elapsed * 1000:.1f} ms; render "
+            f"{'-' if render is None else f'{render * 1000:.1f} ms'}; {size if size is not None else '-'} bytes"
+        ]
+        for duration, sql in recorder.slowest():
+            lines.append(f"  {duration * 1000:8.1f} ms  {sql[:500]}")
+        logger.warning('\n'.join(lines))
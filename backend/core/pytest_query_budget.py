@@ -0,0 +1,68 @@
+"""
+Query budget pytest plugin
+Loaded from conftest.py. A test declares how many queries its body may
+run; exceeding the budget (or repeating one query shape too often, the
+N+1 signature) fails the test with the offending fingerprints and the
+lines that issued them.
+
+    @pytest.mark.query_budget(6)
+    def test_patient_list(doctor_client, patients):
+        doctor_client.get('/api/doctor/patients/')
+
+    @pytest.mark.query_budget(4, max_repeats=1)   # no query shape twice
+    def test_patient_detail(...): ...
+
+    def test_inline(query_budget):
+        with query_budget(3):
+            ...
+
+Only the test body is measured; fixture setup is not.
+"""
+from contextlib import contextmanager
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers',
+        'query_budget(limit, max_repeats=None): fail if the test body runs more than '
+        'limit queries or any query fingerprint more than max_repeats times',
+    )
+
+
+def _check(tracker, limit, max_repeats, label):
+    problems = []
+    if tracker.count > limit:
+        problems.append(f"{label}: {tracker.count} queries, budget {limit}")
+    if max_repeats is not None and tracker.repeated(max_repeats + 1):
+        problems.append(f"{label}: a query ran more than {max_repeats} time(s) (N+1?)")
+    if problems:
+        pytest.fail('\n'.join(problems) + '\n' + tracker.report(), pytrace=False)
+
+
+@contextmanager
+def _budget(limit, max_repeats=None, label='Query budget exceeded'):
+    from core.query_analysis import QueryTracker
+
+    tracker = QueryTracker()
+    with tracker.capture():
+        yield tracker
+    _check(tracker, limit, max_repeats, label)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker('query_budget')
+    if marker is None:
+        return (yield)
+    limit = marker.args[0] if marker.args else marker.kwargs['limit']
+    with _budget(limit, marker.kwargs.get('max_repeats'), f'{item.name} exceeded its query budget'):
+        result = yield
+    return result
+
+
+@pytest.fixture
+def query_budget():
+    """Context manager enforcing a budget on one block of a test"""
+    return _budget
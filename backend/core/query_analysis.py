@@ -0,0 +1,118 @@
+"""
+Query Analysis
+SQL fingerprinting (literals stripped, IN lists collapsed) and a query
+tracker that groups a block's queries by fingerprint and attributes
+repeats to the project line that issued them, to find N+1 patterns.
+Used by RequestMetricsMiddleware and the query budget pytest plugin.
+"""
+import re
+import sys
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'(?<![\w."])-?\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%s|\?|\$\d+')
+_IN_LIST = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.IGNORECASE)
+_VALUES_LIST = re.compile(r'\bVALUES\s*\(.*\)', re.IGNORECASE | re.DOTALL)
+_WHITESPACE = re.compile(r'\s+')
+
+
+def fingerprint(sql):
+    """
+    Normalize SQL so queries differing only in literal values compare equal:
+        SELECT ... WHERE "id" = 42 AND "name" = 'x'   -> ... "id" = ? AND "name" = ?
+        ... "id" IN (1, 2, 3)                          -> ... "id" IN (...)
+    """
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _PLACEHOLDER.sub('?', sql)
+    sql = _IN_LIST.sub('IN (...)', sql)
+    sql = _VALUES_LIST.sub('VALUES (...)', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+_PROJECT_ROOT = str(Path(settings.BASE_DIR).resolve())
+_SKIP_PARTS = (
+    'site-packages', 'dist-packages', f'{Path(__file__).name}', 'core/middleware.py', 'core/sqlite_tuning.py',
+)
+
+
+def call_site(skip=2):
+    """First project frame ('path.py:line in function') below the ORM and this module"""
+    frame = sys._getframe(skip)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_PROJECT_ROOT) and not any(part in filename for part in _SKIP_PARTS):
+            relative = filename[len(_PROJECT_ROOT):].lstrip('/\\')
+            return f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return '<unknown>'
+
+
+class QueryTracker:
+    """
+    Usage:
+        tracker = QueryTracker()
+        with tracker.capture():
+            ...
+        tracker.count, tracker.repeated(threshold=3), tracker.report()
+    """
+
+    def __init__(self, attribute=True):
+        self.attribute = attribute
+        self.queries = []  # (fingerprint, sql, seconds, call site)
+
+    def __call__(self, execute, sql, params, many, context):
+        site = call_site() if self.attribute else None
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((fingerprint(sql), sql, time.perf_counter() - start, site))
+
+    @contextmanager
+    def capture(self, using=None):
+        """Track queries on every connection (or just `using`) in this thread"""
+        aliases = [using] if using else list(connections)
+        with ExitStack() as stack:
+            for alias in aliases:
+                stack.enter_context(connections[alias].execute_wrapper(self))
+            yield self
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    def repeated(self, threshold=2):
+        """
+        Fingerprints executed at least `threshold` times, most frequent first:
+        [{'fingerprint', 'count', 'seconds', 'call_sites': [(site, count)]}]
+        """
+        groups = {}
+        for fp, _, seconds, site in self.queries:
+            group = groups.setdefault(fp, {'fingerprint': fp, 'count': 0, 'seconds': 0.0, 'sites': Counter()})
+            group['count'] += 1
+            group['seconds'] += seconds
+            group['sites'][site] += 1
+        repeated = []
+        for group in groups.values():
+            if group['count'] >= threshold:
+                group['call_sites'] = group.pop('sites').most_common()
+                repeated.append(group)
+        repeated.sort(key=lambda group: group['count'], reverse=True)
+        return repeated
+
+    def report(self, threshold=2, limit=5):
+        lines = [f"{self.count} queries"]
+        for group in self.repeated(threshold)[:limit]:
+            lines.append(f"  x{group['count']}  {group['fingerprint'][:300]}")
+            for site, count in group['call_sites'][:3]:
+                lines.append(f"        {count} from {site}")
+        return '\n'.join(lines)
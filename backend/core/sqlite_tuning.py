@@ -0,0 +1,150 @@
+"""
+SQLite Concurrency Tuning
+Settings for a SQLite DATABASES entry that serves concurrent writers
+(sessions, vitals, notifications) without "database is locked" errors:
+
+    journal_mode=WAL       readers no longer block the writer or each other
+    synchronous=NORMAL     fsync at checkpoints rather than every commit (safe with WAL)
+    mmap_size, cache_size  memory-mapped reads and a larger page cache
+    BEGIN IMMEDIATE        transactions take the write lock up front, so a
+                           read-then-write transaction never fails to upgrade
+    timeout                SQLite's busy handler waits this long for the lock
+
+The connection-level pragmas run as the connection's init_command, i.e. on
+every new connection. journal_mode is stored in the database file and
+changing it needs a lock that SQLite will not wait for, so WAL is enabled
+once per process and database, with retries, rather than per connection.
+Statements that still hit SQLITE_BUSY after the timeout are retried with
+backoff by a wrapper installed when the connection is created. A busy
+statement has had no effect and, with BEGIN IMMEDIATE, only the BEGIN or an
+autocommit write can be busy, so retrying it is safe.
+"""
+import random
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+from django.db import OperationalError
+from django.db.backends.signals import connection_created
+
+
+BUSY_MESSAGES = ('database is locked', 'database table is locked', 'database is busy')
+
+
+def is_sqlite(database):
+    return database.get('ENGINE', '').endswith('sqlite3')
+
+
+def sqlite_pragmas(mmap_size=256 * 1024 * 1024, cache_size=-64 * 1024):
+    """PRAGMA statements run on each new connection (cache_size < 0 is in KiB)"""
+    return [
+        'PRAGMA synchronous=NORMAL',
+        f'PRAGMA mmap_size={int(mmap_size)}',
+        f'PRAGMA cache_size={int(cache_size)}',
+    ]
+
+
+def configure_sqlite(database, busy_timeout=5, mmap_size=256 * 1024 * 1024, cache_size=-64 * 1024):
+    """
+    Copy of a DATABASES entry with the tuning applied.
+    Entries for other engines are returned unchanged.
+    """
+    if not is_sqlite(database):
+        return database
+    database = {**database, 'OPTIONS': dict(database.get('OPTIONS', {}))}
+    options = database['OPTIONS']
+    commands = [command for command in options.get('init_command', '').split(';') if command.strip()]
+    options['init_command'] = ';'.join(commands + sqlite_pragmas(mmap_size, cache_size))
+    options['transaction_mode'] = 'IMMEDIATE'
+    options['timeout'] = busy_timeout
+    return database
+
+
+def is_tuned(database):
+    return is_sqlite(database) and database.get('OPTIONS', {}).get('transaction_mode') == 'IMMEDIATE'
+
+
+def is_busy_error(exc):
+    return isinstance(exc, OperationalError) and str(exc).lower().startswith(BUSY_MESSAGES)
+
+
+# Busy statements per alias, in this process
+
+_busy = Counter()
+_busy_lock = threading.Lock()
+
+
+def _record(alias, key):
+    with _busy_lock:
+        _busy[alias, key] += 1
+
+
+class BusyRetry:
+    """Connection execute wrapper: retry SQLITE_BUSY with jittered exponential backoff"""
+
+    def __init__(self, retries=3, backoff=0.05):
+        self.retries = retries
+        self.backoff = backoff
+
+    def __call__(self, execute, sql, params, many, context):
+        alias = context['connection'].alias
+        for attempt in range(self.retries + 1):
+            try:
+                return execute(sql, params, many, context)
+            except OperationalError as exc:
+                if not is_busy_error(exc) or attempt == self.retries:
+                    if is_busy_error(exc):
+                        _record(alias, 'errors')
+                    raise
+                _record(alias, 'retries')
+                time.sleep(self.backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+
+
+_wal_enabled = set()
+_wal_lock = threading.Lock()
+
+
+def enable_wal(connection, retries=3, backoff=0.05):
+    """Switch the connection's database file to WAL unless this process already did"""
+    name = connection.settings_dict['NAME']
+    with _wal_lock:
+        if name in _wal_enabled:
+            return
+        for attempt in range(retries + 1):
+            try:
+                connection.connection.execute('PRAGMA journal_mode=WAL')
+                break
+            except sqlite3.OperationalError as exc:
+                if 'locked' not in str(exc) or attempt == retries:
+                    raise
+                time.sleep(backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+        _wal_enabled.add(name)
+
+
+def _tune_connection(sender, connection, **kwargs):
+    from django.conf import settings
+
+    if connection.vendor != 'sqlite' or not is_tuned(connection.settings_dict):
+        return
+    retries = getattr(settings, 'DB_SQLITE_BUSY_RETRIES', 3)
+    backoff = getattr(settings, 'DB_SQLITE_BUSY_BACKOFF', 0.05)
+    enable_wal(connection, retries, backoff)
+    # The wrapper list belongs to the alias and survives reconnects. Insert
+    # first: execute_wrapper() blocks open at this point pop from the end.
+    if not any(isinstance(wrapper, BusyRetry) for wrapper in connection.execute_wrappers):
+        connection.execute_wrappers.insert(0, BusyRetry(retries, backoff))
+
+
+connection_created.connect(_tune_connection, dispatch_uid='core.sqlite_tuning.tune')
+
+
+def sqlite_stats():
+    """Busy retries and statements that stayed busy, per tuned SQLite alias"""
+    from django.db import connections
+
+    return {
+        alias: {'busy_retries': _busy[alias, 'retries'], 'busy_errors': _busy[alias, 'errors']}
+        for alias in connections
+        if is_tuned(connections[alias].settings_dict)
+    }
@@ -4,7 +4,11 @@
 # Use PORT from environment or default to 8000
 PORT=${PORT:-8000}
 
-echo "Starting Gunicorn on port $PORT"
+# Workers and threads also size the database pool (DB_CONN_MODE=pool)
+WEB_CONCURRENCY=${WEB_CONCURRENCY:-3}
+GUNICORN_THREADS=${GUNICORN_THREADS:-1}
+
+echo "Starting Gunicorn on port $PORT with $WEB_CONCURRENCY workers x $GUNICORN_THREADS threads"
 
 # Run gunicorn
-exec gunicorn --bind 0.0.0.0:$PORT --workers 3 pregnancy.wsgi:application
+exec gunicorn --bind 0.0.0.0:$PORT --workers $WEB_CONCURRENCY --threads $GUNICORN_THREADS pregnancy.wsgi:application
@@ -0,0 +1,56 @@
+"""
+Management command to run the custom reminder dispatcher daemon
+Run with: python manage.py dispatch_reminders
+Use --once from cron to process a single tick and exit, and
+--recompute after a timezone database upgrade.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.notifications.reminder_dispatch import (
+    ReminderDispatcher, TICK_SECONDS, recompute_next_fire_times
+)
+
+
+class Command(BaseCommand):
+    help = 'Dispatch custom reminders whose next_fire_at has passed'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Fire everything due now and exit'
+        )
+        parser.add_argument(
+            '--recompute', action='store_true',
+            help='Recompute next_fire_at for all active reminders and exit'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Reminders per dispatch query and bulk write'
+        )
+
+    def handle(self, *args, **options):
+        if options['recompute']:
+            updated = recompute_next_fire_times(batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Recomputed {updated} reminders'))
+            return
+
+        dispatcher = ReminderDispatcher(batch_size=options['batch_size'])
+
+        if options['once']:
+            sent = dispatcher.tick()
+            self.stdout.write(self.style.SUCCESS(f'Sent {sent} reminders'))
+            return
+
+        try:
+            while True:
+                sent = dispatcher.tick()
+                if sent:
+                    self.stdout.write(f'{timezone.now():%Y-%m-%d %H:%M} sent {sent} reminders')
+
+                # Sleep until just after the next minute boundary
+                time.sleep(TICK_SECONDS - time.time() % TICK_SECONDS + 0.5)
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING(f'Stopped: {dispatcher.stats}'))
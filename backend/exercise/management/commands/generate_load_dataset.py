@@ -0,0 +1,281 @@
+"""
+Management command to generate a synthetic dataset for load testing
+Run with: python manage.py generate_load_dataset --scale small
+          python manage.py generate_load_dataset --patients 100000 --sessions 10000000 --vitals 50000000
+
+Everything is written with bulk_create in fixed-size batches generated
+on the fly, so memory stays flat at any scale. Rows are spread over the
+last --days days. Generated accounts are named load_* (password: loadtest)
+and can be removed with --clear. Use a throwaway database.
+"""
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from exercise.models import (
+    ActivityData, Exercise, ExerciseSession, HealthVitals, PregnancyProfile, UserProfile
+)
+
+
+SCALES = {
+    # name: (patients, sessions, vitals, activity days per patient)
+    'tiny': (100, 2_000, 10_000, 14),
+    'small': (1_000, 100_000, 500_000, 30),
+    'medium': (10_000, 1_000_000, 5_000_000, 30),
+    'large': (100_000, 10_000_000, 50_000_000, 30),
+}
+
+PREFIX = 'load_'
+PASSWORD = 'loadtest'
+
+DEFAULT_EXERCISES = [
+    ('Squats', 'Supported squats for hip and leg strength', 'easy', 'hips,knees'),
+    ('Pelvic Tilts', 'Gentle pelvic tilts for lower back relief', 'easy', 'spine,hips'),
+    ('Cat-Cow Stretch', 'Spinal mobility on hands and knees', 'easy', 'spine'),
+    ('Side-Lying Leg Lifts', 'Hip abductor strengthening', 'medium', 'hips'),
+    ('Wall Push-Ups', 'Upper body strength against a wall', 'medium', 'shoulders,elbows'),
+]
+
+
+@contextmanager
+def explicit_timestamps(*fields):
+    """Let bulk_create keep the generated value of auto_now_add fields"""
+    saved = [(field, field.auto_now_add) for field in fields]
+    for field, _ in saved:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, value in saved:
+            field.auto_now_add = value
+
+
+def _field(model, name):
+    return model._meta.get_field(name)
+
+
+class Command(BaseCommand):
+    help = 'Bulk-generate patients, sessions, vitals and activity for benchmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=sorted(SCALES), default='small')
+        parser.add_argument('--patients', type=int, help='Override the scale preset')
+        parser.add_argument('--sessions', type=int, help='Total exercise sessions')
+        parser.add_argument('--vitals', type=int, help='Total health vitals rows')
+        parser.add_argument('--activity-days', type=int, help='Daily activity rows per patient')
+        parser.add_argument('--doctors', type=int, default=10)
+        parser.add_argument('--days', type=int, default=180, help='History window in days')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--clear', action='store_true', help='Delete previously generated load_* users first')
+
+    def handle(self, *args, **options):
+        patients, sessions, vitals, activity_days = SCALES[options['scale']]
+        patients = options['patients'] if options['patients'] is not None else patients
+        sessions = options['sessions'] if options['sessions'] is not None else sessions
+        vitals = options['vitals'] if options['vitals'] is not None else vitals
+        activity_days = options['activity_days'] if options['activity_days'] is not None else activity_days
+        if patients < 1:
+            raise CommandError('--patients must be at least 1')
+
+        self.verbosity = options['verbosity']
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.now = timezone.now()
+        self.days = options['days']
+
+        if options['clear']:
+            deleted, _ = User.objects.filter(username__startswith=PREFIX).delete()
+            self.log(f"Cleared {deleted} rows from a previous load dataset")
+        if User.objects.filter(username__startswith=PREFIX).exists():
+            raise CommandError('A load dataset already exists; pass --clear to replace it')
+
+        started = time.monotonic()
+        patient_ids = self.create_users(patients, options['doctors'])
+        exercise_ids = self.ensure_exercises()
+        counts = {
+            'patients': len(patient_ids),
+            'doctors': options['doctors'],
+            'sessions': self.create_sessions(patient_ids, exercise_ids, sessions),
+            'vitals': self.create_vitals(patient_ids, vitals),
+            'activity': self.create_activity(patient_ids, activity_days),
+        }
+        elapsed = time.monotonic() - started
+        if self.verbosity:
+            self.stdout.write(self.style.SUCCESS(
+                'Generated ' + ', '.join(f"{value:,} {name}" for name, value in counts.items())
+                + f" in {elapsed:.1f}s"
+            ))
+        return None
+
+    # Helpers
+
+    def log(self, message):
+        if self.verbosity:
+            self.stdout.write(message)
+
+    def spread(self, index, total):
+        """A timestamp within the history window, evenly spread with jitter"""
+        seconds = self.days * 86400
+        offset = seconds * (index + self.rng.random()) / max(total, 1)
+        return self.now - timedelta(seconds=seconds - offset)
+
+    def bulk(self, model, rows, label, total):
+        """bulk_create from a generator in batch_size transactions"""
+        written = 0
+        batch = []
+        step = max(total // 10, self.batch_size)
+        next_report = step
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                written += self._flush(model, batch)
+                batch = []
+                if written >= next_report:
+                    self.log(f"  {label}: {written:,}/{total:,}")
+                    next_report += step
+        if batch:
+            written += self._flush(model, batch)
+        return written
+
+    def _flush(self, model, batch):
+        with transaction.atomic():
+            model.objects.bulk_create(batch, batch_size=self.batch_size)
+        return len(batch)
+
+    # Generators
+
+    def create_users(self, patients, doctors):
+        self.log(f"Creating {patients:,} patients and {doctors} doctors...")
+        password = make_password(PASSWORD)  # hashed once, not per user
+
+        def users():
+            yield User(username=f'{PREFIX}admin', email='admin@load.test', password=password,
+                       is_staff=True, date_joined=self.now - timedelta(days=self.days))
+            for i in range(doctors):
+                yield User(username=f'{PREFIX}doctor_{i}', email=f'doctor{i}@load.test', password=password,
+                           date_joined=self.now - timedelta(days=self.days))
+            for i in range(patients):
+                joined = self.spread(i, patients)
+                yield User(
+                    username=f'{PREFIX}patient_{i}', email=f'patient{i}@load.test', password=password,
+                    date_joined=joined,
+                    last_login=joined + (self.now - joined) * self.rng.random(),
+                )
+
+        self.bulk(User, users(), 'users', patients + doctors + 1)
+        users_by_name = User.objects.filter(username__startswith=PREFIX).values_list('username', 'id')
+        roles = []
+        patient_ids = []
+        for username, user_id in users_by_name.iterator(chunk_size=self.batch_size):
+            if username.startswith(f'{PREFIX}patient_'):
+                roles.append((user_id, 'patient'))
+                patient_ids.append(user_id)
+            else:
+                roles.append((user_id, 'admin' if username == f'{PREFIX}admin' else 'doctor'))
+        patient_ids.sort()
+
+        today = self.now.date()
+
+        def profiles():
+            for user_id, role in roles:
+                lmp = today - timedelta(days=self.rng.randint(14, 280)) if role == 'patient' else None
+                yield UserProfile(
+                    user_id=user_id, role=role, full_name=f'Load {role.title()} {user_id}',
+                    lmp_date=lmp, created_at=self.now,
+                )
+
+        with explicit_timestamps(_field(UserProfile, 'created_at')):
+            self.bulk(UserProfile, profiles(), 'profiles', len(roles))
+
+        def pregnancy_profiles():
+            for user_id in patient_ids:
+                yield PregnancyProfile(
+                    user_id=user_id, lmp_date=today - timedelta(days=self.rng.randint(14, 280)),
+                    created_at=self.now,
+                )
+
+        with explicit_timestamps(_field(PregnancyProfile, 'created_at')):
+            self.bulk(PregnancyProfile, pregnancy_profiles(), 'pregnancy profiles', len(patient_ids))
+        return patient_ids
+
+    def ensure_exercises(self):
+        if not Exercise.objects.exists():
+            Exercise.objects.bulk_create([
+                Exercise(name=name, description=description, difficulty=difficulty, target_joints=joints)
+                for name, description, difficulty, joints in DEFAULT_EXERCISES
+            ])
+        return list(Exercise.objects.values_list('id', flat=True))
+
+    def create_sessions(self, patient_ids, exercise_ids, total):
+        self.log(f"Creating {total:,} exercise sessions...")
+        rng = self.rng
+        per_patient, extra = divmod(total, len(patient_ids))
+
+        def sessions():
+            for p, user_id in enumerate(patient_ids):
+                count = per_patient + (1 if p < extra else 0)
+                for i in range(count):
+                    start = self.spread(i, count)
+                    yield ExerciseSession(
+                        user_id=user_id,
+                        exercise_id=exercise_ids[rng.randrange(len(exercise_ids))],
+                        start_time=start,
+                        end_time=start + timedelta(minutes=rng.randint(5, 30)),
+                        rep_count=rng.randint(5, 30),
+                        avg_posture_score=round(rng.uniform(55, 98), 1),
+                        posture_warnings='' if rng.random() < 0.8 else 'Knee alignment',
+                    )
+
+        return self.bulk(ExerciseSession, sessions(), 'sessions', total)
+
+    def create_vitals(self, patient_ids, total):
+        self.log(f"Creating {total:,} health vitals...")
+        rng = self.rng
+        per_patient, extra = divmod(total, len(patient_ids))
+        stress_levels = ['low'] * 6 + ['medium'] * 3 + ['high']
+
+        def vitals():
+            for p, user_id in enumerate(patient_ids):
+                count = per_patient + (1 if p < extra else 0)
+                for i in range(count):
+                    yield HealthVitals(
+                        user_id=user_id,
+                        timestamp=self.spread(i, count),
+                        heart_rate=rng.randint(70, 110),
+                        spo2=rng.randint(94, 100),
+                        stress_level=stress_levels[rng.randrange(len(stress_levels))],
+                        fatigue_level=rng.randint(0, 100),
+                        daily_active_minutes=rng.randint(0, 120),
+                    )
+
+        with explicit_timestamps(_field(HealthVitals, 'timestamp')):
+            return self.bulk(HealthVitals, vitals(), 'vitals', total)
+
+    def create_activity(self, patient_ids, days):
+        total = len(patient_ids) * days
+        self.log(f"Creating {total:,} daily activity rows...")
+        rng = self.rng
+        today = self.now.date()
+
+        def activity():
+            for user_id in patient_ids:
+                for day in range(days):
+                    yield ActivityData(
+                        user_id=user_id,
+                        date=today - timedelta(days=day),
+                        steps=rng.randint(1500, 12000),
+                        avg_heart_rate=rng.uniform(70, 100),
+                        calories=rng.uniform(1600, 2600),
+                        active_minutes=rng.randint(0, 90),
+                        sleep_minutes=rng.randint(300, 540),
+                    )
+
+        return self.bulk(ActivityData, activity(), 'activity', total)
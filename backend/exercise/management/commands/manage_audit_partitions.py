@@ -0,0 +1,46 @@
+"""
+Management command to maintain monthly audit log partitions
+Run with: python manage.py manage_audit_partitions
+Schedule it daily (cron / Railway cron job) so next month's partition
+exists before it is needed and expired months are dropped.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from apps.reports.partitions import (
+    ensure_partitions, is_partitioned, list_partitions, prune_audit_partitions
+)
+
+
+class Command(BaseCommand):
+    help = 'Create upcoming audit log partitions and drop months past retention'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead', type=int, default=settings.AUDIT_PARTITION_MONTHS_AHEAD,
+            help='Create partitions for this many months after the current one'
+        )
+        parser.add_argument(
+            '--retention-months', type=int, default=settings.AUDIT_RETENTION_MONTHS,
+            help='Keep this many full months before the current one'
+        )
+        parser.add_argument(
+            '--list', action='store_true',
+            help='Only list existing partitions'
+        )
+
+    def handle(self, *args, **options):
+        mode = 'native' if is_partitioned() else 'partition_key'
+        if options['list']:
+            keys = list_partitions()
+            self.stdout.write(f"{mode}: {', '.join(map(str, keys)) or 'none'}")
+            return
+
+        created = ensure_partitions(months_ahead=options['months_ahead'])
+        dropped = prune_audit_partitions(retention_months=options['retention_months'])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{mode}: created {len(created)} partition(s), dropped {len(dropped)} "
+                f"({', '.join(map(str, dropped)) or 'none'})"
+            )
+        )
@@ -0,0 +1,39 @@
+"""
+Management command to expire and archive old notifications
+Run with: python manage.py prune_notifications
+Schedule it daily (cron / Railway cron job).
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from apps.notifications.retention import run_retention
+
+
+class Command(BaseCommand):
+    help = 'Expire old read notifications and archive the rest in bounded batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--read-days', type=int, default=settings.NOTIFICATION_READ_RETENTION_DAYS,
+            help='Delete read notifications older than this many days'
+        )
+        parser.add_argument(
+            '--archive-days', type=int, default=settings.NOTIFICATION_ARCHIVE_AFTER_DAYS,
+            help='Archive remaining notifications older than this many days'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=settings.NOTIFICATION_BATCH_SIZE,
+            help='Rows per DELETE/UPDATE batch'
+        )
+
+    def handle(self, *args, **options):
+        result = run_retention(
+            read_days=options['read_days'],
+            archive_days=options['archive_days'],
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Expired: {result['expired']}, Archived: {result['archived']}"
+            )
+        )
@@ -0,0 +1,43 @@
+"""
+Management command to re-score stored sessions after a scoring rule change
+Run with: python manage.py rescore_sessions [--workers 8] [--dry-run]
+Recomputes rep_count and avg_posture_score from session telemetry with
+apps/exercises/pose_analysis.py (the Python port of poseAnalysis.ts).
+"""
+
+from django.core.management.base import BaseCommand
+from apps.exercises.rescoring import rescore_sessions
+
+
+class Command(BaseCommand):
+    help = 'Re-score sessions from their stored telemetry with the current posture scoring rules'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=None,
+            help='Scoring processes (default: one per CPU, 0: score in this process)'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=200,
+            help='Sessions per worker task and per bulk update'
+        )
+        parser.add_argument(
+            '--session', type=int, action='append', dest='sessions',
+            help='Only re-score this session id (repeatable)'
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Score and count changes without writing them'
+        )
+
+    def handle(self, *args, **options):
+        result = rescore_sessions(
+            session_ids=options['sessions'],
+            workers=options['workers'],
+            chunk_size=options['chunk_size'],
+            dry_run=options['dry_run'],
+        )
+        verb = 'Would change' if options['dry_run'] else 'Changed'
+        self.stdout.write(
+            self.style.SUCCESS(f"Scored: {result['scored']}, {verb}: {result['changed']}")
+        )
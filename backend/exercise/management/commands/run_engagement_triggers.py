@@ -0,0 +1,28 @@
+"""
+Management command to evaluate engagement notification triggers
+Run with: python manage.py run_engagement_triggers
+Schedule it hourly (cron / Railway cron job); each trigger fires at most
+once per user and period however often it runs.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from apps.notifications.engagement import run_engagement_triggers
+
+
+class Command(BaseCommand):
+    help = 'Evaluate engagement triggers for all users and send notifications in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=settings.NOTIFICATION_BATCH_SIZE,
+            help='Rows per bulk INSERT'
+        )
+
+    def handle(self, *args, **options):
+        counts = run_engagement_triggers(batch_size=options['batch_size'])
+        if not counts:
+            self.stdout.write('No engagement notifications due')
+            return
+        for trigger_type, sent in sorted(counts.items()):
+            self.stdout.write(self.style.SUCCESS(f'{trigger_type}: {sent}'))
@@ -0,0 +1,47 @@
+"""
+Management command to run the background job worker (core/jobs.py)
+Run with: python manage.py run_jobs
+Use --once from cron to run everything due and exit. Set
+JOBS_RUN_IN_PROCESS=False on the web servers when a worker runs.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.reports.data_export import purge_expired_exports
+from core.jobs import JobRunner
+
+
+class Command(BaseCommand):
+    help = 'Run queued background jobs (data exports, user deletions)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Run every due job and exit'
+        )
+        parser.add_argument(
+            '--poll', type=float, default=5.0,
+            help='Seconds to wait between polls when the queue is empty'
+        )
+
+    def handle(self, *args, **options):
+        runner = JobRunner()
+
+        if options['once']:
+            ran = runner.run_pending()
+            purged = purge_expired_exports()
+            self.stdout.write(self.style.SUCCESS(f'Ran {ran} jobs {runner.stats}, purged {purged} expired exports'))
+            return
+
+        try:
+            while True:
+                ran = runner.run_pending()
+                if ran:
+                    self.stdout.write(f'{timezone.now():%Y-%m-%d %H:%M} ran {ran} jobs')
+                else:
+                    purge_expired_exports()
+                    time.sleep(options['poll'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING(f'Stopped: {runner.stats}'))
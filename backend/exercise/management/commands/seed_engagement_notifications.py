@@ -15,15 +15,15 @@ class Command(BaseCommand):
             {
                 'trigger_type': 'inactive_user',
                 'title': 'We miss you! 💙',
-                'message': "It's been 3 days since your last workout. A quick 5-minute session can make a big difference for you and your baby!",
+                'message': "It's been {days} days since your last workout. A quick 5-minute session can make a big difference for you and your baby!",
                 'action_url': '/exercises',
                 'priority': 'medium',
                 'send_email': True,
             },
             {
                 'trigger_type': 'streak_milestone',
-                'title': '🔥 7-Day Streak!',
-                'message': 'Amazing! You\'ve exercised 7 days in a row. Keep the momentum going!',
+                'title': '🔥 {days}-Day Streak!',
+                'message': 'Amazing! You\'ve exercised {days} days in a row. Keep the momentum going!',
                 'action_url': '/dashboard',
                 'priority': 'low',
                 'send_email': False,
@@ -47,7 +47,7 @@ class Command(BaseCommand):
             {
                 'trigger_type': 'pregnancy_week',
                 'title': '🤰 Pregnancy Milestone!',
-                'message': 'Congratulations on reaching a new week! Check out this week\'s tips and exercises.',
+                'message': 'Congratulations on reaching week {week}! Check out this week\'s tips and exercises.',
                 'action_url': '/pregnancy',
                 'priority': 'medium',
                 'send_email': True,
@@ -55,7 +55,7 @@ class Command(BaseCommand):
             {
                 'trigger_type': 'achievement',
                 'title': '🏆 Achievement Unlocked!',
-                'message': 'You\'ve completed 100 reps! You\'re doing amazing!',
+                'message': 'You\'ve completed {reps} reps! You\'re doing amazing!',
                 'action_url': '/dashboard',
                 'priority': 'low',
                 'send_email': False,
@@ -71,7 +71,7 @@ class Command(BaseCommand):
             {
                 'trigger_type': 'weekly_summary',
                 'title': '📊 Your Weekly Summary is Ready!',
-                'message': 'Check out your progress from this week. You\'re making great strides!',
+                'message': 'You completed {sessions} sessions and {reps} reps last week. You\'re making great strides!',
                 'action_url': '/reports',
                 'priority': 'medium',
                 'send_email': True,
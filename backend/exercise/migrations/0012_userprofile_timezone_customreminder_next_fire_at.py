@@ -0,0 +1,44 @@
+# Generated by Django 5.1.1 on 2026-10-18 22:50
+
+import apps.notifications.schedule
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+from apps.notifications.schedule import get_zone, reminder_next_fire_at
+
+
+def populate_next_fire_at(apps, schema_editor):
+    CustomReminder = apps.get_model('exercise', 'CustomReminder')
+    UserProfile = apps.get_model('exercise', 'UserProfile')
+    now = timezone.now()
+    zones = dict(UserProfile.objects.values_list('user_id', 'timezone'))
+    reminders = list(CustomReminder.objects.filter(is_active=True))
+    for reminder in reminders:
+        reminder.next_fire_at = reminder_next_fire_at(reminder, now, get_zone(zones.get(reminder.user_id)))
+    CustomReminder.objects.bulk_update(reminders, ['next_fire_at'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exercise', '0011_doctor_faq_guidancearticle'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customreminder',
+            name='next_fire_at',
+            field=models.DateTimeField(blank=True, help_text="Next send time in UTC, precomputed from the user's timezone", null=True),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='timezone',
+            field=models.CharField(default='UTC', help_text='IANA timezone name used for reminders and quiet hours, e.g. Asia/Kolkata', max_length=64, validators=[apps.notifications.schedule.validate_timezone_name]),
+        ),
+        migrations.AddIndex(
+            model_name='customreminder',
+            index=models.Index(fields=['is_active', 'next_fire_at'], name='exercise_cu_is_acti_28ba51_idx'),
+        ),
+        migrations.RunPython(populate_next_fire_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.1 on 2026-10-19 00:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exercise', '0012_userprofile_timezone_customreminder_next_fire_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exercisesession',
+            name='client_id',
+            field=models.CharField(blank=True, help_text='Idempotency key generated by the client (POST /sessions/sync/)', max_length=64, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='exercisesession',
+            constraint=models.UniqueConstraint(fields=('user', 'client_id'), name='unique_session_client_id'),
+        ),
+    ]
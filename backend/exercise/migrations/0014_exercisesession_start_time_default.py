@@ -0,0 +1,19 @@
+# Generated by Django 5.1.1 on 2026-10-19 01:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exercise', '0013_exercisesession_client_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='exercisesession',
+            name='start_time',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
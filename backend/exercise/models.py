@@ -3,6 +3,7 @@ from django.contrib.auth.models import User
 from datetime import timedelta, date
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
+from apps.notifications.schedule import validate_timezone_name
 
 
 class Exercise(models.Model):
@@ -18,11 +19,21 @@ class Exercise(models.Model):
 class ExerciseSession(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     exercise = models.ForeignKey(Exercise, on_delete=models.CASCADE)
-    start_time = models.DateTimeField(auto_now_add=True)
+    # Not auto_now_add: sessions synced from an offline queue keep the time they were done
+    start_time = models.DateTimeField(default=timezone.now)
     end_time = models.DateTimeField(null=True, blank=True)
     rep_count = models.IntegerField(default=0)
     avg_posture_score = models.FloatField(default=0.0)
     posture_warnings = models.TextField(blank=True)
+    client_id = models.CharField(
+        max_length=64, null=True, blank=True,
+        help_text='Idempotency key generated by the client (POST /sessions/sync/)'
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'client_id'], name='unique_session_client_id'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.exercise.name}"
@@ -165,6 +176,13 @@ class UserProfile(models.Model):
     emergency_contact_relationship = models.CharField(max_length=100, blank=True)
     emergency_contact_phone = models.CharField(max_length=20, blank=True)
     
+    # Preferences
+    timezone = models.CharField(
+        max_length=64, default='UTC',
+        validators=[validate_timezone_name],
+        help_text='IANA timezone name used for reminders and quiet hours, e.g. Asia/Kolkata'
+    )
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
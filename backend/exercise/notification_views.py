@@ -1,106 +1,7 @@
 """
-Notification API Views
-Endpoints for managing in-app notifications
+Compatibility shim: moved to apps/notifications/notification_views.py
 """
-
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
-from rest_framework import status
-from .models import Notification
-from .serializers import NotificationSerializer
-
-
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def get_notifications(request):
-    """
-    Get user notifications with pagination
-    Query params:
-    - page: page number (default: 1)
-    - page_size: items per page (default: 10)
-    """
-    notifications = Notification.objects.filter(user=request.user)
-    unread_count = notifications.filter(is_read=False).count()
-    
-    # Pagination
-    page = int(request.GET.get('page', 1))
-    page_size = int(request.GET.get('page_size', 10))
-    start = (page - 1) * page_size
-    end = start + page_size
-    
-    notifications_data = NotificationSerializer(
-        notifications[start:end], 
-        many=True
-    ).data
-    
-    return Response({
-        'notifications': notifications_data,
-        'unread_count': unread_count,
-        'total': notifications.count(),
-        'page': page,
-        'page_size': page_size
-    })
-
-
-@api_view(['POST'])
-@permission_classes([IsAuthenticated])
-def mark_notification_read(request, notification_id):
-    """Mark a specific notification as read"""
-    try:
-        notification = Notification.objects.get(
-            id=notification_id, 
-            user=request.user
-        )
-        notification.is_read = True
-        notification.save()
-        return Response({'message': 'Marked as read'})
-    except Notification.DoesNotExist:
-        return Response(
-            {'error': 'Notification not found'}, 
-            status=status.HTTP_404_NOT_FOUND
-        )
-
-
-@api_view(['POST'])
-@permission_classes([IsAuthenticated])
-def mark_all_notifications_read(request):
-    """Mark all user notifications as read"""
-    count = Notification.objects.filter(
-        user=request.user, 
-        is_read=False
-    ).update(is_read=True)
-    
-    return Response({
-        'message': f'{count} notifications marked as read',
-        'count': count
-    })
-
-
-@api_view(['DELETE'])
-@permission_classes([IsAuthenticated])
-def delete_notification(request, notification_id):
-    """Delete a specific notification"""
-    try:
-        notification = Notification.objects.get(
-            id=notification_id, 
-            user=request.user
-        )
-        notification.delete()
-        return Response({'message': 'Notification deleted'})
-    except Notification.DoesNotExist:
-        return Response(
-            {'error': 'Notification not found'}, 
-            status=status.HTTP_404_NOT_FOUND
-        )
-
-
-@api_view(['DELETE'])
-@permission_classes([IsAuthenticated])
-def clear_all_notifications(request):
-    """Delete all user notifications"""
-    count, _ = Notification.objects.filter(user=request.user).delete()
-    return Response({
-        'message': f'{count} notifications deleted',
-        'count': count
-    })
+from apps.notifications.notification_views import (  # noqa: F401
+    get_notifications, mark_notification_read, mark_all_notifications_read, delete_notification,
+    clear_all_notifications,
+)
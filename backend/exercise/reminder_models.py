@@ -6,6 +6,7 @@ For scheduled notifications and user engagement
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
+from apps.notifications.schedule import get_user_timezone, reminder_next_fire_at
 
 
 class CustomReminder(models.Model):
@@ -40,6 +41,10 @@ class CustomReminder(models.Model):
     send_email = models.BooleanField(default=False, help_text="Send email notification")
     send_notification = models.BooleanField(default=True, help_text="Send in-app notification")
     last_sent = models.DateTimeField(null=True, blank=True)
+    next_fire_at = models.DateTimeField(
+        null=True, blank=True,
+        help_text="Next send time in UTC, precomputed from the user's timezone"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -48,20 +53,37 @@ class CustomReminder(models.Model):
         indexes = [
             models.Index(fields=['user', 'is_active']),
             models.Index(fields=['scheduled_time']),
+            models.Index(fields=['is_active', 'next_fire_at']),
         ]
     
     def __str__(self):
         return f"{self.user.username} - {self.title} ({self.get_frequency_display()})"
     
-    def should_send_today(self):
-        """Check if reminder should be sent today"""
+    def save(self, *args, **kwargs):
+        """Keep next_fire_at in step with the schedule on every save"""
+        self.next_fire_at = self.compute_next_fire_at() if self.is_active else None
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'next_fire_at' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'next_fire_at']
+        super().save(*args, **kwargs)
+    
+    def compute_next_fire_at(self, after=None, tz=None):
+        """Next UTC send time after `after` (default now) in the user's timezone"""
+        after = after or timezone.now()
+        if self.created_at is None:
+            self.created_at = after
+        return reminder_next_fire_at(self, after, tz or get_user_timezone(self.user))
+    
+    def should_send_today(self, tz=None):
+        """Check if reminder should be sent today (in the user's timezone)"""
         if not self.is_active:
             return False
         
-        today = timezone.now()
+        tz = tz or get_user_timezone(self.user)
+        today = timezone.localtime(timezone.now(), tz)
         
         # Check if already sent today
-        if self.last_sent and self.last_sent.date() == today.date():
+        if self.last_sent and timezone.localtime(self.last_sent, tz).date() == today.date():
             return False
         
         # Check frequency
@@ -73,7 +95,7 @@ class CustomReminder(models.Model):
             return today.weekday() in self.days_of_week
         elif self.frequency == 'monthly':
             # Send on the same day of month as created
-            return today.day == self.created_at.day
+            return today.day == timezone.localtime(self.created_at, tz).day
         
         return False
 
@@ -142,12 +164,13 @@ class NotificationPreferences(models.Model):
     def __str__(self):
         return f"{self.user.username} - Notification Preferences"
     
-    def is_quiet_hours(self):
-        """Check if current time is within quiet hours"""
+    def is_quiet_hours(self, at=None, tz=None):
+        """Check if current time (or the given datetime) is within quiet hours, in the user's timezone"""
         if not self.quiet_hours_enabled or not self.quiet_hours_start or not self.quiet_hours_end:
             return False
         
-        now = timezone.now().time()
+        tz = tz or get_user_timezone(self.user)
+        now = timezone.localtime(at or timezone.now(), tz).time()
         start = self.quiet_hours_start
         end = self.quiet_hours_end
         
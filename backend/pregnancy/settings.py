@@ -14,14 +14,18 @@ DEBUG = config('DEBUG', default=False, cast=bool)
 if not DEBUG and config('SENTRY_DSN', default=''):
     import sentry_sdk
     from sentry_sdk.integrations.django import DjangoIntegration
-    from sentry_sdk.integrations.redis import RedisIntegration
-    
+
+    # Only the integrations this deployment uses: auto-enabling would import
+    # every supported library that happens to be installed
+    sentry_integrations = [DjangoIntegration()]
+    if config('REDIS_URL', default=''):
+        from sentry_sdk.integrations.redis import RedisIntegration
+        sentry_integrations.append(RedisIntegration())
+
     sentry_sdk.init(
         dsn=config('SENTRY_DSN'),
-        integrations=[
-            DjangoIntegration(),
-            RedisIntegration(),
-        ],
+        integrations=sentry_integrations,
+        auto_enabling_integrations=False,
         traces_sample_rate=float(config('SENTRY_TRACES_SAMPLE_RATE', default='0.1')),
         profiles_sample_rate=float(config('SENTRY_PROFILES_SAMPLE_RATE', default='0.1')),
         environment=config('SENTRY_ENVIRONMENT', default='production'),
@@ -55,6 +59,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestMetricsMiddleware',
+    'core.db_router.ReadReplicaMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -98,6 +104,56 @@ DATABASES = {
     }
 }
 
+# Database Connections (see core/db_connections.py)
+# DB_CONN_MODE: per_request, persistent (CONN_MAX_AGE + health checks) or
+# pool (psycopg 3 pool on PostgreSQL, sized from GUNICORN_THREADS per worker)
+from core.db_connections import configure_database
+DB_CONN_MODE = config('DB_CONN_MODE', default='persistent')
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=60, cast=int)
+DB_POOL_TIMEOUT = config('DB_POOL_TIMEOUT', default=10, cast=float)
+# Gunicorn reads the same variables in entrypoint.sh
+WEB_CONCURRENCY = config('WEB_CONCURRENCY', default=3, cast=int)
+GUNICORN_THREADS = config('GUNICORN_THREADS', default=1, cast=int)
+DATABASES['default'] = configure_database(
+    DATABASES['default'], DB_CONN_MODE, max_age=DB_CONN_MAX_AGE,
+    threads=GUNICORN_THREADS, pool_timeout=DB_POOL_TIMEOUT,
+)
+
+# SQLite Concurrency (see core/sqlite_tuning.py)
+# WAL, synchronous=NORMAL, mmap/cache pragmas, BEGIN IMMEDIATE and a busy
+# timeout with retry; ignored for other engines
+from core.sqlite_tuning import configure_sqlite
+DB_SQLITE_TUNING = config('DB_SQLITE_TUNING', default=True, cast=bool)
+DB_SQLITE_BUSY_TIMEOUT = config('DB_SQLITE_BUSY_TIMEOUT', default=5, cast=float)
+DB_SQLITE_BUSY_RETRIES = config('DB_SQLITE_BUSY_RETRIES', default=3, cast=int)
+DB_SQLITE_BUSY_BACKOFF = config('DB_SQLITE_BUSY_BACKOFF', default=0.05, cast=float)
+DB_SQLITE_MMAP_SIZE = config('DB_SQLITE_MMAP_SIZE', default=256 * 1024 * 1024, cast=int)
+# Negative values are KiB: -65536 = 64 MiB of page cache per connection
+DB_SQLITE_CACHE_SIZE = config('DB_SQLITE_CACHE_SIZE', default=-64 * 1024, cast=int)
+if DB_SQLITE_TUNING:
+    DATABASES['default'] = configure_sqlite(
+        DATABASES['default'], busy_timeout=DB_SQLITE_BUSY_TIMEOUT,
+        mmap_size=DB_SQLITE_MMAP_SIZE, cache_size=DB_SQLITE_CACHE_SIZE,
+    )
+
+# Read Replica (see core/db_router.py)
+# Set DB_REPLICA_HOST to send read-only endpoints (reports, doctor views,
+# weekly report, vitals history) to a replica; other settings default to the primary's
+if config('DB_REPLICA_HOST', default=''):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': config('DB_REPLICA_NAME', default=DATABASES['default']['NAME']),
+        'USER': config('DB_REPLICA_USER', default=DATABASES['default']['USER']),
+        'PASSWORD': config('DB_REPLICA_PASSWORD', default=DATABASES['default']['PASSWORD']),
+        'HOST': config('DB_REPLICA_HOST'),
+        'PORT': config('DB_REPLICA_PORT', default=DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+READ_REPLICA_ALIAS = 'replica' if 'replica' in DATABASES else None
+# After writing, a user reads from the primary for this long (replication lag)
+READ_REPLICA_STICKY_SECONDS = config('READ_REPLICA_STICKY_SECONDS', default=5, cast=int)
+DATABASE_ROUTERS = ['core.db_router.ReadReplicaRouter']
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -217,6 +273,9 @@ CORS_ALLOW_HEADERS = [
     'x-requested-with',
 ]
 
+# Lets the frontend read download filenames
+CORS_EXPOSE_HEADERS = ['Content-Disposition']
+
 # JWT Settings
 from datetime import timedelta
 SIMPLE_JWT = {
@@ -235,6 +294,48 @@ EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default=f'AI Pregnancy Care <{EMAIL_HOST_USER}>')
 
+# Notification Retention
+NOTIFICATION_READ_RETENTION_DAYS = config('NOTIFICATION_READ_RETENTION_DAYS', default=30, cast=int)
+NOTIFICATION_ARCHIVE_AFTER_DAYS = config('NOTIFICATION_ARCHIVE_AFTER_DAYS', default=90, cast=int)
+NOTIFICATION_BATCH_SIZE = config('NOTIFICATION_BATCH_SIZE', default=1000, cast=int)
+ENGAGEMENT_INACTIVE_DAYS = config('ENGAGEMENT_INACTIVE_DAYS', default=3, cast=int)
+
+# Audit Logging
+AUDIT_ASYNC = config('AUDIT_ASYNC', default=True, cast=bool)
+AUDIT_QUEUE_SIZE = config('AUDIT_QUEUE_SIZE', default=10000, cast=int)
+AUDIT_FLUSH_SIZE = config('AUDIT_FLUSH_SIZE', default=200, cast=int)
+AUDIT_FLUSH_INTERVAL = config('AUDIT_FLUSH_INTERVAL', default=1.0, cast=float)
+AUDIT_RETENTION_MONTHS = config('AUDIT_RETENTION_MONTHS', default=24, cast=int)
+AUDIT_PARTITION_MONTHS_AHEAD = config('AUDIT_PARTITION_MONTHS_AHEAD', default=2, cast=int)
+AUDIT_PARTITION_BATCH_SIZE = config('AUDIT_PARTITION_BATCH_SIZE', default=5000, cast=int)
+
+# Server-side PDF/CSV reports (REPORT_WORKERS=0 renders in the request process)
+REPORT_WORKERS = config('REPORT_WORKERS', default=2, cast=int)
+REPORT_CACHE_TIMEOUT = config('REPORT_CACHE_TIMEOUT', default=86400, cast=int)
+REPORT_MAX_DAYS = config('REPORT_MAX_DAYS', default=366, cast=int)
+
+# Background jobs (core/jobs.py). JOBS_RUN_IN_PROCESS starts a worker thread
+# in the web process when a job is queued; turn it off when `manage.py run_jobs` runs
+JOBS_RUN_IN_PROCESS = config('JOBS_RUN_IN_PROCESS', default=True, cast=bool)
+JOB_LEASE_SECONDS = config('JOB_LEASE_SECONDS', default=600, cast=int)
+JOB_MAX_ATTEMPTS = config('JOB_MAX_ATTEMPTS', default=3, cast=int)
+
+# Per-user data exports (kept outside MEDIA_ROOT: only served through their token)
+DATA_EXPORT_DIR = config('DATA_EXPORT_DIR', default=str(BASE_DIR / 'exports'))
+DATA_EXPORT_TTL_HOURS = config('DATA_EXPORT_TTL_HOURS', default=48, cast=int)
+DATA_EXPORT_CHUNK_SIZE = config('DATA_EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# User deletion: rows per DELETE statement (apps/reports/user_deletion.py)
+USER_DELETION_BATCH_SIZE = config('USER_DELETION_BATCH_SIZE', default=500, cast=int)
+
+# Request Metrics (served at /metrics in Prometheus format)
+REQUEST_METRICS_ENABLED = config('REQUEST_METRICS_ENABLED', default=True, cast=bool)
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+SLOW_REQUEST_MS = config('SLOW_REQUEST_MS', default=1000, cast=int)
+SLOW_REQUEST_TOP_QUERIES = config('SLOW_REQUEST_TOP_QUERIES', default=5, cast=int)
+# Warn when one query fingerprint runs this many times in a request (0 = off)
+QUERY_REPEAT_WARNING = config('QUERY_REPEAT_WARNING', default=10 if DEBUG else 0, cast=int)
+
 # Security Settings (Production)
 if not DEBUG:
     # CSRF Settings
@@ -261,7 +362,7 @@ LOGGING = {
     'disable_existing_loggers': False,
     'formatters': {
         'json': {
-            '()': 'pythonjsonlogger.jsonlogger.JsonFormatter',
+            '()': 'core.log_formatters.JsonFormatter',  # imports pythonjsonlogger on first use
             'format': '%(levelname)s %(asctime)s %(module)s %(message)s %(pathname)s %(lineno)d',
         },
         'verbose': {
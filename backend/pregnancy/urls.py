@@ -3,10 +3,8 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.views.generic import RedirectView
-from rest_framework_simplejwt.views import TokenRefreshView
-from exercise.auth_serializers import CustomTokenObtainPairView
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
-from exercise.registration_views import register_user
+from core.lazy_views import lazy_view
+from core.metrics import metrics_view
 
 urlpatterns = [
     # Redirect root to admin
@@ -15,22 +13,30 @@ urlpatterns = [
     path('admin/', admin.site.urls),
 
     # JWT Auth
-    path('api/auth/token/', CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
-    path('api/auth/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
-    path('api/auth/register/', register_user, name='register'),
+    path('api/auth/token/', lazy_view('apps.users.authentication.CustomTokenObtainPairView'), name='token_obtain_pair'),
+    path('api/auth/token/refresh/', lazy_view('rest_framework_simplejwt.views.TokenRefreshView'), name='token_refresh'),
+    path('api/auth/register/', lazy_view('apps.users.registration_views.register_user'), name='register'),
     
     # Health Checks
     path('health/', include('core.health_urls')),
     path('ready/', include('core.health_urls')),
     path('alive/', include('core.health_urls')),
+    path('metrics', metrics_view, name='metrics'),
 
     # App APIs
-    path('api/', include('exercise.urls')),
+    path('api/', include('apps.exercises.urls')),
+    path('api/', include('apps.reports.urls')),
+    path('api/', include('apps.health.urls')),
+    path('api/', include('apps.doctors.urls')),
+    path('api/', include('apps.notifications.urls')),
+    path('api/', include('apps.nutrition.urls')),
+    path('api/', include('apps.users.urls')),
+    path('api/', include('apps.guidance.urls')),
 
     # API Documentation
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
-    path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+    path('api/schema/', lazy_view('drf_spectacular.views.SpectacularAPIView'), name='schema'),
+    path('api/docs/', lazy_view('drf_spectacular.views.SpectacularSwaggerView', url_name='schema'), name='swagger-ui'),
+    path('api/redoc/', lazy_view('drf_spectacular.views.SpectacularRedocView', url_name='schema'), name='redoc'),
 ]
 
 # Serve media files in development
@@ -0,0 +1,73 @@
+import time
+import pytest
+from apps.reports.models import AuditLog
+from core.audit import log_action
+from core.audit_writer import AuditWriter
+
+
+def wait_for_rows(count, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if AuditLog.objects.count() >= count:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def make_entry(user, i):
+    return AuditLog(user=user, action='update', model_name='Exercise', object_id=i)
+
+
+@pytest.mark.django_db
+class TestLogAction:
+    """Test cases for the audit entry point"""
+
+    def test_changes_reduced_to_diff(self, admin_user):
+        """Test that full old/new snapshots are stored as changed fields only"""
+        log_action(
+            user=admin_user,
+            action='update',
+            model_name='Exercise',
+            object_id=1,
+            object_repr='Squats',
+            changes={
+                'old': {'name': 'Squats', 'difficulty': 'easy', 'description': 'Same'},
+                'new': {'name': 'Squats', 'difficulty': 'medium', 'description': 'Same'},
+            }
+        )
+        entry = AuditLog.objects.get()
+        assert entry.changes == {'old': {'difficulty': 'easy'}, 'new': {'difficulty': 'medium'}}
+
+    def test_sync_bypasses_queue(self, admin_user, settings):
+        """Test that compliance-critical actions are written before returning"""
+        settings.AUDIT_ASYNC = True
+        log_action(user=admin_user, action='delete', model_name='User', object_id=5, sync=True)
+        assert AuditLog.objects.filter(action='delete').count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAuditWriter:
+    """Test cases for the buffered background writer"""
+
+    def test_flushes_on_size(self, admin_user):
+        """Test that a full batch is written by the background thread"""
+        writer = AuditWriter(flush_size=5, flush_interval=60)
+        try:
+            for i in range(5):
+                assert writer.enqueue(make_entry(admin_user, i))
+            assert wait_for_rows(5)
+        finally:
+            writer.stop()
+
+    def test_flushes_on_interval_and_shutdown(self, admin_user):
+        """Test that a partial batch is written after the interval and on stop()"""
+        writer = AuditWriter(flush_size=100, flush_interval=0.2)
+        writer.enqueue(make_entry(admin_user, 1))
+        assert wait_for_rows(1)
+
+        writer.flush_interval = 60
+        for i in range(3):
+            writer.enqueue(make_entry(admin_user, i))
+        writer.stop()
+        assert AuditLog.objects.count() == 4
+        assert writer.written == 4
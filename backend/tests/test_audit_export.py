@@ -0,0 +1,111 @@
+import csv
+import gzip
+import io
+import json
+import pytest
+from datetime import datetime, timezone as dt_timezone
+from rest_framework import status
+from apps.reports import audit_export
+from apps.reports.models import AuditLog
+from exercise.models import UserProfile
+
+
+@pytest.fixture
+def audit_rows(admin_user, create_user):
+    """25 entries over three days, a third of them by another user"""
+    other = create_user(username='auditor', email='auditor@example.com')
+    AuditLog.objects.bulk_create([
+        AuditLog(
+            user=other if i % 3 == 0 else admin_user,
+            action='delete' if i % 5 == 0 else 'update',
+            model_name='Exercise' if i % 2 else 'User',
+            object_id=i,
+            object_repr=f'Object, "{i}"',
+            changes={'new': {'rep': i}},
+            timestamp=datetime(2024, 3, 1 + i % 3, 12, tzinfo=dt_timezone.utc),
+        )
+        for i in range(25)
+    ])
+    return other
+
+
+def read_stream(response):
+    return b''.join(response.streaming_content)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('admin_profile')
+class TestAuditExport:
+    """Test cases for the streaming audit log export"""
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        # Force several keyset chunks, including rows sharing a timestamp across a boundary
+        monkeypatch.setattr(audit_export, 'EXPORT_CHUNK_SIZE', 4)
+
+    def test_csv_streams_every_row_once(self, admin_client, audit_rows):
+        """Test that the CSV export contains each row in (timestamp, id) order"""
+        response = admin_client.get('/api/admin/audit-logs/export/')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response['Content-Type'] == 'text/csv'
+        assert 'attachment; filename="audit-logs-' in response['Content-Disposition']
+
+        rows = list(csv.DictReader(io.StringIO(read_stream(response).decode())))
+        # 25 seeded rows plus the audit entry for this export
+        assert len(rows) == 26
+        assert rows[-1]['action'] == 'export'
+        keys = [(r['timestamp'], int(r['id'])) for r in rows]
+        assert keys == sorted(keys)
+        assert rows[0]['object_repr'] == 'Object, "0"'
+        assert json.loads(rows[0]['changes']) == {'new': {'rep': 0}}
+
+    def test_ndjson_with_filters(self, admin_client, audit_rows):
+        """Test date, user, action and model filters on the NDJSON export"""
+        response = admin_client.get(
+            '/api/admin/audit-logs/export/?export_format=ndjson'
+            f'&start=2024-03-01&end=2024-03-01&user={audit_rows.id}&model=User'
+        )
+        assert response['Content-Type'] == 'application/x-ndjson'
+        records = [json.loads(line) for line in read_stream(response).decode().splitlines()]
+        assert [r['object_id'] for r in records] == [0, 6, 12, 18, 24]
+        assert {r['username'] for r in records} == {'auditor'}
+
+        response = admin_client.get(
+            '/api/admin/audit-logs/export/?export_format=ndjson'
+            '&start=2024-03-01&end=2024-03-02&action=update&model=Exercise'
+        )
+        records = [json.loads(line) for line in read_stream(response).decode().splitlines()]
+        expected = {i for i in range(25) if i % 3 in (0, 1) and i % 5 and i % 2}
+        assert {r['object_id'] for r in records} == expected
+        assert all(r['username'] in ('admin', 'auditor') for r in records)
+
+    def test_gzip(self, admin_client, audit_rows):
+        """Test that the gzipped stream decompresses to the plain export"""
+        plain = read_stream(admin_client.get('/api/admin/audit-logs/export/?export_format=ndjson'))
+        response = admin_client.get('/api/admin/audit-logs/export/?export_format=ndjson&gzip=1')
+        assert response['Content-Type'] == 'application/gzip'
+        assert response['Content-Disposition'].endswith('.ndjson.gz"')
+        body = gzip.decompress(read_stream(response))
+        # The first export is itself audited, so it shows up in the second
+        assert body.startswith(plain)
+        assert json.loads(body.splitlines()[-1])['action'] == 'export'
+
+    def test_invalid_parameters(self, admin_client):
+        """Test that unknown formats and malformed filters are rejected"""
+        for query in ('export_format=xml', 'start=yesterday', 'end=2024-13-01', 'user=x'):
+            response = admin_client.get(f'/api/admin/audit-logs/export/?{query}')
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_is_audited(self, admin_client, admin_user):
+        """Test that running an export leaves its own audit entry"""
+        read_stream(admin_client.get('/api/admin/audit-logs/export/?action=delete'))
+        entry = AuditLog.objects.get(action='export')
+        assert entry.user == admin_user
+        assert entry.object_repr == 'action=delete'
+
+    def test_requires_admin(self, authenticated_client):
+        """Test that non-admins cannot export the audit trail"""
+        UserProfile.objects.create(user=authenticated_client.user, role='patient')
+        response = authenticated_client.get('/api/admin/audit-logs/export/')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
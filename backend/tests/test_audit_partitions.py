@@ -0,0 +1,130 @@
+import importlib
+
+import pytest
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+from rest_framework import status
+from apps.reports.models import AuditLog
+from apps.reports.partitions import add_months, list_partitions, month_key, prune_audit_partitions
+
+
+NOW = datetime(2024, 6, 15, 12, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def monthly_logs(admin_user):
+    """Five entries in each month from January to June 2024"""
+    AuditLog.objects.bulk_create([
+        AuditLog(
+            user=admin_user, action='update', model_name='Exercise', object_id=month * 10 + i,
+            timestamp=datetime(2024, month, 1 + i * 5, tzinfo=dt_timezone.utc),
+        )
+        for month in range(1, 7)
+        for i in range(5)
+    ])
+
+
+def walk(client, query):
+    seen, cursor = [], None
+    while True:
+        url = f'/api/admin/audit-logs/?{query}' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        seen.extend(response.data['logs'])
+        cursor = response.data['next_cursor']
+        if not response.data['has_more']:
+            return seen
+
+
+def test_month_arithmetic():
+    """Test month keys are UTC and roll over years"""
+    assert month_key(datetime(2024, 3, 31, 23, 30, tzinfo=dt_timezone(timedelta(hours=-2)))) == 202404
+    assert add_months(202411, 3) == 202502
+    assert add_months(202401, -1) == 202312
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('admin_profile')
+class TestAuditPartitions:
+    """Test cases for month-partitioned audit storage"""
+
+    def test_partition_key_set_on_every_write_path(self, admin_user):
+        """Test save() and bulk_create() (the buffered writer's path) both set the key"""
+        saved = AuditLog.objects.create(
+            user=admin_user, action='view', model_name='User',
+            timestamp=datetime(2024, 2, 29, tzinfo=dt_timezone.utc)
+        )
+        bulk, = AuditLog.objects.bulk_create([
+            AuditLog(action='view', model_name='User', timestamp=datetime(2023, 12, 31, tzinfo=dt_timezone.utc))
+        ])
+        assert saved.partition_key == 202402
+        assert AuditLog.objects.get(pk=bulk.pk).partition_key == 202312
+
+    def test_range_queries_prune_months(self, monthly_logs, admin_user):
+        """Test a recent-by-user query is bounded to the current month's partition"""
+        recent = AuditLog.objects.between(NOW - timedelta(hours=24), NOW).filter(user=admin_user)
+        sql = str(recent.query)
+        assert '"partition_key" >= 202406' in sql
+        assert '"partition_key" <= 202406' in sql
+        assert recent.count() == 0
+        assert AuditLog.objects.between(NOW - timedelta(days=5), NOW).count() == 1
+
+        spring = AuditLog.objects.between(
+            datetime(2024, 3, 1, tzinfo=dt_timezone.utc), datetime(2024, 5, 1, tzinfo=dt_timezone.utc)
+        )
+        assert set(spring.values_list('partition_key', flat=True)) == {202403, 202404}
+
+    def test_cursor_walk(self, admin_client, monthly_logs):
+        """Test cursor pages cover every row once, newest first, across months"""
+        rows = walk(admin_client, 'limit=4&model=Exercise')
+        assert len(rows) == len({r['id'] for r in rows}) == 30
+        keys = [(r['timestamp'], r['id']) for r in rows]
+        assert keys == sorted(keys, reverse=True)
+
+        march = walk(admin_client, 'limit=2&start=2024-03-01&end=2024-03-31')
+        assert sorted(r['object_id'] for r in march) == [30, 31, 32, 33, 34]
+
+    def test_invalid_parameters(self, admin_client):
+        """Test malformed cursors and limits are rejected"""
+        for query in ('cursor=bogus', 'limit=x', 'limit=0', 'start=soon'):
+            response = admin_client.get(f'/api/admin/audit-logs/?{query}')
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_retention_drops_whole_months(self, monthly_logs):
+        """Test pruning removes every month before the cutoff and nothing after"""
+        assert list_partitions() == [202401, 202402, 202403, 202404, 202405, 202406]
+        assert prune_audit_partitions(retention_months=3, now=NOW) == [202401, 202402]
+        assert list_partitions() == [202403, 202404, 202405, 202406]
+        assert AuditLog.objects.count() == 20
+
+    def test_management_command(self, monthly_logs, capsys):
+        """Test the maintenance command reports what it did"""
+        call_command('manage_audit_partitions', '--list')
+        assert '202401' in capsys.readouterr().out
+        call_command('manage_audit_partitions', '--retention-months=0')
+        assert 'dropped 6 (202401' in capsys.readouterr().out
+
+
+@pytest.mark.django_db(transaction=True)
+def test_initial_migration_adopts_syncdb_table():
+    """Test 0001 brings a table created by --run-syncdb up to the model instead of failing"""
+    initial = importlib.import_module('apps.reports.migrations.0001_initial')
+    partition_key = AuditLog._meta.get_field('partition_key')
+    partition_index = next(index for index in AuditLog._meta.indexes if 'partition_key' in index.fields)
+    with connection.schema_editor() as editor:
+        editor.remove_index(AuditLog, partition_index)
+        editor.remove_field(AuditLog, partition_key)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "INSERT INTO reports_auditlog (action, model_name, object_repr, changes, user_agent, timestamp) "
+            "VALUES ('view', 'Exercise', '', '{}', '', %s)",
+            [datetime(2024, 3, 31, 23, 30, tzinfo=dt_timezone.utc)]
+        )
+
+    with connection.schema_editor() as editor:
+        initial.create_or_adopt_table(apps, editor)
+    assert AuditLog.objects.get().partition_key == 202403
+    with connection.cursor() as cursor:
+        assert partition_index.name in connection.introspection.get_constraints(cursor, AuditLog._meta.db_table)
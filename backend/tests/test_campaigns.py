@@ -5,6 +5,7 @@ from apps.notifications.models_email import EmailCampaign
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('admin_profile')
 class TestEmailCampaignAPI:
     """Test cases for email campaign endpoints"""
     
@@ -102,6 +103,7 @@ class TestEmailCampaignAPI:
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('admin_profile')
 class TestAnalyticsAPI:
     """Test cases for analytics endpoints"""
     
@@ -137,6 +139,7 @@ class TestAnalyticsAPI:
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('admin_profile')
 class TestUserManagementAPI:
     """Test cases for user management endpoints"""
     
@@ -0,0 +1,154 @@
+import io
+import json
+import os
+import zipfile
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.exercises import telemetry
+from apps.exercises.models import SessionTelemetry
+from apps.reports.data_export import purge_expired_exports
+from apps.reports.models import AuditLog, BackgroundJob, DataExport
+from core import jobs
+from core.jobs import JobRunner, enqueue
+from exercise.models import ActivityData, Exercise, ExerciseSession, HealthVitals, Notification, UserProfile
+
+
+@pytest.fixture(autouse=True)
+def export_dir(settings, tmp_path):
+    settings.DATA_EXPORT_DIR = str(tmp_path / 'exports')
+    return tmp_path / 'exports'
+
+
+@pytest.fixture
+def patient(db):
+    user = User.objects.create_user(username='patient', password='testpass123', email='p@test.com')
+    UserProfile.objects.create(user=user, role='patient')
+    squat = Exercise.objects.create(name='Squat', description='-', difficulty='easy')
+    session = ExerciseSession.objects.create(user=user, exercise=squat, rep_count=10, avg_posture_score=80)
+    recording = SessionTelemetry(session=session)
+    recording.append(telemetry.quantize_batch({
+        't': [0, 33], 'rep': [0, 1], 'score': [90, 85.5], 'velocity': [None, 12.5],
+        'issues': [0, 1], 'angles': [[120, 95.5]],
+    }))
+    recording.save()
+    for offset in range(5):
+        ActivityData.objects.create(user=user, date=timezone.localdate() - timedelta(days=offset), steps=4000)
+    HealthVitals.objects.create(user=user, heart_rate=80, spo2=98, stress_level='low', fatigue_level=3, daily_active_minutes=30)
+    Notification.objects.create(user=user, title='Hi', message='Welcome')
+    other = User.objects.create_user(username='other', password='testpass123')
+    ActivityData.objects.create(user=other, date=timezone.localdate(), steps=1)
+    return user
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+def read_ndjson(archive, name):
+    return [json.loads(line) for line in archive.read(name).decode().splitlines()]
+
+
+@pytest.mark.django_db
+class TestDataExport:
+
+    def test_export_archive(self, patient, settings):
+        """Test the job writes every table of the user's data and the token link downloads it"""
+        settings.DATA_EXPORT_CHUNK_SIZE = 2  # several cursor fetches and writes per table
+        client = client_for(patient)
+        response = client.post('/api/exports/', {}, format='json')
+        assert response.status_code == 202
+        assert response.data['status'] == 'pending' and response.data['download_url'] is None
+        # A second request while one is queued returns the same export
+        assert client.post('/api/exports/', {}, format='json').data['id'] == response.data['id']
+
+        assert JobRunner().run_pending() == 1
+        status = client.get(f"/api/exports/{response.data['id']}/").data
+        assert status['status'] == 'ready'
+        assert status['row_counts']['activity_data.ndjson'] == 5
+
+        download = APIClient().get(status['download_url'])
+        assert download.status_code == 200
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(download.streaming_content)))
+        account, = read_ndjson(archive, 'account.ndjson')
+        assert account['username'] == 'patient' and 'password' not in account
+        assert [row['steps'] for row in read_ndjson(archive, 'activity_data.ndjson')] == [4000] * 5
+        assert read_ndjson(archive, 'health_vitals.ndjson')[0]['heart_rate'] == 80
+        assert read_ndjson(archive, 'notifications.ndjson')[0]['title'] == 'Hi'
+        frames = read_ndjson(archive, 'session_telemetry.ndjson')
+        assert frames[1] == {'session_id': frames[1]['session_id'], 't_ms': 33, 'rep': 1, 'score': 85.5,
+                             'velocity': 12.5, 'issues': [telemetry.ISSUE_CODES[0]], 'angles': [95.5]}
+        assert frames[0]['velocity'] is None
+        assert read_ndjson(archive, 'audit_log.ndjson')[0]['model_name'] == 'UserDataExport'
+        assert json.loads(archive.read('manifest.json'))['files']['profile.ndjson'] == 1
+        assert AuditLog.objects.filter(model_name='UserDataExport', object_repr='patient (download)').exists()
+
+    def test_link_expires(self, patient, export_dir):
+        """Test an expired link is refused and its file is purged"""
+        client = client_for(patient)
+        export_id = client.post('/api/exports/', {}, format='json').data['id']
+        JobRunner().run_pending()
+        export = DataExport.objects.get(id=export_id)
+        assert os.path.exists(export.file_path)
+
+        DataExport.objects.filter(id=export_id).update(expires_at=timezone.now() - timedelta(minutes=1))
+        assert APIClient().get(f'/api/exports/download/{export.token}/').status_code == 410
+        assert APIClient().get('/api/exports/download/not-a-token/').status_code == 404
+        assert purge_expired_exports() == 1
+        assert os.listdir(export_dir) == []
+        assert client.get(f'/api/exports/{export_id}/').data['status'] == 'expired'
+
+    def test_access(self, patient, admin_client, admin_profile):
+        """Test only admins can export other users, and exports are private to their users"""
+        other = User.objects.get(username='other')
+        assert client_for(other).post('/api/exports/', {'user_id': patient.id}, format='json').status_code == 403
+
+        response = admin_client.post('/api/exports/', {'user_id': patient.id}, format='json')
+        assert response.status_code == 202
+        assert DataExport.objects.get(id=response.data['id']).user == patient
+        assert client_for(patient).get(f"/api/exports/{response.data['id']}/").status_code == 200
+        assert client_for(other).get(f"/api/exports/{response.data['id']}/").status_code == 404
+        assert admin_client.post('/api/exports/', {'user_id': 10 ** 6}, format='json').status_code == 404
+
+
+@pytest.mark.django_db
+class TestJobRunner:
+
+    def test_retry_then_fail(self, monkeypatch):
+        """Test a failing job is retried with backoff, then marked failed"""
+        monkeypatch.setitem(jobs.JOB_HANDLERS, 'user_export', f'{__name__}.failing_handler')
+        job = enqueue('user_export', {'export_id': 0})
+        runner = JobRunner(max_attempts=2)
+
+        assert runner.run_pending() == 1
+        job.refresh_from_db()
+        assert job.status == 'pending' and job.run_after > timezone.now() and 'disk full' in job.error
+        assert runner.run_pending() == 0  # backing off
+
+        BackgroundJob.objects.filter(id=job.id).update(run_after=timezone.now())
+        assert runner.run_pending() == 1
+        job.refresh_from_db()
+        assert job.status == 'failed' and job.attempts == 2 and job.finished_at is not None
+
+    def test_expired_lease_is_reclaimed(self):
+        """Test a job whose worker died is claimed again once its lease runs out"""
+        job = enqueue('user_export', {'export_id': 0})
+        runner = JobRunner()
+        assert runner.claim().id == job.id
+        assert runner.claim() is None  # leased
+
+        BackgroundJob.objects.filter(id=job.id).update(locked_until=timezone.now() - timedelta(seconds=1))
+        reclaimed = runner.claim()
+        assert reclaimed.id == job.id and reclaimed.attempts == 2
+        assert runner.run(reclaimed)
+        reclaimed.refresh_from_db()
+        assert reclaimed.status == 'completed' and reclaimed.result == {'skipped': 'export no longer exists'}
+
+
+def failing_handler(job):
+    raise RuntimeError('disk full')
@@ -0,0 +1,65 @@
+import pytest
+from django.test import Client
+from core import db_connections
+from core.db_connections import configure_database, connection_mode, pool_bounds
+from core.metrics import render_database_metrics
+
+
+SQLITE = {'ENGINE': 'django.db.backends.sqlite3', 'NAME': 'db.sqlite3'}
+POSTGRES = {'ENGINE': 'django.db.backends.postgresql', 'NAME': 'pregnancy', 'OPTIONS': {'sslmode': 'require'}}
+
+
+def test_per_request_and_persistent_modes():
+    """Test CONN_MAX_AGE and health checks follow the mode"""
+    per_request = configure_database(SQLITE, 'per_request')
+    assert per_request['CONN_MAX_AGE'] == 0
+    assert connection_mode(per_request) == 'per_request'
+
+    persistent = configure_database(SQLITE, 'persistent', max_age=120)
+    assert persistent['CONN_MAX_AGE'] == 120
+    assert persistent['CONN_HEALTH_CHECKS'] is True
+    assert connection_mode(persistent) == 'persistent'
+
+    with pytest.raises(ValueError):
+        configure_database(SQLITE, 'always')
+
+
+def test_pool_mode_sized_from_threads(monkeypatch):
+    """Test the pool holds a connection per thread plus background threads, without persistent connections"""
+    monkeypatch.setattr(db_connections, 'pool_available', lambda database: True)
+    database = configure_database(POSTGRES, 'pool', threads=4, pool_timeout=5)
+
+    assert database['OPTIONS'] == {'sslmode': 'require', 'pool': {'min_size': 4, 'max_size': 5, 'timeout': 5}}
+    assert database['CONN_MAX_AGE'] == 0
+    assert connection_mode(database) == 'pool'
+    assert pool_bounds(0) == (1, 2)
+    # The source entry is not modified
+    assert 'pool' not in POSTGRES['OPTIONS']
+
+
+def test_pool_mode_falls_back_without_postgres():
+    """Test pool mode on SQLite uses persistent connections"""
+    database = configure_database(SQLITE, 'pool')
+    assert connection_mode(database) == 'persistent'
+    assert 'pool' not in database['OPTIONS']
+
+
+@pytest.mark.django_db
+def test_connection_stats_exposed(admin_client, admin_profile, settings):
+    """Test /metrics and system health report the connection mode and connections opened"""
+    metrics = render_database_metrics()
+    assert 'db_connections_opened_total{alias="default",mode=' in metrics
+
+    rendered = render_database_metrics({'default': {
+        'mode': 'pool', 'opened': 3, 'pool': {'pool_size': 4, 'pool_available': 2, 'requests_num': 10},
+    }})
+    assert 'db_pool_pool_available{alias="default"} 2' in rendered
+    assert 'db_pool_requests_num_total{alias="default"} 10' in rendered
+
+    settings.METRICS_TOKEN = 'scrape-secret'
+    response = Client().get('/metrics', secure=True, HTTP_AUTHORIZATION='Bearer scrape-secret')
+    assert 'db_connections_opened_total' in response.content.decode()
+
+    response = admin_client.get('/api/admin/system-health/')
+    assert response.status_code == 200
+    assert response.data['database']['connections']['mode'] in ('per_request', 'persistent', 'pool')
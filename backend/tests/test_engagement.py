@@ -0,0 +1,160 @@
+import pytest
+from io import StringIO
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from exercise.models import (
+    EngagementNotification, Exercise, ExerciseSession, Notification, NotificationPreferences, UserProfile
+)
+from apps.notifications import engagement
+from apps.notifications.engagement import EngagementEngine, run_engagement_triggers
+from apps.notifications.models import EngagementDelivery
+
+# A Saturday: five days earlier is still this ISO week, so weekly summaries stay out of the way
+NOW = datetime(2026, 3, 14, 12, 0, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def engagement_templates(db):
+    cache.clear()
+    call_command('seed_engagement_notifications', stdout=StringIO())
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def exercise(db):
+    return Exercise.objects.create(name='Pelvic Tilt', description='Gentle tilt')
+
+
+def add_session(user, exercise, start_time, rep_count=10):
+    session = ExerciseSession.objects.create(user=user, exercise=exercise, rep_count=rep_count)
+    ExerciseSession.objects.filter(id=session.id).update(start_time=start_time)
+    return session
+
+
+def titles(user):
+    return list(Notification.objects.filter(user=user).values_list('title', flat=True))
+
+
+@pytest.mark.django_db
+class TestEngagementTriggers:
+    """Test cases for the engagement trigger engine"""
+
+    def test_inactive_user_notified_once(self, create_user, exercise):
+        """Test that an inactive user gets one nudge per inactive stretch"""
+        user = create_user()
+        add_session(user, exercise, NOW - timedelta(days=5))
+
+        assert run_engagement_triggers(now=NOW)['inactive_user'] == 1
+        assert run_engagement_triggers(now=NOW) == {}
+        notification = Notification.objects.get(user=user)
+        assert notification.notification_type == 'exercise_reminder'
+        assert "It's been 5 days" in notification.message
+
+    def test_preferences_respected(self, create_user, exercise):
+        """Test opted-out users and staff roles are not notified"""
+        opted_out = create_user(username='optedout')
+        NotificationPreferences.objects.create(user=opted_out, enable_engagement=False)
+        no_reminders = create_user(username='noreminders')
+        NotificationPreferences.objects.create(user=no_reminders, enable_exercise_reminders=False)
+        doctor = create_user(username='doctor')
+        UserProfile.objects.create(user=doctor, role='doctor')
+        for user in (opted_out, no_reminders, doctor):
+            add_session(user, exercise, NOW - timedelta(days=5))
+
+        run_engagement_triggers(now=NOW)
+        assert not Notification.objects.exists()
+
+    def test_streak_milestone(self, create_user, exercise):
+        """Test a 7-day run of sessions triggers the 7-day milestone"""
+        user = create_user()
+        today = timezone.now().date()
+        for offset in range(7):
+            day = today - timedelta(days=offset)
+            add_session(user, exercise, datetime.combine(day, time(0, 30), tzinfo=dt_timezone.utc))
+        # A gap before the run must not extend it
+        add_session(user, exercise, timezone.now() - timedelta(days=9))
+
+        counts = run_engagement_triggers()
+        assert counts['streak_milestone'] == 1
+        assert '🔥 7-Day Streak!' in titles(user)
+        assert EngagementDelivery.objects.get(user=user, trigger_type='streak_milestone').period_key == \
+            f'{today:%Y-%m-%d}-7'
+
+    def test_pregnancy_week_crossing(self, create_user):
+        """Test a user entering a new pregnancy week is congratulated once"""
+        user = create_user()
+        UserProfile.objects.create(user=user, lmp_date=timezone.now().date() - timedelta(days=20 * 7))
+
+        assert run_engagement_triggers()['pregnancy_week'] == 1
+        assert run_engagement_triggers() == {}
+        assert 'reaching week 20' in Notification.objects.get(user=user).message
+
+    def test_weekly_summary(self, create_user, exercise):
+        """Test users active last week get one summary with their totals"""
+        user = create_user()
+        today = timezone.now().date()
+        last_monday = today - timedelta(days=today.weekday() + 7)
+        for day in range(2):
+            add_session(
+                user, exercise,
+                datetime.combine(last_monday + timedelta(days=day), time(12, 0), tzinfo=dt_timezone.utc),
+                rep_count=15
+            )
+
+        counts = run_engagement_triggers()
+        assert counts['weekly_summary'] == 1
+        summary = Notification.objects.get(user=user, notification_type='system')
+        assert 'You completed 2 sessions and 30 reps last week' in summary.message
+
+    def test_quiet_hours_defer(self, create_user, exercise):
+        """Test users in quiet hours are skipped until a later run"""
+        user = create_user()
+        add_session(user, exercise, NOW - timedelta(days=5))
+        NotificationPreferences.objects.create(
+            user=user,
+            quiet_hours_enabled=True,
+            quiet_hours_start=time(0, 0),
+            quiet_hours_end=time(23, 59, 59)
+        )
+
+        assert run_engagement_triggers(now=NOW) == {}
+        NotificationPreferences.objects.filter(user=user).update(quiet_hours_enabled=False)
+        assert run_engagement_triggers(now=NOW)['inactive_user'] == 1
+
+    def test_overlapping_runs_send_once(self, create_user, exercise, monkeypatch):
+        """Test a run that overlaps another drops what the other sent, notifications and emails alike"""
+        user = create_user(email='patient@example.com')
+        add_session(user, exercise, NOW - timedelta(days=5))
+        EngagementNotification.objects.update(send_email=True)
+        emails = []
+        monkeypatch.setattr(engagement, 'send_email', lambda *args: emails.append(args))
+
+        first = EngagementEngine(now=NOW)
+        check_quiet_hours = first._users_in_quiet_hours
+
+        def second_run_finishes_first(user_ids):
+            # Both runs have computed the same pending set; the second one commits first
+            assert run_engagement_triggers(now=NOW)['inactive_user'] == 1
+            return check_quiet_hours(user_ids)
+
+        monkeypatch.setattr(first, '_users_in_quiet_hours', second_run_finishes_first)
+        assert first.run() == {}
+        assert Notification.objects.filter(user=user).count() == 1
+        assert EngagementDelivery.objects.filter(user=user).count() == 1
+        assert len(emails) == 1
+
+    def test_query_count_independent_of_users(self, create_user, exercise, django_assert_max_num_queries):
+        """Test the engine issues a fixed number of queries for any number of users"""
+        for i in range(30):
+            user = create_user(username=f'user{i}')
+            add_session(user, exercise, NOW - timedelta(days=5), rep_count=120)
+            UserProfile.objects.create(user=user, lmp_date=NOW.date() - timedelta(days=70))
+
+        with django_assert_max_num_queries(20):
+            counts = run_engagement_triggers(now=NOW)
+        assert counts['inactive_user'] == 30
+        assert counts['pregnancy_week'] == 30
+        assert counts['achievement'] == 30
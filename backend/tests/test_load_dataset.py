@@ -0,0 +1,51 @@
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from exercise.models import ActivityData, ExerciseSession, HealthVitals, UserProfile
+
+
+def generate(**options):
+    call_command(
+        'generate_load_dataset', patients=20, doctors=2, sessions=205, vitals=410,
+        activity_days=3, batch_size=50, verbosity=0, **options
+    )
+
+
+@pytest.mark.django_db
+def test_generates_requested_counts():
+    """Test every patient gets a share of the requested rows"""
+    generate()
+
+    assert UserProfile.objects.filter(role='patient').count() == 20
+    assert UserProfile.objects.filter(role='doctor').count() == 2
+    assert UserProfile.objects.filter(role='admin').count() == 1
+    assert ExerciseSession.objects.count() == 205
+    assert HealthVitals.objects.count() == 410
+    assert ActivityData.objects.count() == 60
+    assert ExerciseSession.objects.values('user').distinct().count() == 20
+
+
+@pytest.mark.django_db
+def test_history_is_spread_over_time():
+    """Test auto_now_add timestamps keep their generated values"""
+    generate(days=30)
+
+    sessions = ExerciseSession.objects.order_by('start_time')
+    span = sessions.last().start_time - sessions.first().start_time
+    assert span.days >= 25
+    assert HealthVitals.objects.dates('timestamp', 'day').count() > 20
+    # The fields are restored for normal saves
+    assert HealthVitals._meta.get_field('timestamp').auto_now_add
+
+
+@pytest.mark.django_db
+def test_refuses_to_duplicate_without_clear():
+    """Test a second run needs --clear and then replaces the dataset"""
+    generate()
+    with pytest.raises(CommandError):
+        generate()
+
+    generate(clear=True)
+    assert User.objects.filter(username__startswith='load_patient_').count() == 20
+    assert ExerciseSession.objects.count() == 205
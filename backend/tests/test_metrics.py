@@ -0,0 +1,74 @@
+import logging
+import random
+import pytest
+from django.test import Client
+from core.metrics import Histogram, registry
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+def test_histogram_quantiles_within_bucket_precision():
+    """Test HDR-style quantiles stay within ~1.6% over a wide value range"""
+    rng = random.Random(7)
+    values = sorted(int(rng.lognormvariate(9, 2)) for _ in range(20000))
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert abs(histogram.quantile(q) - exact) <= exact * 0.016 + 1
+    assert histogram.quantile(1.0) == values[-1]
+    # Sparse buckets: memory grows with the value range, not the sample count
+    assert len(histogram.counts) < 2000
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('admin_profile')
+class TestRequestMetrics:
+    """Test cases for the request metrics middleware and /metrics"""
+
+    def test_records_per_route(self, admin_client):
+        """Test wall time, queries, render time and size are recorded by route pattern"""
+        for _ in range(3):
+            assert admin_client.get('/api/admin/users/?page_size=5').status_code == 200
+        stats = registry.routes[('GET', 'api/admin/users/')].snapshot()
+        count, _, _ = stats['duration']
+        assert count == 3
+        queries, total_queries, _ = stats['db_queries']
+        assert queries == 3 and total_queries >= 3
+        assert stats['render_time'][0] == 3
+        assert stats['response_size'][1] > 0
+
+    def test_prometheus_output(self, admin_client, settings):
+        """Test the exposition format and the bearer token"""
+        admin_client.get('/api/admin/users/')
+        settings.DEBUG = True
+        body = Client().get('/metrics').content.decode()
+        assert '# TYPE http_request_duration_seconds summary' in body
+        assert 'http_request_db_queries_count{method="GET",route="api/admin/users/"} 1' in body
+        assert 'http_request_duration_seconds{method="GET",route="api/admin/users/",quantile="0.99"}' in body
+
+        # Without a token, production does not serve it at all
+        settings.DEBUG = False
+        assert Client().get('/metrics').status_code == 404
+
+        settings.METRICS_TOKEN = 'scrape-secret'
+        assert Client().get('/metrics').status_code == 403
+        response = Client().get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-secret')
+        assert response.status_code == 200
+
+    def test_slow_request_log(self, admin_client, settings, caplog):
+        """Test slow requests are logged with their top queries"""
+        settings.SLOW_REQUEST_MS = 0
+        settings.SLOW_REQUEST_TOP_QUERIES = 2
+        with caplog.at_level(logging.WARNING, logger='performance'):
+            admin_client.get('/api/admin/users/')
+        record = next(r for r in caplog.records if r.name == 'performance')
+        message = record.getMessage()
+        assert message.startswith('Slow request: GET /api/admin/users/')
+        assert len([line for line in message.splitlines() if ' ms  ' in line]) == 2
@@ -0,0 +1,202 @@
+import pytest
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from exercise.models import Notification
+from exercise.notification_utils import create_notification
+from apps.notifications.feed import get_unread_count
+from apps.notifications.models import NotificationArchive
+from apps.notifications.retention import expire_read_notifications, run_retention
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def make_notifications(user, count, **kwargs):
+    return [
+        create_notification(
+            user=user,
+            notification_type='system',
+            title=f'Notification {i}',
+            message='Test message',
+            **kwargs
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.django_db
+class TestNotificationFeed:
+    """Test cases for the keyset-paginated notification feed"""
+
+    def test_feed_pages_with_cursor(self, authenticated_client):
+        """Test walking the feed with next_cursor visits every item once"""
+        created = make_notifications(authenticated_client.user, 25)
+
+        seen = []
+        cursor = None
+        while True:
+            url = '/api/notifications/?page_size=10'
+            if cursor:
+                url += f'&cursor={cursor}'
+            response = authenticated_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            seen.extend(n['id'] for n in response.data['notifications'])
+            cursor = response.data['next_cursor']
+            if not response.data['has_more']:
+                break
+
+        assert seen == sorted((n.id for n in created), reverse=True)
+        assert 'total' not in response.data
+
+    def test_since_returns_only_new_items(self, authenticated_client):
+        """Test that since= returns only notifications newer than the cursor"""
+        make_notifications(authenticated_client.user, 3)
+        response = authenticated_client.get('/api/notifications/')
+        latest = response.data['latest_cursor']
+
+        new = make_notifications(authenticated_client.user, 2)
+        response = authenticated_client.get(f'/api/notifications/?since={latest}')
+        assert [n['id'] for n in response.data['notifications']] == [new[1].id, new[0].id]
+
+        latest = response.data['latest_cursor']
+        response = authenticated_client.get(f'/api/notifications/?since={latest}')
+        assert response.data['notifications'] == []
+        assert response.data['latest_cursor'] == latest
+
+    def test_since_poll_catches_up_past_page_size(self, authenticated_client):
+        """Test more new items than a page are all returned by repeating the poll"""
+        make_notifications(authenticated_client.user, 2)
+        latest = authenticated_client.get('/api/notifications/').data['latest_cursor']
+
+        new = make_notifications(authenticated_client.user, 25)
+        seen = []
+        while True:
+            response = authenticated_client.get(f'/api/notifications/?page_size=10&since={latest}')
+            page = [n['id'] for n in response.data['notifications']]
+            assert page == sorted(page, reverse=True)
+            seen = page + seen
+            latest = response.data['latest_cursor']
+            assert response.data['next_cursor'] is None
+            if not response.data['has_more']:
+                break
+
+        assert seen == sorted((n.id for n in new), reverse=True)
+
+    def test_invalid_cursor(self, authenticated_client):
+        """Test that a malformed cursor is rejected"""
+        response = authenticated_client.get('/api/notifications/?cursor=not-a-cursor')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_legacy_page_pagination(self, authenticated_client):
+        """Test that page= keeps the offset response shape"""
+        make_notifications(authenticated_client.user, 5)
+        response = authenticated_client.get('/api/notifications/?page=2&page_size=2')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['total'] == 5
+        assert len(response.data['notifications']) == 2
+
+
+# Counter updates run on commit, so these tests commit for real
+@pytest.mark.django_db(transaction=True)
+class TestUnreadCounter:
+    """Test cases for the cached unread counter"""
+
+    def test_counter_tracks_mutations(self, authenticated_client):
+        """Test create, read, delete and mark-all keep the counter exact"""
+        user = authenticated_client.user
+        notifications = make_notifications(user, 4)
+        assert authenticated_client.get('/api/notifications/').data['unread_count'] == 4
+
+        create_notification(user, 'system', 'New', 'Message')
+        assert get_unread_count(user.id) == 5
+
+        authenticated_client.post(f'/api/notifications/{notifications[0].id}/read/')
+        authenticated_client.post(f'/api/notifications/{notifications[0].id}/read/')
+        assert get_unread_count(user.id) == 4
+
+        authenticated_client.delete(f'/api/notifications/{notifications[1].id}/delete/')
+        assert get_unread_count(user.id) == 3
+
+        authenticated_client.post('/api/notifications/mark-all-read/')
+        assert get_unread_count(user.id) == 0
+        assert not Notification.objects.filter(user=user, is_read=False).exists()
+
+    def test_counter_unchanged_on_rollback(self, create_user):
+        """Test a notification rolled back with its transaction leaves the counter alone"""
+        user = create_user()
+        make_notifications(user, 2)
+        assert get_unread_count(user.id) == 2
+
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                create_notification(user, 'system', 'Rolled back', 'Message')
+                raise RuntimeError
+        assert get_unread_count(user.id) == 2
+
+    def test_counter_served_from_cache(self, authenticated_client, django_assert_num_queries):
+        """Test that a warm counter needs no COUNT query"""
+        user = authenticated_client.user
+        make_notifications(user, 3)
+        get_unread_count(user.id)
+        with django_assert_num_queries(0):
+            assert get_unread_count(user.id) == 3
+
+    def test_mark_read_missing_notification(self, authenticated_client):
+        """Test marking an unknown notification returns 404"""
+        response = authenticated_client.post('/api/notifications/999999/read/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestNotificationRetention:
+    """Test cases for notification expiry and archival"""
+
+    def age(self, notifications, days):
+        Notification.objects.filter(id__in=[n.id for n in notifications]).update(
+            created_at=timezone.now() - timedelta(days=days)
+        )
+
+    def test_read_notifications_expire(self, create_user):
+        """Test that old read notifications are deleted and recent ones kept"""
+        user = create_user()
+        old = make_notifications(user, 5)
+        recent = make_notifications(user, 2)
+        Notification.objects.filter(user=user).update(is_read=True)
+        self.age(old, 40)
+
+        assert expire_read_notifications(days=30, batch_size=2) == 5
+        assert set(Notification.objects.values_list('id', flat=True)) == {n.id for n in recent}
+
+    @pytest.mark.django_db(transaction=True)
+    def test_old_notifications_archived(self, create_user):
+        """Test that notifications past the archive window move to the archive"""
+        user = create_user()
+        old = make_notifications(user, 3)
+        self.age(old, 100)
+        make_notifications(user, 1)
+        assert get_unread_count(user.id) == 4
+
+        result = run_retention(read_days=30, archive_days=90, batch_size=2)
+
+        assert result == {'expired': 0, 'archived': 3}
+        assert Notification.objects.filter(user=user).count() == 1
+        # One archive row per batch; earlier rows are never rewritten
+        archives = list(NotificationArchive.objects.filter(user=user))
+        assert [(archive.sequence, archive.item_count) for archive in archives] == [(0, 2), (1, 1)]
+        assert sorted(item[0] for archive in archives for item in archive.get_items()) == sorted(n.id for n in old)
+        assert get_unread_count(user.id) == 1
+
+    def test_clear_all_runs_in_batches(self, authenticated_client, settings):
+        """Test clear-all deletes every notification with a small batch size"""
+        settings.NOTIFICATION_BATCH_SIZE = 2
+        make_notifications(authenticated_client.user, 5)
+        response = authenticated_client.delete('/api/notifications/clear-all/')
+        assert response.data['count'] == 5
+        assert not Notification.objects.filter(user=authenticated_client.user).exists()
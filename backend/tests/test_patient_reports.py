@@ -0,0 +1,132 @@
+import csv
+import io
+import re
+import zipfile
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils import timezone
+from apps.reports import patient_reports
+from apps.reports.report_rendering import render_batch
+from exercise.models import ActivityData, Exercise, ExerciseSession, UserProfile
+
+
+@pytest.fixture(autouse=True)
+def inline_rendering(settings):
+    """Render in-process and start from an empty artifact cache"""
+    settings.REPORT_WORKERS = 0
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def roster(db):
+    """A doctor and two patients with a week of activity"""
+    doctor = User.objects.create_user(username='doctor', password='testpass123')
+    UserProfile.objects.create(user=doctor, role='doctor')
+    squat = Exercise.objects.create(name='Squat', description='-', difficulty='easy')
+    today = timezone.localdate()
+    patients = []
+    for n, username in enumerate(['alice', 'bella']):
+        patient = User.objects.create_user(username=username, password='testpass123', first_name=username.title())
+        UserProfile.objects.create(user=patient, role='patient')
+        for offset in range(7):
+            ActivityData.objects.create(user=patient, date=today - timedelta(days=offset), steps=5000 + n,
+                                        calories=200, avg_heart_rate=80, sleep_minutes=420)
+        ExerciseSession.objects.create(user=patient, exercise=squat, rep_count=10, avg_posture_score=85)
+        patients.append(patient)
+    return doctor, patients, today
+
+
+def download(response):
+    assert response.status_code == 200
+    return b''.join(response.streaming_content) if response.streaming else response.content
+
+
+@pytest.mark.django_db
+class TestPatientReports:
+
+    def test_own_csv_report(self, roster, api_client):
+        """Test a patient downloads one CSV row per day plus a totals row"""
+        _, (alice, _), today = roster
+        api_client.force_authenticate(alice)
+
+        response = api_client.get('/api/reports/weekly/', {'export_format': 'csv'})
+        rows = list(csv.reader(io.StringIO(download(response).decode())))
+
+        assert response['Content-Type'] == 'text/csv'
+        assert f'alice-{today - timedelta(days=6)}-{today}.csv' in response['Content-Disposition']
+        assert rows[0][:3] == ['patient', 'date', 'steps']
+        assert [row[1] for row in rows[1:8]] == [(today - timedelta(days=6 - n)).isoformat() for n in range(7)]
+        assert rows[8][:3] == ['alice', 'total', str(7 * 5000)]
+        assert rows[8][6] == '1'
+
+    def test_pdf_report_is_well_formed(self, roster, api_client):
+        """Test the PDF header, trailer and cross-reference offsets"""
+        doctor, (alice, _), _ = roster
+        api_client.force_authenticate(doctor)
+
+        data = download(api_client.get(f'/api/reports/patients/{alice.id}/'))
+
+        assert data.startswith(b'%PDF-1.4') and data.endswith(b'%%EOF\n')
+        xref = int(re.search(rb'startxref\n(\d+)', data).group(1))
+        assert data[xref:].startswith(b'xref')
+        offsets = [int(offset) for offset in re.findall(rb'(\d{10}) 00000 n', data)]
+        for number, offset in enumerate(offsets, start=1):
+            assert data[offset:].startswith(f'{number} 0 obj'.encode())
+
+    def test_roster_zip_and_cache(self, roster, api_client, monkeypatch):
+        """Test the roster ZIP has one file per patient and unchanged reports are not rendered again"""
+        doctor, patients, _ = roster
+        api_client.force_authenticate(doctor)
+        rendered = []
+
+        def counting_render_batch(jobs):
+            rendered.extend(report['patient']['username'] for _, report in jobs)
+            return render_batch(jobs)
+
+        monkeypatch.setattr(patient_reports, 'render_batch', counting_render_batch)
+
+        first = download(api_client.get('/api/reports/roster/', {'export_format': 'csv'}))
+        archive = zipfile.ZipFile(io.BytesIO(first))
+        assert [name.split('-')[0] for name in archive.namelist()] == ['alice', 'bella']
+        assert archive.read(archive.namelist()[1]).decode().splitlines()[1].split(',')[2] == '5001'
+        assert rendered == ['alice', 'bella']
+
+        second = download(api_client.get('/api/reports/roster/', {'export_format': 'csv'}))
+        assert zipfile.ZipFile(io.BytesIO(second)).read(archive.namelist()[0]) == archive.read(archive.namelist()[0])
+        assert rendered == ['alice', 'bella']
+
+        ActivityData.objects.create(user=patients[0], date=timezone.localdate(), steps=1)
+        download(api_client.get('/api/reports/roster/', {'export_format': 'csv'}))
+        assert rendered == ['alice', 'bella', 'alice']
+
+    def test_access_and_validation(self, roster, api_client):
+        """Test patients cannot export others' reports and bad parameters are rejected"""
+        doctor, (alice, bella), _ = roster
+        api_client.force_authenticate(alice)
+        assert api_client.get('/api/reports/roster/').status_code == 403
+        assert api_client.get(f'/api/reports/patients/{bella.id}/').status_code == 403
+        assert api_client.get('/api/reports/weekly/', {'export_format': 'docx'}).status_code == 400
+        assert api_client.get('/api/reports/weekly/', {'start_date': '2024-02-30'}).status_code == 400
+
+        api_client.force_authenticate(doctor)
+        assert api_client.get(f'/api/reports/patients/{doctor.id + 1000}/').status_code == 404
+        assert api_client.get('/api/reports/roster/', {'patients': 'a,b'}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_roster_rendered_in_process_pool(roster, settings):
+    """Test cache misses rendered across worker processes match inline rendering"""
+    _, patients, today = roster
+    names = patient_reports.exercise_name_map()
+    reports = [patient_reports.build_report(patient, today - timedelta(days=6), today, names) for patient in patients]
+    inline = [data for _, data in patient_reports.render_reports(reports, 'pdf')]
+
+    cache.clear()
+    settings.REPORT_WORKERS = 2
+    pooled = [data for _, data in patient_reports.render_reports(reports, 'pdf')]
+    assert pooled == inline
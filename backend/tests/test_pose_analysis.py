@@ -0,0 +1,113 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from apps.exercises import pose_analysis, telemetry
+from apps.exercises.models import SessionTelemetry
+from apps.exercises.rescoring import rescore_sessions
+from exercise.models import Exercise, ExerciseSession
+
+# Written by frontend/src/test/poseAnalysis.golden.test.ts (UPDATE_GOLDEN=1 npx vitest run)
+GOLDEN = json.loads((Path(__file__).parent / 'fixtures' / 'pose_golden.json').read_text())
+
+
+def golden_landmarks(case):
+    """The case's landmarks as a (frames, 33, 4) array, NaN where the TS input had none"""
+    stored = np.array([[[np.nan if v is None else v for v in point] for point in frame]
+                       for frame in case['landmarks']])
+    landmarks = np.full((len(stored), 33, 4), np.nan)
+    landmarks[:, GOLDEN['landmark_indices']] = stored
+    return landmarks
+
+
+def expected_column(frames, key):
+    return np.array([np.nan if frame[key] is None else frame[key] for frame in frames], dtype=float)
+
+
+@pytest.mark.parametrize('case', GOLDEN['cases'], ids=lambda case: case['exercise'])
+def test_matches_typescript_golden_output(case):
+    """Test every per-frame value, the rep count and the session average match poseAnalysis.ts"""
+    result = pose_analysis.score_landmarks(golden_landmarks(case), case['t_ms'], case['exercise'])
+    expected = case['expected']
+    frames = [frame for frame in expected['frames'] if frame['visible']]
+
+    assert result['visible'].tolist() == [frame['visible'] for frame in expected['frames']]
+    for key in ('raw_angle', 'angle', 'velocity', 'score'):
+        np.testing.assert_allclose(result[key], expected_column(frames, key), rtol=0, atol=1e-9, err_msg=key)
+    assert result['phase'] == [frame['phase'] for frame in frames]
+    assert result['counted'].tolist() == [frame['counted'] for frame in frames]
+    too_fast = 1 << telemetry.ISSUE_CODES.index('too_fast')
+    assert [pose_analysis.issue_messages(mask & ~too_fast) for mask in result['issues']] == \
+        [frame['issues'] for frame in frames]
+    assert result['reps'] == expected['reps']
+    assert result['avg_posture_score'] == pytest.approx(expected['avg_posture_score'], abs=1e-9)
+
+
+def store_golden_session(user, case, **telemetry_fields):
+    """Save a golden case as a session with telemetry recorded the way ExerciseExecution.tsx does"""
+    scored = pose_analysis.score_landmarks(golden_landmarks(case), case['t_ms'], case['exercise'])
+    t_ms = np.asarray(case['t_ms'])[scored['visible']]
+    batch = {
+        't': (t_ms - t_ms[0]).tolist(),
+        'rep': np.cumsum(scored['counted']).tolist(),
+        'score': scored['score'].tolist(),
+        'velocity': [None if np.isnan(v) else round(float(v), 1) for v in scored['velocity']],
+        'issues': scored['issues'].tolist(),
+        'angles': [np.round(scored['angle'], 1).tolist(), np.round(scored['raw_angle'], 1).tolist()],
+    }
+    exercise = Exercise.objects.create(name=case['exercise'].replace('_', ' ').title(), description='-', difficulty='easy')
+    session = ExerciseSession.objects.create(user=user, exercise=exercise, rep_count=0, avg_posture_score=0)
+    stored = SessionTelemetry(session=session, angle_count=2, **telemetry_fields)
+    stored.append(telemetry.quantize_batch(batch))
+    stored.save()
+    return session, scored
+
+
+@pytest.mark.django_db
+def test_rescore_from_telemetry():
+    """Test re-scoring stored telemetry reproduces the live session's reps and score"""
+    user = User.objects.create_user(username='patient', password='testpass123')
+    sessions = [store_golden_session(user, case) for case in GOLDEN['cases']]
+
+    assert rescore_sessions(workers=0, dry_run=True) == {'scored': 5, 'changed': 5}
+    assert ExerciseSession.objects.filter(rep_count=0).count() == 5
+
+    assert rescore_sessions(workers=0, chunk_size=2) == {'scored': 5, 'changed': 5}
+    for session, scored in sessions:
+        session.refresh_from_db()
+        assert session.rep_count == scored['reps']
+        # Stored angles are quantized to 0.1 degree
+        assert session.avg_posture_score == pytest.approx(scored['avg_posture_score'], abs=1.5)
+
+    # Unchanged rules: nothing to write
+    assert rescore_sessions(workers=0)['changed'] == 0
+
+
+@pytest.mark.django_db
+def test_rescore_in_worker_processes():
+    """Test the process pool gives the same scores as scoring in-process"""
+    user = User.objects.create_user(username='patient', password='testpass123')
+    sessions = [store_golden_session(user, case) for case in GOLDEN['cases']]
+
+    assert rescore_sessions(workers=2, chunk_size=2) == {'scored': 5, 'changed': 5}
+    for session, scored in sessions:
+        session.refresh_from_db()
+        assert session.rep_count == scored['reps']
+    assert rescore_sessions(workers=0)['changed'] == 0
+
+
+@pytest.mark.django_db
+def test_rescore_command():
+    """Test the command re-scores selected sessions, preferring the recorded exercise type"""
+    user = User.objects.create_user(username='patient', password='testpass123')
+    squat, scored = store_golden_session(user, GOLDEN['cases'][0], exercise_type='squat')
+    other, _ = store_golden_session(user, GOLDEN['cases'][1])
+
+    call_command('rescore_sessions', '--workers', '0', '--session', str(squat.id))
+    squat.refresh_from_db()
+    other.refresh_from_db()
+    assert squat.rep_count == scored['reps']
+    assert other.rep_count == 0
@@ -0,0 +1,193 @@
+"""
+Query budgets for doctor, admin, analytics and nutrition endpoints.
+Data fixtures are sized so an N+1 (one query per patient, session or
+category) would blow the budget.
+"""
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from core.query_analysis import QueryTracker, fingerprint
+from exercise.models import (
+    ActivityData, Exercise, ExerciseSession, HealthVitals, NutritionCategory,
+    NutritionFood, NutritionTip, PregnancyProfile, UserProfile
+)
+
+PATIENTS = 6
+
+
+def client_for(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+    return client
+
+
+@pytest.fixture
+def patients(create_user):
+    exercise = Exercise.objects.create(name='Squats', description='Supported squats')
+    now = timezone.now()
+    users = []
+    for i in range(PATIENTS):
+        user = create_user(username=f'patient{i}', email=f'patient{i}@example.com')
+        UserProfile.objects.create(user=user, role='patient')
+        PregnancyProfile.objects.create(user=user, lmp_date=now.date() - timedelta(weeks=10 + i))
+        for day in range(3):
+            ExerciseSession.objects.create(
+                user=user, exercise=exercise, rep_count=10, avg_posture_score=80,
+                end_time=now - timedelta(days=day)
+            )
+            ActivityData.objects.create(user=user, date=now.date() - timedelta(days=day), steps=4000)
+            HealthVitals.objects.create(user=user, heart_rate=80, spo2=98, fatigue_level=20)
+        users.append(user)
+    return users
+
+
+@pytest.fixture
+def doctor_client(create_user):
+    doctor = create_user(username='drsmith')
+    UserProfile.objects.create(user=doctor, role='doctor')
+    return client_for(doctor)
+
+
+@pytest.fixture
+def nutrition(db):
+    for c in range(4):
+        category = NutritionCategory.objects.create(name=f'Category {c}', icon='🥦', description='Greens')
+        for f in range(3):
+            NutritionFood.objects.create(
+                category=category, name=f'Food {c}-{f}', description='Good', benefits='Iron',
+                trimester_recommended=[1, 2, 3], is_avoid=(f == 2)
+            )
+    NutritionTip.objects.create(title='Hydrate', content='Drink water')
+
+
+def test_fingerprint_normalizes_literals():
+    """Test queries differing only in values share a fingerprint"""
+    a = fingerprint("SELECT * FROM t WHERE id = 42 AND name = 'O''Brien' AND x IN (1, 2, 3)")
+    b = fingerprint("SELECT *  FROM t WHERE id = 7 AND name = 'x' AND x IN (9)")
+    assert a == b == 'SELECT * FROM t WHERE id = ? AND name = ? AND x IN (...)'
+    assert fingerprint('SELECT "t1"."col2" FROM "t1" LIMIT 21') == 'SELECT "t1"."col2" FROM "t1" LIMIT ?'
+
+
+@pytest.mark.django_db
+def test_tracker_attributes_repeats_to_call_site(patients):
+    """Test an N+1 loop is reported with the line that issued it"""
+    tracker = QueryTracker()
+    with tracker.capture():
+        for user in patients:
+            ExerciseSession.objects.filter(user=user).count()
+    group, = tracker.repeated(threshold=PATIENTS)
+    assert group['count'] == PATIENTS
+    (site, count), = group['call_sites']
+    assert site.startswith('tests/test_query_budgets.py:') and count == PATIENTS
+
+
+@pytest.mark.django_db
+def test_budget_failure_reports_offenders(patients, query_budget):
+    """Test exceeding a budget fails with the repeated fingerprint"""
+    with pytest.raises(pytest.fail.Exception) as failure:
+        with query_budget(2):
+            for user in patients:
+                list(ExerciseSession.objects.filter(user=user))
+    message = str(failure.value)
+    assert f'{PATIENTS} queries, budget 2' in message
+    assert f'x{PATIENTS}' in message
+
+
+@pytest.mark.django_db
+class TestDoctorBudgets:
+    """Doctor endpoints: constant queries regardless of patient count"""
+
+    @pytest.mark.query_budget(4, max_repeats=2)
+    def test_patient_list(self, doctor_client, patients):
+        response = doctor_client.get('/api/doctor/patients/')
+        assert response.status_code == 200
+        assert response.data['count'] == PATIENTS
+        assert response.data['patients'][0]['statistics']['total_sessions'] == 3
+
+    @pytest.mark.query_budget(10, max_repeats=2)
+    def test_patient_detail(self, doctor_client, patients):
+        response = doctor_client.get(f'/api/doctor/patient/{patients[0].id}/')
+        assert response.status_code == 200
+        assert len(response.data['recent_sessions']) == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('admin_profile')
+class TestAdminBudgets:
+    """Admin dashboard and management endpoints"""
+
+    @pytest.mark.query_budget(10)
+    def test_admin_analytics(self, admin_client, patients):
+        assert admin_client.get('/api/admin-analytics/').status_code == 200
+
+    @pytest.mark.query_budget(3)
+    def test_user_list(self, admin_client, patients):
+        assert admin_client.get('/api/user-list/').status_code == 200
+
+    @pytest.mark.query_budget(3)
+    def test_user_directory(self, admin_client, patients):
+        assert admin_client.get('/api/admin/users/').status_code == 200
+
+    @pytest.mark.query_budget(3)
+    def test_user_growth(self, admin_client, patients):
+        assert admin_client.get('/api/user-growth/').status_code == 200
+
+    @pytest.mark.query_budget(3)
+    def test_activity_trends(self, admin_client, patients):
+        assert admin_client.get('/api/activity-trends/').status_code == 200
+
+    @pytest.mark.query_budget(3)
+    def test_audit_logs(self, admin_client, patients):
+        assert admin_client.get('/api/admin/audit-logs/').status_code == 200
+
+    @pytest.mark.query_budget(14)
+    def test_system_health(self, admin_client, patients):
+        assert admin_client.get('/api/admin/system-health/').status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('admin_profile')
+class TestAnalyticsBudgets:
+    """Admin analytics endpoints"""
+
+    @pytest.mark.query_budget(12)
+    def test_retention(self, admin_client, patients):
+        assert admin_client.get('/api/admin/analytics/retention/').status_code == 200
+
+    @pytest.mark.query_budget(9)
+    def test_feature_adoption(self, admin_client, patients):
+        assert admin_client.get('/api/admin/analytics/feature-adoption/').status_code == 200
+
+    @pytest.mark.query_budget(7)
+    def test_engagement(self, admin_client, patients):
+        assert admin_client.get('/api/admin/analytics/engagement/').status_code == 200
+
+
+@pytest.mark.django_db
+class TestNutritionBudgets:
+    """Nutrition guide endpoints"""
+
+    @pytest.mark.query_budget(2, max_repeats=1)
+    def test_categories(self, authenticated_client, nutrition):
+        response = authenticated_client.get('/api/nutrition/categories/')
+        assert [c['food_count'] for c in response.data] == [3, 3, 3, 3]
+
+    @pytest.mark.query_budget(2)
+    def test_foods(self, authenticated_client, nutrition):
+        response = authenticated_client.get('/api/nutrition/foods/?trimester=2')
+        assert len(response.data) == 12
+
+    @pytest.mark.query_budget(3)
+    def test_recommended(self, authenticated_client, nutrition):
+        response = authenticated_client.get('/api/nutrition/recommended/')
+        assert len(response.data['recommended_foods']) == 8
+
+    @pytest.mark.query_budget(2)
+    def test_tips(self, authenticated_client, nutrition):
+        assert len(authenticated_client.get('/api/nutrition/tips/').data) == 1
+
+    @pytest.mark.query_budget(2)
+    def test_avoid(self, authenticated_client, nutrition):
+        assert len(authenticated_client.get('/api/nutrition/avoid/').data) == 4
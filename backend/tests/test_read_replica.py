@@ -0,0 +1,113 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils import timezone
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.reports.models import WeeklySnapshot
+from apps.reports.weekly_snapshots import iso_week, week_start
+from core.db_router import ReadReplicaMiddleware, read_replica
+from exercise.models import ActivityData, Notification, UserProfile
+
+
+pytestmark = pytest.mark.django_db(databases=['default', 'replica'])
+
+
+@pytest.fixture(autouse=True)
+def replica(settings):
+    settings.READ_REPLICA_ALIAS = 'replica'
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def replicate():
+    """Copy users and profiles from the primary, as replication would"""
+    for model in (User, UserProfile):
+        model.objects.using('replica').all().delete()
+        model.objects.using('replica').bulk_create(list(model.objects.using('default').all()))
+
+
+def make_patient(username):
+    user = User.objects.create_user(username=username, password='testpass123')
+    UserProfile.objects.create(user=user, role='patient')
+    return user
+
+
+@pytest.fixture
+def doctor():
+    user = User.objects.create_user(username='drsmith', password='testpass123')
+    UserProfile.objects.create(user=user, role='doctor')
+    return user
+
+
+@pytest.fixture
+def doctor_client(doctor):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(doctor).access_token}')
+    return client
+
+
+def test_read_only_endpoint_reads_replica(settings, doctor_client):
+    """Test the doctor roster is served from the replica, lag included"""
+    make_patient('patient1')
+    make_patient('patient2')
+    replicate()
+    make_patient('patient3')  # not replicated yet
+
+    assert doctor_client.get('/api/doctor/patients/').data['count'] == 2
+
+    settings.READ_REPLICA_ALIAS = None
+    assert doctor_client.get('/api/doctor/patients/').data['count'] == 3
+
+
+def test_request_reads_primary_after_writing(doctor):
+    """Test the first write pins the rest of the request to the primary"""
+    make_patient('patient1')
+    replicate()
+    make_patient('patient2')
+
+    @read_replica
+    def view(request):
+        before = UserProfile.objects.filter(role='patient').count()
+        Notification.objects.create(user=request.user, title='Reviewed', message='Chart reviewed')
+        after = UserProfile.objects.filter(role='patient').count()
+        return before, after
+
+    request = RequestFactory().get('/')
+    request.user = doctor
+    assert ReadReplicaMiddleware(view)(request) == (1, 2)
+    # Writes always go to the primary
+    assert Notification.objects.using('default').count() == 1
+    assert Notification.objects.using('replica').count() == 0
+
+
+def test_user_reads_primary_after_a_write_request(doctor, doctor_client):
+    """Test a user who just wrote reads their writes on the next request"""
+    make_patient('patient1')
+    replicate()
+    make_patient('patient2')
+    Notification.objects.create(user=doctor, title='New patient', message='Assigned')
+
+    assert doctor_client.post('/api/notifications/mark-all-read/').status_code == 200
+    assert doctor_client.get('/api/doctor/patients/').data['count'] == 2
+
+    cache.clear()  # sticky window over
+    assert doctor_client.get('/api/doctor/patients/').data['count'] == 1
+
+
+def test_weekly_snapshot_computed_from_primary(doctor, doctor_client):
+    """Test a snapshot stored while serving from the replica holds the primary's data, not the lag"""
+    last_monday = week_start(timezone.localdate()) - timedelta(days=7)
+    ActivityData.objects.create(user=doctor, date=last_monday, steps=5000, calories=200, sleep_minutes=420)
+    replicate()  # the activity row has not reached the replica
+
+    response = doctor_client.get('/api/weekly-report/', {
+        'start_date': last_monday.isoformat(), 'end_date': (last_monday + timedelta(days=6)).isoformat()
+    })
+    assert response.data['activity_summary']['total_steps'] == 5000
+    snapshot = WeeklySnapshot.objects.using('default').get(user=doctor, week=iso_week(last_monday))
+    assert snapshot.days[last_monday.isoformat()]['activities'] == [[5000, 200, None, 420]]
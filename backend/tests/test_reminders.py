@@ -0,0 +1,195 @@
+import pytest
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+from django.core.cache import cache
+from rest_framework import status
+from exercise.models import CustomReminder, Notification, NotificationPreferences, UserProfile
+from apps.notifications.reminder_dispatch import ReminderDispatcher, recompute_next_fire_times
+from apps.notifications.schedule import next_fire_time
+
+UTC = dt_timezone.utc
+NEW_YORK = ZoneInfo('America/New_York')
+KOLKATA = ZoneInfo('Asia/Kolkata')
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestNextFireTime:
+    """Test cases for reminder frequency rules"""
+
+    created = datetime(2025, 1, 15, 8, 0, tzinfo=UTC)
+
+    def test_daily(self):
+        after = datetime(2025, 3, 3, 9, 30, tzinfo=UTC)
+        assert next_fire_time('daily', time(9, 0), [], self.created, None, after) == \
+            datetime(2025, 3, 4, 9, 0, tzinfo=UTC)
+
+    def test_weekly(self):
+        # 2025-03-03 is a Monday; next Wednesday (2) or Friday (4)
+        after = datetime(2025, 3, 3, 9, 30, tzinfo=UTC)
+        assert next_fire_time('weekly', time(9, 0), [2, 4], self.created, None, after) == \
+            datetime(2025, 3, 5, 9, 0, tzinfo=UTC)
+        assert next_fire_time('weekly', time(9, 0), [], self.created, None, after) is None
+
+    def test_monthly(self):
+        after = datetime(2025, 3, 20, 0, 0, tzinfo=UTC)
+        assert next_fire_time('monthly', time(7, 0), [], self.created, None, after) == \
+            datetime(2025, 4, 15, 7, 0, tzinfo=UTC)
+
+    def test_once(self):
+        after = datetime(2025, 3, 3, 9, 30, tzinfo=UTC)
+        assert next_fire_time('once', time(10, 0), [], self.created, None, after) == \
+            datetime(2025, 3, 3, 10, 0, tzinfo=UTC)
+        assert next_fire_time('once', time(10, 0), [], self.created, after, after) is None
+
+    def test_local_timezone(self):
+        """Test slots follow the user's wall clock, including across UTC midnight"""
+        after = datetime(2025, 3, 3, 20, 0, tzinfo=UTC)  # 01:30 on the 4th in Kolkata
+        assert next_fire_time('daily', time(2, 0), [], self.created, None, after, KOLKATA) == \
+            datetime(2025, 3, 3, 20, 30, tzinfo=UTC)
+        # Weekly days are local weekdays: Tuesday 4th in Kolkata
+        assert next_fire_time('weekly', time(2, 0), [1], self.created, None, after, KOLKATA) == \
+            datetime(2025, 3, 3, 20, 30, tzinfo=UTC)
+
+    def test_dst_transition(self):
+        """Test a 09:00 reminder keeps local time across the spring-forward jump"""
+        before = datetime(2025, 3, 8, 15, 0, tzinfo=UTC)
+        saturday = next_fire_time('daily', time(9, 0), [], self.created, None, before, NEW_YORK)
+        sunday = next_fire_time('daily', time(9, 0), [], self.created, None, saturday, NEW_YORK)
+        assert saturday == datetime(2025, 3, 9, 13, 0, tzinfo=UTC)  # 09:00 EDT
+        assert sunday == datetime(2025, 3, 10, 13, 0, tzinfo=UTC)
+
+        # A slot inside the skipped hour fires just after the jump
+        assert next_fire_time('daily', time(2, 30), [], self.created, None, before, NEW_YORK) == \
+            datetime(2025, 3, 9, 7, 30, tzinfo=UTC)  # 03:30 EDT
+
+
+@pytest.mark.django_db
+class TestReminderDispatcher:
+    """Test cases for the reminder dispatcher"""
+
+    now = datetime(2025, 3, 3, 8, 0, 30, tzinfo=UTC)
+
+    def make_reminder(self, user, scheduled_time, **kwargs):
+        reminder = CustomReminder.objects.create(
+            user=user,
+            reminder_type='medicine',
+            title='Take vitamins',
+            message='Prenatal vitamins',
+            scheduled_time=scheduled_time,
+            **kwargs
+        )
+        CustomReminder.objects.filter(id=reminder.id).update(
+            created_at=self.now - timedelta(days=10)
+        )
+        recompute_next_fire_times(user_ids=[user.id], now=self.now)
+        reminder.refresh_from_db()
+        return reminder
+
+    def test_next_fire_at_set_on_save(self, create_user):
+        """Test that saving a reminder schedules it and deactivating clears it"""
+        user = create_user()
+        reminder = CustomReminder.objects.create(
+            user=user, reminder_type='water', title='Drink water',
+            message='Stay hydrated', scheduled_time=time(9, 0)
+        )
+        assert reminder.next_fire_at is not None
+        reminder.is_active = False
+        reminder.save()
+        reminder.refresh_from_db()
+        assert reminder.next_fire_at is None
+
+    def test_fires_once_per_slot(self, create_user):
+        """Test a daily reminder fires at its slot and moves to the next day"""
+        user = create_user()
+        reminder = self.make_reminder(user, time(9, 0))
+        assert reminder.next_fire_at == datetime(2025, 3, 3, 9, 0, tzinfo=UTC)
+        dispatcher = ReminderDispatcher()
+
+        assert dispatcher.tick(self.now + timedelta(minutes=30)) == 0
+        assert dispatcher.tick(datetime(2025, 3, 3, 9, 0, 5, tzinfo=UTC)) == 1
+        assert dispatcher.tick(datetime(2025, 3, 3, 12, 0, tzinfo=UTC)) == 0
+
+        reminder.refresh_from_db()
+        assert reminder.last_sent == datetime(2025, 3, 3, 9, 0, 5, tzinfo=UTC)
+        assert reminder.next_fire_at == datetime(2025, 3, 4, 9, 0, tzinfo=UTC)
+        assert Notification.objects.filter(user=user, title='Take vitamins').count() == 1
+
+    def test_user_timezone(self, create_user):
+        """Test a reminder fires at the user's local time"""
+        user = create_user()
+        UserProfile.objects.create(user=user, timezone='Asia/Kolkata')
+        reminder = self.make_reminder(user, time(14, 30))
+        assert reminder.next_fire_at == datetime(2025, 3, 3, 9, 0, tzinfo=UTC)
+
+        assert ReminderDispatcher().tick(datetime(2025, 3, 3, 9, 0, 5, tzinfo=UTC)) == 1
+
+    def test_quiet_hours_defer(self, create_user):
+        """Test that a reminder due in local quiet hours is sent when they end"""
+        user = create_user()
+        UserProfile.objects.create(user=user, timezone='Asia/Kolkata')
+        self.make_reminder(user, time(14, 30))
+        NotificationPreferences.objects.create(
+            user=user,
+            quiet_hours_enabled=True,
+            quiet_hours_start=time(14, 0),
+            quiet_hours_end=time(15, 0)
+        )
+        dispatcher = ReminderDispatcher()
+
+        assert dispatcher.tick(datetime(2025, 3, 3, 9, 0, 5, tzinfo=UTC)) == 0
+        assert dispatcher.stats['deferred'] == 1
+        assert dispatcher.tick(datetime(2025, 3, 3, 9, 31, 5, tzinfo=UTC)) == 1
+        assert Notification.objects.filter(user=user).count() == 1
+
+    def test_timezone_change_recomputes(self, authenticated_client):
+        """Test that changing profile timezone moves pending reminders"""
+        user = authenticated_client.user
+        UserProfile.objects.create(user=user)
+        reminder = CustomReminder.objects.create(
+            user=user, reminder_type='water', title='Drink water',
+            message='Stay hydrated', scheduled_time=time(9, 0)
+        )
+        utc_fire_at = reminder.next_fire_at
+
+        response = authenticated_client.put('/api/profile/', {'timezone': 'Asia/Kolkata'}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        reminder.refresh_from_db()
+        assert reminder.next_fire_at.astimezone(KOLKATA).time() == time(9, 0)
+        assert reminder.next_fire_at != utc_fire_at
+
+        response = authenticated_client.put('/api/profile/', {'timezone': 'Mars/Olympus'}, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_tick_query_count_is_constant(self, create_user, django_assert_max_num_queries):
+        """Test that many due reminders are dispatched with batched queries"""
+        users = [create_user(username=f'user{i}') for i in range(20)]
+        for user in users:
+            self.make_reminder(user, time(9, 0))
+            self.make_reminder(user, time(10, 0))
+        dispatcher = ReminderDispatcher()
+
+        with django_assert_max_num_queries(8):
+            assert dispatcher.tick(datetime(2025, 3, 3, 9, 0, 5, tzinfo=UTC)) == 20
+
+
+@pytest.mark.django_db
+class TestLocalTimeChecks:
+    """Test cases for timezone-aware model checks"""
+
+    def test_is_quiet_hours_uses_timezone(self, create_user):
+        """Test quiet hours are evaluated on the user's wall clock"""
+        prefs = NotificationPreferences.objects.create(
+            user=create_user(),
+            quiet_hours_enabled=True,
+            quiet_hours_start=time(22, 0),
+            quiet_hours_end=time(7, 0)
+        )
+        at = datetime(2025, 3, 3, 18, 0, tzinfo=UTC)  # 23:30 in Kolkata
+        assert prefs.is_quiet_hours(at=at, tz=KOLKATA)
+        assert not prefs.is_quiet_hours(at=at, tz=UTC)
@@ -0,0 +1,103 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from exercise.models import Exercise, ExerciseSession
+from apps.exercises.session_sync import EXERCISE_IDS_KEY
+from apps.reports.models import WeeklySnapshot
+from apps.reports.weekly_snapshots import iso_week, week_start
+
+
+def queued(client_id, exercise, reps=10):
+    return {'client_id': client_id, 'exercise_id': exercise.id, 'rep_count': reps, 'avg_posture_score': 88.5}
+
+
+@pytest.fixture
+def exercises(db):
+    cache.delete(EXERCISE_IDS_KEY)
+    return [
+        Exercise.objects.create(name=name, description=name, difficulty='easy')
+        for name in ('Squat', 'Arm Raise')
+    ]
+
+
+@pytest.mark.django_db
+class TestSessionSync:
+    """Tests for POST /api/sessions/sync/"""
+
+    def test_flush_and_retry(self, authenticated_client, exercises, query_budget):
+        """Test a flush inserts new sessions, a retried flush only reports duplicates"""
+        squat, arm_raise = exercises
+        items = [queued('a', squat), queued('b', arm_raise, reps=4), queued('a', squat),
+                 {'client_id': 'c', 'exercise_id': 999, 'rep_count': 1, 'avg_posture_score': 50}]
+
+        response = authenticated_client.post('/api/sessions/sync/', {'sessions': items}, format='json')
+        assert response.status_code == 200
+        results = response.data['results']
+        assert [r['status'] for r in results] == ['created', 'created', 'duplicate', 'invalid']
+        assert results[2]['id'] == results[0]['id']
+        assert 'exercise_id' in results[3]['errors']
+        assert (response.data['created'], response.data['duplicate'], response.data['invalid']) == (2, 1, 1)
+        assert ExerciseSession.objects.get(id=results[1]['id']).rep_count == 4
+
+        # Lost response: the client sends the same queue again
+        with query_budget(6, max_repeats=1):
+            retry = authenticated_client.post('/api/sessions/sync/', {'sessions': items[:3]}, format='json')
+        assert [r['status'] for r in retry.data['results']] == ['duplicate'] * 3
+        assert [r['id'] for r in retry.data['results']] == [r['id'] for r in results[:3]]
+        assert ExerciseSession.objects.count() == 2
+
+    def test_one_insert_per_flush(self, authenticated_client, exercises, query_budget):
+        """Test a full queue is validated from the cached id set and stored with one INSERT"""
+        squat, _ = exercises
+        items = [queued(f'session-{i}', squat) for i in range(50)]
+        authenticated_client.post('/api/sessions/sync/', {'sessions': items[:1]}, format='json')
+
+        with query_budget(6, max_repeats=1):
+            response = authenticated_client.post('/api/sessions/sync/', {'sessions': items}, format='json')
+        assert response.data['created'] == 49 and response.data['duplicate'] == 1
+        assert ExerciseSession.objects.filter(client_id__startswith='session-').count() == 50
+
+    def test_session_from_last_week(self, authenticated_client, exercises):
+        """Test a session flushed late keeps its start time and invalidates that week's snapshot"""
+        squat, _ = exercises
+        start = timezone.now() - timedelta(days=7)
+        user = authenticated_client.user
+        day = timezone.localdate(start)
+        WeeklySnapshot.objects.create(user=user, week=iso_week(day), week_start=week_start(day), days={})
+        item = {**queued('late', squat), 'start_time': start.isoformat(),
+                'end_time': (start + timedelta(minutes=20)).isoformat()}
+
+        response = authenticated_client.post('/api/sessions/sync/', {'sessions': [item]}, format='json')
+        assert response.data['created'] == 1
+        assert ExerciseSession.objects.get(client_id='late').start_time == start
+        assert not WeeklySnapshot.objects.filter(user=user).exists()
+
+        future = {**queued('future', squat), 'start_time': (timezone.now() + timedelta(days=1)).isoformat()}
+        backwards = {**item, 'client_id': 'backwards', 'end_time': (start - timedelta(minutes=1)).isoformat()}
+        response = authenticated_client.post('/api/sessions/sync/', {'sessions': [future, backwards]}, format='json')
+        assert [r['status'] for r in response.data['results']] == ['invalid', 'invalid']
+        assert 'start_time' in response.data['results'][0]['errors']
+        assert 'end_time' in response.data['results'][1]['errors']
+
+    def test_new_exercise_and_bad_requests(self, authenticated_client, exercises):
+        """Test an exercise created after the id set was cached is accepted; malformed bodies are rejected"""
+        squat, _ = exercises
+        authenticated_client.post('/api/sessions/sync/', {'sessions': [queued('a', squat)]}, format='json')
+        march = Exercise.objects.create(name='Seated March', description='-', difficulty='easy')
+        response = authenticated_client.post('/api/sessions/sync/', {'sessions': [queued('b', march)]}, format='json')
+        assert response.data['created'] == 1
+
+        assert authenticated_client.post('/api/sessions/sync/', {'sessions': 'x'}, format='json').status_code == 400
+        too_many = [queued(str(i), squat) for i in range(101)]
+        assert authenticated_client.post('/api/sessions/sync/', {'sessions': too_many}, format='json').status_code == 400
+
+    def test_single_session_post_validates_exercise(self, authenticated_client, exercises):
+        """Test POST /api/sessions/ rejects an unknown exercise with a 400"""
+        response = authenticated_client.post('/api/sessions/', {'exercise_id': 999, 'rep_count': 3,
+                                                                 'avg_posture_score': 70}, format='json')
+        assert response.status_code == 400
+        response = authenticated_client.post('/api/sessions/', {'exercise_id': exercises[0].id, 'rep_count': 3,
+                                                                 'avg_posture_score': 70}, format='json')
+        assert response.status_code == 201
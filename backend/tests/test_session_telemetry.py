@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.exercises import telemetry
+from apps.exercises.models import SessionTelemetry
+from exercise.models import Exercise, ExerciseSession, UserProfile
+
+
+def make_batch(frames, start=0, angles=2):
+    """A squat-like recording at 30 fps: angle oscillating 90-170 degrees, a rep every 90 frames"""
+    i = np.arange(start, start + frames)
+    angle = 130 + 40 * np.cos(2 * np.pi * i / 90)
+    return {
+        't': (i * 33).tolist(),
+        'rep': (i // 90).tolist(),
+        'score': np.clip(95 - (i // 90) * 2 - (angle < 100) * 10, 0, 100).tolist(),
+        'velocity': [None if n == 0 else round(float(abs(v)), 2) for n, v in zip(i, np.gradient(angle) * 30)],
+        'issues': np.where(angle < 100, 1 << telemetry.ISSUE_CODES.index('knees_forward'), 0).tolist(),
+        'angles': [np.round(angle + k, 2).tolist() for k in range(angles)],
+    }
+
+
+def client_for(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+    return client
+
+
+@pytest.fixture
+def patient(db):
+    user = User.objects.create_user(username='patient', password='testpass123')
+    UserProfile.objects.create(user=user, role='patient')
+    return user
+
+
+@pytest.fixture
+def session(patient):
+    exercise = Exercise.objects.create(name='Squat', description='Squats', difficulty='easy')
+    return ExerciseSession.objects.create(user=patient, exercise=exercise, rep_count=10)
+
+
+def test_codec_round_trip_and_size():
+    """Test a batch decodes to its quantized values and compresses well below raw int32 storage"""
+    batch = make_batch(900)
+    matrix = telemetry.quantize_batch(batch)
+    blob = telemetry.encode_chunk(matrix) + telemetry.encode_chunk(telemetry.quantize_batch(make_batch(900, start=900)))
+    arrays = telemetry.decode(blob)
+
+    assert arrays['t_ms'].shape == (1800,)
+    assert arrays['angles'].shape == (1800, 2)
+    np.testing.assert_array_equal(arrays['t_ms'][:900], batch['t'])
+    np.testing.assert_allclose(arrays['angles'][:900, 0], batch['angles'][0], atol=0.05)
+    np.testing.assert_allclose(arrays['score'][:900], batch['score'], atol=0.05)
+    assert np.isnan(arrays['velocity'][0]) and not np.isnan(arrays['velocity'][1])
+    assert telemetry.issue_names(arrays['issues'].max()) == ['knees_forward']
+    assert len(blob) < 0.1 * matrix.nbytes * 2
+
+    reps = telemetry.rep_summary(arrays)
+    assert [rep['rep'] for rep in reps] == list(range(20))
+    assert reps[0]['frames'] == 90 and reps[0]['angle_max'] == 170.0
+    assert reps[19]['mean_score'] < reps[0]['mean_score']
+
+    with pytest.raises(telemetry.TelemetryError):
+        telemetry.quantize_batch({**batch, 'score': batch['score'][:-1]})
+    with pytest.raises(telemetry.TelemetryError):
+        telemetry.quantize_batch({**batch, 'issues': [1 << len(telemetry.ISSUE_CODES)] * 900})
+
+
+def test_post_batches(patient, session):
+    """Test batches append in order, retries are ignored and gaps or bad data rejected"""
+    client = client_for(patient)
+    url = f'/api/sessions/{session.id}/telemetry/'
+
+    response = client.post(url, {'seq': 0, **make_batch(300)}, format='json')
+    assert response.status_code == 201
+    assert client.post(url, {'seq': 1, **make_batch(300, start=300)}, format='json').status_code == 201
+    # Retried batch
+    response = client.post(url, {'seq': 1, **make_batch(300, start=300)}, format='json')
+    assert response.status_code == 200 and response.data['duplicate']
+    assert client.post(url, {'seq': 5, **make_batch(10)}, format='json').status_code == 409
+    assert client.post(url, {'seq': 2, **make_batch(10, angles=3)}, format='json').status_code == 400
+    assert client.post(url, {'seq': 2, 't': 'soon'}, format='json').status_code == 400
+
+    stored = SessionTelemetry.objects.get(session=session)
+    assert (stored.frame_count, stored.batch_count) == (600, 2)
+
+    other = User.objects.create_user(username='other', password='testpass123')
+    assert client_for(other).post(url, make_batch(10), format='json').status_code == 404
+
+
+def test_get_decoded_series(patient, session):
+    """Test the owner and doctors get downsampled series and the rep summary; other patients do not"""
+    url = f'/api/sessions/{session.id}/telemetry/'
+    batch = make_batch(900)
+    client_for(patient).post(url, batch, format='json')
+
+    doctor = User.objects.create_user(username='doctor', password='testpass123')
+    UserProfile.objects.create(user=doctor, role='doctor')
+    response = client_for(doctor).get(url, {'max_points': 300})
+    assert response.status_code == 200
+    assert response.data['frames'] == 900
+    assert response.data['step'] == 3
+    assert len(response.data['series']['t_ms']) == 300
+    assert response.data['series']['velocity'][0] is None
+    assert len(response.data['reps']) == 10
+    assert response.data['reps'][0]['issues'] == {'knees_forward': sum(a < 100 for a in batch['angles'][0][:90])}
+
+    assert client_for(patient).get(url).status_code == 200
+    other = User.objects.create_user(username='other', password='testpass123')
+    assert client_for(other).get(url).status_code == 404
@@ -0,0 +1,81 @@
+import pytest
+from django.db import OperationalError
+from django.db.utils import ConnectionHandler
+from core.sqlite_tuning import BusyRetry, configure_sqlite, sqlite_stats
+
+
+SQLITE = {'ENGINE': 'django.db.backends.sqlite3', 'NAME': 'db.sqlite3', 'OPTIONS': {'init_command': 'PRAGMA temp_store=MEMORY'}}
+POSTGRES = {'ENGINE': 'django.db.backends.postgresql', 'NAME': 'pregnancy'}
+
+
+class FakeConnection:
+    alias = 'fake'
+
+
+def test_configure_sqlite_options():
+    """Test the tuning sets pragmas, BEGIN IMMEDIATE and the busy timeout, and leaves other engines alone"""
+    database = configure_sqlite(SQLITE, busy_timeout=2, mmap_size=1024, cache_size=-2000)
+    options = database['OPTIONS']
+    assert options['transaction_mode'] == 'IMMEDIATE'
+    assert options['timeout'] == 2
+    assert options['init_command'].split(';') == [
+        'PRAGMA temp_store=MEMORY', 'PRAGMA synchronous=NORMAL', 'PRAGMA mmap_size=1024', 'PRAGMA cache_size=-2000',
+    ]
+    assert SQLITE['OPTIONS'] == {'init_command': 'PRAGMA temp_store=MEMORY'}
+    assert configure_sqlite(POSTGRES) is POSTGRES
+
+
+@pytest.mark.django_db
+def test_tuned_connection_uses_wal(tmp_path):
+    """Test a new connection to a file database comes up in WAL with the pragmas and the retry wrapper"""
+    handler = ConnectionHandler({'default': configure_sqlite({
+        'ENGINE': 'django.db.backends.sqlite3', 'NAME': str(tmp_path / 'tuned.sqlite3'),
+    }, cache_size=-1000)})
+    connection = handler['default']
+    try:
+        with connection.cursor() as cursor:
+            pragmas = {}
+            for pragma in ('journal_mode', 'synchronous', 'cache_size'):
+                cursor.execute(f'PRAGMA {pragma}')
+                pragmas[pragma] = cursor.fetchone()[0]
+        assert pragmas == {'journal_mode': 'wal', 'synchronous': 1, 'cache_size': -1000}
+        assert connection.transaction_mode == 'IMMEDIATE'
+        assert any(isinstance(wrapper, BusyRetry) for wrapper in connection.execute_wrappers)
+        # The test database is tuned by the settings
+        assert sqlite_stats()['default'] == {'busy_retries': 0, 'busy_errors': 0}
+    finally:
+        connection.close()
+
+
+def test_busy_retry():
+    """Test busy statements are retried with backoff and other errors are not"""
+    calls = []
+
+    def locked_twice(sql, params, many, context):
+        calls.append(sql)
+        if len(calls) <= 2:
+            raise OperationalError('database is locked')
+        return 'ok'
+
+    retry = BusyRetry(retries=3, backoff=0.001)
+    context = {'connection': FakeConnection()}
+    assert retry(locked_twice, 'BEGIN IMMEDIATE', None, False, context) == 'ok'
+    assert len(calls) == 3
+
+    def always_locked(sql, params, many, context):
+        calls.append(sql)
+        raise OperationalError('database is locked')
+
+    calls.clear()
+    with pytest.raises(OperationalError):
+        retry(always_locked, 'INSERT', None, False, context)
+    assert len(calls) == 4
+
+    def broken(sql, params, many, context):
+        calls.append(sql)
+        raise OperationalError('no such table: health_vitals')
+
+    calls.clear()
+    with pytest.raises(OperationalError):
+        retry(broken, 'SELECT', None, False, context)
+    assert len(calls) == 1
@@ -0,0 +1,91 @@
+import json
+import logging
+import logging.config
+
+import pytest
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import path
+from core.import_profile import import_chain, parse_importtime, profile_startup
+from core.lazy_views import lazy_view
+
+# Cold-start budget of a worker (WSGI application and URLconf loaded),
+# about twice what it takes on a developer machine
+STARTUP_IMPORT_BUDGET_MS = 1200
+STARTUP_RSS_BUDGET_KB = 100 * 1024
+
+# Loaded on the first request that needs them, never at startup
+DEFERRED_MODULES = [
+    'numpy',
+    'pythonjsonlogger',
+    'sentry_sdk',
+    'drf_spectacular.views',
+    'apps.exercises.telemetry_views',
+    'apps.reports.report_views',
+    'apps.reports.data_export',
+    'apps.doctors.views',
+    'apps.users.authentication',
+]
+
+# exercise/ holds the models; its other modules are shims for old import paths
+EXERCISE_MODELS = {
+    'exercise', 'exercise.admin', 'exercise.apps', 'exercise.models',
+    'exercise.reminder_models', 'exercise.nutrition_models', 'exercise.extended_models',
+}
+
+
+def ping(request):
+    return HttpResponse('pong')
+
+
+@pytest.mark.slow
+def test_cold_start_budget():
+    """Test a fresh worker starts within budget, without loading views, shims or optional integrations"""
+    report = profile_startup(env={'DEBUG': 'False'})
+    loaded = set(report['loaded'])
+    assert 'apps.reports.urls' in loaded and 'apps.reports.models' in loaded
+    assert {module for module in loaded if module.split('.')[0] == 'exercise'} == EXERCISE_MODELS
+    assert not [module for module in DEFERRED_MODULES if module in loaded], [
+        import_chain(report['modules'], module) for module in DEFERRED_MODULES if module in loaded
+    ]
+    assert report['import_ms'] < STARTUP_IMPORT_BUDGET_MS
+    assert report['max_rss_kb'] < STARTUP_RSS_BUDGET_KB
+
+
+def test_lazy_view_imported_on_first_request():
+    """Test a lazy view is named from its path and only imported when called"""
+    view = lazy_view(f'{__name__}.ping')
+    pattern = path('ping/', view, name='ping')
+    assert pattern.lookup_str == f'{__name__}.ping'
+    assert view._view is None
+
+    assert view(RequestFactory().get('/ping/')).content == b'pong'
+    assert view.resolve() is ping
+
+    redirect = lazy_view('django.views.generic.RedirectView', url='/to/')
+    assert redirect(RequestFactory().get('/from/'))['Location'] == '/to/'
+
+
+def test_parse_importtime():
+    """Test timings are read per module with the module that imported each"""
+    modules = parse_importtime(
+        'import time: self [us] | cumulative | imported package\n'
+        'import time:       120 |        120 |     numpy.core\n'
+        'import time:       300 |        420 |   numpy\n'
+        'import time:        80 |         80 |   json\n'
+        'import time:        50 |        550 | apps.exercises.telemetry\n'
+        'import time:        10 |         10 | os\n'
+    )
+    assert [(m['module'], m['self_us'], m['depth']) for m in modules][:2] == [('numpy.core', 120, 2), ('numpy', 300, 1)]
+    assert import_chain(modules, 'numpy.core') == ['apps.exercises.telemetry', 'numpy', 'numpy.core']
+    assert modules[2]['parent'] == 'apps.exercises.telemetry' and modules[4]['parent'] is None
+
+
+def test_json_log_formatter():
+    """Test the deferred JSON formatter formats records as configured in LOGGING"""
+    logging.config.dictConfig(settings.LOGGING)
+    handler = next(h for h in logging.getLogger('django').handlers if isinstance(h, logging.FileHandler))
+    record = logging.LogRecord('django', logging.WARNING, __file__, 7, 'slow %s', ('query',), None)
+    line = json.loads(handler.formatter.format(record))
+    assert line['message'] == 'slow query' and line['levelname'] == 'WARNING' and line['lineno'] == 7
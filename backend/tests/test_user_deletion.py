@@ -0,0 +1,132 @@
+import re
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from apps.exercises import telemetry
+from apps.exercises.models import SessionTelemetry
+from apps.notifications.models import NotificationArchive
+from apps.reports import user_deletion
+from apps.reports.models import AuditLog, BackgroundJob
+from apps.reports.user_deletion import DELETION_PLAN
+from core.jobs import JobRunner
+from exercise.models import (
+    ActivityData, CustomReminder, Exercise, ExerciseSession, HealthVitals, Notification, UserProfile,
+)
+
+
+def add_history(user, exercise, days):
+    for day in range(days):
+        session = ExerciseSession.objects.create(user=user, exercise=exercise, rep_count=10, avg_posture_score=80)
+        recording = SessionTelemetry(session=session)
+        recording.append(telemetry.quantize_batch({
+            't': [0], 'rep': [0], 'score': [90], 'velocity': [None], 'issues': [0], 'angles': [[120]],
+        }))
+        recording.save()
+        ActivityData.objects.create(user=user, date=timezone.localdate() - timedelta(days=day), steps=4000)
+        HealthVitals.objects.create(user=user, heart_rate=80, spo2=98, stress_level='low',
+                                    fatigue_level=3, daily_active_minutes=30)
+        Notification.objects.create(user=user, title='Hi', message='Welcome')
+    NotificationArchive.objects.create(user=user, period=timezone.localdate().replace(day=1), payload=b'')
+    CustomReminder.objects.create(user=user, title='Walk', message='-', reminder_type='exercise',
+                                  scheduled_time=timezone.now().time())
+    AuditLog.objects.create(user=user, action='login', model_name='User', object_id=user.id)
+
+
+@pytest.fixture
+def patients(db):
+    exercise = Exercise.objects.create(name='Squat', description='-', difficulty='easy')
+    users = []
+    for username in ('leaving', 'staying'):
+        user = User.objects.create_user(username=username, password='testpass123')
+        UserProfile.objects.create(user=user, role='patient')
+        add_history(user, exercise, days=7)
+        users.append(user)
+    return users
+
+
+def user_rows(user_id):
+    return {
+        model._meta.db_table: model.objects.filter(**{lookup: user_id}).count()
+        for model, lookup, _ in DELETION_PLAN
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('admin_profile')
+class TestUserDeletion:
+
+    def test_deleted_in_bounded_batches(self, patients, admin_client, settings):
+        """Test the endpoint deactivates the user and the job deletes their data in batches, children first"""
+        settings.USER_DELETION_BATCH_SIZE = 3
+        leaving, staying = patients
+        before = user_rows(staying.id)
+
+        response = admin_client.delete(f'/api/admin/users/{leaving.id}/delete/')
+        assert response.status_code == 200
+        leaving.refresh_from_db()
+        assert not leaving.is_active
+        # Asking again while the job is queued does not queue another
+        assert admin_client.delete(f'/api/admin/users/{leaving.id}/delete/').data['job_id'] == response.data['job_id']
+
+        with CaptureQueriesContext(connection) as queries:
+            assert JobRunner().run_pending() == 1
+        writes = [q['sql'] for q in queries if re.match(r'(DELETE FROM|UPDATE) "(?!reports_backgroundjob)', q['sql'])]
+        batched = [sql for sql in writes if ' IN (' in sql]
+        assert batched and all(sql.split(' IN (')[1].split(')')[0].count(',') < 3 for sql in batched)
+        tables = [re.match(r'(?:DELETE FROM|UPDATE) "(\w+)"', sql).group(1) for sql in batched]
+        assert tables.index(SessionTelemetry._meta.db_table) < tables.index(ExerciseSession._meta.db_table)
+
+        assert not User.objects.filter(id=leaving.id).exists()
+        assert not any(user_rows(leaving.id).values())
+        assert user_rows(staying.id) == before
+        job = BackgroundJob.objects.get(id=response.data['job_id'])
+        assert job.status == 'completed'
+        assert job.result['rows']['health_vitals'] == 7 and job.result['rows']['exercise_exercisesession'] == 7
+        # History that only referenced the user is kept, unlinked
+        assert AuditLog.objects.filter(action='login', object_id=leaving.id, user__isnull=True).exists()
+        record = AuditLog.objects.get(object_repr='leaving (data deleted)')
+        assert record.user.username == 'admin' and record.changes['rows']['exercise_notification'] == 7
+
+    def test_resumes_after_crash(self, patients, monkeypatch, settings):
+        """Test a job that dies mid-table is reclaimed and finishes from its checkpoint"""
+        settings.USER_DELETION_BATCH_SIZE = 2
+        leaving, _ = patients
+        job = user_deletion.request_deletion(leaving, None)
+        run_batch = user_deletion._run_batch
+        vitals_batches = []
+
+        def crash_on_second_vitals_batch(model, *args):
+            if model is HealthVitals and len(vitals_batches) < 2:
+                vitals_batches.append(model)
+                if len(vitals_batches) == 2:
+                    raise RuntimeError('worker killed')
+            return run_batch(model, *args)
+
+        monkeypatch.setattr(user_deletion, '_run_batch', crash_on_second_vitals_batch)
+        runner = JobRunner()
+        assert runner.run(runner.claim()) is False
+        job.refresh_from_db()
+        vitals_step = [model for model, _, _ in DELETION_PLAN].index(HealthVitals)
+        assert job.progress['step'] == vitals_step and job.progress['deleted']['health_vitals'] == 2
+        assert HealthVitals.objects.filter(user=leaving).count() == 5
+
+        BackgroundJob.objects.filter(id=job.id).update(run_after=timezone.now())
+        assert runner.run(runner.claim())
+        job.refresh_from_db()
+        assert job.result['rows']['health_vitals'] == 7
+        assert job.result['rows']['exercise_exercisesession'] == 7  # counted once, before the crash
+        assert not User.objects.filter(id=leaving.id).exists()
+
+
+def test_plan_covers_every_user_relation():
+    """Test every table referencing User is in the deletion plan, so none is left to the collector"""
+    planned = {(model, lookup) for model, lookup, _ in DELETION_PLAN}
+    relations = {
+        (rel.related_model, rel.field.name) for rel in User._meta.related_objects
+        if rel.related_model._meta.app_label not in ('admin', 'auth') and not rel.many_to_many
+    }
+    assert relations <= planned
@@ -0,0 +1,107 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework import status
+from exercise.models import Exercise, ExerciseSession, UserProfile
+
+
+@pytest.fixture
+def exercise(db):
+    return Exercise.objects.create(name='Squats', description='Supported squats')
+
+
+@pytest.fixture
+def roster(create_user, exercise):
+    """Ten patients with i sessions of 10 reps each, plus a doctor"""
+    users = []
+    for i in range(10):
+        user = create_user(username=f'patient{i}', email=f'patient{i}@example.com')
+        UserProfile.objects.create(user=user, role='patient')
+        for _ in range(i):
+            ExerciseSession.objects.create(user=user, exercise=exercise, rep_count=10)
+        users.append(user)
+    doctor = create_user(username='drsmith', email='smith@clinic.com')
+    UserProfile.objects.create(user=doctor, role='doctor')
+    return users
+
+
+def walk(client, query):
+    seen, cursor = [], None
+    while True:
+        url = f'/api/admin/users/?{query}' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        seen.extend(response.data['users'])
+        cursor = response.data['next_cursor']
+        if not response.data['has_more']:
+            return seen
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('admin_profile')
+class TestUserDirectory:
+    """Test cases for the admin user directory"""
+
+    def test_keyset_walk_sorted_by_aggregate(self, admin_client, roster):
+        """Test paging by total_reps visits every user once in order"""
+        rows = walk(admin_client, 'sort=-total_reps&page_size=3')
+        assert len(rows) == len({r['id'] for r in rows}) == 12
+        reps = [r['total_reps'] for r in rows]
+        assert reps == sorted(reps, reverse=True)
+        assert rows[0]['username'] == 'patient9'
+        assert rows[0]['exercise_sessions'] == 9
+
+    def test_filters(self, admin_client, roster, exercise):
+        """Test search, role, activity and trimester filters"""
+        assert [r['username'] for r in walk(admin_client, 'q=clinic')] == ['drsmith']
+        assert len(walk(admin_client, 'role=patient')) == 10
+
+        ExerciseSession.objects.filter(user=roster[9]).update(
+            start_time=timezone.now() - timedelta(days=30)
+        )
+        active = {r['username'] for r in walk(admin_client, 'active_within=7')}
+        assert 'patient9' not in active and 'patient1' in active
+        inactive = {r['username'] for r in walk(admin_client, 'inactive_for=7&role=patient')}
+        assert inactive == {'patient0', 'patient9'}
+
+        UserProfile.objects.filter(user=roster[3]).update(
+            lmp_date=timezone.now().date() - timedelta(weeks=20)
+        )
+        rows = walk(admin_client, 'trimester=2')
+        assert [r['username'] for r in rows] == ['patient3']
+        assert rows[0]['trimester'] == 2
+
+        # A row's trimester is the one its filter matches; past week 42 it has none
+        for user, weeks in ((roster[4], 30), (roster[5], 60)):
+            UserProfile.objects.filter(user=user).update(lmp_date=timezone.now().date() - timedelta(weeks=weeks))
+        assert [r['username'] for r in walk(admin_client, 'trimester=3')] == ['patient4']
+        rows = {r['username']: r for r in walk(admin_client, 'role=patient')}
+        assert (rows['patient4']['trimester'], rows['patient5']['trimester']) == (3, None)
+        assert rows['patient5']['pregnancy_week'] == 60
+
+    def test_single_query_per_page(self, admin_client, roster, django_assert_max_num_queries):
+        """Test that counts are annotated rather than queried per user"""
+        with django_assert_max_num_queries(3):
+            response = admin_client.get('/api/admin/users/?page_size=100')
+        assert len(response.data['users']) == 12
+
+    def test_invalid_parameters(self, admin_client):
+        """Test that bad sort keys, cursors and filters are rejected"""
+        for query in ('sort=password', 'cursor=bogus', 'trimester=5', 'active_within=x'):
+            response = admin_client.get(f'/api/admin/users/?{query}')
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_requires_admin(self, authenticated_client):
+        """Test that non-admins cannot list users"""
+        UserProfile.objects.create(user=authenticated_client.user, role='patient')
+        response = authenticated_client.get('/api/admin/users/')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_legacy_user_list(self, admin_client, roster, django_assert_max_num_queries):
+        """Test the unpaginated list keeps its shape without per-user queries"""
+        with django_assert_max_num_queries(3):
+            response = admin_client.get('/api/user-list/')
+        assert len(response.data) == 12
+        patient = next(u for u in response.data if u['username'] == 'patient4')
+        assert patient['role'] == 'patient'
+        assert patient['exercise_sessions'] == 4
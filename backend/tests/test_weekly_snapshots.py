@@ -0,0 +1,109 @@
+from datetime import datetime, time, timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.utils import timezone
+from apps.reports.models import WeeklySnapshot
+from apps.reports.weekly_snapshots import iso_week, week_start
+from exercise.models import ActivityData, Exercise, ExerciseSession
+
+
+def session_on(user, exercise, day, reps, score):
+    session = ExerciseSession.objects.create(user=user, exercise=exercise, rep_count=reps, avg_posture_score=score)
+    # Move start_time with update(), as a past import would (no post_save)
+    start = timezone.make_aware(datetime.combine(day, time(9)))
+    ExerciseSession.objects.filter(id=session.id).update(start_time=start)
+    return session
+
+
+@pytest.fixture
+def history(db):
+    """Two weeks of data: last ISO week (complete) and the current week"""
+    user = User.objects.create_user(username='patient', password='testpass123')
+    squat = Exercise.objects.create(name='Squat', description='-', difficulty='easy')
+    march = Exercise.objects.create(name='Seated March', description='-', difficulty='easy')
+    today = timezone.localdate()
+    last_monday = week_start(today) - timedelta(days=7)
+    for offset in range(7):
+        ActivityData.objects.create(user=user, date=last_monday + timedelta(days=offset), steps=6000,
+                                    calories=250.5, avg_heart_rate=80 if offset % 2 else None, sleep_minutes=420)
+    session_on(user, squat, last_monday, 10, 80)
+    session_on(user, march, last_monday + timedelta(days=3), 20, 60)
+    ActivityData.objects.create(user=user, date=today, steps=3000, calories=100, avg_heart_rate=90, sleep_minutes=400)
+    session_on(user, squat, today, 5, 90)
+    return user, squat, last_monday, today
+
+
+def report(client, start, end):
+    response = client.get('/api/weekly-report/', {'start_date': start.isoformat(), 'end_date': end.isoformat()})
+    assert response.status_code == 200
+    return response.data
+
+
+@pytest.mark.django_db
+class TestWeeklySnapshots:
+
+    def test_completed_week_served_from_snapshot(self, history, api_client, query_budget):
+        """Test the first report stores last week's snapshot and later ones aggregate only the current week"""
+        user, squat, last_monday, today = history
+        api_client.force_authenticate(user)
+
+        first = report(api_client, last_monday, today)
+        assert list(WeeklySnapshot.objects.filter(user=user).values_list('week', flat=True)) == [iso_week(last_monday)]
+        assert first['activity_summary']['total_steps'] == 7 * 6000 + 3000
+        assert first['activity_summary']['total_calories'] == pytest.approx(7 * 250.5 + 100)
+        assert first['activity_summary']['avg_heart_rate'] == pytest.approx((3 * 80 + 90) / 4)
+        assert first['activity_summary']['total_sleep_hours'] == pytest.approx((7 * 420 + 400) / 60)
+        assert first['exercise_summary']['total_sessions'] == 3
+        assert first['exercise_summary']['total_reps'] == 35
+        assert first['exercise_summary']['avg_posture_score'] == pytest.approx((80 + 60 + 90) / 3)
+        assert first['exercise_summary']['exercises'] == [
+            {'exercise_id': squat.id, 'count': 2},
+            {'exercise_id': Exercise.objects.get(name='Seated March').id, 'count': 1}]
+        assert [day['date'] for day in first['daily_data']][:2] == [last_monday.isoformat(), (last_monday + timedelta(days=1)).isoformat()]
+        assert first['daily_data'][0]['calories'] == 250
+
+        # Snapshot lookup plus the current week's activity rows and session aggregate
+        with query_budget(3, max_repeats=1):
+            again = report(api_client, last_monday, today)
+        assert again == first
+
+        # A range inside the completed week is only the snapshot lookup
+        with query_budget(1):
+            midweek = report(api_client, last_monday + timedelta(days=2), last_monday + timedelta(days=4))
+        assert midweek['exercise_summary']['total_sessions'] == 1
+        assert midweek['activity_summary']['total_steps'] == 3 * 6000
+
+    def test_backfill_invalidates_only_its_week(self, history, api_client):
+        """Test new data for a completed week drops its snapshot; current-week data does not"""
+        user, squat, last_monday, today = history
+        api_client.force_authenticate(user)
+        report(api_client, last_monday, today)
+
+        ExerciseSession.objects.create(user=user, exercise=squat, rep_count=1, avg_posture_score=50)
+        assert WeeklySnapshot.objects.filter(user=user).count() == 1
+
+        ActivityData.objects.create(user=user, date=last_monday + timedelta(days=1), steps=1000, calories=0, sleep_minutes=0)
+        assert WeeklySnapshot.objects.filter(user=user).count() == 0
+        backfilled = report(api_client, last_monday, last_monday + timedelta(days=6))
+        assert backfilled['activity_summary']['total_steps'] == 7 * 6000 + 1000
+
+        # Editing a past session also invalidates
+        session = ExerciseSession.objects.filter(user=user, start_time__date=last_monday).get()
+        session.rep_count = 12
+        session.save()
+        assert report(api_client, last_monday, last_monday + timedelta(days=6))['exercise_summary']['total_reps'] == 32
+
+        # Deletes invalidate too, through the API or not
+        response = api_client.delete(f'/api/sessions/{session.id}/')
+        assert response.status_code == 204
+        assert report(api_client, last_monday, last_monday + timedelta(days=6))['exercise_summary']['total_reps'] == 20
+        ActivityData.objects.filter(user=user, date=last_monday).get().delete()
+        assert WeeklySnapshot.objects.filter(user=user).count() == 0
+        assert report(api_client, last_monday, last_monday + timedelta(days=6))['activity_summary']['total_steps'] == 6 * 6000 + 1000
+
+    def test_invalid_dates(self, history, api_client):
+        """Test missing or malformed dates are rejected"""
+        api_client.force_authenticate(history[0])
+        assert api_client.get('/api/weekly-report/', {'start_date': 'monday', 'end_date': '2024-01-07'}).status_code == 400
+        assert api_client.get('/api/weekly-report/').status_code == 400
@@ -5,6 +5,7 @@ import { Dumbbell, BarChart3, Baby, LogOut, FileText, Leaf, UserCircle } from 'l
 import apiClient, { getErrorMessage } from './utils/api'
 import { toast } from './components/Toast'
 import { APP_CONFIG } from './utils/constants'
+import { syncSessionsWhenOnline } from './utils/sessionQueue'
 import LandingPage from './pages/LandingPage'
 import ExerciseLibrary from './pages/ExerciseLibrary'
 import ExerciseDetail from './pages/ExerciseDetail'
@@ -157,6 +158,11 @@ function App() {
     }
   }, [])
 
+  // Flush sessions queued while offline once signed in, and on reconnect
+  useEffect(() => {
+    if (user) return syncSessionsWhenOnline()
+  }, [user])
+
   const login = async (username: string, password: string): Promise<boolean> => {
     try {
       const res = await apiClient.post('/auth/token/', { username, password })
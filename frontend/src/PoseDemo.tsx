@@ -1,6 +1,7 @@
 import { useEffect, useRef, useState, useCallback } from 'react'
 import { useAuth } from './App'
 import apiClient from './utils/api'
+import { enqueueSession, flushSessionQueue, resolveExerciseId } from './utils/sessionQueue'
 import { toast } from './components/Toast'
 import { MEDIAPIPE_WASM_URL, MEDIAPIPE_MODEL_URL } from './utils/constants'
 import { FilesetResolver, PoseLandmarker, DrawingUtils } from '@mediapipe/tasks-vision'
@@ -131,21 +132,27 @@ export default function PoseDemo() {
 
     setSaving(true)
     try {
-      const res = await apiClient.get('/exercises/')
-      const targetEx = res.data.find((ex: any) =>
-        ex.name.toLowerCase().includes(currentExercise)
-      ) || res.data[0]
-
-      await apiClient.post('/sessions/', {
-        exercise_id: targetEx.id,
+      const clientId = enqueueSession({
+        exercise_id: await resolveExerciseId(currentExercise),
         rep_count: reps,
         avg_posture_score: Number(avgPostureScore.toFixed(1)),
         posture_warnings: postureIssues.join(', ')
       })
-
-      toast.success(`🎉 Saved ${reps} ${EXERCISES[currentExercise].name} @ ${avgPostureScore.toFixed(0)}% posture!`)
+      const message = `${reps} ${EXERCISES[currentExercise].name} @ ${avgPostureScore.toFixed(0)}% posture`
       setReps(0)
       setAvgPostureScore(0)
+
+      try {
+        const saved = (await flushSessionQueue()).get(clientId)
+        if (saved?.id) {
+          toast.success(`🎉 Saved ${message}!`)
+        } else if (saved) {
+          toast.error('Failed to save session. Please try again.')
+        }
+      } catch (error) {
+        console.error('Session sync failed:', error)
+        toast(`📴 Offline: ${message} will be saved when you reconnect`)
+      }
     } catch (error) {
       console.error('Save failed:', error)
       toast.error('Failed to save session. Please try again.')
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { Bell, X } from 'lucide-react'
 import { motion, AnimatePresence } from 'framer-motion'
 import apiClient from '../utils/api'
@@ -19,11 +19,13 @@ export default function NotificationBell() {
     const [unreadCount, setUnreadCount] = useState(0)
     const [isOpen, setIsOpen] = useState(false)
     const [loading, setLoading] = useState(false)
+    // Cursor of the newest notification seen; polls fetch only newer items
+    const latestCursor = useRef<string | null>(null)
 
     useEffect(() => {
         fetchNotifications()
         // Poll every 30 seconds for new notifications
-        const interval = setInterval(fetchNotifications, 30000)
+        const interval = setInterval(pollNotifications, 30000)
         return () => clearInterval(interval)
     }, [])
 
@@ -32,11 +34,36 @@ export default function NotificationBell() {
             const response = await apiClient.get('/notifications/')
             setNotifications(response.data.notifications)
             setUnreadCount(response.data.unread_count)
+            latestCursor.current = response.data.latest_cursor
         } catch (error) {
             console.error('Failed to fetch notifications:', error)
         }
     }
 
+    const pollNotifications = async () => {
+        if (!latestCursor.current) {
+            return fetchNotifications()
+        }
+        try {
+            // Each response holds the oldest new items; repeat until caught up
+            let hasMore = true
+            while (hasMore) {
+                const response = await apiClient.get('/notifications/', {
+                    params: { since: latestCursor.current }
+                })
+                const fresh: Notification[] = response.data.notifications
+                if (fresh.length > 0) {
+                    setNotifications(prev => [...fresh, ...prev].slice(0, 10))
+                }
+                setUnreadCount(response.data.unread_count)
+                latestCursor.current = response.data.latest_cursor
+                hasMore = response.data.has_more
+            }
+        } catch (error) {
+            console.error('Failed to poll notifications:', error)
+        }
+    }
+
     const markAsRead = async (id: number) => {
         try {
             await apiClient.post(`/notifications/${id}/read/`)
@@ -1,7 +1,8 @@
 import { useState, useEffect } from 'react'
 import { motion } from 'framer-motion'
-import { Users, Activity, Heart, TrendingUp, Calendar, LogOut, X, BarChart3 } from 'lucide-react'
+import { Users, Activity, Heart, TrendingUp, Calendar, LogOut, X, BarChart3, Download } from 'lucide-react'
 import apiClient from '../utils/api'
+import { downloadReport } from '../utils/reports'
 import { useAuth } from '../App'
 import { useNavigate } from 'react-router-dom'
 import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from 'recharts'
@@ -52,6 +53,7 @@ export default function DoctorDashboard() {
     const [patientDetail, setPatientDetail] = useState<PatientDetail | null>(null)
     const [loading, setLoading] = useState(true)
     const [detailLoading, setDetailLoading] = useState(false)
+    const [exporting, setExporting] = useState(false)
     const { logout } = useAuth()
     const navigate = useNavigate()
 
@@ -71,6 +73,18 @@ export default function DoctorDashboard() {
         }
     }
 
+    const exportRoster = async () => {
+        try {
+            setExporting(true)
+            // One PDF per patient in a ZIP, rendered on the server
+            await downloadReport('/reports/roster/', { export_format: 'pdf' })
+        } catch (error) {
+            console.error('Failed to export roster reports:', error)
+        } finally {
+            setExporting(false)
+        }
+    }
+
     const fetchPatientDetail = async (patientId: number) => {
         try {
             setDetailLoading(true)
@@ -115,13 +129,23 @@ export default function DoctorDashboard() {
                         </h1>
                         <p className="text-gray-600">Patient Monitoring & Health Overview</p>
                     </div>
-                    <button
-                        onClick={handleLogout}
-                        className="flex items-center gap-2 bg-red-500 hover:bg-red-600 text-white px-6 py-3 rounded-xl font-semibold transition-all"
-                    >
-                        <LogOut className="w-5 h-5" />
-                        Logout
-                    </button>
+                    <div className="flex gap-3">
+                        <button
+                            onClick={exportRoster}
+                            disabled={exporting}
+                            className="flex items-center gap-2 bg-green-600 hover:bg-green-700 text-white px-6 py-3 rounded-xl font-semibold transition-all disabled:opacity-50"
+                        >
+                            <Download className="w-5 h-5" />
+                            {exporting ? 'Exporting...' : 'Export Reports'}
+                        </button>
+                        <button
+                            onClick={handleLogout}
+                            className="flex items-center gap-2 bg-red-500 hover:bg-red-600 text-white px-6 py-3 rounded-xl font-semibold transition-all"
+                        >
+                            <LogOut className="w-5 h-5" />
+                            Logout
+                        </button>
+                    </div>
                 </div>
 
                 {/* Summary Stats */}
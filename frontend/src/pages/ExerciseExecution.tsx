@@ -9,6 +9,8 @@ import { EXERCISES, type ExerciseType } from '../types'
 import ExerciseStats from '../components/ExerciseStats'
 import SafetyAlertOverlay from '../components/SafetyAlertOverlay'
 import { Loader, AlertCircle, Play, Square, Save, Heart } from 'lucide-react'
+import { TelemetryRecorder, issueMask } from '../utils/telemetry'
+import { enqueueSession, flushSessionQueue, resolveExerciseId } from '../utils/sessionQueue'
 import {
     calculateAngle,
     AngleSmoothing,
@@ -55,6 +57,10 @@ export default function ExerciseExecution() {
     const velocityTrackerRef = useRef<VelocityTracker>(new VelocityTracker())
     const previousLandmarksRef = useRef<any[] | null>(null)
 
+    // Per-frame telemetry, uploaded with the session
+    const telemetryRef = useRef<TelemetryRecorder>(new TelemetryRecorder())
+    const telemetryRepsRef = useRef(0)
+
     const exercise = id ? EXERCISES[id as ExerciseType] : null
 
     if (!exercise) {
@@ -111,6 +117,7 @@ export default function ExerciseExecution() {
 
         if (repResult.counted) {
             setReps(r => r + 1)
+            telemetryRepsRef.current++
         }
 
         setPhase(repResult.phase === 'transition' ? phaseRef.current : repResult.phase)
@@ -125,6 +132,14 @@ export default function ExerciseExecution() {
         setPostureIssues(postureAnalysis.issues)
         setAvgPostureScore(prev => (prev * 0.9 + postureAnalysis.score * 0.1))
 
+        telemetryRef.current.record({
+            angles: [smoothedAngle, rawAngle],
+            score: postureAnalysis.score,
+            velocity: currentVelocity,
+            rep: telemetryRepsRef.current,
+            issues: issueMask(postureAnalysis.issues, currentVelocity !== null && currentVelocity > 150)
+        })
+
         previousLandmarksRef.current = lm
     }, [exercise])
 
@@ -167,21 +182,35 @@ export default function ExerciseExecution() {
 
         setSaving(true)
         try {
-            const res = await apiClient.get('/exercises/')
-            const targetEx = res.data.find((ex: any) =>
-                ex.name.toLowerCase().includes(exercise.id)
-            ) || res.data[0]
-
-            await apiClient.post('/sessions/', {
-                exercise_id: targetEx.id,
+            const clientId = enqueueSession({
+                exercise_id: await resolveExerciseId(exercise.id),
                 rep_count: reps,
                 avg_posture_score: Number(avgPostureScore.toFixed(1)),
                 posture_warnings: postureIssues.join(', ')
             })
-
-            toast.success(`🎉 Saved ${reps} ${exercise.name} @ ${avgPostureScore.toFixed(0)}% posture!`)
+            const message = `${reps} ${exercise.name} @ ${avgPostureScore.toFixed(0)}% posture`
             setReps(0)
             setAvgPostureScore(0)
+
+            let saved
+            try {
+                saved = (await flushSessionQueue()).get(clientId)
+            } catch (error) {
+                console.error('Session sync failed:', error)
+                toast(`📴 Offline: ${message} will be saved when you reconnect`)
+            }
+
+            if (saved?.id) {
+                // The session is saved even if its telemetry cannot be uploaded
+                try {
+                    await telemetryRef.current.upload(saved.id, exercise.id)
+                } catch (error) {
+                    console.error('Telemetry upload failed:', error)
+                }
+                toast.success(`🎉 Saved ${message}!`)
+            } else if (saved) {
+                toast.error('Failed to save session. Please try again.')
+            }
         } catch (error) {
             console.error('Save failed:', error)
             toast.error('Failed to save session. Please try again.')
@@ -322,6 +351,8 @@ export default function ExerciseExecution() {
             setReps(0)
             setAvgPostureScore(0)
             setPostureIssues([])
+            telemetryRef.current.start()
+            telemetryRepsRef.current = 0
 
             // Reset trackers
             angleSmootherRef.current.reset()
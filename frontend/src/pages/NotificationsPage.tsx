@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { motion } from 'framer-motion'
 import { Bell, Check, X, Trash2, Filter, ArrowLeft } from 'lucide-react'
 import apiClient from '../utils/api'
@@ -19,16 +19,25 @@ export default function NotificationsPage() {
     const [loading, setLoading] = useState(true)
     const [filter, setFilter] = useState<'all' | 'unread' | 'read'>('all')
     const [priorityFilter, setPriorityFilter] = useState<string>('all')
+    // Older pages are fetched on demand; polls fetch only items newer than latestCursor
+    const [nextCursor, setNextCursor] = useState<string | null>(null)
+    const [loadingMore, setLoadingMore] = useState(false)
+    const latestCursor = useRef<string | null>(null)
 
     useEffect(() => {
         fetchNotifications()
+        // Poll every 30 seconds for new notifications
+        const interval = setInterval(pollNotifications, 30000)
+        return () => clearInterval(interval)
     }, [])
 
     const fetchNotifications = async () => {
         try {
             setLoading(true)
-            const response = await apiClient.get('/notifications/?page_size=100')
+            const response = await apiClient.get('/notifications/')
             setNotifications(response.data.notifications)
+            setNextCursor(response.data.next_cursor)
+            latestCursor.current = response.data.latest_cursor
         } catch (error) {
             console.error('Failed to fetch notifications:', error)
         } finally {
@@ -36,6 +45,44 @@ export default function NotificationsPage() {
         }
     }
 
+    const loadMore = async () => {
+        if (!nextCursor) return
+        try {
+            setLoadingMore(true)
+            const response = await apiClient.get('/notifications/', {
+                params: { cursor: nextCursor }
+            })
+            setNotifications(prev => [...prev, ...response.data.notifications])
+            setNextCursor(response.data.next_cursor)
+        } catch (error) {
+            console.error('Failed to load more notifications:', error)
+        } finally {
+            setLoadingMore(false)
+        }
+    }
+
+    const pollNotifications = async () => {
+        if (!latestCursor.current) return
+        try {
+            // Each response holds the oldest new items; repeat until caught up
+            let hasMore = true
+            while (hasMore) {
+                const response = await apiClient.get('/notifications/', {
+                    params: { since: latestCursor.current }
+                })
+                const fresh: Notification[] = response.data.notifications
+                if (fresh.length > 0) {
+                    const ids = new Set(fresh.map(n => n.id))
+                    setNotifications(prev => [...fresh, ...prev.filter(n => !ids.has(n.id))])
+                }
+                latestCursor.current = response.data.latest_cursor
+                hasMore = response.data.has_more
+            }
+        } catch (error) {
+            console.error('Failed to poll notifications:', error)
+        }
+    }
+
     const markAsRead = async (id: number) => {
         try {
             await apiClient.post(`/notifications/${id}/read/`)
@@ -83,6 +130,7 @@ export default function NotificationsPage() {
         try {
             await apiClient.delete('/notifications/clear-all/')
             setNotifications([])
+            setNextCursor(null)
         } catch (error) {
             console.error('Failed to clear notifications:', error)
         }
@@ -359,6 +407,16 @@ export default function NotificationsPage() {
                             </motion.div>
                         ))
                     )}
+
+                    {!loading && nextCursor && (
+                        <button
+                            onClick={loadMore}
+                            disabled={loadingMore}
+                            className="w-full py-3 bg-white rounded-xl shadow-lg text-blue-600 font-medium hover:bg-blue-50 disabled:opacity-50"
+                        >
+                            {loadingMore ? 'Loading...' : 'Load more'}
+                        </button>
+                    )}
                 </div>
             </div>
         </motion.div>
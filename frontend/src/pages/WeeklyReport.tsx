@@ -14,7 +14,7 @@ import {
 } from 'lucide-react'
 import apiClient, { getErrorMessage } from '../utils/api'
 import { toast } from '../components/Toast'
-import { generatePDFReport } from '../utils/pdfReportGenerator'
+import { downloadReport, ReportFormat } from '../utils/reports'
 import {
     LineChart,
     Line,
@@ -61,6 +61,7 @@ const COLORS = ['#3B82F6', '#8B5CF6', '#EC4899', '#10B981', '#F59E0B', '#EF4444'
 export default function WeeklyReport() {
     const navigate = useNavigate()
     const [loading, setLoading] = useState(false)
+    const [exporting, setExporting] = useState(false)
     const [reportData, setReportData] = useState<WeeklyReportData | null>(null)
     const [dateRange, setDateRange] = useState({
         start: getLastWeekStart(),
@@ -99,18 +100,20 @@ export default function WeeklyReport() {
         }
     }
 
-    const exportToPDF = () => {
-        if (!reportData) {
-            toast.error('No data to export')
-            return
-        }
-
+    const exportReport = async (format: ReportFormat) => {
+        setExporting(true)
         try {
-            generatePDFReport(reportData)
-            toast.success('PDF report generated successfully!')
-        } catch (error) {
-            console.error('PDF generation error:', error)
-            toast.error('Failed to generate PDF report')
+            // Rendered on the server: same date range as the charts
+            await downloadReport('/reports/weekly/', {
+                export_format: format,
+                start_date: dateRange.start,
+                end_date: dateRange.end
+            })
+            toast.success(`${format.toUpperCase()} report downloaded`)
+        } catch (err) {
+            toast.error(`Failed to export report: ${getErrorMessage(err)}`)
+        } finally {
+            setExporting(false)
         }
     }
 
@@ -150,13 +153,24 @@ export default function WeeklyReport() {
                                 {reportData ? `${reportData.week_start} to ${reportData.week_end}` : 'Select date range'}
                             </p>
                         </div>
-                        <button
-                            onClick={exportToPDF}
-                            className="flex items-center gap-2 px-6 py-3 bg-gradient-to-r from-blue-600 to-purple-600 text-white font-bold rounded-xl hover:from-blue-700 hover:to-purple-700 transition-all"
-                        >
-                            <Download className="w-5 h-5" />
-                            Export PDF
-                        </button>
+                        <div className="flex gap-3">
+                            <button
+                                onClick={() => exportReport('pdf')}
+                                disabled={exporting}
+                                className="flex items-center gap-2 px-6 py-3 bg-gradient-to-r from-blue-600 to-purple-600 text-white font-bold rounded-xl hover:from-blue-700 hover:to-purple-700 transition-all disabled:opacity-50"
+                            >
+                                <Download className="w-5 h-5" />
+                                Export PDF
+                            </button>
+                            <button
+                                onClick={() => exportReport('csv')}
+                                disabled={exporting}
+                                className="flex items-center gap-2 px-6 py-3 bg-white text-purple-700 font-bold rounded-xl border-2 border-purple-200 hover:bg-purple-50 transition-all disabled:opacity-50"
+                            >
+                                <Download className="w-5 h-5" />
+                                Export CSV
+                            </button>
+                        </div>
                     </div>
                 </motion.div>
 
@@ -26,6 +26,8 @@ const AuditLogs: React.FC = () => {
         limit: 100
     });
     const [expandedRow, setExpandedRow] = useState<number | null>(null);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [loadingMore, setLoadingMore] = useState(false);
 
     useEffect(() => {
         loadLogs();
@@ -36,6 +38,7 @@ const AuditLogs: React.FC = () => {
             setLoading(true);
             const data = await getAuditLogs(filters);
             setLogs(data.logs || []);
+            setNextCursor(data.next_cursor || null);
         } catch (error) {
             console.error('Failed to load audit logs:', error);
         } finally {
@@ -43,6 +46,20 @@ const AuditLogs: React.FC = () => {
         }
     };
 
+    const loadMore = async () => {
+        if (!nextCursor) return;
+        try {
+            setLoadingMore(true);
+            const data = await getAuditLogs({ ...filters, cursor: nextCursor });
+            setLogs((current) => [...current, ...(data.logs || [])]);
+            setNextCursor(data.next_cursor || null);
+        } catch (error) {
+            console.error('Failed to load audit logs:', error);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const formatDate = (dateString: string) => {
         const date = new Date(dateString);
         return date.toLocaleString();
@@ -108,7 +125,7 @@ const AuditLogs: React.FC = () => {
                     </div>
 
                     <div className="filter-group">
-                        <label>Limit</label>
+                        <label>Page Size</label>
                         <select
                             value={filters.limit}
                             onChange={(e) => setFilters({ ...filters, limit: Number(e.target.value) })}
@@ -183,6 +200,12 @@ const AuditLogs: React.FC = () => {
                         {logs.length === 0 && (
                             <div className="no-data">No audit logs found</div>
                         )}
+
+                        {nextCursor && (
+                            <button className="load-more-btn" onClick={loadMore} disabled={loadingMore}>
+                                {loadingMore ? 'Loading...' : 'Load more'}
+                            </button>
+                        )}
                     </div>
                 )}
 
@@ -337,6 +360,23 @@ const AuditLogs: React.FC = () => {
             border: 1px solid #e5e7eb;
           }
           
+          .load-more-btn {
+            display: block;
+            margin: 16px auto;
+            padding: 10px 24px;
+            border: 1px solid #d1d5db;
+            border-radius: 8px;
+            background: white;
+            color: #374151;
+            font-size: 14px;
+            cursor: pointer;
+          }
+          
+          .load-more-btn:disabled {
+            opacity: 0.6;
+            cursor: not-allowed;
+          }
+          
           .no-data {
             padding: 48px;
             text-align: center;
@@ -1,64 +1,34 @@
 import React, { useState } from 'react';
 import AdminNav from '../../components/admin/AdminNav';
-import { getAuditLogs } from '../../services/adminApi';
+import { downloadAuditExport } from '../../services/adminApi';
 import './admin.css';
 
 const ExportAuditLogs: React.FC = () => {
     const [exporting, setExporting] = useState(false);
+    const [compress, setCompress] = useState(false);
     const [filters, setFilters] = useState({
         action: '',
         startDate: '',
         endDate: '',
     });
 
-    const exportToCSV = async () => {
+    const runExport = async (format: 'csv' | 'ndjson') => {
         setExporting(true);
         try {
-            const data = await getAuditLogs(filters);
-
-            // Convert to CSV
-            const headers = ['Timestamp', 'User', 'Action', 'Model', 'Object', 'IP Address'];
-            const csvContent = [
-                headers.join(','),
-                ...data.map((log: any) => [
-                    new Date(log.timestamp).toLocaleString(),
-                    log.user_username || 'System',
-                    log.action,
-                    log.model_name,
-                    log.object_repr,
-                    log.ip_address || 'N/A'
-                ].join(','))
-            ].join('\n');
+            // The server streams every matching row; nothing is capped or built in the browser
+            const { blob, filename } = await downloadAuditExport({
+                action: filters.action,
+                start: filters.startDate,
+                end: filters.endDate,
+                format,
+                gzip: compress,
+            });
 
             // Download
-            const blob = new Blob([csvContent], { type: 'text/csv' });
-            const url = window.URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = `audit-logs-${new Date().toISOString().split('T')[0]}.csv`;
-            a.click();
-            window.URL.revokeObjectURL(url);
-
-            alert('Audit logs exported successfully!');
-        } catch (error) {
-            console.error('Export failed:', error);
-            alert('Failed to export audit logs');
-        } finally {
-            setExporting(false);
-        }
-    };
-
-    const exportToJSON = async () => {
-        setExporting(true);
-        try {
-            const data = await getAuditLogs(filters);
-
-            // Download JSON
-            const blob = new Blob([JSON.stringify(data, null, 2)], { type: 'application/json' });
             const url = window.URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
-            a.download = `audit-logs-${new Date().toISOString().split('T')[0]}.json`;
+            a.download = filename;
             a.click();
             window.URL.revokeObjectURL(url);
 
@@ -77,7 +47,7 @@ const ExportAuditLogs: React.FC = () => {
             <div className="admin-content">
                 <div className="page-header">
                     <h1>📥 Export Audit Logs</h1>
-                    <p>Download audit logs in CSV or JSON format</p>
+                    <p>Download audit logs in CSV or NDJSON format</p>
                 </div>
 
                 <div className="export-card">
@@ -116,20 +86,29 @@ const ExportAuditLogs: React.FC = () => {
                         </div>
                     </div>
 
+                    <label className="export-option">
+                        <input
+                            type="checkbox"
+                            checked={compress}
+                            onChange={(e) => setCompress(e.target.checked)}
+                        />
+                        Compress (gzip)
+                    </label>
+
                     <div className="export-actions">
                         <button
                             className="btn-export csv"
-                            onClick={exportToCSV}
+                            onClick={() => runExport('csv')}
                             disabled={exporting}
                         >
                             📄 Export as CSV
                         </button>
                         <button
                             className="btn-export json"
-                            onClick={exportToJSON}
+                            onClick={() => runExport('ndjson')}
                             disabled={exporting}
                         >
-                            📋 Export as JSON
+                            📋 Export as NDJSON
                         </button>
                     </div>
                 </div>
@@ -157,6 +136,15 @@ const ExportAuditLogs: React.FC = () => {
             margin-bottom: 24px;
           }
           
+          .export-option {
+            display: flex;
+            align-items: center;
+            gap: 8px;
+            margin-bottom: 24px;
+            color: #374151;
+            font-size: 14px;
+          }
+          
           .export-actions {
             display: flex;
             gap: 12px;
@@ -61,6 +61,15 @@ const SystemHealth: React.FC = () => {
                                 <span className="metric-label">Connection Time</span>
                                 <span className="metric-value">{health?.database?.connection_time_ms} ms</span>
                             </div>
+                            <div className="health-metric">
+                                <span className="metric-label">Connections</span>
+                                <span className="metric-value">
+                                    {health?.database?.connections?.mode}
+                                    {health?.database?.connections?.pool
+                                        ? ` (${health.database.connections.pool.pool_available}/${health.database.connections.pool.pool_size} idle)`
+                                        : ` (${health?.database?.connections?.opened} opened)`}
+                                </span>
+                            </div>
                         </div>
                         <div className="table-counts">
                             <h3>Table Records</h3>
@@ -1,7 +1,6 @@
 import React, { useEffect, useState } from 'react';
 import AdminNav from '../../components/admin/AdminNav';
-import Pagination from '../../components/admin/Pagination';
-import { getUserList, changeUserRole, deleteUser } from '../../services/adminApi';
+import { getUserDirectory, changeUserRole, deleteUser } from '../../services/adminApi';
 import './admin.css';
 
 interface User {
@@ -11,6 +10,8 @@ interface User {
     role: string;
     last_login: string;
     date_joined: string;
+    exercise_sessions: number;
+    total_reps: number;
 }
 
 const UserManagement: React.FC = () => {
@@ -21,17 +22,34 @@ const UserManagement: React.FC = () => {
     const [showRoleModal, setShowRoleModal] = useState(false);
     const [selectedUser, setSelectedUser] = useState<User | null>(null);
     const [newRole, setNewRole] = useState('');
-    const [currentPage, setCurrentPage] = useState(1);
+    const [sort, setSort] = useState('-id');
     const [pageSize, setPageSize] = useState(10);
+    // Cursors of the pages before the current one; the last entry loads the current page
+    const [cursors, setCursors] = useState<(string | null)[]>([null]);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+
+    // Filters and sort are applied server-side; debounce typing in the search box
+    useEffect(() => {
+        const timer = setTimeout(() => setCursors([null]), 300);
+        return () => clearTimeout(timer);
+    }, [searchTerm, roleFilter, sort, pageSize]);
 
     useEffect(() => {
         loadUsers();
-    }, []);
+    }, [cursors]);
 
     const loadUsers = async () => {
+        setLoading(true);
         try {
-            const data = await getUserList();
+            const data = await getUserDirectory({
+                q: searchTerm,
+                role: roleFilter === 'all' ? undefined : roleFilter,
+                sort,
+                cursor: cursors[cursors.length - 1],
+                page_size: pageSize,
+            });
             setUsers(data.users || []);
+            setNextCursor(data.next_cursor);
         } catch (error) {
             console.error('Failed to load users:', error);
         } finally {
@@ -62,7 +80,7 @@ const UserManagement: React.FC = () => {
         if (!confirm(`Are you sure you want to delete user "${user.username}"? This action cannot be undone.`)) return;
         try {
             await deleteUser(user.id);
-            alert('User deleted successfully!');
+            alert('User deactivated. Their data is being deleted in the background.');
             await loadUsers();
         } catch (error) {
             console.error('Failed to delete user:', error);
@@ -70,18 +88,6 @@ const UserManagement: React.FC = () => {
         }
     };
 
-    const filteredUsers = users.filter(user => {
-        const matchesSearch = user.username.toLowerCase().includes(searchTerm.toLowerCase()) ||
-            user.email.toLowerCase().includes(searchTerm.toLowerCase());
-        const matchesRole = roleFilter === 'all' || user.role === roleFilter;
-        return matchesSearch && matchesRole;
-    });
-
-    const totalPages = Math.ceil(filteredUsers.length / pageSize);
-    const paginatedUsers = filteredUsers.slice(
-        (currentPage - 1) * pageSize,
-        currentPage * pageSize
-    );
 
     return (
         <div className="admin-layout">
@@ -112,6 +118,17 @@ const UserManagement: React.FC = () => {
                         <option value="doctor">Doctor</option>
                         <option value="admin">Admin</option>
                     </select>
+                    <select
+                        value={sort}
+                        onChange={(e) => setSort(e.target.value)}
+                        className="filter-select"
+                    >
+                        <option value="-id">Newest</option>
+                        <option value="username">Username</option>
+                        <option value="-last_login">Last Login</option>
+                        <option value="-exercise_sessions">Most Sessions</option>
+                        <option value="-total_reps">Most Reps</option>
+                    </select>
                 </div>
 
                 {loading ? (
@@ -124,13 +141,14 @@ const UserManagement: React.FC = () => {
                                     <th>Username</th>
                                     <th>Email</th>
                                     <th>Role</th>
+                                    <th>Sessions</th>
                                     <th>Last Login</th>
                                     <th>Joined</th>
                                     <th>Actions</th>
                                 </tr>
                             </thead>
                             <tbody>
-                                {paginatedUsers.map((user) => (
+                                {users.map((user) => (
                                     <tr key={user.id}>
                                         <td><strong>{user.username}</strong></td>
                                         <td>{user.email}</td>
@@ -139,6 +157,7 @@ const UserManagement: React.FC = () => {
                                                 {user.role}
                                             </span>
                                         </td>
+                                        <td>{user.exercise_sessions}</td>
                                         <td>{user.last_login ? new Date(user.last_login).toLocaleDateString() : 'Never'}</td>
                                         <td>{new Date(user.date_joined).toLocaleDateString()}</td>
                                         <td>
@@ -156,22 +175,36 @@ const UserManagement: React.FC = () => {
                             </tbody>
                         </table>
 
-                        {filteredUsers.length === 0 && (
+                        {users.length === 0 && (
                             <div className="no-data">No users found matching your criteria.</div>
                         )}
 
-                        {filteredUsers.length > 0 && (
-                            <Pagination
-                                currentPage={currentPage}
-                                totalPages={totalPages}
-                                onPageChange={setCurrentPage}
-                                pageSize={pageSize}
-                                onPageSizeChange={(size) => {
-                                    setPageSize(size);
-                                    setCurrentPage(1);
-                                }}
-                            />
-                        )}
+                        <div className="cursor-pagination">
+                            <button
+                                className="btn-secondary"
+                                disabled={cursors.length === 1}
+                                onClick={() => setCursors(cursors.slice(0, -1))}
+                            >
+                                Previous
+                            </button>
+                            <span>Page {cursors.length}</span>
+                            <button
+                                className="btn-secondary"
+                                disabled={!nextCursor}
+                                onClick={() => setCursors([...cursors, nextCursor])}
+                            >
+                                Next
+                            </button>
+                            <select
+                                value={pageSize}
+                                onChange={(e) => setPageSize(Number(e.target.value))}
+                                className="filter-select"
+                            >
+                                {[10, 25, 50, 100].map((size) => (
+                                    <option key={size} value={size}>{size} / page</option>
+                                ))}
+                            </select>
+                        </div>
                     </div>
                 )}
 
@@ -226,6 +259,19 @@ const UserManagement: React.FC = () => {
             min-width: 150px;
           }
           
+          .cursor-pagination {
+            display: flex;
+            align-items: center;
+            justify-content: flex-end;
+            gap: 12px;
+            margin-top: 16px;
+          }
+          
+          .cursor-pagination button:disabled {
+            opacity: 0.5;
+            cursor: not-allowed;
+          }
+          
           .role-badge {
             padding: 4px 12px;
             border-radius: 12px;
@@ -34,16 +34,49 @@ export const getAuditLogs = async (filters?: {
   user?: number;
   model?: string;
   limit?: number;
+  cursor?: string | null;
 }) => {
   const params = new URLSearchParams();
   if (filters?.action) params.append('action', filters.action);
   if (filters?.user) params.append('user', filters.user.toString());
   if (filters?.model) params.append('model', filters.model);
   if (filters?.limit) params.append('limit', filters.limit.toString());
+  if (filters?.cursor) params.append('cursor', filters.cursor);
 
   return apiCall(`/admin/audit-logs/?${params.toString()}`);
 };
 
+// Streamed server-side export of the full (filtered) audit trail
+export const downloadAuditExport = async (filters: {
+  action?: string;
+  user?: number;
+  model?: string;
+  start?: string;
+  end?: string;
+  format?: 'csv' | 'ndjson';
+  gzip?: boolean;
+}) => {
+  const { format, gzip, ...rest } = filters;
+  const params = new URLSearchParams();
+  Object.entries(rest).forEach(([key, value]) => {
+    if (value !== undefined && value !== '') params.append(key, String(value));
+  });
+  params.append('export_format', format || 'csv');
+  if (gzip) params.append('gzip', '1');
+
+  const token = getAuthToken();
+  const response = await fetch(`${API_BASE}/admin/audit-logs/export/?${params}`, {
+    headers: { 'Authorization': token ? `Bearer ${token}` : '' },
+  });
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({ error: 'Export failed' }));
+    throw new Error(error.error || `HTTP ${response.status}`);
+  }
+  const disposition = response.headers.get('Content-Disposition') || '';
+  const filename = disposition.match(/filename="([^"]+)"/)?.[1] || 'audit-logs';
+  return { blob: await response.blob(), filename };
+};
+
 // ==================== CMS - EXERCISES ====================
 export const getExercises = () => apiCall('/admin/cms/exercises/');
 
@@ -172,6 +205,23 @@ export const getAdminAnalytics = () => apiCall('/admin-analytics/');
 
 export const getUserList = () => apiCall('/user-list/');
 
+export const getUserDirectory = (params: {
+  q?: string;
+  role?: string;
+  active_within?: number;
+  inactive_for?: number;
+  trimester?: number;
+  sort?: string;
+  cursor?: string | null;
+  page_size?: number;
+} = {}) => {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== '') query.append(key, String(value));
+  });
+  return apiCall(`/admin/users/?${query}`);
+};
+
 // ==================== USER MANAGEMENT ====================
 export const changeUserRole = (userId: number, role: string) =>
   apiCall(`/admin/users/${userId}/change-role/`, {
@@ -0,0 +1,18 @@
+import { describe, it, expect } from 'vitest'
+import fs from 'fs'
+import path from 'path'
+import { buildGolden } from './poseGolden'
+
+// Shared with the Python port's parity tests
+const GOLDEN_PATH = path.resolve(__dirname, '../../../backend/tests/fixtures/pose_golden.json')
+
+describe('poseAnalysis golden output', () => {
+    it('matches backend/tests/fixtures/pose_golden.json', () => {
+        const golden = buildGolden()
+        if (process.env.UPDATE_GOLDEN) {
+            fs.writeFileSync(GOLDEN_PATH, JSON.stringify(golden) + '\n')
+        }
+        // JSON round trip: the file stores numbers as JSON does
+        expect(JSON.parse(JSON.stringify(golden))).toEqual(JSON.parse(fs.readFileSync(GOLDEN_PATH, 'utf8')))
+    })
+})
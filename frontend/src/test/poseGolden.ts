@@ -0,0 +1,178 @@
+/**
+ * Pose Analysis Golden Cases
+ * Deterministic landmark recordings run through poseAnalysis.ts exactly as
+ * ExerciseExecution's processExercise does. The output is the golden file
+ * backend/tests/fixtures/pose_golden.json, which the Python port
+ * (backend/apps/exercises/pose_analysis.py) must reproduce.
+ */
+
+import {
+    calculateAngle,
+    AngleSmoothing,
+    areLandmarksVisible,
+    analyzePosture,
+    RepCounter,
+    VelocityTracker
+} from '../utils/poseAnalysis'
+
+interface GoldenExercise {
+    joints: number[]
+    thresholds: { down: number; up: number }
+}
+
+// Subset of EXERCISES (types.ts) covering both landmark checks and both angle paths
+export const GOLDEN_EXERCISES: { [id: string]: GoldenExercise } = {
+    squat: { joints: [23, 25, 27], thresholds: { down: 130, up: 150 } },
+    arm_raise: { joints: [11, 13, 15], thresholds: { down: 90, up: 140 } },
+    wall_pushup: { joints: [11, 13, 15], thresholds: { down: 100, up: 160 } },
+    calf_raise: { joints: [25, 27, 31], thresholds: { down: 95, up: 115 } },
+    seated_march: { joints: [23, 25, 27], thresholds: { down: 100, up: 50 } }
+}
+
+// Landmarks stored in the golden file; the rest are never read
+export const GOLDEN_LANDMARKS = [11, 12, 13, 14, 15, 16, 23, 25, 27, 31]
+
+// Small seeded PRNG (mulberry32) so cases are identical on every run
+const prng = (seed: number) => () => {
+    seed = (seed + 0x6d2b79f5) | 0
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed)
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296
+}
+
+const round4 = (value: number) => Math.round(value * 10000) / 10000
+
+/**
+ * A recording of `frames` frames at ~30 fps: the tracked joint bends
+ * through the exercise's range `reps` times, with jitter, dropped
+ * landmarks and (for squats and arm raises) form faults
+ */
+export const makeCase = (exercise: string, frames: number, reps: number, seed: number, use3d: boolean) => {
+    const random = prng(seed)
+    const { joints, thresholds } = GOLDEN_EXERCISES[exercise]
+    const low = Math.min(thresholds.down, thresholds.up) - 25
+    const high = Math.max(thresholds.down, thresholds.up) + 15
+    const landmarks: any[][] = []
+    const tMs: number[] = []
+    let t = 0
+
+    for (let i = 0; i < frames; i++) {
+        t += 30 + Math.floor(random() * 8)
+        tMs.push(t)
+        const phase = (i / frames) * reps * 2 * Math.PI
+        const angle = ((low + high) / 2 + ((high - low) / 2) * Math.cos(phase) + (random() - 0.5) * 6) * Math.PI / 180
+
+        const frame: any[] = []
+        for (const index of GOLDEN_LANDMARKS) {
+            const point: any = {
+                x: round4(0.3 + random() * 0.4),
+                y: round4(0.2 + random() * 0.6),
+                visibility: round4(0.9 + random() * 0.1)
+            }
+            if (use3d) point.z = round4((random() - 0.5) * 0.2)
+            frame[index] = point
+        }
+
+        // Place the tracked joints so that their angle follows the curve
+        const [a, b, c] = joints
+        const vertex = { x: 0.5, y: 0.5 }
+        const armA = 0.2 + random() * 0.02
+        const armC = 0.2 + random() * 0.02
+        frame[b] = { ...frame[b], x: vertex.x, y: vertex.y }
+        frame[a] = { ...frame[a], x: round4(vertex.x), y: round4(vertex.y - armA) }
+        frame[c] = { ...frame[c], x: round4(vertex.x + armC * Math.sin(angle)), y: round4(vertex.y - armC * Math.cos(angle)) }
+        if (use3d) {
+            frame[a].z = 0
+            frame[b].z = 0
+            frame[c].z = round4((random() - 0.5) * 0.02)
+        }
+
+        // Form faults
+        if (exercise === 'squat' && i % 17 < 3) {
+            frame[25] = { ...frame[25], x: round4(frame[27].x + 0.15) }
+        }
+        if (exercise === 'arm_raise' && i % 23 < 4) {
+            frame[16] = { ...frame[16], x: round4(frame[14].x + 0.3), y: frame[14].y }
+        }
+        // Dropped landmark
+        if (random() < 0.05) {
+            frame[joints[Math.floor(random() * 3)]].visibility = round4(random() * 0.4)
+        }
+        landmarks.push(frame)
+    }
+    return { exercise, tMs, landmarks }
+}
+
+export const GOLDEN_CASES = () => [
+    makeCase('squat', 150, 4, 1, true),
+    makeCase('arm_raise', 120, 3, 2, true),
+    makeCase('wall_pushup', 90, 2, 3, false),
+    makeCase('calf_raise', 90, 3, 4, true),
+    makeCase('seated_march', 60, 2, 5, false)
+]
+
+/**
+ * processExercise() from ExerciseExecution.tsx over a whole recording,
+ * with performance.now() driven by the recorded timestamps
+ */
+export const runCase = (exercise: string, tMs: number[], landmarks: any[][]) => {
+    const { joints, thresholds } = GOLDEN_EXERCISES[exercise]
+    const smoother = new AngleSmoothing()
+    const counter = new RepCounter()
+    const velocityTracker = new VelocityTracker()
+    const targetAngle = (thresholds.down + thresholds.up) / 2
+    const realNow = performance.now
+    let clock = 0
+    performance.now = () => clock
+
+    const frames: any[] = []
+    let reps = 0
+    let avgPostureScore = 0
+    try {
+        landmarks.forEach((lm, i) => {
+            clock = tMs[i]
+            if (!areLandmarksVisible(lm, joints)) {
+                frames.push({ visible: false })
+                return
+            }
+            const rawAngle = calculateAngle(lm[joints[0]], lm[joints[1]], lm[joints[2]])
+            const angle = smoother.smooth(rawAngle)
+            const velocity = velocityTracker.getVelocity(angle)
+            const rep = counter.count(angle, thresholds.down, thresholds.up)
+            if (rep.counted) reps++
+            const posture = analyzePosture(angle, targetAngle, exercise as any, lm)
+            avgPostureScore = avgPostureScore * 0.9 + posture.score * 0.1
+            frames.push({
+                visible: true,
+                raw_angle: rawAngle,
+                angle,
+                velocity,
+                phase: rep.phase,
+                counted: rep.counted,
+                score: posture.score,
+                issues: posture.issues
+            })
+        })
+    } finally {
+        performance.now = realNow
+    }
+    return { frames, reps, avg_posture_score: avgPostureScore }
+}
+
+/**
+ * The golden file: inputs (only GOLDEN_LANDMARKS) and TS outputs per case
+ */
+export const buildGolden = () => ({
+    landmark_indices: GOLDEN_LANDMARKS,
+    cases: GOLDEN_CASES().map(({ exercise, tMs, landmarks }) => ({
+        exercise,
+        t_ms: tMs,
+        landmarks: landmarks.map(frame => GOLDEN_LANDMARKS.map(index => {
+            const point = frame[index]
+            return point.z === undefined
+                ? [point.x, point.y, null, point.visibility]
+                : [point.x, point.y, point.z, point.visibility]
+        })),
+        expected: runCase(exercise, tMs, landmarks)
+    }))
+})
@@ -0,0 +1,28 @@
+/**
+ * Report Downloads
+ * PDF/CSV reports are rendered on the server (/reports/...); this fetches
+ * one and saves it under the filename the server chose
+ */
+import apiClient from './api'
+
+export type ReportFormat = 'pdf' | 'csv'
+
+interface ReportParams {
+    export_format: ReportFormat
+    start_date?: string
+    end_date?: string
+    patients?: string
+}
+
+export async function downloadReport(path: string, params: ReportParams) {
+    const response = await apiClient.get(path, { params, responseType: 'blob' })
+    const disposition: string = response.headers['content-disposition'] || ''
+    const filename = disposition.match(/filename="([^"]+)"/)?.[1] || `report.${params.export_format}`
+
+    const url = window.URL.createObjectURL(response.data)
+    const a = document.createElement('a')
+    a.href = url
+    a.download = filename
+    a.click()
+    window.URL.revokeObjectURL(url)
+}
@@ -0,0 +1,143 @@
+/**
+ * Offline Session Queue
+ * Finished sessions are queued in localStorage with a client-generated id
+ * and flushed in one request (POST /sessions/sync/). A flush that fails, or
+ * whose response is lost, is simply retried: the server recognises ids it
+ * has already stored and returns the existing session instead.
+ */
+
+import apiClient from './api'
+import { API_ENDPOINTS, APP_CONFIG } from './constants'
+
+export interface QueuedSession {
+    client_id: string
+    exercise_id: number
+    rep_count: number
+    avg_posture_score: number
+    posture_warnings: string
+    start_time: string
+    end_time: string
+}
+
+export interface SyncResult {
+    client_id: string
+    status: 'created' | 'duplicate' | 'invalid'
+    id?: number
+    errors?: Record<string, string[]>
+}
+
+const MAX_BATCH = 100 // Server limit per request
+
+// One queue per user, so a session is never flushed under someone else's token
+const storageKey = () => {
+    const user = localStorage.getItem('user')
+    const username = user ? JSON.parse(user).username : 'anonymous'
+    return `sessionQueue:${username}`
+}
+
+const load = (): QueuedSession[] => {
+    try {
+        return JSON.parse(localStorage.getItem(storageKey()) || '[]')
+    } catch {
+        return []
+    }
+}
+
+const save = (queue: QueuedSession[]) => {
+    if (queue.length) {
+        localStorage.setItem(storageKey(), JSON.stringify(queue))
+    } else {
+        localStorage.removeItem(storageKey())
+    }
+}
+
+const newClientId = () =>
+    typeof crypto !== 'undefined' && 'randomUUID' in crypto
+        ? crypto.randomUUID()
+        : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 12)}`
+
+export const pendingSessionCount = () => load().length
+
+const EXERCISES_KEY = 'exerciseCatalog'
+
+/**
+ * Backend exercise id for a frontend exercise type. The catalogue is kept
+ * in localStorage so that a session can still be queued while offline.
+ */
+export const resolveExerciseId = async (exerciseType: string): Promise<number> => {
+    let exercises: { id: number; name: string }[]
+    try {
+        const res = await apiClient.get(API_ENDPOINTS.EXERCISES)
+        exercises = res.data.map((ex: any) => ({ id: ex.id, name: ex.name }))
+        localStorage.setItem(EXERCISES_KEY, JSON.stringify(exercises))
+    } catch (error) {
+        const cached = localStorage.getItem(EXERCISES_KEY)
+        if (!cached) throw error
+        exercises = JSON.parse(cached)
+    }
+    const target = exercises.find(ex => ex.name.toLowerCase().includes(exerciseType)) || exercises[0]
+    return target.id
+}
+
+/**
+ * Queue a finished session; returns its client id. Its times are taken
+ * now, not at flush time, so a session flushed days later is still
+ * recorded on the day it was done.
+ */
+export const enqueueSession = (
+    session: Omit<QueuedSession, 'client_id' | 'start_time' | 'end_time'> & { start_time?: string }
+): string => {
+    const endTime = new Date().toISOString()
+    const queued = { start_time: endTime, ...session, client_id: newClientId(), end_time: endTime }
+    save([...load(), queued])
+    return queued.client_id
+}
+
+let flushing: Promise<Map<string, SyncResult>> | null = null
+
+/**
+ * Send every queued session, MAX_BATCH per request. Stored (and invalid)
+ * sessions leave the queue; the rest stay for the next flush.
+ * Returns the results by client id.
+ */
+export const flushSessionQueue = (): Promise<Map<string, SyncResult>> => {
+    // Concurrent callers share one flush
+    if (!flushing) {
+        flushing = flush().finally(() => { flushing = null })
+    }
+    return flushing
+}
+
+const flush = async () => {
+    const results = new Map<string, SyncResult>()
+    let queue = load()
+    while (queue.length) {
+        const batch = queue.slice(0, MAX_BATCH)
+        const res = await apiClient.post(`${API_ENDPOINTS.SESSIONS}sync/`, { sessions: batch })
+        for (const result of res.data.results as SyncResult[]) {
+            results.set(result.client_id, result)
+            if (result.status === 'invalid') {
+                console.error('Queued session rejected:', result.client_id, result.errors)
+            }
+        }
+        // Sessions queued while the request was in flight are kept
+        const sent = new Set(batch.map(session => session.client_id))
+        queue = load().filter(session => !sent.has(session.client_id))
+        save(queue)
+    }
+    return results
+}
+
+/**
+ * Flush whenever the browser comes back online; returns the unsubscribe function
+ */
+export const syncSessionsWhenOnline = () => {
+    const onOnline = () => {
+        if (localStorage.getItem(APP_CONFIG.TOKEN_STORAGE_KEY)) {
+            flushSessionQueue().catch(error => console.error('Session sync failed:', error))
+        }
+    }
+    window.addEventListener('online', onOnline)
+    onOnline()
+    return () => window.removeEventListener('online', onOnline)
+}
@@ -0,0 +1,113 @@
+/**
+ * Session Telemetry Recorder
+ * Buffers per-frame samples during an exercise session as columns and
+ * uploads them in batches once the session is saved
+ * (POST /sessions/:id/telemetry/, see backend apps/exercises/telemetry.py)
+ */
+
+import apiClient from './api'
+
+/**
+ * Bit i of the issues mask; keep in sync with ISSUE_CODES in the backend
+ */
+export const ISSUE_CODES = [
+    'large_deviation',
+    'moderate_deviation',
+    'minor_deviation',
+    'knees_forward',
+    'leaning_forward',
+    'arms_asymmetric',
+    'too_fast',
+] as const
+
+export type IssueCode = typeof ISSUE_CODES[number]
+
+// analyzePosture() issue messages
+const ISSUE_MESSAGES: Record<string, IssueCode> = {
+    'Large angle deviation': 'large_deviation',
+    'Moderate angle deviation': 'moderate_deviation',
+    'Minor angle deviation': 'minor_deviation',
+    'Knees too far forward': 'knees_forward',
+    'Leaning too far forward': 'leaning_forward',
+    'Arms not symmetrical': 'arms_asymmetric',
+}
+
+const BATCH_SIZE = 600 // 20 s at 30 fps
+const MAX_FRAMES = 200000 // Server limit per session
+
+export const issueMask = (issues: string[], tooFast = false): number => {
+    let mask = tooFast ? 1 << ISSUE_CODES.indexOf('too_fast') : 0
+    for (const issue of issues) {
+        const code = ISSUE_MESSAGES[issue]
+        if (code) mask |= 1 << ISSUE_CODES.indexOf(code)
+    }
+    return mask
+}
+
+export interface TelemetrySample {
+    angles: number[]
+    score: number
+    velocity: number | null
+    rep: number
+    issues: number
+}
+
+export class TelemetryRecorder {
+    private startTime = 0
+    private t: number[] = []
+    private rep: number[] = []
+    private score: number[] = []
+    private velocity: (number | null)[] = []
+    private issues: number[] = []
+    private angles: number[][] = []
+
+    start() {
+        this.startTime = performance.now()
+        this.t = []
+        this.rep = []
+        this.score = []
+        this.velocity = []
+        this.issues = []
+        this.angles = []
+    }
+
+    get frameCount(): number {
+        return this.t.length
+    }
+
+    record(sample: TelemetrySample) {
+        if (this.t.length >= MAX_FRAMES) return
+        if (this.angles.length === 0) {
+            this.angles = sample.angles.map(() => [])
+        }
+        if (sample.angles.length !== this.angles.length) return
+
+        this.t.push(Math.round(performance.now() - this.startTime))
+        this.rep.push(sample.rep)
+        this.score.push(Math.min(100, Math.max(0, sample.score)))
+        this.velocity.push(sample.velocity === null || !isFinite(sample.velocity) ? null : Math.round(sample.velocity * 10) / 10)
+        this.issues.push(sample.issues)
+        sample.angles.forEach((angle, i) => this.angles[i].push(Math.round(angle * 10) / 10))
+    }
+
+    /**
+     * Upload the buffered samples for a saved session, BATCH_SIZE frames per request.
+     * seq makes a retried batch a no-op on the server; exerciseType lets the
+     * server re-score the session when the scoring rules change.
+     */
+    async upload(sessionId: number, exerciseType?: string) {
+        for (let seq = 0, start = 0; start < this.t.length; seq++, start += BATCH_SIZE) {
+            const end = start + BATCH_SIZE
+            await apiClient.post(`/sessions/${sessionId}/telemetry/`, {
+                seq,
+                exercise_type: exerciseType,
+                t: this.t.slice(start, end),
+                rep: this.rep.slice(start, end),
+                score: this.score.slice(start, end),
+                velocity: this.velocity.slice(start, end),
+                issues: this.issues.slice(start, end),
+                angles: this.angles.map(column => column.slice(start, end)),
+            })
+        }
+    }
+}